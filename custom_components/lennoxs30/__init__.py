@@ -10,6 +10,8 @@ import logging
 import re
 import time
 from asyncio.locks import Event
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
@@ -28,7 +30,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
-from homeassistant.helpers.entity import StateInfo
+from homeassistant.helpers.entity import Entity, StateInfo
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.unit_system import US_CUSTOMARY_SYSTEM
 from lennoxs30api import (
@@ -41,23 +43,45 @@ from lennoxs30api import (
 )
 from lennoxs30api.s30exception import EC_COMMS_ERROR, EC_CONFIG_TIMEOUT
 
+from .backoff import RetryBackoff
+from .command_queue import ZoneCommandQueue
+from .command_scheduler import COMMAND_PRIORITIES, PRIORITY_USER, CommandScheduler
+from .command_tracker import OPTIMISTIC_STATE_TIMEOUT, CommandTracker, PendingCommand
+from .config_cache import ConfigCache
 from .const import (
+    CONF_ADAPTIVE_POLLING,
     CONF_ALLERGEN_DEFENDER_SWITCH,
     CONF_APP_ID,
     CONF_CLOUD_CONNECTION,
+    CONF_COMMAND_DEBOUNCE,
     CONF_CREATE_DIAGNOSTICS_SENSORS,
     CONF_CREATE_INVERTER_POWER,
     CONF_CREATE_PARAMETERS,
     CONF_CREATE_SENSORS,
+    CONF_DIAG_EXTERNAL_STATISTICS,
+    CONF_DIAG_PUBLISH_POLICY,
+    CONF_DIAG_STATISTICS_INTERVAL,
     CONF_FAST_POLL_COUNT,
     CONF_FAST_POLL_INTERVAL,
+    CONF_HOT_PATH_SENSORS,
     CONF_INIT_WAIT_TIME,
     CONF_LOG_MESSAGES_TO_FILE,
+    CONF_MAX_POLL_INTERVAL,
     CONF_MESSAGE_DEBUG_FILE,
     CONF_MESSAGE_DEBUG_LOGGING,
+    CONF_METRICS_REFRESH_INTERVAL,
+    CONF_OPTIMISTIC_STATE,
     CONF_PII_IN_MESSAGE_LOGS,
+    CONF_RESTORE_STATE,
+    CONF_SYSTEM_CONCURRENCY,
+    CONF_WARM_START,
     DEFAULT_CLOUD_TIMEOUT,
+    DEFAULT_COMMAND_DEBOUNCE,
+    DEFAULT_DIAG_STATISTICS_INTERVAL,
     DEFAULT_LOCAL_TIMEOUT,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_METRICS_REFRESH_INTERVAL,
+    DEFAULT_SYSTEM_CONCURRENCY,
     LENNOX_DEFAULT_CLOUD_APP_ID,
     LENNOX_DEFAULT_LOCAL_APP_ID,
     LENNOX_DOMAIN,
@@ -74,7 +98,14 @@ from .device import (
     S30ZoneThermostat,
     S40BleDevice,
 )
+from .diag_capture import DiagCapture, async_register_capture_services
+from .histogram import COUNT_BUCKETS, TIMING_BUCKETS_MS, Histogram
+from .poll_scheduler import AdaptivePollScheduler, PollScheduler
 from .util import dict_redact_fields
+from .zone_changes import ZoneChange
+
+if TYPE_CHECKING:
+    from .diag_recorder import DiagStatisticsImporter
 
 DOMAIN = LENNOX_DOMAIN
 DOMAIN_STATE = "lennoxs30.state"
@@ -99,8 +130,34 @@ DEFAULT_POLL_INTERVAL: int = 10
 DEFAULT_LOCAL_POLL_INTERVAL: int = 1
 DEFAULT_FAST_POLL_INTERVAL: float = 0.75
 MAX_ERRORS = 2
+# Connection retries back off exponentially from the minimum to the maximum interval
+RETRY_MIN_INTERVAL_SECONDS = 5
 RETRY_INTERVAL_SECONDS = 60
 
+# Message pump timings, retrieve includes the long poll wait of local connections.
+# Process is the time the api takes to process a message including the api callbacks, dispatch is the time to write the updated entities.
+HOT_PATH_RETRIEVE = "retrieve_ms"
+HOT_PATH_PROCESS = "process_ms"
+HOT_PATH_DISPATCH = "dispatch_ms"
+HOT_PATH_ENTITIES = "entities_per_message"
+
+# The api metrics that change whenever any of its metrics change, the times are set with one of the counters
+API_METRICS_CHANGE_FIELDS = (
+    "message_count",
+    "send_count",
+    "receive_count",
+    "bytes_in",
+    "error_count",
+    "http_2xx_cnt",
+    "timeouts",
+    "client_response_errors",
+    "server_disconnects",
+    "connection_errors",
+    "sender_message_drop",
+    "sibling_message_drop",
+    "last_reconnect_time",
+)
+
 UNTRACKED_STATE_ATTRIBUTES = {
     "unrecorded_attributes": {
         "message_count",
@@ -117,6 +174,14 @@ UNTRACKED_STATE_ATTRIBUTES = {
         "hostname",
         "sibling_id",
         "sibling_ip",
+        "entity_callbacks",
+        "entity_writes",
+        "entity_writes_suppressed",
+        "poll_interval",
+        "poll_reason",
+        "system_timings",
+        "command_latency",
+        "command_scheduler",
     }
 }
 
@@ -313,6 +378,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     poll_interval = entry.data[CONF_SCAN_INTERVAL]
     fast_poll_interval = entry.data[CONF_FAST_POLL_INTERVAL]
     fast_poll_count = entry.data[CONF_FAST_POLL_COUNT]
+    adaptive_polling = entry.data.get(CONF_ADAPTIVE_POLLING, False)
+    max_poll_interval = entry.data.get(CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL)
     timeout = entry.data[CONF_TIMEOUT]
 
     allergen_defender_switch = entry.data[CONF_ALLERGEN_DEFENDER_SWITCH]
@@ -322,6 +389,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     conf_pii_in_message_logs = entry.data[CONF_PII_IN_MESSAGE_LOGS]
     conf_message_debug_logging = entry.data[CONF_MESSAGE_DEBUG_LOGGING]
     conf_message_debug_file = entry.data[CONF_MESSAGE_DEBUG_FILE]
+    metrics_refresh_interval = entry.data.get(CONF_METRICS_REFRESH_INTERVAL, DEFAULT_METRICS_REFRESH_INTERVAL)
+    system_concurrency = entry.data.get(CONF_SYSTEM_CONCURRENCY, DEFAULT_SYSTEM_CONCURRENCY)
+    warm_start = entry.data.get(CONF_WARM_START, False)
+    restore_state = entry.data.get(CONF_RESTORE_STATE, False)
+    hot_path_sensors = entry.data.get(CONF_HOT_PATH_SENSORS, False)
+    optimistic_state = entry.data.get(CONF_OPTIMISTIC_STATE, False)
+    diag_publish_policy = entry.data.get(CONF_DIAG_PUBLISH_POLICY, False)
+    diag_statistics_interval = entry.data.get(CONF_DIAG_STATISTICS_INTERVAL, DEFAULT_DIAG_STATISTICS_INTERVAL)
+    diag_external_statistics = entry.data.get(CONF_DIAG_EXTERNAL_STATISTICS, False)
+    command_debounce = entry.data.get(CONF_COMMAND_DEBOUNCE, DEFAULT_COMMAND_DEBOUNCE)
     # If no path specified then it goes into the config directory,
     if conf_message_debug_file == "":
         conf_message_debug_file = None
@@ -360,25 +437,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         message_logging_file=conf_message_debug_file,
         create_diagnostic_sensors=create_diagnostic_sensors,
         create_equipment_parameters=create_parameters,
+        metrics_refresh_interval=metrics_refresh_interval,
+        adaptive_polling=adaptive_polling,
+        max_poll_interval=max_poll_interval,
+        system_concurrency=system_concurrency,
+        warm_start=warm_start,
+        restore_state=restore_state,
+        hot_path_sensors=hot_path_sensors,
+        optimistic_state=optimistic_state,
+        diag_publish_policy=diag_publish_policy,
+        diag_statistics_interval=diag_statistics_interval,
+        diag_external_statistics=diag_external_statistics,
+        command_debounce=command_debounce,
+    )
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, manager.async_shutdown)
+    hass.data[DOMAIN][entry.unique_id] = {MANAGER: manager}
+    async_register_capture_services(hass)
+    # Connecting and waiting for the configuration can take a while, do not hold up Home Assistant startup.
+    manager.initialize_task = entry.async_create_background_task(
+        hass, manager.s30_initialize_task(), f"lennoxs30 initialize [{entry.title}]"
     )
-    try:
-        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, manager.async_shutdown)
-        hass.data[DOMAIN][entry.unique_id] = {MANAGER: manager}
-        await manager.s30_initialize()
-    except S30Exception as err:
-        if err.error_code == EC_LOGIN:
-            manager.updateState(DS_LOGIN_FAILED)
-            raise HomeAssistantError(
-                f"Lennox30 unable to login host [{host_name}] - please check credentials and restart Home Assistant"
-            ) from err
-        elif err.error_code == EC_CONFIG_TIMEOUT:
-            _LOGGER.warning("async_setup: %s", err.message)
-            _LOGGER.info("connection will be retried in 1 minute")
-            asyncio.create_task(manager.initialize_retry_task())
-        else:
-            _LOGGER.error("async_setup unexpected error %s", err.message)
-            _LOGGER.info("connection will be retried in 1 minute")
-            asyncio.create_task(manager.initialize_retry_task())
     _LOGGER.debug("async_setup complete host [%s]", host_name)
     return True
 
@@ -386,7 +464,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.debug("async_unload_entry entry [%s]", entry.unique_id)
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = True
+    # Platforms are only forwarded once the configuration has been received.
+    if hass.data[DOMAIN][entry.unique_id][MANAGER].platforms_initialized:
+        unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         entry_data = hass.data[DOMAIN].pop(entry.unique_id)
         manager: Manager = entry_data[MANAGER]
@@ -406,6 +487,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         return False
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the cached configuration when the entry is deleted."""
+    await ConfigCache(hass, entry.entry_id).async_remove()
+
+
 class Manager:
     """Manages the connection to cloud or local via API"""
 
@@ -432,18 +518,39 @@ class Manager:
         message_logging_file: str = None,
         create_diagnostic_sensors: bool = False,
         create_equipment_parameters: bool = False,
+        metrics_refresh_interval: int = DEFAULT_METRICS_REFRESH_INTERVAL,
+        adaptive_polling: bool = False,
+        max_poll_interval: int = DEFAULT_MAX_POLL_INTERVAL,
+        system_concurrency: int = DEFAULT_SYSTEM_CONCURRENCY,
+        warm_start: bool = False,
+        restore_state: bool = False,
+        hot_path_sensors: bool = False,
+        optimistic_state: bool = False,
+        diag_publish_policy: bool = False,
+        diag_statistics_interval: int = 0,
+        diag_external_statistics: bool = False,
+        command_debounce: float = DEFAULT_COMMAND_DEBOUNCE,
     ):
         self.system_parameter_safety_on = {}
         self.config_entry: ConfigEntry = config
         self._reinitialize: bool = False
+        self._login_required: bool = False
+        self._retry_backoff: RetryBackoff = RetryBackoff(RETRY_MIN_INTERVAL_SECONDS, RETRY_INTERVAL_SECONDS)
         self._err_cnt: int = 0
         self.mp_wakeup_event: Event = Event()
         self._climate_entities_initialized: bool = False
+        self.initialize_task: asyncio.Task = None
+        self.startup_timings: dict[str, float] = {}
         self._hass: HomeAssistant = hass
         self._config: ConfigEntry = config
         self._poll_interval: int = poll_interval
         self._fast_poll_interval: float = fast_poll_interval
         self._fast_poll_count: int = fast_poll_count
+        self.poll_scheduler: PollScheduler
+        if adaptive_polling:
+            self.poll_scheduler = AdaptivePollScheduler(poll_interval, fast_poll_interval, fast_poll_count, max_poll_interval)
+        else:
+            self.poll_scheduler = PollScheduler(poll_interval, fast_poll_interval, fast_poll_count)
         self._protocol = protocol
         self._ip_address = ip_address
         self._pii_message_log = pii_message_logs
@@ -460,6 +567,32 @@ class Manager:
             message_logging_file=self._message_logging_file,
             timeout=timeout,
         )
+        # The last known configuration is replayed at startup so entities are created before the controller responds
+        self.config_cache: ConfigCache = None
+        if warm_start:
+            self.config_cache = ConfigCache(hass, config.entry_id)
+        self._api_process_message = self.api.processMessage
+        self.api.processMessage = self._process_message
+        self.hot_path: dict[str, Histogram] = {
+            HOT_PATH_RETRIEVE: Histogram(TIMING_BUCKETS_MS),
+            HOT_PATH_PROCESS: Histogram(TIMING_BUCKETS_MS),
+            HOT_PATH_DISPATCH: Histogram(TIMING_BUCKETS_MS),
+            HOT_PATH_ENTITIES: Histogram(COUNT_BUCKETS),
+        }
+        self._cycle_messages: int = 0
+        self._cycle_process_time: float = 0.0
+        # Commands waiting for the controller to reflect them
+        self.command_tracker: CommandTracker = CommandTracker()
+        # Entities show the requested values of commands waiting for confirmation
+        self.optimistic_state: bool = optimistic_state
+        # Timers reverting the requested values of each command the controller has not confirmed yet
+        self._optimistic_timers: dict[PendingCommand, asyncio.TimerHandle] = {}
+        # Entities showing each attribute of a target, keyed by the id of the target and the attribute, None for all
+        self._attribute_entities: dict[tuple[int, str], dict[Entity, None]] = {}
+        # Bounds the number and rate of commands sent to the controller
+        self.command_scheduler: CommandScheduler = CommandScheduler()
+        # Setpoint and mode changes to each zone are collected for the debounce window and sent as one command
+        self.command_queue: ZoneCommandQueue = ZoneCommandQueue(self, command_debounce)
         self._shutdown = False
         self._retrieve_task = None
         self.allergen_defender_switch = allergen_defender_switch
@@ -467,7 +600,20 @@ class Manager:
         self.create_alert_sensors: bool = True
         self.create_inverter_power: bool = create_inverter_power
         self.create_diagnostic_sensors: bool = create_diagnostic_sensors
+        # Diagnostic sensors publish according to the deadband and interval rules of their unit
+        self.diag_publish_policy: bool = diag_publish_policy
+        # Numeric diagnostic sensors publish the statistics of a rolling window of this many seconds, 0 disables
+        self.diag_statistics_interval: int = diag_statistics_interval
+        # Diagnostic captures by sysId, created by the start_capture service
+        self.diag_captures: dict[str, DiagCapture] = {}
+        # Numeric diagnostics are imported into long-term statistics instead of being created as sensors
+        self.diag_external_statistics: bool = diag_external_statistics
+        # Long-term statistics importers by sysId, created with the sensors
+        self.diag_importers: dict[str, "DiagStatisticsImporter"] = {}
         self.create_equipment_parameters: bool = create_equipment_parameters
+        # Entities publish their last known values, marked as stale, while the connection is not established
+        self.restore_state: bool = restore_state
+        self.hot_path_sensors: bool = hot_path_sensors
         self._conf_init_wait_time = conf_init_wait_time
         self._reinitialize = False
 
@@ -486,9 +632,39 @@ class Manager:
             self.is_metric = True
         self.connected = False
         self.last_cloud_presence_poll: float = None
-
-        self._cs_callbacks = []
+        # Limits the number of systems subscribed or checked for cloud presence at the same time
+        self._system_concurrency: int = max(system_concurrency, 1)
+        self.system_timings: dict[str, float] = {}
+
+        # Connection state publishing, the state entity is only written when the state changes or the metrics are due
+        self._metrics_refresh_interval: int = metrics_refresh_interval
+        self._metrics: dict[str, any] = {}
+        self._api_metrics_key: tuple = None
+        self._siblings_key: tuple = None
+        self._published_state: str = None
+        # Copy of the metrics last published, the working metrics are updated in place
+        self._published_metrics: dict[str, any] = None
+        self._last_publish_time: float = None
+        self.state_publish_count: int = 0
+        self.state_publish_skipped: int = 0
+
+        # Entities updated while a message cycle is running are written once when the cycle completes
+        self._message_cycle: bool = False
+        self._dirty_entities: dict[Entity, None] = {}
+        # True while the message pump is retrieving, the cycle is only opened once messages are received
+        self._retrieving: bool = False
+        self.entity_callbacks: int = 0
+        self.entity_writes: int = 0
+        # Writes skipped because the state of the entity was the same as the last state written
+        self.entity_writes_suppressed: int = 0
+
+        # Entity callbacks are kept in dicts, registering the same callback again has no effect
+        self._cs_callbacks: dict[Callable[[bool], None], None] = {}
+        self._cloud_status_callbacks: dict[str, dict[Callable[[], None], None]] = {}
         self.system_equip_device_map: dict[str, dict[int, Device]] = {}
+        # Registry fields of each device when it was last written, unchanged devices are not written on reconnect
+        self.device_fingerprints: dict[str, tuple] = {}
+        self.device_registrations: dict[str, int] = {"updated": 0, "skipped": 0}
         if index == 0:
             self.connection_state = DOMAIN_STATE
         else:
@@ -504,9 +680,15 @@ class Manager:
         """Called when hass shutsdown"""
         _LOGGER.debug("async_shutdown started host [%s]", self._ip_address)
         self._shutdown = True
+        self.command_queue.cancel()
+        for timer in self._optimistic_timers.values():
+            timer.cancel()
+        self._optimistic_timers.clear()
         if self._retrieve_task is not None:
             self.mp_wakeup_event.set()
             await self._retrieve_task
+        if self.config_cache is not None:
+            await self.config_cache.async_save()
         await self.api.shutdown()
         _LOGGER.debug("async_shutdown complete [%s]", self._ip_address)
 
@@ -525,27 +707,84 @@ class Manager:
         ):
             self.connected = False
             self.executeConnectionStateCallbacks()
-        self._hass.states.async_set(
-            self.connection_state, state, self.getMetricsList(), force_update=True, state_info=UNTRACKED_STATE_ATTRIBUTES
-        )
 
-    def registerConnectionStateCallback(self, callbackfunc):
-        """Register a callback when the connection state changes"""
-        self._cs_callbacks.append({"func": callbackfunc})
+        now = time.monotonic()
+        if (
+            state == self._published_state
+            and self._last_publish_time is not None
+            and now - self._last_publish_time < self._metrics_refresh_interval
+        ):
+            self.state_publish_skipped += 1
+            return
+        metrics = self._metrics_snapshot()
+        if state == self._published_state and metrics == self._published_metrics:
+            self.state_publish_skipped += 1
+            return
+        self._published_state = state
+        self._published_metrics = metrics
+        self._last_publish_time = now
+        self.state_publish_count += 1
+        self._hass.states.async_set(self.connection_state, state, metrics, force_update=True, state_info=UNTRACKED_STATE_ATTRIBUTES)
+
+    def registerConnectionStateCallback(self, callbackfunc: Callable[[bool], None]) -> Callable[[], None]:
+        """Register a callback when the connection state changes, returns a function that removes it"""
+        self._cs_callbacks[callbackfunc] = None
+        return lambda: self._cs_callbacks.pop(callbackfunc, None)
 
     def executeConnectionStateCallbacks(self):
         """Executes callbacks when connection state has changed"""
-        for callback in self._cs_callbacks:
-            callbackfunc = callback["func"]
-            try:
-                callbackfunc(self.connected)
-            except Exception:
-                # Log and eat this exception so we can process other callbacks
-                _LOGGER.exception("executeConnectionStateCallbacks - failed ")
+        self._execute_entity_callbacks("executeConnectionStateCallbacks", self._cs_callbacks, self.connected)
+
+    def registerCloudStatusCallback(self, system: lennox_system, callbackfunc: Callable[[], None]) -> Callable[[], None]:
+        """Register a callback when the cloud status of the system changes, returns a function that removes it"""
+        callbacks = self._cloud_status_callbacks.get(system.sysId)
+        if callbacks is None:
+            callbacks = {}
+            self._cloud_status_callbacks[system.sysId] = callbacks
+            # A single api callback per system fans out to the entities
+            system.registerOnUpdateCallback(lambda: self.executeCloudStatusCallbacks(system), ["cloud_status"])
+        callbacks[callbackfunc] = None
+        return lambda: callbacks.pop(callbackfunc, None)
+
+    def executeCloudStatusCallbacks(self, system: lennox_system) -> None:
+        """Executes callbacks when the cloud status of the system has changed"""
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("executeCloudStatusCallbacks sysId [%s] cloud_status [%s]", system.sysId, system.cloud_status)
+        self._execute_entity_callbacks("executeCloudStatusCallbacks", self._cloud_status_callbacks.get(system.sysId, {}))
+
+    def _execute_entity_callbacks(self, name: str, callbacks: dict[Callable, None], *args) -> None:
+        """Runs the callbacks as a message cycle, so each entity state is written once in a single pass"""
+        in_message_cycle = self._message_cycle
+        self._message_cycle = True
+        try:
+            # Callbacks may be removed while running
+            for callbackfunc in list(callbacks):
+                try:
+                    callbackfunc(*args)
+                except Exception:
+                    # Log and eat this exception so we can process other callbacks
+                    _LOGGER.exception("%s - failed ", name)
+        finally:
+            # Inside a message cycle the entities are written at the end of the cycle
+            if in_message_cycle is False:
+                self.flush_dirty_entities()
 
     def getMetricsList(self):
         """Get the list of connection state metrics"""
-        metrics = self.api.metrics.getMetricList()
+        return self._metrics_snapshot()
+
+    def _metrics_snapshot(self) -> dict[str, any]:
+        """Returns a copy of the refreshed metrics, the nested dicts are copied as they are updated in place"""
+        return {key: dict(value) if isinstance(value, dict) else value for key, value in self._update_metrics().items()}
+
+    def _update_metrics(self) -> dict[str, any]:
+        """Refreshes the metrics dict in place and returns it"""
+        metrics = self._metrics
+        api_metrics = self.api.metrics
+        api_metrics_key = tuple(getattr(api_metrics, field) for field in API_METRICS_CHANGE_FIELDS)
+        if api_metrics_key != self._api_metrics_key:
+            self._api_metrics_key = api_metrics_key
+            metrics.update(api_metrics.getMetricList())
         # TODO these are at the individual S30 level, when we have a device object we should move this there
         systems = self.api.system_list
         if len(systems) > 0:
@@ -555,26 +794,279 @@ class Manager:
                 metrics["diagLevel"] = system.diagLevel
                 metrics["softwareVersion"] = system.softwareVersion
                 metrics["hostname"] = self._ip_address
-                metrics["sibling_id"] = {sibling.sibling_identifier for sibling in system.siblings}
-                metrics["sibling_ip"] = {sibling.sibling_ipAddress for sibling in system.siblings}
+                # The api appends siblings to the list or replaces it when there are none
+                siblings_key = (id(system.siblings), len(system.siblings))
+                if siblings_key != self._siblings_key:
+                    self._siblings_key = siblings_key
+                    metrics["sibling_id"] = {sibling.sibling_identifier for sibling in system.siblings}
+                    metrics["sibling_ip"] = {sibling.sibling_ipAddress for sibling in system.siblings}
+        metrics["entity_callbacks"] = self.entity_callbacks
+        metrics["entity_writes"] = self.entity_writes
+        metrics["entity_writes_suppressed"] = self.entity_writes_suppressed
+        metrics.update(self.poll_scheduler.get_metrics())
+        metrics["system_timings"] = self.system_timings
+        metrics["command_latency"] = self.command_tracker.get_metrics()
+        metrics["command_scheduler"] = self.command_scheduler.get_metrics()
         return metrics
 
+    def _process_message(self, message: dict) -> None:
+        """Times the processing of the message by the api, recording its configuration sections in the cache"""
+        start = time.monotonic()
+        if self._retrieving:
+            # The messages of a retrieve are processed without yielding, the pump writes the entities after the last one
+            self._message_cycle = True
+        if self.config_cache is not None:
+            sys_id = message.get("SenderID", message.get("SenderId"))
+            if "Data" in message and self.api.getSystem(sys_id) is not None:
+                self.config_cache.record(sys_id, message["Data"])
+        self._api_process_message(message)
+        # The update callbacks for the message have run, check if it confirms any commands
+        if len(self.command_tracker.pending) != 0:
+            self._check_commands()
+        elapsed = time.monotonic() - start
+        self._cycle_messages += 1
+        self._cycle_process_time += elapsed
+        self.hot_path[HOT_PATH_PROCESS].record(elapsed * 1000.0)
+
+    def _record_cycle(self, start: float, retrieve_end: float, writes: int) -> None:
+        """Records the timings of the message cycle"""
+        self.hot_path[HOT_PATH_RETRIEVE].record((retrieve_end - start - self._cycle_process_time) * 1000.0)
+        if writes != 0:
+            self.hot_path[HOT_PATH_DISPATCH].record((time.monotonic() - retrieve_end) * 1000.0)
+        if self._cycle_messages != 0:
+            self.hot_path[HOT_PATH_ENTITIES].record(writes / self._cycle_messages)
+
+    def register_attribute_entity(self, entity: Entity, target: Any, attributes: list[str] | None) -> Callable[[], None]:
+        """Registers the entity as showing the attributes of the target, all of them when None, returns a function that removes it"""
+        keys = [(id(target), attr) for attr in (attributes if attributes is not None else [None])]
+        for key in keys:
+            self._attribute_entities.setdefault(key, {})[entity] = None
+
+        def remove() -> None:
+            for key in keys:
+                entities = self._attribute_entities.get(key)
+                if entities is not None:
+                    entities.pop(entity, None)
+
+        return remove
+
+    def optimistic_value(self, target: Any, attr: str, value: Any) -> Any:
+        """Returns the value of the attribute of the target to display, the requested value while optimistic_state is enabled and a recent command is waiting for confirmation"""
+        if self.optimistic_state and len(self.command_tracker.pending) != 0:
+            return self.command_tracker.requested_value(target, attr, value, max_age=OPTIMISTIC_STATE_TIMEOUT)
+        return value
+
+    def _update_optimistic_entities(self, pending: PendingCommand) -> None:
+        """Refreshes the entities showing the attributes requested by the command"""
+        if self.optimistic_state is False or len(pending.requested) == 0:
+            return
+        target_id = id(pending.target)
+        callbacks: dict[Callable[[], None], None] = {}
+        for attr in [*pending.requested, None]:
+            for entity in self._attribute_entities.get((target_id, attr), ()):
+                callbacks[entity.schedule_update_ha_state] = None
+        self._execute_entity_callbacks("update_optimistic_entities", callbacks)
+
+    def _start_optimistic(self, pending: PendingCommand) -> None:
+        """Shows the requested values of the command and reverts them if the controller has not confirmed it in time"""
+        if self.optimistic_state and pending is not None and len(pending.requested) != 0:
+            self._update_optimistic_entities(pending)
+            self._optimistic_timers[pending] = self._hass.loop.call_later(OPTIMISTIC_STATE_TIMEOUT, self._optimistic_expired, pending)
+
+    def _cancel_optimistic(self, pending: PendingCommand) -> None:
+        """Stops the timer reverting the requested values of the command"""
+        if (timer := self._optimistic_timers.pop(pending, None)) is not None:
+            timer.cancel()
+
+    def _check_commands(self) -> None:
+        """Checks for commands confirmed by the controller, their requested values no longer need to be reverted"""
+        for pending in self.command_tracker.check():
+            self._cancel_optimistic(pending)
+
+    def _optimistic_expired(self, pending: PendingCommand) -> None:
+        """Reverts the entities showing the requested values of a command the controller did not confirm"""
+        self._optimistic_timers.pop(pending, None)
+        if pending in self.command_tracker.pending:
+            _LOGGER.warning(
+                "Command [%s] %s not confirmed by the controller after [%s] seconds, reverting to the reported values",
+                pending.command_type,
+                pending.requested,
+                OPTIMISTIC_STATE_TIMEOUT,
+            )
+            self._update_optimistic_entities(pending)
+
+    async def send_command(self, command_type: str, target: Any, attributes: dict[str, Any], command: Awaitable) -> None:
+        """Sends the command to the controller and times until the change is reflected in the attributes of the target
+
+        attributes maps each attribute expected to change to the requested value, or None when the resulting value is not known.
+        """
+        pending = self.command_tracker.start(command_type, target, attributes)
+        self._start_optimistic(pending)
+        try:
+            async with self.command_scheduler.slot(COMMAND_PRIORITIES.get(command_type, PRIORITY_USER)):
+                await command
+        except BaseException:
+            self.command_tracker.cancel(pending)
+            if pending is not None:
+                self._cancel_optimistic(pending)
+                self._update_optimistic_entities(pending)
+            # Not started when cancelled while waiting for the scheduler
+            if asyncio.iscoroutine(command):
+                command.close()
+            raise
+
+    async def async_set_zones(self, changes: list[ZoneChange]) -> int:
+        """Sends the changes to several zones at once and triggers a single fast poll. Returns the number of commands sent
+
+        Each zone is changed through the lennox_zone methods, the zones are changed concurrently within the limits of the
+        command scheduler.
+        """
+        results = await asyncio.gather(*[self._async_set_zone(change) for change in changes], return_exceptions=True)
+        self.mp_wakeup_event.set()
+        sent = 0
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+            sent += result
+        return sent
+
+    async def _async_set_zone(self, change: ZoneChange) -> int:
+        zone = change.zone
+        tracked = change.tracked_attributes()
+        _LOGGER.info("set_zones sysId [%s] zone [%s] changes %s", zone.system.sysId, zone.id, tracked)
+        # Same order as the climate entity, the mode moves the zone to its manual schedule before the setpoints are changed
+        if change.hvac_mode is not None:
+            await self.send_command("hvac_mode", zone, tracked["hvac_mode"], zone.setHVACMode(change.hvac_mode))
+        if len(change.setpoints) != 0:
+            await self.send_command("setpoint", zone, tracked["setpoint"], zone.perform_setpoint(**change.setpoints))
+        if change.fan_mode is not None:
+            await self.send_command("fan_mode", zone, tracked["fan_mode"], zone.setFanMode(change.fan_mode))
+        return len(tracked)
+
+    def get_hot_path_metrics(self) -> dict[str, dict[str, any]]:
+        """Returns a summary of each message pump timing histogram"""
+        return {name: histogram.as_dict() for name, histogram in self.hot_path.items()}
+
+    def warm_start(self) -> None:
+        """Processes the cached configuration of each system"""
+        systems = [lsystem.sysId for lsystem in self.api.system_list if self.config_cache.replay(lsystem)]
+        if len(systems) > 0:
+            _LOGGER.info("warm_start host [%s] processed cached configuration for systems %s", self._ip_address, systems)
+
+    def entity_mark_dirty(self, entity: Entity) -> bool:
+        """Defers the state write of the entity to the end of the message cycle, returns False when no cycle is running"""
+        self.entity_callbacks += 1
+        if self._message_cycle is False:
+            self.entity_writes += 1
+            return False
+        self._dirty_entities[entity] = None
+        return True
+
+    def flush_dirty_entities(self) -> int:
+        """Writes the state of each entity updated during the message cycle, returns the number written
+
+        An entity whose fingerprint is the same as when it was last written is not written again, entities without a
+        fingerprint are written and Home Assistant skips a state that has not changed.
+        """
+        self._message_cycle = False
+        if len(self._dirty_entities) == 0:
+            return 0
+        writes = self.entity_writes
+        dirty_entities = self._dirty_entities
+        self._dirty_entities = {}
+        for entity in dirty_entities:
+            # Entity may have been removed during the cycle
+            if entity.hass is None:
+                continue
+            try:
+                fingerprint = None if entity.force_update else entity.state_fingerprint()
+                if fingerprint is not None and fingerprint == entity.written_fingerprint:
+                    self.entity_writes_suppressed += 1
+                    continue
+                entity.async_write_ha_state()
+                entity.written_fingerprint = fingerprint
+                self.entity_writes += 1
+            except Exception:
+                # Log and eat this exception so we can write the other entities
+                _LOGGER.exception("flush_dirty_entities - failed to write entity [%s]", entity.entity_id)
+        return self.entity_writes - writes
+
+    @property
+    def platforms_initialized(self) -> bool:
+        """True once the entity platforms have been setup"""
+        return self._climate_entities_initialized
+
+    async def s30_initialize_task(self) -> None:
+        """Initializes the connection in the background, retrying on failure"""
+        try:
+            await self.s30_initialize()
+            return
+        except S30Exception as err:
+            if err.error_code == EC_LOGIN:
+                self.updateState(DS_LOGIN_FAILED)
+                _LOGGER.error(
+                    "Lennox30 unable to login host [%s] - please check credentials and reload the integration",
+                    self._ip_address,
+                )
+                return
+            if err.error_code == EC_CONFIG_TIMEOUT:
+                _LOGGER.warning("async_setup: %s", err.message)
+            else:
+                _LOGGER.error("async_setup unexpected error %s", err.message)
+            _LOGGER.info("connection will be retried")
+        except Exception:
+            _LOGGER.exception("s30_initialize_task host [%s] unexpected exception", self._ip_address)
+            _LOGGER.info("connection will be retried")
+        # Retried in this task, which the config entry cancels when it is unloaded
+        await self.initialize_retry_task()
+
+    def _startup_phase(self, phase: str, start: float) -> float:
+        """Records the duration of a startup phase and returns the current time"""
+        now = time.monotonic()
+        self.startup_timings[phase] = round(now - start, 3)
+        return now
+
     async def s30_initialize(self):
         """Initialized the connection to the S30"""
+        self.startup_timings = {}
+        self.device_registrations = {"updated": 0, "skipped": 0}
+        start = phase_start = time.monotonic()
         self.updateState(DS_CONNECTING)
+        if self.config_cache is not None:
+            await self.config_cache.async_load()
         await self.connect_subscribe()
+        phase_start = self._startup_phase("connect", phase_start)
+        # The cached configuration is processed before the live configuration, which then updates it
+        if self.config_cache is not None:
+            self.warm_start()
         await self.configuration_initialization()
+        phase_start = self._startup_phase("configuration", phase_start)
         if len(g_unique_id_update) != 0:
             await self.unique_id_updates()
         # Launch the message pump loop
         self._retrieve_task = asyncio.create_task(self.messagePump_task())
-        # Since there is no change detection implemented to update device attributes like SW version - alwayas reinit
+        # Devices are registered on every connect, only those whose registry fields changed are written
         await self.create_devices()
+        phase_start = self._startup_phase("devices", phase_start)
+        _LOGGER.debug(
+            "s30_initialize host [%s] devices updated [%d] skipped [%d]",
+            self._ip_address,
+            self.device_registrations["updated"],
+            self.device_registrations["skipped"],
+        )
         # Only add entities the first time, on reconnect we do not need to add them again
         if self._climate_entities_initialized is False:
             await self._hass.config_entries.async_forward_entry_setups(self._config, PLATFORMS)
             self._climate_entities_initialized = True
+            self._startup_phase("platforms", phase_start)
+        self._startup_phase("total", start)
         self.updateState(DS_CONNECTED)
+        _LOGGER.info(
+            "s30_initialize host [%s] connected in [%.1f] seconds - configuration [%.1f] seconds",
+            self._ip_address,
+            self.startup_timings["total"],
+            self.startup_timings["configuration"],
+        )
 
     async def unique_id_updates(self):
         """Update Unique Ids for affected S40 systems, where the prefix of 123_ was being used"""
@@ -657,52 +1149,64 @@ class Manager:
     async def create_devices(self):
         """Creates devices for the discoved lennox equipment"""
         for system in self.api.system_list:
-            equip_device_map: dict[int, Device] = self.system_equip_device_map.get(system.sysId)
-            if equip_device_map is None:
-                equip_device_map = {}
-                self.system_equip_device_map[system.sysId] = equip_device_map
-            s30: S30ControllerDevice = S30ControllerDevice(self._hass, self.config_entry, system)
-            s30.register_device()
-            if s30.equipment is not None:
-                equip_device_map[s30.equipment.equipment_id] = s30
-
-            if system.has_outdoor_unit:
-                s30_outdoor_unit = S30OutdoorUnit(self._hass, self.config_entry, system, s30)
-                s30_outdoor_unit.register_device()
-                if s30_outdoor_unit.equipment is not None:
-                    equip_device_map[s30_outdoor_unit.equipment.equipment_id] = s30_outdoor_unit
-            if system.has_indoor_unit:
-                s30_indoor_unit = S30IndoorUnit(self._hass, self.config_entry, system, s30)
-                s30_indoor_unit.register_device()
-                if s30_indoor_unit.equipment is not None:
-                    equip_device_map[s30_indoor_unit.equipment.equipment_id] = s30_indoor_unit
-
-            for eq in system.equipment.values():
-                if eq.equipment_id != 0 and equip_device_map.get(eq.equipment_id) is None:
-                    aux_unit = S30AuxiliaryUnit(self._hass, self.config_entry, system, s30, eq)
-                    aux_unit.register_device()
-                    equip_device_map[aux_unit.equipment.equipment_id] = aux_unit
-
-            if system.supports_ventilation():
-                d: S30VentilationUnit = S30VentilationUnit(self._hass, self.config_entry, system, s30)
-                d.register_device()
-                equip_device_map[VENTILATION_EQUIPMENT_ID] = d
-
-            for zone in system.zone_list:
-                if zone.is_zone_active():
-                    z: S30ZoneThermostat = S30ZoneThermostat(self._hass, self.config_entry, system, zone, s30)
-                    z.register_device()
-
-            for ble_device in system.ble_devices.values():
-                if ble_device.deviceType != "tstat":
-                    ble: S40BleDevice = S40BleDevice(self._hass, self.config_entry, system, ble_device, s30)
-                    ble.register_device()
+            self.create_system_devices(system)
+
+    def register_device(self, device: Device) -> None:
+        """Registers the device, skipping the registry write when nothing has changed"""
+        if device.register_device(self.device_fingerprints):
+            self.device_registrations["updated"] += 1
+        else:
+            self.device_registrations["skipped"] += 1
+
+    def create_system_devices(self, system: lennox_system) -> None:
+        """Creates devices for the lennox equipment of a system"""
+        equip_device_map: dict[int, Device] = self.system_equip_device_map.get(system.sysId)
+        if equip_device_map is None:
+            equip_device_map = {}
+            self.system_equip_device_map[system.sysId] = equip_device_map
+        s30: S30ControllerDevice = S30ControllerDevice(self._hass, self.config_entry, system)
+        self.register_device(s30)
+        if s30.equipment is not None:
+            equip_device_map[s30.equipment.equipment_id] = s30
+
+        if system.has_outdoor_unit:
+            s30_outdoor_unit = S30OutdoorUnit(self._hass, self.config_entry, system, s30)
+            self.register_device(s30_outdoor_unit)
+            if s30_outdoor_unit.equipment is not None:
+                equip_device_map[s30_outdoor_unit.equipment.equipment_id] = s30_outdoor_unit
+        if system.has_indoor_unit:
+            s30_indoor_unit = S30IndoorUnit(self._hass, self.config_entry, system, s30)
+            self.register_device(s30_indoor_unit)
+            if s30_indoor_unit.equipment is not None:
+                equip_device_map[s30_indoor_unit.equipment.equipment_id] = s30_indoor_unit
+
+        for eq in system.equipment.values():
+            if eq.equipment_id != 0 and equip_device_map.get(eq.equipment_id) is None:
+                aux_unit = S30AuxiliaryUnit(self._hass, self.config_entry, system, s30, eq)
+                self.register_device(aux_unit)
+                equip_device_map[aux_unit.equipment.equipment_id] = aux_unit
+
+        if system.supports_ventilation():
+            d: S30VentilationUnit = S30VentilationUnit(self._hass, self.config_entry, system, s30)
+            self.register_device(d)
+            equip_device_map[VENTILATION_EQUIPMENT_ID] = d
+
+        for zone in system.zone_list:
+            if zone.is_zone_active():
+                z: S30ZoneThermostat = S30ZoneThermostat(self._hass, self.config_entry, system, zone, s30)
+                self.register_device(z)
+
+        for ble_device in system.ble_devices.values():
+            if ble_device.deviceType != "tstat":
+                ble: S40BleDevice = S40BleDevice(self._hass, self.config_entry, system, ble_device, s30)
+                self.register_device(ble)
 
     async def initialize_retry_task(self):
         """Retries the connection on failure"""
+        self._retry_backoff.reset()
         while True:
             self.updateState(DS_RETRY_WAIT)
-            await asyncio.sleep(RETRY_INTERVAL_SECONDS)
+            await asyncio.sleep(self._retry_backoff.next_delay())
             self.updateState(DS_CONNECTING)
             try:
                 await self.s30_initialize()
@@ -722,7 +1226,7 @@ class Manager:
                 elif e.error_code == EC_CONFIG_TIMEOUT:
                     _LOGGER.warning("async_setup: host [%s] %s", self._ip_address, e.as_string())
                     _LOGGER.info(
-                        "connection host [%s] will be retried in 1 minute",
+                        "connection host [%s] will be retried",
                         self._ip_address,
                     )
                 else:
@@ -732,32 +1236,32 @@ class Manager:
                         e.as_string(),
                     )
                     _LOGGER.info(
-                        "async setup host [%s] will be retried in 1 minute",
+                        "async setup host [%s] will be retried",
                         self._ip_address,
                     )
 
     async def configuration_initialization(self) -> None:
-        """Waits for the configuration to arrive"""
-        # Wait for zones to appear on each system
-        systemsWithZones = 0
+        """Waits for the configuration of each system to arrive, recording the time each system took"""
+        # Systems are ready once the name and zones have been received, only the systems still waiting are checked
+        pending: list[lennox_system] = list(self.api.system_list)
+        start = time.monotonic()
         loops: int = 0
-        numOfSystems = len(self.api.system_list)
+        numOfSystems = len(pending)
         # To speed startup, we only want to sleep when a message was not received.
         got_message: bool = True
         offline_error_logged = {}
-        while systemsWithZones < numOfSystems and loops < self._conf_init_wait_time:
+        while len(pending) > 0 and loops < self._conf_init_wait_time:
             _LOGGER.debug(
                 "configuration_initialization waiting for zone config to arrive host [%s]  numSystems [%d] systemsWithZones [%d]",
                 self._ip_address,
                 numOfSystems,
-                systemsWithZones,
+                numOfSystems - len(pending),
             )
             # Only take a breather if we did not get a message.
             if got_message is False:
                 await asyncio.sleep(1.0)
-            systemsWithZones = 0
             got_message = await self.messagePump()
-            for lsystem in self.api.system_list:
+            for lsystem in list(pending):
                 if lsystem.cloud_status == "offline":
                     if offline_error_logged.get(lsystem.sysId) is None:
                         _LOGGER.error(
@@ -767,26 +1271,36 @@ class Manager:
                         )
                         offline_error_logged[lsystem.sysId] = True
                 # Issue #33 - system configuration isn't complete until we've received the name from Lennox.
-                if lsystem.config_complete() is False:
+                if lsystem.config_complete() is False or len(lsystem.zone_list) == 0:
                     continue
-                numZones = len(lsystem.zone_list)
-                _LOGGER.debug(
-                    "configuration_initialization host [%s] wait for zones system [%s] numZone [%d]",
+                pending.remove(lsystem)
+                self._system_ready(lsystem, start)
+            if got_message is False:
+                loops += 1
+        if len(pending) > 0:
+            for lsystem in pending:
+                _LOGGER.warning(
+                    "configuration_initialization host [%s] timeout waiting for configuration of system [%s]",
                     self._ip_address,
                     lsystem.sysId,
-                    numZones,
                 )
-                if numZones > 0:
-                    systemsWithZones += 1
-            if got_message is False:
-                loops += 1
-        if systemsWithZones < numOfSystems:
             raise S30Exception(
                 "Timeout waiting for configuration data from Lennox - this sometimes happens, the connection will be automatically retried.  Consult the readme for more details",
                 EC_CONFIG_TIMEOUT,
                 1,
             )
 
+    def _system_ready(self, lsystem: lennox_system, start: float) -> None:
+        """Records the time the system took to become ready"""
+        elapsed = self._startup_phase(f"system_ready_{lsystem.sysId}", start) - start
+        _LOGGER.debug(
+            "configuration_initialization host [%s] system [%s] ready numZone [%d] in [%.1f] seconds",
+            self._ip_address,
+            lsystem.sysId,
+            len(lsystem.zone_list),
+            elapsed,
+        )
+
     async def connect(self):
         """Connect to the cloud or local"""
         await self.api.serverConnect()
@@ -795,27 +1309,62 @@ class Manager:
         """Establishes the subscription"""
         await self.api.serverConnect()
 
-        for lsystem in self.api.system_list:
-            await self.api.subscribe(lsystem)
+        results = await self.gather_systems("subscribe", self.api.subscribe)
+        # The first failure is raised once all the subscriptions have completed
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def resubscribe(self) -> bool:
+        """Subscribes again using the existing session, returns False if any system failed"""
+        results = await self.gather_systems("subscribe", self.api.subscribe)
+        for result in results:
+            if isinstance(result, BaseException):
+                _LOGGER.info("resubscribe host [%s] failed - reconnecting [%s]", self._ip_address, result)
+                return False
+        return True
+
+    async def gather_systems(self, operation: str, func: Callable[[lennox_system], Awaitable]) -> list:
+        """Runs func for each system with bounded concurrency, returns the results or exceptions in system order"""
+        semaphore = asyncio.Semaphore(self._system_concurrency)
+
+        async def run(system: lennox_system):
+            async with semaphore:
+                start = time.monotonic()
+                try:
+                    return await func(system)
+                finally:
+                    self.system_timings[f"{operation}_{system.sysId}"] = round(time.monotonic() - start, 3)
+
+        return await asyncio.gather(*(run(system) for system in self.api.system_list), return_exceptions=True)
 
     async def reinitialize_task(self) -> None:
         """Reinitializes the connection"""
-        while True:
-            try:
-                self.updateState(DS_CONNECTING)
-                _LOGGER.debug("reinitialize_task host [%s] - trying reconnect", self._ip_address)
-                await self.connect_subscribe()
-                self.updateState(DS_CONNECTED)
-                break
-            except S30Exception as e:
-                _LOGGER.error("reinitialize_task host [%s] %s", self._ip_address, e.as_string())
-                if e.error_code == EC_LOGIN:
-                    raise HomeAssistantError(
-                        f"Lennox30 unable to login host [{self._ip_address}]  - please check credentials and restart Home Assistant"
-                    ) from e
-            self.updateState(DS_RETRY_WAIT)
-            await asyncio.sleep(RETRY_INTERVAL_SECONDS)
-
+        self._retry_backoff.reset()
+        self.updateState(DS_CONNECTING)
+        # Routine connection drops only lose the subscription, so first try to subscribe again on the existing session.
+        # When that fails log in again, backing off between attempts.
+        if self._login_required is False and await self.resubscribe():
+            _LOGGER.debug("reinitialize_task host [%s] - resubscribe successful", self._ip_address)
+            self.updateState(DS_CONNECTED)
+        else:
+            while True:
+                self.updateState(DS_RETRY_WAIT)
+                await asyncio.sleep(self._retry_backoff.next_delay())
+                try:
+                    self.updateState(DS_CONNECTING)
+                    _LOGGER.debug("reinitialize_task host [%s] - trying reconnect", self._ip_address)
+                    await self.connect_subscribe()
+                    self.updateState(DS_CONNECTED)
+                    break
+                except S30Exception as e:
+                    _LOGGER.error("reinitialize_task host [%s] %s", self._ip_address, e.as_string())
+                    if e.error_code == EC_LOGIN:
+                        raise HomeAssistantError(
+                            f"Lennox30 unable to login host [{self._ip_address}]  - please check credentials and restart Home Assistant"
+                        ) from e
+
+        self._login_required = False
         _LOGGER.debug("reinitialize_task host [%s] - reconnect successful", self._ip_address)
         self._retrieve_task = asyncio.create_task(self.messagePump_task())
 
@@ -837,55 +1386,57 @@ class Manager:
             return
 
         self.last_cloud_presence_poll = time.time()
+        await self.gather_systems("cloud_presence", self.update_system_cloud_presence)
 
-        for system in self.api.system_list:
-            if _LOGGER.isEnabledFor(logging.DEBUG):
-                _LOGGER.debug("update_cloud_presence sysId [%s]", system.sysId)
-            old_status = system.cloud_status
-            try:
-                await system.update_system_online_cloud()
-                new_status = system.cloud_status
-                if new_status == "offline" and old_status == "online":
+    async def update_system_cloud_presence(self, system: lennox_system) -> None:
+        """Updates the cloud presence of a system, resubscribing when it comes back online"""
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("update_cloud_presence sysId [%s]", system.sysId)
+        old_status = system.cloud_status
+        try:
+            await system.update_system_online_cloud()
+            new_status = system.cloud_status
+            if new_status == "offline" and old_status == "online":
+                _LOGGER.error(
+                    "cloud status changed to offline for sysId [%s] name [%s]",
+                    system.sysId,
+                    system.name,
+                )
+            elif old_status == "offline" and new_status == "online":
+                _LOGGER.info(
+                    "cloud status changed to online for sysId [%s] name [%s] - resubscribing",
+                    system.sysId,
+                    system.name,
+                )
+                try:
+                    await self.api.subscribe(system)
+                except S30Exception as e:
                     _LOGGER.error(
-                        "cloud status changed to offline for sysId [%s] name [%s]",
+                        "update_cloud_presence resubscribe error sysid [%s] error %s",
                         system.sysId,
-                        system.name,
+                        e.as_string(),
                     )
-                elif old_status == "offline" and new_status == "online":
-                    _LOGGER.info(
-                        "cloud status changed to online for sysId [%s] name [%s] - resubscribing",
+                    self._reinitialize = True
+                except Exception as e:
+                    _LOGGER.exception(
+                        "update_cloud_presence resubscribe error unexpected exception sysid [%s] error {%s}",
                         system.sysId,
-                        system.name,
+                        e,
                     )
-                    try:
-                        await self.api.subscribe(system)
-                    except S30Exception as e:
-                        _LOGGER.error(
-                            "update_cloud_presence resubscribe error sysid [%s] error %s",
-                            system.sysId,
-                            e.as_string(),
-                        )
-                        self._reinitialize = True
-                    except Exception as e:
-                        _LOGGER.exception(
-                            "update_cloud_presence resubscribe error unexpected exception sysid [%s] error {%s}",
-                            system.sysId,
-                            e,
-                        )
-                        self._reinitialize = True
+                    self._reinitialize = True
 
-            except S30Exception as e:
-                _LOGGER.error(
-                    "update_cloud_presence sysid [%s] error %s",
-                    system.sysId,
-                    e.as_string(),
-                )
-            except Exception as e:
-                _LOGGER.exception(
-                    "update_cloud_presence unexpected exception sysid [%s] error %s",
-                    system.sysId,
-                    e,
-                )
+        except S30Exception as e:
+            _LOGGER.error(
+                "update_cloud_presence sysid [%s] error %s",
+                system.sysId,
+                e.as_string(),
+            )
+        except Exception as e:
+            _LOGGER.exception(
+                "update_cloud_presence unexpected exception sysid [%s] error %s",
+                system.sysId,
+                e,
+            )
 
     def get_reinitialize(self):
         """Determine if object is reinitializing"""
@@ -896,8 +1447,8 @@ class Manager:
         await asyncio.sleep(self._poll_interval)
         self._reinitialize = False
         self._err_cnt = 0
-        fast_polling: bool = False
-        fast_polling_cd: int = 0
+        scheduler = self.poll_scheduler
+        scheduler.reset()
         received = False
         while self.get_reinitialize() is False:
             try:
@@ -908,23 +1459,21 @@ class Manager:
             if self.api.isLANConnection is False:
                 await self.update_cloud_presence()
 
-            if fast_polling:
-                fast_polling_cd = fast_polling_cd - 1
-                if fast_polling_cd <= 0:
-                    fast_polling = False
+            # Commands not yet confirmed or expired keep the scheduler fast polling
+            scheduler.on_retrieve(received, pending_confirmations=self.command_tracker.expected)
 
             if self._shutdown:
                 break
 
             if not received:
-                if fast_polling:
-                    res = await asyncio.sleep(min(self._fast_poll_interval, self._poll_interval))
+                interval = scheduler.next_interval()
+                if scheduler.fast_polling:
+                    await asyncio.sleep(interval)
                 else:
-                    res = await self.event_wait_mp_wakeup(self._poll_interval)
+                    res = await self.event_wait_mp_wakeup(interval)
                     if res:
                         self.mp_wakeup_event.clear()
-                        fast_polling = True
-                        fast_polling_cd = self._fast_poll_count
+                        scheduler.start_fast_poll(self.command_tracker.expected)
 
         if self._shutdown:
             _LOGGER.debug("messagePump_task host [%s] is exiting to shutdown", self._ip_address)
@@ -949,7 +1498,18 @@ class Manager:
         try:
             if _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug("messagePump host [%s] running", self._ip_address)
-            received = await self.api.messagePump()
+            self._retrieving = True
+            self._cycle_messages = 0
+            self._cycle_process_time = 0.0
+            start = time.monotonic()
+            try:
+                received = await self.api.messagePump()
+            finally:
+                self._retrieving = False
+                retrieve_end = time.monotonic()
+                self._record_cycle(start, retrieve_end, self.flush_dirty_entities())
+                # Expire commands that have not been confirmed
+                self._check_commands()
             self.updateState(DS_CONNECTED)
         except S30Exception as e:
             self._err_cnt += 1
@@ -960,6 +1520,7 @@ class Manager:
                     self._ip_address,
                 )
                 self._reinitialize = True
+                self._login_required = True
             # If its an HTTP error, we will not log an error, just and info message, unless
             # this exceeds the max consecutive error count
             elif e.error_code == EC_HTTP_ERR and self._err_cnt < MAX_ERRORS:
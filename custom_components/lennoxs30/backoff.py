@@ -0,0 +1,37 @@
+"""Delays between connection attempts."""
+
+import random
+from collections.abc import Callable
+
+
+class RetryBackoff:
+    """Exponential backoff with jitter, the delay grows by factor on each attempt up to max_delay.
+
+    The delay is randomly reduced by up to the jitter fraction, so controllers that dropped at the same time
+    do not all reconnect at the same time.
+    """
+
+    def __init__(
+        self,
+        initial_delay: float,
+        max_delay: float,
+        factor: float = 2.0,
+        jitter: float = 0.25,
+        rand: Callable[[], float] = random.random,
+    ) -> None:
+        self.initial_delay: float = initial_delay
+        self.max_delay: float = max(max_delay, initial_delay)
+        self.factor: float = factor
+        self.jitter: float = jitter
+        self.attempts: int = 0
+        self._rand: Callable[[], float] = rand
+
+    def reset(self) -> None:
+        """Called once a connection has been established."""
+        self.attempts = 0
+
+    def next_delay(self) -> float:
+        """Returns the seconds to wait before the next attempt."""
+        delay = min(self.initial_delay * self.factor ** min(self.attempts, 32), self.max_delay)
+        self.attempts += 1
+        return delay * (1.0 - self.jitter * self._rand())
@@ -2,7 +2,9 @@
 """Provides mixin to be used in all entities to drive availability from cloud status or connection status."""
 
 import logging
+from typing import Any, Callable
 
+from homeassistant.helpers.restore_state import RestoreEntity
 from lennoxs30api import lennox_system
 
 from . import Manager
@@ -17,17 +19,14 @@ class S30BaseEntityMixin:
         """Initialize base mixin."""
         self._manager: Manager = manager
         self._system: lennox_system = system
+        # Fingerprint of the state last written by the manager, None when it is not known
+        self.written_fingerprint: tuple = None
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
-        self._manager.registerConnectionStateCallback(self.connection_state_callback)
+        self.async_on_remove(self._manager.registerConnectionStateCallback(self.connection_state_callback))
         if self.base_ignore_cloud_status is False:
-            self._system.registerOnUpdateCallback(
-                self.cloud_status_update_callback,
-                [
-                    "cloud_status",
-                ],
-            )
+            self.async_on_remove(self._manager.registerCloudStatusCallback(self._system, self.cloud_status_update_callback))
         await super().async_added_to_hass()
 
     @property
@@ -47,6 +46,25 @@ class S30BaseEntityMixin:
             _LOGGER.debug("connection_state_callback connected [%s]", connected)
         self.schedule_update_ha_state()
 
+    def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
+        """Defers the state write to the end of the message cycle, the manager writes each entity once per cycle."""
+        if force_refresh or self._manager.entity_mark_dirty(self) is False:
+            self.written_fingerprint = None
+            super().schedule_update_ha_state(force_refresh)
+
+    def state_fingerprint(self) -> tuple | None:
+        """Override to return the values the state is rendered from, a state with the same fingerprint as the last one written is not written again. None always writes."""
+        return None
+
+    def register_update_callback(self, target: Any, callbackfunc: Callable[[], None], match: list[str] = None) -> None:
+        """Registers the callback for updates of the attributes of the target, the entity is also refreshed when a command requests a value for one of them."""
+        target.registerOnUpdateCallback(callbackfunc, match)
+        self.async_on_remove(self._manager.register_attribute_entity(self, target, match))
+
+    def optimistic_value(self, target: Any, attr: str) -> Any:
+        """Returns the attribute of the target, or the value requested by a command waiting for confirmation when optimistic_state is enabled."""
+        return self._manager.optimistic_value(target, attr, getattr(target, attr))
+
     @property
     def available(self) -> bool:
         """Determines if entity is available."""
@@ -64,3 +82,51 @@ class S30BaseEntityMixin:
     def should_poll(self) -> bool:
         """No polling needed."""
         return False
+
+
+class S30RestoreEntityMixin(S30BaseEntityMixin):
+    """Mixin for entities that publish their last known values while the connection is not established.
+
+    When restore_state is enabled the entity remains available while the connection is not established, it publishes
+    the last known values with the stale attribute set. Values that have not been received are restored from the
+    state saved by Home Assistant, by a subclass that also derives from RestoreEntity and is only created when
+    restore_state is enabled.
+    """
+
+    def __init__(self, manager: Manager, system: lennox_system) -> None:
+        """Initialize restore mixin."""
+        super().__init__(manager, system)
+        self._restored_values: dict[str, Any] = {}
+
+    async def async_added_to_hass(self) -> None:
+        """Run when entity about to be added to hass."""
+        await super().async_added_to_hass()
+        if self._manager.restore_state and isinstance(self, RestoreEntity):
+            await self.async_restore_values()
+
+    async def async_restore_values(self) -> None:
+        """Override to load the saved values into _restored_values."""
+
+    @property
+    def stale(self) -> bool:
+        """True when the values published are not from the current connection."""
+        return self._manager.restore_state and self._manager.connected is False
+
+    def restored_value(self, key: str, value: Any) -> Any:
+        """Returns the value, while stale a missing value is replaced by the restored value."""
+        if value is None and self.stale:
+            return self._restored_values.get(key)
+        return value
+
+    def stale_attributes(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        """Adds the stale attribute when restore_state is enabled."""
+        if self._manager.restore_state:
+            attrs["stale"] = self.stale
+        return attrs
+
+    @property
+    def available(self) -> bool:
+        """Stale entities remain available."""
+        if self.stale:
+            return True
+        return super().available
@@ -15,7 +15,7 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from lennoxs30api import LENNOX_OUTDOOR_UNIT_HP, lennox_system
 
@@ -120,6 +120,12 @@ class S30HomeStateBinarySensor(S30BaseEntityMixin, BinarySensorEntity):
         super().__init__(manager, system)
         self._hass = hass
         self._myname = self._system.name + "_home_state"
+        # HA fails with dashes in IDs
+        self._attr_unique_id = (self._system.unique_id + "_HS").replace("-", "")
+        self._attr_name = self._myname
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, self._system.unique_id)},
+        }
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -142,12 +148,6 @@ class S30HomeStateBinarySensor(S30BaseEntityMixin, BinarySensorEntity):
         _LOGGER.debug("update_callback S30HomeStateBinarySensor myname [%s]", self._myname)
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        """Return unique_id."""
-        # HA fails with dashes in IDs
-        return (self._system.unique_id + "_HS").replace("-", "")
-
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
@@ -161,23 +161,11 @@ class S30HomeStateBinarySensor(S30BaseEntityMixin, BinarySensorEntity):
         attrs["smart_away_setpoint_state"] = self._system.sa_setpointState
         return attrs
 
-    @property
-    def name(self) -> str:
-        """Return entity name."""
-        return self._myname
-
     @property
     def is_on(self) -> bool:
         """Return entity state."""
         return self._system.get_away_mode() is False
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return {
-            "identifiers": {(DOMAIN, self._system.unique_id)},
-        }
-
     @property
     def device_class(self) -> BinarySensorDeviceClass:
         """Return device_class."""
@@ -192,6 +180,12 @@ class S30InternetStatus(S30BaseEntityMixin, BinarySensorEntity):
         super().__init__(manager, system)
         self._hass = hass
         self._myname = self._system.name + "_internet_status"
+        # HA fails with dashes in IDs
+        self._attr_unique_id = (self._system.unique_id + UNIQUE_ID_SUFFIX_INTENET_STATUS_SENSOR).replace("-", "")
+        self._attr_name = self._myname
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, self._system.unique_id)},
+        }
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -210,12 +204,6 @@ class S30InternetStatus(S30BaseEntityMixin, BinarySensorEntity):
             _LOGGER.debug("update_callback S30InternetStatus myname [%s]", self._myname)
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        """Return entity unique_id."""
-        # HA fails with dashes in IDs
-        return (self._system.unique_id + UNIQUE_ID_SUFFIX_INTENET_STATUS_SENSOR).replace("-", "")
-
     @property
     def extra_state_attributes(self) -> dict:
         """Return extra attributes."""
@@ -228,23 +216,11 @@ class S30InternetStatus(S30BaseEntityMixin, BinarySensorEntity):
             return False
         return super().available
 
-    @property
-    def name(self) -> str:
-        """Return entity name."""
-        return self._myname
-
     @property
     def is_on(self) -> bool:
         """Return entity state."""
         return self._system.internetStatus
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return {
-            "identifiers": {(DOMAIN, self._system.unique_id)},
-        }
-
     @property
     def device_class(self) -> BinarySensorDeviceClass:
         """Return device_class."""
@@ -264,6 +240,12 @@ class S30RelayServerStatus(S30BaseEntityMixin, BinarySensorEntity):
         super().__init__(manager, system)
         self._hass = hass
         self._myname = self._system.name + "_relay_server"
+        # HA fails with dashes in IDs
+        self._attr_unique_id = (self._system.unique_id + UNIQUE_ID_SUFFIX_RELAY_STATUS_SENSOR).replace("-", "")
+        self._attr_name = self._myname
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, self._system.unique_id)},
+        }
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -281,22 +263,11 @@ class S30RelayServerStatus(S30BaseEntityMixin, BinarySensorEntity):
         _LOGGER.debug("update_callback S30RelayServerStatus myname [%s]", self._myname)
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        """Return unique_id."""
-        # HA fails with dashes in IDs
-        return (self._system.unique_id + UNIQUE_ID_SUFFIX_RELAY_STATUS_SENSOR).replace("-", "")
-
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
         return {}
 
-    @property
-    def name(self) -> str:
-        """Return entity name."""
-        return self._myname
-
     @property
     def available(self) -> bool:
         """Return entity availability."""
@@ -309,13 +280,6 @@ class S30RelayServerStatus(S30BaseEntityMixin, BinarySensorEntity):
         """Return entity state."""
         return self._system.relayServerConnected
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return {
-            "identifiers": {(DOMAIN, self._system.unique_id)},
-        }
-
     @property
     def device_class(self) -> BinarySensorDeviceClass:
         """Return device_class."""
@@ -335,6 +299,12 @@ class S30CloudConnectedStatus(S30BaseEntityMixin, BinarySensorEntity):
         super().__init__(manager, system)
         self._hass = hass
         self._myname = self._system.name + "_cloud_connected"
+        # HA fails with dashes in IDs
+        self._attr_unique_id = (self._system.unique_id + UNIQUE_ID_SUFFIX_CLOUD_CONNECTED_SENSOR).replace("-", "")
+        self._attr_name = self._myname
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, self._system.unique_id)},
+        }
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -358,22 +328,11 @@ class S30CloudConnectedStatus(S30BaseEntityMixin, BinarySensorEntity):
             _LOGGER.debug("update_callback S30CloudConnectedStatus myname [%s]", self._myname)
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        """Return entity unique_id."""
-        # HA fails with dashes in IDs
-        return (self._system.unique_id + UNIQUE_ID_SUFFIX_CLOUD_CONNECTED_SENSOR).replace("-", "")
-
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra attributes."""
         return {}
 
-    @property
-    def name(self) -> str:
-        """Return name."""
-        return self._myname
-
     @property
     def available(self) -> bool:
         """Return entity availability."""
@@ -390,13 +349,6 @@ class S30CloudConnectedStatus(S30BaseEntityMixin, BinarySensorEntity):
             return False
         return None
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return {
-            "identifiers": {(DOMAIN, self._system.unique_id)},
-        }
-
     @property
     def device_class(self) -> BinarySensorDeviceClass:
         """Return device_class."""
@@ -416,6 +368,12 @@ class S30HeatpumpLowAmbientLockout(S30BaseEntityMixin, BinarySensorEntity):
         super().__init__(manager, system)
         self._hass = hass
         self._myname = self._system.name + "_hp_lo_ambient_lockout"
+        # HA fails with dashes in IDs
+        self._attr_unique_id = (self._system.unique_id + UNIQUE_ID_SUFFIX_HP_LOW_AMBIENT_LOCKOUT).replace("-", "")
+        self._attr_name = self._myname
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, self._system.unique_id)},
+        }
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -433,29 +391,11 @@ class S30HeatpumpLowAmbientLockout(S30BaseEntityMixin, BinarySensorEntity):
         _LOGGER.debug("update_callback S30HeatpumpLowAmbientLockout myname [%s]", self._myname)
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        """Return unique_id."""
-        # HA fails with dashes in IDs
-        return (self._system.unique_id + UNIQUE_ID_SUFFIX_HP_LOW_AMBIENT_LOCKOUT).replace("-", "")
-
-    @property
-    def name(self) -> str:
-        """Return name."""
-        return self._myname
-
     @property
     def is_on(self) -> bool:
         """Return entity state."""
         return self._system.heatpump_low_ambient_lockout
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return {
-            "identifiers": {(DOMAIN, self._system.unique_id)},
-        }
-
 
 class S30AuxheatHighAmbientLockout(S30BaseEntityMixin, BinarySensorEntity):
     """Auxheat lockout."""
@@ -465,6 +405,12 @@ class S30AuxheatHighAmbientLockout(S30BaseEntityMixin, BinarySensorEntity):
         super().__init__(manager, system)
         self._hass = hass
         self._myname = self._system.name + "_auxheat_hi_ambient_lockout"
+        # HA fails with dashes in IDs
+        self._attr_unique_id = (self._system.unique_id + UNIQUE_ID_SUFFIX_AUX_HI_AMBIENT_LOCKOUT).replace("-", "")
+        self._attr_name = self._myname
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, self._system.unique_id)},
+        }
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -483,25 +429,7 @@ class S30AuxheatHighAmbientLockout(S30BaseEntityMixin, BinarySensorEntity):
             _LOGGER.debug("update_callback S30AuxheatHighAmbientLockout myname [%s]", self._myname)
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        """Return entity unique_id."""
-        # HA fails with dashes in IDs
-        return (self._system.unique_id + UNIQUE_ID_SUFFIX_AUX_HI_AMBIENT_LOCKOUT).replace("-", "")
-
-    @property
-    def name(self) -> str:
-        """Return entity name."""
-        return self._myname
-
     @property
     def is_on(self) -> bool:
         """Return entitiy state."""
         return self._system.aux_heat_high_ambient_lockout
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return {
-            "identifiers": {(DOMAIN, self._system.unique_id)},
-        }
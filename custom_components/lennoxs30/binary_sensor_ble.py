@@ -13,7 +13,7 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
 )
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.helpers.entity import EntityCategory
 from lennoxs30api import LENNOX_BLE_COMMSTATUS_AVAILABLE, LENNOX_BLE_STATUS_INPUT_AVAILABLE, LennoxBle, lennox_system
 from lennoxs30api.lennox_ble import LennoxBleInput
 
@@ -43,6 +43,11 @@ class BleCommStatusBinarySensor(S30BaseEntityMixin, BinarySensorEntity):
         self._hass = hass
         self._myname = f"{self._system.name} {ble_device.deviceName} comm_status"
         self._ble_device: LennoxBle = ble_device
+        self._attr_unique_id = helper_create_system_unique_id(self._system, f"{UNIQUE_ID_SUFFIX_BLE_COMMSTATUS}_{self._ble_device.ble_id}")
+        self._attr_name = self._myname
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, helper_create_ble_device_id(self._system, self._ble_device))},
+        }
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -61,33 +66,16 @@ class BleCommStatusBinarySensor(S30BaseEntityMixin, BinarySensorEntity):
             _LOGGER.debug("update_callback BleCommStatusBinarySensor myname [%s]", self._myname)
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        """Create unique id for entity."""
-        return helper_create_system_unique_id(self._system, f"{UNIQUE_ID_SUFFIX_BLE_COMMSTATUS}_{self._ble_device.ble_id}")
-
     @property
     def extra_state_attributes(self) -> dict[str, str]:
         """Return attributes."""
         return {"commStatus": self._ble_device.commStatus}
 
-    @property
-    def name(self) -> str:
-        """Return entity name."""
-        return self._myname
-
     @property
     def is_on(self) -> bool:
         """Return state."""
         return self._ble_device.commStatus == LENNOX_BLE_COMMSTATUS_AVAILABLE
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return {
-            "identifiers": {(DOMAIN, helper_create_ble_device_id(self._system, self._ble_device))},
-        }
-
     @property
     def device_class(self) -> BinarySensorDeviceClass:
         """Return device_class."""
@@ -122,6 +110,14 @@ class BleBinarySensor(S30BaseEntityMixin, BinarySensorEntity):
         self._status_value: LennoxBleInput = status_value
         self._device_class: str = sensor_dict.get("device_class")
         self._entity_category: str = sensor_dict.get("entity_category")
+        self._attr_unique_id = helper_create_system_unique_id(
+            self._system,
+            f"{UNIQUE_ID_SUFFIX_BLE}_{self._ble_device.ble_id}_{self._sensor_value.input_id}",
+        )
+        self._attr_name = self._myname
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, helper_create_ble_device_id(self._system, self._ble_device))},
+        }
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -151,31 +147,11 @@ class BleBinarySensor(S30BaseEntityMixin, BinarySensorEntity):
             _LOGGER.debug("status_value_update BleBinarySensor myname [%s]", self._myname)
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        """Return unique id for entity."""
-        return helper_create_system_unique_id(
-            self._system,
-            f"{UNIQUE_ID_SUFFIX_BLE}_{self._ble_device.ble_id}_{self._sensor_value.input_id}",
-        )
-
-    @property
-    def name(self) -> str:
-        """Return entity name."""
-        return self._myname
-
     @property
     def is_on(self) -> bool:
         """Return on state."""
         return self._sensor_value.value == "1"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return {
-            "identifiers": {(DOMAIN, helper_create_ble_device_id(self._system, self._ble_device))},
-        }
-
     @property
     def device_class(self) -> BinarySensorDeviceClass:
         """Return device_class."""
@@ -11,7 +11,7 @@ from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from lennoxs30api.s30api_async import lennox_system
 from lennoxs30api.s30exception import S30Exception
@@ -64,17 +64,10 @@ class EquipmentParameterUpdateButton(S30BaseEntityMixin, ButtonEntity):
         self.hass: HomeAssistant = hass
         self._myname = self._system.name + "_parameter_update"
         _LOGGER.debug("Create EquipmentParameterUpdateButton myname [%s]", self._myname)
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique_id."""
         # HA fails with dashes in IDs
-        return (self._system.unique_id + UNIQUE_ID_SUFFIX_PARAMETER_UPDATE_BUTTON).replace("-", "")
-
-    @property
-    def name(self) -> str:
-        """Return entitiy name."""
-        return self._myname
+        self._attr_unique_id = (self._system.unique_id + UNIQUE_ID_SUFFIX_PARAMETER_UPDATE_BUTTON).replace("-", "")
+        self._attr_name = self._myname
+        self._attr_device_info = helper_get_equipment_device_info(self._manager, self._system, 0)
 
     async def async_press(self) -> None:
         """Update the current value."""
@@ -91,11 +84,6 @@ class EquipmentParameterUpdateButton(S30BaseEntityMixin, ButtonEntity):
             err = f"EquipmentParameterUpdateButton::async_press unexpected exception, please log issue, [{self._myname}] exception [{ex}]"
             raise HomeAssistantError(err) from ex
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return helper_get_equipment_device_info(self._manager, self._system, 0)
-
     @property
     def entity_category(self) -> EntityCategory:
         """Return entity_category."""
@@ -116,16 +104,9 @@ class ResetSmartHubButton(S30BaseEntityMixin, ButtonEntity):
         self.hass: HomeAssistant = hass
         self._myname = self._system.name + "_reset_smarthub"
         _LOGGER.debug("Create ResetSmartHubButton myname [%s]", self._myname)
-
-    @property
-    def unique_id(self) -> str:
-        """Return entity unique_id."""
-        return helper_create_system_unique_id(self._system, UNIQUE_ID_SUFFIX_RESET_SMART_HUB)
-
-    @property
-    def name(self) -> str:
-        """Return entity name."""
-        return self._myname
+        self._attr_unique_id = helper_create_system_unique_id(self._system, UNIQUE_ID_SUFFIX_RESET_SMART_HUB)
+        self._attr_name = self._myname
+        self._attr_device_info = helper_get_equipment_device_info(self._manager, self._system, 0)
 
     async def async_press(self) -> None:
         """Update the current value."""
@@ -144,11 +125,6 @@ class ResetSmartHubButton(S30BaseEntityMixin, ButtonEntity):
             err = f"ResetSmartHubButton::async_press unexpected exception, please log issue, [{self._myname}] exception [{ex}]"
             raise HomeAssistantError(err) from ex
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return helper_get_equipment_device_info(self._manager, self._system, 0)
-
     @property
     def entity_category(self) -> EntityCategory:
         """Return entity category."""
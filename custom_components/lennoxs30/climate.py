@@ -11,8 +11,12 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from homeassistant.components.climate import ClimateEntity, ClimateEntityFeature
+import voluptuous as vol
+from homeassistant.components.climate import DATA_COMPONENT, ClimateEntity, ClimateEntityFeature
 from homeassistant.components.climate.const import (
+    ATTR_CURRENT_HUMIDITY,
+    ATTR_CURRENT_TEMPERATURE,
+    ATTR_FAN_MODE,
     ATTR_HVAC_MODE,
     ATTR_TARGET_TEMP_HIGH,
     ATTR_TARGET_TEMP_LOW,
@@ -26,13 +30,16 @@ from homeassistant.components.climate.const import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
+    ATTR_ENTITY_ID,
     ATTR_TEMPERATURE,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.restore_state import RestoreEntity
 from lennoxs30api import (
     EC_BAD_PARAMETERS,
     LENNOX_BAD_STATUS,
@@ -55,8 +62,9 @@ from lennoxs30api.s30api_async import (
 )
 
 from . import Manager
-from .base_entity import S30BaseEntityMixin
+from .base_entity import S30RestoreEntityMixin
 from .const import MANAGER
+from .zone_changes import ZoneChange
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -70,15 +78,95 @@ PRESET_SCHEDULE_OVERRIDE = "schedule hold"
 SUPPORT_FLAGS = ClimateEntityFeature.PRESET_MODE | ClimateEntityFeature.FAN_MODE | ClimateEntityFeature.TURN_OFF
 # Standard set of fan modes
 FAN_MODES = [FAN_AUTO, FAN_ON, FAN_CIRCULATE]
+# Zone attributes rendered in the extra state attributes
+ZONE_STATE_ATTRIBUTES = [
+    "allergenDefender",
+    "damper",
+    "demand",
+    "fan",
+    "humidityMode",
+    "humOperation",
+    "tempOperation",
+    "ventilation",
+    "heatCoast",
+    "defrost",
+    "balancePoint",
+    "aux",
+    "coolCoast",
+    "ssr",
+]
+# Zone attributes that feed the state, the other properties and the supported features
+ZONE_UPDATE_ATTRIBUTES = ZONE_STATE_ATTRIBUTES + [
+    "temperature",
+    "temperatureC",
+    "temperatureStatus",
+    "humidity",
+    "humidityStatus",
+    "systemMode",
+    "fanMode",
+    "sp",
+    "spC",
+    "csp",
+    "cspC",
+    "hsp",
+    "hspC",
+    "desp",
+    "husp",
+    "heatingOption",
+    "coolingOption",
+    "humidificationOption",
+    "dehumidificationOption",
+    "maxCsp",
+    "maxCspC",
+    "minCsp",
+    "minCspC",
+    "maxHsp",
+    "maxHspC",
+    "minHsp",
+    "minHspC",
+    "maxHumSp",
+    "minHumSp",
+    "maxDehumSp",
+    "minDehumSp",
+    "scheduleId",
+    "scheduleHold",
+]
 
 DOMAIN = "lennoxs30"
 
+SERVICE_SET_ZONES = "set_zones"
+ATTR_ZONES = "zones"
+SET_ZONES_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ZONES): vol.All(
+            cv.ensure_list,
+            [
+                vol.Schema(
+                    {
+                        vol.Required(ATTR_ENTITY_ID): cv.entity_id,
+                        vol.Optional(ATTR_HVAC_MODE): vol.Coerce(HVACMode),
+                        vol.Optional(ATTR_FAN_MODE): cv.string,
+                        vol.Optional(ATTR_TEMPERATURE): vol.Coerce(float),
+                        vol.Optional(ATTR_TARGET_TEMP_HIGH): vol.Coerce(float),
+                        vol.Optional(ATTR_TARGET_TEMP_LOW): vol.Coerce(float),
+                    }
+                )
+            ],
+        )
+    }
+)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> bool:
     """Set up the climate entity."""
     _LOGGER.debug("climate:async_setup_platform enter")
     climate_list = []
     manager: Manager = hass.data[DOMAIN][entry.unique_id][MANAGER]
+    # The thermostats only restore their saved values when restore_state is enabled
+    climate_class = S30RestoreClimate if manager.restore_state else S30Climate
+    # The service is shared by all config entries
+    if not hass.services.has_service(DOMAIN, SERVICE_SET_ZONES):
+        hass.services.async_register(DOMAIN, SERVICE_SET_ZONES, async_set_zones_service, schema=SET_ZONES_SCHEMA)
     for system in manager.api.system_list:
         for zone in system.zone_list:
             if zone.is_zone_active():
@@ -88,7 +176,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
                     zone.name,
                     manager.is_metric,
                 )
-                climate = S30Climate(hass, manager, system, zone)
+                climate = climate_class(hass, manager, system, zone)
                 climate_list.append(climate)
             else:
                 _LOGGER.debug("Skipping inactive zone - system [%s] zone [%s]", system.sysId, zone.name)
@@ -100,7 +188,38 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     return True
 
 
-class S30Climate(S30BaseEntityMixin, ClimateEntity):
+async def async_set_zones_service(call: ServiceCall) -> None:
+    """Changes several zones, the changes to the zones of a system are sent together."""
+    component: EntityComponent[ClimateEntity] = call.hass.data[DATA_COMPONENT]
+    manager_changes: dict[Manager, list[ZoneChange]] = {}
+    entity_ids: set[str] = set()
+    for request in call.data[ATTR_ZONES]:
+        entity_id = request[ATTR_ENTITY_ID]
+        entity = component.get_entity(entity_id)
+        if not isinstance(entity, S30Climate):
+            raise HomeAssistantError(f"set_zones [{entity_id}] is not a lennoxs30 climate entity")
+        if entity_id in entity_ids:
+            raise HomeAssistantError(f"set_zones [{entity_id}] is specified more than once")
+        entity_ids.add(entity_id)
+        change = entity.zone_change(
+            hvac_mode=request.get(ATTR_HVAC_MODE),
+            fan_mode=request.get(ATTR_FAN_MODE),
+            temperature=request.get(ATTR_TEMPERATURE),
+            target_temp_high=request.get(ATTR_TARGET_TEMP_HIGH),
+            target_temp_low=request.get(ATTR_TARGET_TEMP_LOW),
+        )
+        manager_changes.setdefault(entity._manager, []).append(change)
+
+    for manager, changes in manager_changes.items():
+        try:
+            await manager.async_set_zones(changes)
+        except S30Exception as ex:
+            raise HomeAssistantError(f"set_zones [{ex.as_string()}]") from ex
+        except Exception as ex:
+            raise HomeAssistantError(f"set_zones unexpected exception, please log issue, exception [{ex}]") from ex
+
+
+class S30Climate(S30RestoreEntityMixin, ClimateEntity):
     """Class for Lennox S30 thermostat."""
 
     def __init__(self, hass: HomeAssistant, manager: Manager, system: lennox_system, zone: lennox_zone) -> None:
@@ -110,13 +229,25 @@ class S30Climate(S30BaseEntityMixin, ClimateEntity):
         self._zone = zone
         self._myname = self._system.name + "_" + self._zone.name
         self._enable_turn_on_off_backwards_compatibility = False
+        self._attr_unique_id = self._zone.unique_id
+        self._attr_name = self._myname
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, self.unique_id)},
+        }
+        # Cached extra state attributes and the stale value they were built with, only used once subscribed
+        self._cached_attributes: dict[str, Any] = None
+        self._cached_attributes_stale: bool = None
+        self._subscribed: bool = False
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         _LOGGER.debug("async_added_to_hass S30Climate myname [%s]", self._myname)
-        self._zone.registerOnUpdateCallback(self.zone_update_callback)
+        # Invalidate the cached attributes before the state is written
+        self.register_update_callback(self._zone, self.zone_attributes_callback, ZONE_STATE_ATTRIBUTES)
+        self.register_update_callback(self._zone, self.zone_update_callback, ZONE_UPDATE_ATTRIBUTES)
         # We need notification of state of system.manualAwayMode in order to update the preset mode in HA.
-        self._system.registerOnUpdateCallback(
+        self.register_update_callback(
+            self._system,
             self.system_update_callback,
             [
                 "manualAwayMode",
@@ -128,24 +259,39 @@ class S30Climate(S30BaseEntityMixin, ClimateEntity):
                 "zoningMode",
             ],
         )
+        self._subscribed = True
         await super().async_added_to_hass()
 
-    @property
-    def unique_id(self) -> str:
-        """Returns unique identifier for this entity."""
-        return self._zone.unique_id
+    async def async_restore_values(self) -> None:
+        """Restore the current temperature and humidity."""
+        if (last_state := await self.async_get_last_state()) is not None:
+            self._restored_values[ATTR_CURRENT_TEMPERATURE] = last_state.attributes.get(ATTR_CURRENT_TEMPERATURE)
+            self._restored_values[ATTR_CURRENT_HUMIDITY] = last_state.attributes.get(ATTR_CURRENT_HUMIDITY)
 
     def zone_update_callback(self) -> None:
         """Trigger Callbacks for zone changes that affect this entity."""
         self.schedule_update_ha_state()
 
+    def zone_attributes_callback(self) -> None:
+        """Invalidates the cached attributes when a zone attribute they render changes."""
+        self._cached_attributes = None
+
     def system_update_callback(self) -> None:
         """Trigger Callbacks for system changes that affect this entity."""
+        # zoningMode is rendered in the attributes and enables or disables the zone
+        self._cached_attributes = None
         self.schedule_update_ha_state()
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
+        """Return the state attributes, rebuilt only when one of their inputs has changed."""
+        stale = self.stale
+        if self._subscribed is False or self._cached_attributes is None or self._cached_attributes_stale != stale:
+            self._cached_attributes = self._build_extra_state_attributes()
+            self._cached_attributes_stale = stale
+        return self._cached_attributes
+
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
         attrs: dict[str, Any] = {}
         attrs["allergenDefender"] = self._zone.allergenDefender if self.is_zone_enabled else None
         attrs["damper"] = self._zone.damper if self.is_zone_enabled else None
@@ -169,12 +315,7 @@ class S30Climate(S30BaseEntityMixin, ClimateEntity):
         attrs["ssr"] = self._zone.ssr if self.is_zone_enabled else None
         attrs["zoneEnabled"] = self.is_zone_enabled
         attrs["zoningMode"] = self._system.zoningMode
-        return attrs
-
-    @property
-    def name(self) -> str:
-        """Returns the name."""
-        return self._myname
+        return self.stale_attributes(attrs)
 
     @property
     def is_zone_disabled(self) -> bool:
@@ -193,7 +334,7 @@ class S30Climate(S30BaseEntityMixin, ClimateEntity):
         if self._zone.system.single_setpoint_mode:
             return True
         # If it's in heat and cool then there are two setpoints
-        return self._zone.systemMode != LENNOX_HVAC_HEAT_COOL
+        return self.optimistic_value(self._zone, "systemMode") != LENNOX_HVAC_HEAT_COOL
 
     @property
     def supported_features(self) -> ClimateEntityFeature:
@@ -286,10 +427,24 @@ class S30Climate(S30BaseEntityMixin, ClimateEntity):
         if self.is_zone_disabled:
             return None
 
+        if self._manager.optimistic_state:
+            return self._optimistic_target_temperature()
         if self._manager.is_metric is False:
             return self._zone.getTargetTemperatureF()
         return self._zone.getTargetTemperatureC()
 
+    def _optimistic_target_temperature(self) -> float | None:
+        """Returns the target temperature in the same way as lennox_zone.getTargetTemperatureF/C from the optimistic values."""
+        system_mode = self.optimistic_value(self._zone, "systemMode")
+        suffix = "" if self._manager.is_metric is False else "C"
+        if self._zone.system.single_setpoint_mode:
+            return None if system_mode == LENNOX_HVAC_OFF else self.optimistic_value(self._zone, "sp" + suffix)
+        if system_mode == LENNOX_HVAC_COOL:
+            return self.optimistic_value(self._zone, "csp" + suffix)
+        if system_mode in (LENNOX_HVAC_HEAT, LENNOX_HVAC_EMERGENCY_HEAT):
+            return self.optimistic_value(self._zone, "hsp" + suffix)
+        return None
+
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
@@ -308,7 +463,7 @@ class S30Climate(S30BaseEntityMixin, ClimateEntity):
             t = self._zone.getTemperatureC()
             if _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug("climate:current_temperature name [%s] temperature [%s] C", self._myname, t)
-        return t
+        return self.restored_value(ATTR_CURRENT_TEMPERATURE, t)
 
     @property
     def target_temperature_high(self) -> float | None:
@@ -319,11 +474,15 @@ class S30Climate(S30BaseEntityMixin, ClimateEntity):
             return None
         if self._manager.is_metric is False:
             if _LOGGER.isEnabledFor(logging.DEBUG):
-                _LOGGER.debug("climate:target_temperature_high name [%s] temperature [%s] F", self._myname, self._zone.csp)
-            return self._zone.csp
+                _LOGGER.debug(
+                    "climate:target_temperature_high name [%s] temperature [%s] F", self._myname, self.optimistic_value(self._zone, "csp")
+                )
+            return self.optimistic_value(self._zone, "csp")
         if _LOGGER.isEnabledFor(logging.DEBUG):
-            _LOGGER.debug("climate:target_temperature_high name [%s] temperature [%s] C", self._myname, self._zone.cspC)
-        return self._zone.cspC
+            _LOGGER.debug(
+                "climate:target_temperature_high name [%s] temperature [%s] C", self._myname, self.optimistic_value(self._zone, "cspC")
+            )
+        return self.optimistic_value(self._zone, "cspC")
 
     @property
     def target_temperature_low(self) -> float | None:
@@ -334,11 +493,15 @@ class S30Climate(S30BaseEntityMixin, ClimateEntity):
             return None
         if self._manager.is_metric is False:
             if _LOGGER.isEnabledFor(logging.DEBUG):
-                _LOGGER.debug("climate:target_temperature_low name [%s] temperature [%s] F", self._myname, self._zone.hsp)
-            return self._zone.hsp
+                _LOGGER.debug(
+                    "climate:target_temperature_low name [%s] temperature [%s] F", self._myname, self.optimistic_value(self._zone, "hsp")
+                )
+            return self.optimistic_value(self._zone, "hsp")
         if _LOGGER.isEnabledFor(logging.DEBUG):
-            _LOGGER.debug("climate:target_temperature_low name [%s] temperature [%s] C", self._myname, self._zone.hspC)
-        return self._zone.hspC
+            _LOGGER.debug(
+                "climate:target_temperature_low name [%s] temperature [%s] C", self._myname, self.optimistic_value(self._zone, "hspC")
+            )
+        return self.optimistic_value(self._zone, "hspC")
 
     @property
     def current_humidity(self) -> float | None:
@@ -353,12 +516,12 @@ class S30Climate(S30BaseEntityMixin, ClimateEntity):
         h = self._zone.getHumidity()
         if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("climate:current_humidity name [%s] humidity [%s]", self._myname, h)
-        return h
+        return self.restored_value(ATTR_CURRENT_HUMIDITY, h)
 
     @property
     def hvac_mode(self) -> HVACMode:
         """Return the current hvac operation mode."""
-        r = self._zone.getSystemMode()
+        r = self.optimistic_value(self._zone, "systemMode")
         if r == LENNOX_HVAC_HEAT_COOL:
             r = HVACMode.HEAT_COOL
         elif r == LENNOX_HVAC_EMERGENCY_HEAT:
@@ -402,9 +565,9 @@ class S30Climate(S30BaseEntityMixin, ClimateEntity):
         if self.is_zone_disabled:
             return None
         if self._zone.humidityMode == LENNOX_HUMIDITY_MODE_DEHUMIDIFY:
-            return self._zone.desp
+            return self.optimistic_value(self._zone, "desp")
         if self._zone.humidityMode == LENNOX_HUMIDITY_MODE_HUMIDIFY:
-            return self._zone.husp
+            return self.optimistic_value(self._zone, "husp")
         return None
 
     async def async_set_humidity(self, humidity: float) -> None:
@@ -418,9 +581,13 @@ class S30Climate(S30BaseEntityMixin, ClimateEntity):
             raise HomeAssistantError(err)
         try:
             if self._zone.humidityMode == LENNOX_HUMIDITY_MODE_DEHUMIDIFY:
-                await self._zone.perform_humidify_setpoint(r_desp=humidity)
+                await self._manager.send_command(
+                    "humidity_setpoint", self._zone, {"desp": humidity}, self._zone.perform_humidify_setpoint(r_desp=humidity)
+                )
             elif self._zone.humidityMode == LENNOX_HUMIDITY_MODE_HUMIDIFY:
-                await self._zone.perform_humidify_setpoint(r_husp=humidity)
+                await self._manager.send_command(
+                    "humidity_setpoint", self._zone, {"husp": humidity}, self._zone.perform_humidify_setpoint(r_husp=humidity)
+                )
         except S30Exception as ex:
             err = f"set_humidity [{self._myname}] [{ex.as_string()}]"
             raise HomeAssistantError(err) from ex
@@ -463,7 +630,7 @@ class S30Climate(S30BaseEntityMixin, ClimateEntity):
                 hvac_mode,
                 t_hvac_mode,
             )
-            await self._zone.setHVACMode(t_hvac_mode)
+            await self._manager.command_queue.set_hvac_mode(self._zone, t_hvac_mode)
             await self.async_trigger_fast_poll()
         except S30Exception as ex:
             err = f"set_hvac_mode [{self._myname}] [{ex.as_string()}]"
@@ -502,7 +669,7 @@ class S30Climate(S30BaseEntityMixin, ClimateEntity):
         if self.is_zone_disabled:
             return None
 
-        if self._system.get_away_mode():
+        if self.optimistic_value(self._system, "manualAwayMode") is True or self._system.get_smart_away_mode():
             return PRESET_AWAY
         if self._zone.overrideActive:
             return PRESET_SCHEDULE_OVERRIDE
@@ -550,10 +717,14 @@ class S30Climate(S30BaseEntityMixin, ClimateEntity):
             if preset_mode == PRESET_CANCEL_AWAY_MODE:
                 processed = False
                 if self._system.get_manual_away_mode():
-                    await self._system.set_manual_away_mode(False)
+                    await self._manager.send_command(
+                        "away_mode", self._system, {"manualAwayMode": False}, self._system.set_manual_away_mode(False)
+                    )
                     processed = True
                 if self._system.get_smart_away_mode():
-                    await self._system.cancel_smart_away()
+                    await self._manager.send_command(
+                        "cancel_smart_away", self._system, {"sa_setpointState": None}, self._system.cancel_smart_away()
+                    )
                     processed = True
                 if processed is False:
                     _LOGGER.warning("Ignoring request to cancel away mode because system is not in away mode")
@@ -561,21 +732,27 @@ class S30Climate(S30BaseEntityMixin, ClimateEntity):
                 await self.async_trigger_fast_poll()
                 return
             if preset_mode == PRESET_AWAY:
-                await self._system.set_manual_away_mode(True)
+                await self._manager.send_command(
+                    "away_mode", self._system, {"manualAwayMode": True}, self._system.set_manual_away_mode(True)
+                )
                 await self.async_trigger_fast_poll()
                 return
             # Need to cancel away modes before requesting a new preset
             if self._system.get_manual_away_mode():
-                await self._system.set_manual_away_mode(False)
+                await self._manager.send_command(
+                    "away_mode", self._system, {"manualAwayMode": False}, self._system.set_manual_away_mode(False)
+                )
             if self._system.get_smart_away_mode():
-                await self._system.cancel_smart_away()
+                await self._manager.send_command(
+                    "cancel_smart_away", self._system, {"sa_setpointState": None}, self._system.cancel_smart_away()
+                )
 
             if preset_mode == PRESET_CANCEL_HOLD:
-                await self._zone.setScheduleHold(False)
+                await self._manager.send_command("schedule_hold", self._zone, {"scheduleHold": False}, self._zone.setScheduleHold(False))
             elif preset_mode == PRESET_NONE:
-                await self._zone.setManualMode()
+                await self._manager.send_command("manual_mode", self._zone, {"scheduleId": None}, self._zone.setManualMode())
             else:
-                await self._zone.setSchedule(preset_mode)
+                await self._manager.send_command("schedule", self._zone, {"scheduleId": None}, self._zone.setSchedule(preset_mode))
 
             await self.async_trigger_fast_poll()
 
@@ -591,7 +768,7 @@ class S30Climate(S30BaseEntityMixin, ClimateEntity):
         """Return the current fan mode."""
         if self.is_zone_disabled:
             return None
-        return self._zone.getFanMode()
+        return self.optimistic_value(self._zone, "fanMode")
 
     @property
     def fan_modes(self) -> list[str]:
@@ -600,6 +777,75 @@ class S30Climate(S30BaseEntityMixin, ClimateEntity):
             return []
         return FAN_MODES
 
+    def _check_temperature_request(self, r_hvac_mode: str, r_temperature: float, r_csp: float, r_hsp: float) -> None:
+        """Raises an error if the combination of requested temperatures is not valid."""
+        # A temperature must be specified
+        if r_temperature is None and r_csp is None and r_hsp is None:
+            err = f"climate:async_set_temperature - no temperature given zone [{self._myname}]] hvacMode [{r_hvac_mode}] temperature [{r_temperature}] temp_high [{r_csp}] temp_low [{r_hsp}]"  # noqa: E501
+            raise HomeAssistantError(err)
+
+        # Either provide temperature or high/low but not both
+        if r_temperature is not None and (r_csp is not None or r_hsp is not None):
+            err = f"climate:async_set_temperature - provide either temperature or temp_high / low - zone [{self._myname}] hvacMode [{r_hvac_mode}] temperature [{r_temperature}] temp_high [{r_csp}] temp_low [{r_hsp}]"  # noqa: E501
+            raise HomeAssistantError(err)
+
+        # If no temperature, must specify both high and low
+        if r_temperature is None and (r_csp is None or r_hsp is None):
+            err = f"climate:async_set_temperature - must provide both temp_high / low - zone [{self._myname}] hvacMode [{r_hvac_mode}] temperature [{r_temperature}] temp_high [{r_csp}] temp_low [{r_hsp}]"  # noqa: E501
+            raise HomeAssistantError(err)
+
+        # If single setpoint mode, then must specify r_temperature and not high and low
+        if self._zone.system.single_setpoint_mode and r_temperature is None:
+            err = f"climate:async_set_temperature - zone in single setpoint mode must provide [{ATTR_TEMPERATURE}] - zone [{self._myname}]"
+            raise HomeAssistantError(err)
+
+    def _requested_setpoints(self, r_hvac_mode: str, r_temperature: float, r_csp: float, r_hsp: float) -> dict[str, float]:
+        """Returns the lennox_zone.perform_setpoint arguments for the requested temperatures in the hvac mode."""
+        if r_hvac_mode is None:
+            err = f"set_temperature System Mode is [{r_hvac_mode}] unable to set temperature"
+            raise S30Exception(err, EC_BAD_PARAMETERS, 10)
+        units = "" if self._manager.is_metric is False else "C"
+        if r_temperature is None:
+            return {f"r_hsp{units}": r_hsp, f"r_csp{units}": r_csp}
+        if self._zone.system.single_setpoint_mode:
+            return {f"r_sp{units}": r_temperature}
+        if r_hvac_mode == HVACMode.COOL:
+            return {f"r_csp{units}": r_temperature}
+        if r_hvac_mode == HVACMode.HEAT:
+            return {f"r_hsp{units}": r_temperature}
+        err = f"set_temperature System Mode is [{r_hvac_mode}] unable to set temperature"
+        raise S30Exception(err, EC_BAD_PARAMETERS, 11)
+
+    def zone_change(
+        self,
+        hvac_mode: str = None,
+        fan_mode: str = None,
+        temperature: float = None,
+        target_temp_high: float = None,
+        target_temp_low: float = None,
+    ) -> ZoneChange:
+        """Returns the change to the zone for the set_zones service, raises an error if the request is not valid."""
+        if self.is_zone_disabled:
+            raise HomeAssistantError(f"Unable to set_zones as zone [{self._myname}] is disabled")
+        if hvac_mode is not None and hvac_mode not in self.hvac_modes:
+            raise HomeAssistantError(f"set_zones zone [{self._myname}] does not support hvac_mode [{hvac_mode}]")
+        if fan_mode is not None and fan_mode not in self.fan_modes:
+            raise HomeAssistantError(f"set_zones zone [{self._myname}] does not support fan_mode [{fan_mode}]")
+        setpoints: dict[str, float] = {}
+        if temperature is not None or target_temp_high is not None or target_temp_low is not None:
+            self._check_temperature_request(hvac_mode, temperature, target_temp_high, target_temp_low)
+            try:
+                setpoints = self._requested_setpoints(
+                    hvac_mode if hvac_mode is not None else self.hvac_mode, temperature, target_temp_high, target_temp_low
+                )
+                self._zone.validate_setpoints(**setpoints)
+            except S30Exception as ex:
+                raise HomeAssistantError(f"set_zones [{self._myname}] [{ex.as_string()}]") from ex
+        elif hvac_mode is None and fan_mode is None:
+            raise HomeAssistantError(f"set_zones zone [{self._myname}] no changes requested")
+        lennox_mode = LENNOX_HVAC_HEAT_COOL if hvac_mode == HVACMode.HEAT_COOL else hvac_mode
+        return ZoneChange(self._zone, lennox_mode, setpoints, fan_mode)
+
     async def async_set_temperature(self, **kwargs: dict[str, Any]) -> None:
         """Set new target temperature."""
         if self.is_zone_disabled:
@@ -628,25 +874,7 @@ class S30Climate(S30BaseEntityMixin, ClimateEntity):
             r_hsp,
         )
 
-        # A temperature must be specified
-        if r_temperature is None and r_csp is None and r_hsp is None:
-            err = f"climate:async_set_temperature - no temperature given zone [{self._myname}]] hvacMode [{r_hvac_mode}] temperature [{r_temperature}] temp_high [{r_csp}] temp_low [{r_hsp}]"  # noqa: E501
-            raise HomeAssistantError(err)
-
-        # Either provide temperature or high/low but not both
-        if r_temperature is not None and (r_csp is not None or r_hsp is not None):
-            err = f"climate:async_set_temperature - provide either temperature or temp_high / low - zone [{self._myname}] hvacMode [{r_hvac_mode}] temperature [{r_temperature}] temp_high [{r_csp}] temp_low [{r_hsp}]"  # noqa: E501
-            raise HomeAssistantError(err)
-
-        # If no temperature, must specify both high and low
-        if r_temperature is None and (r_csp is None or r_hsp is None):
-            err = f"climate:async_set_temperature - must provide both temp_high / low - zone [{self._myname}] hvacMode [{r_hvac_mode}] temperature [{r_temperature}] temp_high [{r_csp}] temp_low [{r_hsp}]"  # noqa: E501
-            raise HomeAssistantError(err)
-
-        # If single setpoint mode, then must specify r_temperature and not high and low
-        if self._zone.system.single_setpoint_mode and r_temperature is None:
-            err = f"climate:async_set_temperature - zone in single setpoint mode must provide [{ATTR_TEMPERATURE}] - zone [{self._myname}]"
-            raise HomeAssistantError(err)
+        self._check_temperature_request(r_hvac_mode, r_temperature, r_csp, r_hsp)
 
         try:
             # If an HVAC mode is requested; and we are not in that mode, then the first step
@@ -658,50 +886,9 @@ class S30Climate(S30BaseEntityMixin, ClimateEntity):
             if r_hvac_mode is None:
                 r_hvac_mode = self.hvac_mode
 
-            if r_hvac_mode is None:
-                err = f"set_temperature System Mode is [{r_hvac_mode}] unable to set temperature"
-                raise S30Exception(err, EC_BAD_PARAMETERS, 10)
-
-            if r_temperature is not None:
-                if self._zone.system.single_setpoint_mode:
-                    _LOGGER.debug(
-                        "climate:async_set_temperature set_temperature in single_setpoint_modesystem - zone [%s] temperature [%s]",
-                        self._myname,
-                        r_temperature,
-                    )
-                    if self._manager.is_metric is False:
-                        await self._zone.perform_setpoint(r_sp=r_temperature)
-                    else:
-                        await self._zone.perform_setpoint(r_spC=r_temperature)
-                elif r_hvac_mode == HVACMode.COOL:
-                    _LOGGER.debug(
-                        "climate:async_set_temperature set_temperature system in cool mode - zone [%s] temperature [%s]",
-                        self._myname,
-                        r_temperature,
-                    )
-                    if self._manager.is_metric is False:
-                        await self._zone.perform_setpoint(r_csp=r_temperature)
-                    else:
-                        await self._zone.perform_setpoint(r_cspC=r_temperature)
-                elif r_hvac_mode == HVACMode.HEAT:
-                    _LOGGER.debug(
-                        "climate:async_set_temperature set_temperature system in heat mode - zone [%s] sp [%s]",
-                        self._myname,
-                        r_temperature,
-                    )
-                    if self._manager.is_metric is False:
-                        await self._zone.perform_setpoint(r_hsp=r_temperature)
-                    else:
-                        await self._zone.perform_setpoint(r_hspC=r_temperature)
-                else:
-                    err = f"set_temperature System Mode is [{r_hvac_mode}] unable to set temperature"
-                    raise S30Exception(err, EC_BAD_PARAMETERS, 11)
-            else:
-                _LOGGER.debug("climate:async_set_temperature zone [%s] csp [%s] hsp [%s]", self._myname, r_csp, r_hsp)
-                if self._manager.is_metric is False:
-                    await self._zone.perform_setpoint(r_hsp=r_hsp, r_csp=r_csp)
-                else:
-                    await self._zone.perform_setpoint(r_hspC=r_hsp, r_cspC=r_csp)
+            setpoints = self._requested_setpoints(r_hvac_mode, r_temperature, r_csp, r_hsp)
+            _LOGGER.debug("climate:async_set_temperature zone [%s] hvacMode [%s] setpoints %s", self._myname, r_hvac_mode, setpoints)
+            await self._manager.command_queue.set_setpoints(self._zone, **setpoints)
 
             await self.async_trigger_fast_poll()
 
@@ -719,7 +906,7 @@ class S30Climate(S30BaseEntityMixin, ClimateEntity):
             err = f"Unable to set_fan_mode as zone [{self._myname}] is disabled"
             raise HomeAssistantError(err)
         try:
-            await self._zone.setFanMode(fan_mode)
+            await self._manager.send_command("fan_mode", self._zone, {"fanMode": fan_mode}, self._zone.setFanMode(fan_mode))
             await self.async_trigger_fast_poll()
 
         except S30Exception as ex:
@@ -729,9 +916,6 @@ class S30Climate(S30BaseEntityMixin, ClimateEntity):
             err = f"set_fan_mode unexpected exception, please log issue, [{self._myname}] exception [{ex}]"
             raise HomeAssistantError(err) from ex
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return {
-            "identifiers": {(DOMAIN, self.unique_id)},
-        }
+
+class S30RestoreClimate(S30Climate, RestoreEntity):
+    """Lennox S30 thermostat restoring the temperature and humidity saved by Home Assistant, created when restore_state is enabled."""
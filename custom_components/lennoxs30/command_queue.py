@@ -0,0 +1,154 @@
+"""Collects the setpoint and mode changes made to a zone within a short window and sends them as one command."""
+
+# pylint: disable=line-too-long
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+from lennoxs30api import lennox_zone
+
+if TYPE_CHECKING:
+    from . import Manager
+
+_LOGGER = logging.getLogger(__name__)
+
+# perform_setpoint arguments that set the same setpoint, a later change to one replaces the others
+SETPOINT_GROUPS: dict[str, tuple[str, ...]] = {
+    "r_hsp": ("r_hsp", "r_hspC"),
+    "r_hspC": ("r_hsp", "r_hspC"),
+    "r_csp": ("r_csp", "r_cspC"),
+    "r_cspC": ("r_csp", "r_cspC"),
+    "r_sp": ("r_sp", "r_spC"),
+    "r_spC": ("r_sp", "r_spC"),
+}
+# Name used for the hvac mode in the pending changes
+MODE_FIELD = "systemMode"
+
+
+class _Waiter:
+    """A caller waiting for its changes to be sent."""
+
+    __slots__ = ("future", "fields")
+
+    def __init__(self, future: asyncio.Future, fields: set[str]) -> None:
+        self.future: asyncio.Future = future
+        self.fields: set[str] = fields
+
+
+class _PendingZone:
+    """Changes to a zone that have not been sent yet."""
+
+    __slots__ = ("mode", "setpoints", "waiters", "task")
+
+    def __init__(self) -> None:
+        self.mode: str = None
+        self.setpoints: dict[str, float] = {}
+        self.waiters: list[_Waiter] = []
+        self.task: asyncio.Task = None
+
+
+class ZoneCommandQueue:
+    """Last writer wins queue of the setpoint and mode changes to each zone.
+
+    The first change to a zone starts the debounce window, changes made within the window replace the pending value of
+    the same setpoint or mode. When the window ends the mode is sent followed by the setpoints in a single command. A
+    caller whose changes were all replaced returns without error, the others return once the command has been sent or
+    receive the exception raised sending it. A debounce of 0 sends each change immediately.
+    """
+
+    def __init__(self, manager: Manager, debounce: float) -> None:
+        self._manager: Manager = manager
+        self.debounce: float = debounce
+        self._pending: dict[str, _PendingZone] = {}
+        self.superseded: int = 0
+        self.sent: int = 0
+
+    async def set_hvac_mode(self, zone: lennox_zone, mode: str) -> None:
+        """Sets the hvac mode of the zone."""
+        if self.debounce <= 0:
+            await self._send_mode(zone, mode)
+            return
+        pending = self._get_pending(zone)
+        pending.mode = mode
+        await self._wait(zone, pending, {MODE_FIELD})
+
+    async def set_setpoints(self, zone: lennox_zone, **setpoints: float) -> None:
+        """Sets the setpoints of the zone, the arguments are those of lennox_zone.perform_setpoint."""
+        if self.debounce <= 0:
+            await self._send_setpoints(zone, setpoints)
+            return
+        pending = self._get_pending(zone)
+        for name, value in setpoints.items():
+            for related in SETPOINT_GROUPS[name]:
+                pending.setpoints.pop(related, None)
+            pending.setpoints[name] = value
+        await self._wait(zone, pending, set(setpoints.keys()))
+
+    def _get_pending(self, zone: lennox_zone) -> _PendingZone:
+        pending = self._pending.get(zone.unique_id)
+        if pending is None:
+            pending = self._pending[zone.unique_id] = _PendingZone()
+            pending.task = asyncio.create_task(self._flush_after_debounce(zone, pending))
+        return pending
+
+    async def _wait(self, zone: lennox_zone, pending: _PendingZone, fields: set[str]) -> None:
+        replaced = set()
+        for field in fields:
+            replaced.update(SETPOINT_GROUPS.get(field, (field,)))
+        for waiter in pending.waiters:
+            waiter.fields -= replaced
+            if len(waiter.fields) == 0 and not waiter.future.done():
+                self.superseded += 1
+                waiter.future.set_result(False)
+        pending.waiters = [waiter for waiter in pending.waiters if len(waiter.fields) != 0]
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), fields)
+        pending.waiters.append(waiter)
+        _LOGGER.debug("ZoneCommandQueue zone [%s] queued %s", zone.unique_id, sorted(fields))
+        await waiter.future
+
+    async def _flush_after_debounce(self, zone: lennox_zone, pending: _PendingZone) -> None:
+        try:
+            await asyncio.sleep(self.debounce)
+        finally:
+            # Changes made from here on start a new window
+            if self._pending.get(zone.unique_id) is pending:
+                del self._pending[zone.unique_id]
+        try:
+            if pending.mode is not None:
+                await self._send_mode(zone, pending.mode)
+            if len(pending.setpoints) != 0:
+                await self._send_setpoints(zone, pending.setpoints)
+        except asyncio.CancelledError:
+            for waiter in pending.waiters:
+                if not waiter.future.done():
+                    waiter.future.cancel()
+            raise
+        except Exception as ex:  # pylint: disable=broad-except
+            for waiter in pending.waiters:
+                if not waiter.future.done():
+                    waiter.future.set_exception(ex)
+            return
+        for waiter in pending.waiters:
+            if not waiter.future.done():
+                waiter.future.set_result(True)
+
+    async def _send_mode(self, zone: lennox_zone, mode: str) -> None:
+        self.sent += 1
+        await self._manager.send_command("hvac_mode", zone, {MODE_FIELD: mode}, zone.setHVACMode(mode))
+
+    async def _send_setpoints(self, zone: lennox_zone, setpoints: dict[str, float]) -> None:
+        self.sent += 1
+        # The tracked attribute of each argument is its name without the r_ prefix
+        attributes = {name[2:]: value for name, value in setpoints.items()}
+        await self._manager.send_command("setpoint", zone, attributes, zone.perform_setpoint(**setpoints))
+
+    def cancel(self) -> None:
+        """Cancels the changes that have not been sent."""
+        for pending in list(self._pending.values()):
+            pending.task.cancel()
+            for waiter in pending.waiters:
+                if not waiter.future.done():
+                    waiter.future.cancel()
+        self._pending.clear()
@@ -0,0 +1,144 @@
+"""Limits the number and rate of commands sent to a controller, the waiting commands are sent in priority order."""
+
+# pylint: disable=line-too-long
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from .histogram import TIMING_BUCKETS_MS, Histogram
+
+# Priority classes, lower values are sent first
+PRIORITY_USER = 0
+PRIORITY_PARAMETER = 1
+PRIORITY_DIAGNOSTIC = 2
+PRIORITY_NAMES: tuple[str, ...] = ("user", "parameter", "diagnostic")
+# Command types that are not interactive setpoint or mode changes
+COMMAND_PRIORITIES: dict[str, int] = {
+    "equipment_parameter": PRIORITY_PARAMETER,
+    "zone_test_parameter": PRIORITY_PARAMETER,
+    "diagnostic_level": PRIORITY_DIAGNOSTIC,
+}
+
+# Commands being sent to the controller at the same time
+DEFAULT_COMMAND_CONCURRENCY: int = 2
+# Commands per second allowed once the burst is used
+DEFAULT_COMMAND_RATE: float = 2.0
+# Commands that can be sent back to back after the controller has been idle
+DEFAULT_COMMAND_BURST: int = 6
+
+
+class CommandScheduler:
+    """Concurrency limit and token bucket rate limit for the commands sent to a controller.
+
+    A command waits until fewer than concurrency commands are in flight and a token is available, tokens are added at
+    rate per second up to burst. Waiting commands are released by priority and then in the order they arrived.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_COMMAND_CONCURRENCY,
+        rate: float = DEFAULT_COMMAND_RATE,
+        burst: int = DEFAULT_COMMAND_BURST,
+    ) -> None:
+        self.concurrency: int = concurrency
+        self.rate: float = rate
+        self.burst: int = burst
+        self.in_flight: int = 0
+        self.max_queued: int = 0
+        self.wait: tuple[Histogram, ...] = tuple(Histogram(TIMING_BUCKETS_MS) for _ in PRIORITY_NAMES)
+        self._clock = time.monotonic
+        self._tokens: float = float(burst)
+        self._updated: float = self._clock()
+        self._queue: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._timer: asyncio.TimerHandle = None
+
+    @property
+    def queued(self) -> int:
+        """Number of commands waiting to be sent."""
+        return sum(1 for _, _, future in self._queue if not future.done())
+
+    @asynccontextmanager
+    async def slot(self, priority: int = PRIORITY_USER) -> AsyncIterator[None]:
+        """Waits for the command to be allowed and holds its place in flight until the context exits."""
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self, priority: int = PRIORITY_USER) -> None:
+        """Waits until a command with the priority is allowed to be sent, release must be called once it completes."""
+        start = self._clock()
+        if len(self._queue) == 0 and self._take(start):
+            self.wait[priority].record(0.0)
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (priority, next(self._sequence), future))
+        self.max_queued = max(self.max_queued, self.queued)
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Cancelled after being allowed, give the place to the next command
+            if future.done() and not future.cancelled():
+                self.release()
+            else:
+                self._dispatch()
+            raise
+        self.wait[priority].record((self._clock() - start) * 1000.0)
+
+    def release(self) -> None:
+        """Called when a command allowed by acquire has completed."""
+        self.in_flight -= 1
+        self._dispatch()
+
+    def _take(self, now: float) -> bool:
+        if self.in_flight >= self.concurrency:
+            return False
+        self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        self.in_flight += 1
+        return True
+
+    def _dispatch(self) -> None:
+        while len(self._queue) != 0:
+            future = self._queue[0][2]
+            if future.done():
+                heapq.heappop(self._queue)
+                continue
+            if self._take(self._clock()) is False:
+                if self.in_flight < self.concurrency and self._timer is None:
+                    # Out of tokens, wake up when the next one is added
+                    delay = (1.0 - self._tokens) / self.rate
+                    self._timer = asyncio.get_running_loop().call_later(delay, self._on_timer)
+                return
+            heapq.heappop(self._queue)
+            future.set_result(None)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._dispatch()
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Returns the queue depth and the wait time percentiles in milliseconds of each priority."""
+        wait: dict[str, dict[str, Any]] = {}
+        for name, histogram in zip(PRIORITY_NAMES, self.wait):
+            if histogram.count != 0:
+                summary = histogram.as_dict()
+                summary.pop("buckets")
+                wait[name] = summary
+        return {
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "wait": wait,
+        }
@@ -0,0 +1,139 @@
+"""Measures the time from a command being sent until the controller reflects it."""
+
+# pylint: disable=line-too-long
+import logging
+import time
+from typing import Any, Callable
+
+from .histogram import TIMING_BUCKETS_MS, Histogram
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds to wait for the controller to reflect a command before it is counted as a timeout in the latency metrics
+COMMAND_CONFIRM_TIMEOUT: float = 120.0
+# Seconds the requested value of a command waiting for confirmation is shown when optimistic_state is enabled
+OPTIMISTIC_STATE_TIMEOUT: float = 15.0
+
+
+class PendingCommand:
+    """A command sent to the controller, the values of the attributes it is expected to change and the values requested."""
+
+    __slots__ = ("command_type", "target", "snapshot", "requested", "start")
+
+    def __init__(self, command_type: str, target: Any, snapshot: dict[str, Any], start: float, requested: dict[str, Any] = None) -> None:
+        self.command_type: str = command_type
+        self.target: Any = target
+        self.snapshot: dict[str, Any] = snapshot
+        self.requested: dict[str, Any] = requested if requested is not None else {}
+        self.start: float = start
+
+    def confirmed(self) -> bool:
+        """True once the attributes have the requested values, when no value is known once any of them has changed from the value it had when the command was sent."""
+        target = self.target
+        if len(self.requested) != 0:
+            for attr, value in self.requested.items():
+                if getattr(target, attr, None) != value:
+                    return False
+            return True
+        for attr, value in self.snapshot.items():
+            if getattr(target, attr, None) != value:
+                return True
+        return False
+
+
+class CommandTracker:
+    """Tracks the commands waiting for the controller to confirm them, the latencies are kept per command type."""
+
+    def __init__(self, timeout: float = COMMAND_CONFIRM_TIMEOUT, on_expire: Callable[[PendingCommand], None] = None) -> None:
+        self.timeout: float = timeout
+        # Called with each command that is not confirmed before the timeout
+        self.on_expire: Callable[[PendingCommand], None] = on_expire
+        self.pending: list[PendingCommand] = []
+        self.latency: dict[str, Histogram] = {}
+        self.timeouts: dict[str, int] = {}
+
+    @property
+    def expected(self) -> int:
+        """Number of commands waiting for the controller to reflect a known requested value."""
+        return sum(1 for pending in self.pending if len(pending.requested) != 0)
+
+    def start(self, command_type: str, target: Any, attributes: dict[str, Any], now: float = None) -> PendingCommand:
+        """Starts timing a command.
+
+        attributes maps each attribute of the target the command is expected to change to the requested value, or None
+        when the resulting value is not known. Attributes that already have the requested value are not expected to change,
+        when no attributes remain the command is not tracked and None is returned.
+        """
+        snapshot: dict[str, Any] = {}
+        requested_values: dict[str, Any] = {}
+        for attr, requested in attributes.items():
+            current = getattr(target, attr, None)
+            if requested is None or current != requested:
+                snapshot[attr] = current
+                if requested is not None:
+                    requested_values[attr] = requested
+        if len(snapshot) == 0:
+            return None
+        pending = PendingCommand(command_type, target, snapshot, time.monotonic() if now is None else now, requested_values)
+        self.pending.append(pending)
+        return pending
+
+    def cancel(self, pending: PendingCommand) -> None:
+        """Stops tracking a command that failed to send."""
+        if pending is not None and pending in self.pending:
+            self.pending.remove(pending)
+
+    def requested_value(self, target: Any, attr: str, default: Any, max_age: float = None, now: float = None) -> Any:
+        """Returns the value most recently requested for the attribute of the target by a command waiting for confirmation, otherwise default.
+
+        When max_age is set, commands sent more than max_age seconds ago are ignored.
+        """
+        oldest = None
+        if max_age is not None:
+            oldest = (time.monotonic() if now is None else now) - max_age
+        for pending in reversed(self.pending):
+            # Commands are in the order they were sent, the remaining ones are older
+            if oldest is not None and pending.start < oldest:
+                break
+            if pending.target is target and attr in pending.requested:
+                return pending.requested[attr]
+        return default
+
+    def check(self, now: float = None) -> list[PendingCommand]:
+        """Records the latency of the commands the controller has confirmed and expires those that timed out, returns the confirmed commands."""
+        if len(self.pending) == 0:
+            return []
+        if now is None:
+            now = time.monotonic()
+        confirmed: list[PendingCommand] = []
+        expired: list[PendingCommand] = []
+        remaining: list[PendingCommand] = []
+        for pending in self.pending:
+            if pending.confirmed():
+                histogram = self.latency.get(pending.command_type)
+                if histogram is None:
+                    histogram = self.latency[pending.command_type] = Histogram(TIMING_BUCKETS_MS)
+                histogram.record((now - pending.start) * 1000.0)
+                confirmed.append(pending)
+            elif now - pending.start > self.timeout:
+                self.timeouts[pending.command_type] = self.timeouts.get(pending.command_type, 0) + 1
+                _LOGGER.info("CommandTracker command [%s] not confirmed after [%s] seconds", pending.command_type, self.timeout)
+                expired.append(pending)
+            else:
+                remaining.append(pending)
+        self.pending = remaining
+        if self.on_expire is not None:
+            for pending in expired:
+                self.on_expire(pending)
+        return confirmed
+
+    def get_metrics(self) -> dict[str, dict[str, Any]]:
+        """Returns the latency percentiles in milliseconds and the number of timeouts for each command type."""
+        metrics: dict[str, dict[str, Any]] = {}
+        for command_type in sorted(self.latency.keys() | self.timeouts.keys()):
+            histogram = self.latency.get(command_type)
+            summary = histogram.as_dict() if histogram is not None else Histogram().as_dict()
+            summary.pop("buckets")
+            summary["timeouts"] = self.timeouts.get(command_type, 0)
+            metrics[command_type] = summary
+        return metrics
@@ -0,0 +1,173 @@
+"""Persists the last known configuration of each system so entities can be created before the controller responds."""
+
+# pylint: disable=line-too-long
+import copy
+import logging
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from lennoxs30api import lennox_system
+
+_LOGGER = logging.getLogger(__name__)
+
+CONFIG_CACHE_VERSION = 1
+# Seconds to wait before writing the cache after the topology changes, further changes are written with it.
+CONFIG_CACHE_SAVE_DELAY = 60
+
+# Fields of the messages that describe the topology and configuration of a system, True selects the whole value. Volatile
+# fields like temperatures, diagnostic values and sensor readings are not cached, neither are sections like alerts, schedules
+# and weather. Siblings are not cached as the api appends them on every message.
+CONFIG_CACHE_FIELDS = {
+    "system": {"config": True, "status": {"zoningMode": True, "numberOfZones": True}},
+    "zones": {"config": True},
+    "devices": {"device": True},
+    "equipments": {
+        "equipment": {
+            "equipType": True,
+            "features": True,
+            "parameters": True,
+            "diagnostics": {"diagnostic": {"name": True, "unit": True}},
+        }
+    },
+    "ble": {
+        "devices": {
+            "device": {
+                "deviceName": True,
+                "deviceType": True,
+                "wdn": True,
+                "config": True,
+                "devStatus": {"commStatus": True, "inputsStatus": {"status": {"vid": True, "name": True, "unit": True}}},
+            }
+        }
+    },
+}
+
+
+def select_fields(data: dict, fields: dict) -> dict:
+    """Returns the fields of the message data, lists are selected element by element keeping their ids. Empty values are left out"""
+    result = {}
+    for key, selection in fields.items():
+        if key not in data:
+            continue
+        value = data[key]
+        if selection is True:
+            result[key] = value
+        elif isinstance(value, dict):
+            selected = select_fields(value, selection)
+            if len(selected) != 0:
+                result[key] = selected
+        elif isinstance(value, list):
+            elements = []
+            for item in value:
+                if isinstance(item, dict):
+                    selected = select_fields(item, selection)
+                    if len(selected) != 0:
+                        if "id" in item:
+                            selected["id"] = item["id"]
+                        elements.append(selected)
+            if len(elements) != 0:
+                result[key] = elements
+    return result
+
+
+def _is_id_list(items: list) -> bool:
+    return len(items) > 0 and all(isinstance(item, dict) and "id" in item for item in items)
+
+
+def merge_message_data(target: dict, source: dict) -> bool:
+    """Merges a message into the snapshot, lists of elements with an id are merged by id. Returns True when the snapshot changed"""
+    changed = False
+    for key, value in source.items():
+        current = target.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            changed |= merge_message_data(current, value)
+        elif isinstance(value, list) and isinstance(current, list) and _is_id_list(value) and _is_id_list(current):
+            elements = {item["id"]: item for item in current}
+            for item in value:
+                element = elements.get(item["id"])
+                if element is None:
+                    element = copy.deepcopy(item)
+                    current.append(element)
+                    elements[item["id"]] = element
+                    changed = True
+                else:
+                    changed |= merge_message_data(element, item)
+        elif key not in target or current != value:
+            # Only the values that changed are copied, the message is not retained
+            target[key] = copy.deepcopy(value)
+            changed = True
+    return changed
+
+
+class ConfigCache:
+    """Snapshot of the configuration messages received from each system, stored in Home Assistant storage"""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store = Store(hass, CONFIG_CACHE_VERSION, f"lennoxs30.config_cache.{entry_id}")
+        self.systems: dict[str, dict] = {}
+        self.loaded: bool = False
+        self._dirty: bool = False
+        # Sections replaced by a live message since the cache was loaded
+        self._received: set[tuple[str, str]] = set()
+
+    async def async_load(self) -> None:
+        """Loads the snapshot from storage, a missing or unreadable snapshot results in an empty cache"""
+        if self.loaded:
+            return
+        self.loaded = True
+        try:
+            data = await self._store.async_load()
+        except Exception:
+            _LOGGER.exception("ConfigCache unable to load configuration cache [%s]", self._store.key)
+            return
+        if data is not None:
+            self.systems = data.get("systems", {})
+
+    def record(self, sys_id: str, data: dict) -> None:
+        """Merges the configuration fields of a message received from the system, the snapshot is written when they change.
+
+        The first message of each section received after loading is the configuration sent for the subscription, it replaces
+        the cached section so zones, devices and equipment removed from the system are not created again at the next startup.
+        """
+        sections = select_fields(data, CONFIG_CACHE_FIELDS)
+        if len(sections) == 0:
+            return
+        snapshot = self.systems.setdefault(sys_id, {})
+        changed = False
+        for section, value in sections.items():
+            if (sys_id, section) in self._received:
+                changed |= merge_message_data(snapshot, {section: value})
+                continue
+            self._received.add((sys_id, section))
+            if snapshot.get(section) != value:
+                snapshot[section] = copy.deepcopy(value)
+                changed = True
+        if changed:
+            self._dirty = True
+            self._store.async_delay_save(self._data_to_save, CONFIG_CACHE_SAVE_DELAY)
+
+    def replay(self, system: lennox_system) -> bool:
+        """Processes the cached snapshot for the system, returns True if there was one"""
+        snapshot = self.systems.get(system.sysId)
+        if snapshot is None:
+            return False
+        # Processing a message marks a cloud system as online, that is determined by the live connection
+        cloud_status = system.cloud_status
+        system.processMessage({"SenderID": system.sysId, "Data": copy.deepcopy(snapshot)})
+        system.cloud_status = cloud_status
+        return True
+
+    async def async_save(self) -> None:
+        """Writes the snapshot if it has changed since it was last written"""
+        if self._dirty:
+            await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        """Removes the snapshot from storage"""
+        self.systems = {}
+        self._dirty = False
+        await self._store.async_remove()
+
+    def _data_to_save(self) -> dict:
+        self._dirty = False
+        return {"systems": self.systems}
@@ -27,23 +27,40 @@ from lennoxs30api.s30exception import EC_LOGIN, S30Exception
 
 from . import Manager
 from .const import (
+    CONF_ADAPTIVE_POLLING,
     CONF_ALLERGEN_DEFENDER_SWITCH,
     CONF_APP_ID,
     CONF_CLOUD_CONNECTION,
+    CONF_COMMAND_DEBOUNCE,
     CONF_CREATE_DIAGNOSTICS_SENSORS,
     CONF_CREATE_INVERTER_POWER,
     CONF_CREATE_PARAMETERS,
     CONF_CREATE_SENSORS,
+    CONF_DIAG_EXTERNAL_STATISTICS,
+    CONF_DIAG_PUBLISH_POLICY,
+    CONF_DIAG_STATISTICS_INTERVAL,
     CONF_FAST_POLL_COUNT,
     CONF_FAST_POLL_INTERVAL,
+    CONF_HOT_PATH_SENSORS,
     CONF_INIT_WAIT_TIME,
     CONF_LOCAL_CONNECTION,
     CONF_LOG_MESSAGES_TO_FILE,
+    CONF_MAX_POLL_INTERVAL,
     CONF_MESSAGE_DEBUG_FILE,
     CONF_MESSAGE_DEBUG_LOGGING,
+    CONF_METRICS_REFRESH_INTERVAL,
+    CONF_OPTIMISTIC_STATE,
     CONF_PII_IN_MESSAGE_LOGS,
+    CONF_RESTORE_STATE,
+    CONF_SYSTEM_CONCURRENCY,
+    CONF_WARM_START,
     DEFAULT_CLOUD_TIMEOUT,
+    DEFAULT_COMMAND_DEBOUNCE,
+    DEFAULT_DIAG_STATISTICS_INTERVAL,
     DEFAULT_LOCAL_TIMEOUT,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_METRICS_REFRESH_INTERVAL,
+    DEFAULT_SYSTEM_CONCURRENCY,
     LENNOX_DEFAULT_CLOUD_APP_ID,
     LENNOX_DEFAULT_LOCAL_APP_ID,
 )
@@ -135,8 +152,28 @@ class Lennoxs30ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     vol.Coerce(float), vol.Range(min=0.25, max=300.0)
                 ),
                 vol.Optional(CONF_FAST_POLL_COUNT, default=DEFAULT_FAST_POLL_COUNT): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+                vol.Optional(CONF_ADAPTIVE_POLLING, default=False): cv.boolean,
+                vol.Optional(CONF_MAX_POLL_INTERVAL, default=DEFAULT_MAX_POLL_INTERVAL): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=3600)
+                ),
                 vol.Optional(CONF_INIT_WAIT_TIME, default=conf_wait_time): vol.All(vol.Coerce(int), vol.Range(min=1, max=300)),
                 vol.Optional(CONF_TIMEOUT, default=timeout): vol.All(vol.Coerce(int), vol.Range(min=15, max=300)),
+                vol.Optional(CONF_METRICS_REFRESH_INTERVAL, default=DEFAULT_METRICS_REFRESH_INTERVAL): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=3600)
+                ),
+                vol.Optional(CONF_SYSTEM_CONCURRENCY, default=DEFAULT_SYSTEM_CONCURRENCY): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=16)
+                ),
+                vol.Optional(CONF_WARM_START, default=False): cv.boolean,
+                vol.Optional(CONF_RESTORE_STATE, default=False): cv.boolean,
+                vol.Optional(CONF_HOT_PATH_SENSORS, default=False): cv.boolean,
+                vol.Optional(CONF_OPTIMISTIC_STATE, default=False): cv.boolean,
+                vol.Optional(CONF_DIAG_PUBLISH_POLICY, default=False): cv.boolean,
+                vol.Optional(CONF_DIAG_STATISTICS_INTERVAL, default=DEFAULT_DIAG_STATISTICS_INTERVAL): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=3600)
+                ),
+                vol.Optional(CONF_DIAG_EXTERNAL_STATISTICS, default=False): cv.boolean,
+                vol.Optional(CONF_COMMAND_DEBOUNCE, default=DEFAULT_COMMAND_DEBOUNCE): vol.All(vol.Coerce(float), vol.Range(min=0, max=10)),
                 vol.Optional(CONF_PII_IN_MESSAGE_LOGS, default=False): cv.boolean,
                 vol.Optional(CONF_MESSAGE_DEBUG_LOGGING, default=True): cv.boolean,
                 vol.Optional(CONF_LOG_MESSAGES_TO_FILE, default=False): cv.boolean,
@@ -350,9 +387,57 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                             CONF_FAST_POLL_COUNT,
                             default=self.config_entry.data[CONF_FAST_POLL_COUNT],
                         ): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+                        vol.Optional(
+                            CONF_ADAPTIVE_POLLING,
+                            default=self.config_entry.data.get(CONF_ADAPTIVE_POLLING, False),
+                        ): cv.boolean,
+                        vol.Optional(
+                            CONF_MAX_POLL_INTERVAL,
+                            default=self.config_entry.data.get(CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL),
+                        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=3600)),
                         vol.Optional(CONF_TIMEOUT, default=self.config_entry.data[CONF_TIMEOUT]): vol.All(
                             vol.Coerce(int), vol.Range(min=15, max=300)
                         ),
+                        vol.Optional(
+                            CONF_METRICS_REFRESH_INTERVAL,
+                            default=self.config_entry.data.get(CONF_METRICS_REFRESH_INTERVAL, DEFAULT_METRICS_REFRESH_INTERVAL),
+                        ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                        vol.Optional(
+                            CONF_SYSTEM_CONCURRENCY,
+                            default=self.config_entry.data.get(CONF_SYSTEM_CONCURRENCY, DEFAULT_SYSTEM_CONCURRENCY),
+                        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=16)),
+                        vol.Optional(
+                            CONF_WARM_START,
+                            default=self.config_entry.data.get(CONF_WARM_START, False),
+                        ): cv.boolean,
+                        vol.Optional(
+                            CONF_RESTORE_STATE,
+                            default=self.config_entry.data.get(CONF_RESTORE_STATE, False),
+                        ): cv.boolean,
+                        vol.Optional(
+                            CONF_HOT_PATH_SENSORS,
+                            default=self.config_entry.data.get(CONF_HOT_PATH_SENSORS, False),
+                        ): cv.boolean,
+                        vol.Optional(
+                            CONF_OPTIMISTIC_STATE,
+                            default=self.config_entry.data.get(CONF_OPTIMISTIC_STATE, False),
+                        ): cv.boolean,
+                        vol.Optional(
+                            CONF_DIAG_PUBLISH_POLICY,
+                            default=self.config_entry.data.get(CONF_DIAG_PUBLISH_POLICY, False),
+                        ): cv.boolean,
+                        vol.Optional(
+                            CONF_DIAG_STATISTICS_INTERVAL,
+                            default=self.config_entry.data.get(CONF_DIAG_STATISTICS_INTERVAL, DEFAULT_DIAG_STATISTICS_INTERVAL),
+                        ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                        vol.Optional(
+                            CONF_DIAG_EXTERNAL_STATISTICS,
+                            default=self.config_entry.data.get(CONF_DIAG_EXTERNAL_STATISTICS, False),
+                        ): cv.boolean,
+                        vol.Optional(
+                            CONF_COMMAND_DEBOUNCE,
+                            default=self.config_entry.data.get(CONF_COMMAND_DEBOUNCE, DEFAULT_COMMAND_DEBOUNCE),
+                        ): vol.All(vol.Coerce(float), vol.Range(min=0, max=10)),
                         vol.Optional(CONF_PROTOCOL, default=self.config_entry.data[CONF_PROTOCOL]): cv.string,
                         vol.Optional(
                             CONF_PII_IN_MESSAGE_LOGS,
@@ -407,9 +492,57 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                         CONF_FAST_POLL_COUNT,
                         default=self.config_entry.data[CONF_FAST_POLL_COUNT],
                     ): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+                    vol.Optional(
+                        CONF_ADAPTIVE_POLLING,
+                        default=self.config_entry.data.get(CONF_ADAPTIVE_POLLING, False),
+                    ): cv.boolean,
+                    vol.Optional(
+                        CONF_MAX_POLL_INTERVAL,
+                        default=self.config_entry.data.get(CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=3600)),
                     vol.Optional(CONF_TIMEOUT, default=self.config_entry.data[CONF_TIMEOUT]): vol.All(
                         vol.Coerce(int), vol.Range(min=15, max=300)
                     ),
+                    vol.Optional(
+                        CONF_METRICS_REFRESH_INTERVAL,
+                        default=self.config_entry.data.get(CONF_METRICS_REFRESH_INTERVAL, DEFAULT_METRICS_REFRESH_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                    vol.Optional(
+                        CONF_SYSTEM_CONCURRENCY,
+                        default=self.config_entry.data.get(CONF_SYSTEM_CONCURRENCY, DEFAULT_SYSTEM_CONCURRENCY),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=16)),
+                    vol.Optional(
+                        CONF_WARM_START,
+                        default=self.config_entry.data.get(CONF_WARM_START, False),
+                    ): cv.boolean,
+                    vol.Optional(
+                        CONF_RESTORE_STATE,
+                        default=self.config_entry.data.get(CONF_RESTORE_STATE, False),
+                    ): cv.boolean,
+                    vol.Optional(
+                        CONF_HOT_PATH_SENSORS,
+                        default=self.config_entry.data.get(CONF_HOT_PATH_SENSORS, False),
+                    ): cv.boolean,
+                    vol.Optional(
+                        CONF_OPTIMISTIC_STATE,
+                        default=self.config_entry.data.get(CONF_OPTIMISTIC_STATE, False),
+                    ): cv.boolean,
+                    vol.Optional(
+                        CONF_DIAG_PUBLISH_POLICY,
+                        default=self.config_entry.data.get(CONF_DIAG_PUBLISH_POLICY, False),
+                    ): cv.boolean,
+                    vol.Optional(
+                        CONF_DIAG_STATISTICS_INTERVAL,
+                        default=self.config_entry.data.get(CONF_DIAG_STATISTICS_INTERVAL, DEFAULT_DIAG_STATISTICS_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                    vol.Optional(
+                        CONF_DIAG_EXTERNAL_STATISTICS,
+                        default=self.config_entry.data.get(CONF_DIAG_EXTERNAL_STATISTICS, False),
+                    ): cv.boolean,
+                    vol.Optional(
+                        CONF_COMMAND_DEBOUNCE,
+                        default=self.config_entry.data.get(CONF_COMMAND_DEBOUNCE, DEFAULT_COMMAND_DEBOUNCE),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=10)),
                     vol.Optional(
                         CONF_PII_IN_MESSAGE_LOGS,
                         default=self.config_entry.data[CONF_PII_IN_MESSAGE_LOGS],
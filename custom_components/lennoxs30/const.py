@@ -17,9 +17,31 @@ CONF_MESSAGE_DEBUG_FILE = "message_debug_file"
 CONF_CLOUD_CONNECTION = "cloud_connection"
 CONF_LOCAL_CONNECTION = "local_connection"
 CONF_CREATE_PARAMETERS = "create_parameters"
+CONF_METRICS_REFRESH_INTERVAL = "metrics_refresh_interval"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_MAX_POLL_INTERVAL = "max_scan_interval"
+CONF_SYSTEM_CONCURRENCY = "system_concurrency"
+CONF_WARM_START = "warm_start"
+CONF_RESTORE_STATE = "restore_state"
+CONF_HOT_PATH_SENSORS = "hot_path_sensors"
+CONF_OPTIMISTIC_STATE = "optimistic_state"
+CONF_DIAG_PUBLISH_POLICY = "diagnostic_publish_policy"
+CONF_DIAG_STATISTICS_INTERVAL = "diagnostic_statistics_interval"
+CONF_DIAG_EXTERNAL_STATISTICS = "diagnostic_external_statistics"
+CONF_COMMAND_DEBOUNCE = "command_debounce"
 
 DEFAULT_CLOUD_TIMEOUT = 60
 DEFAULT_LOCAL_TIMEOUT = 30
+# Seconds between republishing the connection state metrics when the state has not changed, 0 publishes every poll.
+DEFAULT_METRICS_REFRESH_INTERVAL = 60
+# Upper limit in seconds the adaptive poll scheduler backs off to when the controller is quiet.
+DEFAULT_MAX_POLL_INTERVAL = 60
+# Number of systems subscribed or checked for cloud presence at the same time.
+DEFAULT_SYSTEM_CONCURRENCY = 4
+# Seconds zone setpoint and mode changes are collected before being sent as one command.
+DEFAULT_COMMAND_DEBOUNCE = 0.0
+# Seconds of diagnostic values aggregated into each published statistic, 0 publishes every change.
+DEFAULT_DIAG_STATISTICS_INTERVAL = 0
 
 LENNOX_DEFAULT_CLOUD_APP_ID = "mapp079372367644467046827001"
 LENNOX_DEFAULT_LOCAL_APP_ID = "homeassistant"
@@ -47,6 +69,7 @@ UNIQUE_ID_SUFFIX_BLE: Final = "_BLE"
 UNIQUE_ID_SUFFIX_BLE_COMMSTATUS: Final = "_BLE_COMMSTATUS"
 UNIQUE_ID_SUFFIX_VENTILATION_SELECT: Final = "_VENT_SELECT"
 UNIQUE_ID_SUFFIX_WIFI_RSSI: Final = "_WIFI_RSSI"
+UNIQUE_ID_SUFFIX_HOT_PATH: Final = "_HOT_PATH_"
 UNIQUE_ID_SUFFIX_EMERGENCY_HEAT: Final = "_EHEAT"
 UNIQUE_ID_SUFFIX_ZONEMODE_SELECT: Final = "_ZONE_MODE_SELECT"
 UNIQUE_ID_SUFFIX_HUM_SETPOINT: Final = "_HUM_SETPOINT"
@@ -9,6 +9,17 @@ from lennoxs30api.s30api_async import LennoxBle, lennox_equipment, lennox_system
 
 from .const import LENNOX_DOMAIN, LENNOX_MFG
 
+# Registry fields that are compared to determine if a device needs to be written to the registry again
+DEVICE_FINGERPRINT_FIELDS = (
+    "name",
+    "model",
+    "sw_version",
+    "hw_version",
+    "via_device",
+    "manufacturer",
+    "suggested_area",
+)
+
 
 class Device:
     """Represent a HASS device."""
@@ -29,6 +40,32 @@ class Device:
         """Generate Unique Name."""
         raise NotImplementedError
 
+    def registry_info(self) -> dict[str, any]:
+        """Return the device registry fields."""
+        raise NotImplementedError
+
+    def register_device(self, fingerprints: dict[str, tuple] = None) -> bool:
+        """Register the device with HASS.
+
+        When fingerprints is provided the registry is only written if the registry fields have changed since
+        the device was last registered. Returns True if the registry was written.
+        """
+        device_registry = dr.async_get(self._hass)
+        identifiers = {(LENNOX_DOMAIN, self.unique_name)}
+        registry_info = self.registry_info()
+        if fingerprints is not None:
+            fingerprint = tuple(registry_info.get(field) for field in DEVICE_FINGERPRINT_FIELDS)
+            if fingerprints.get(self.unique_name) == fingerprint and device_registry.async_get_device(identifiers=identifiers) is not None:
+                return False
+            fingerprints[self.unique_name] = fingerprint
+
+        device_registry.async_get_or_create(
+            config_entry_id=self._config_entry.entry_id,
+            identifiers=identifiers,
+            **registry_info,
+        )
+        return True
+
 
 class S30ControllerDevice(Device):
     """Represents S30 smart hub."""
@@ -45,20 +82,15 @@ class S30ControllerDevice(Device):
         """Create unique_id."""
         return self._system.unique_id
 
-    def register_device(self) -> None:
-        """Register the device with HASS."""
-        device_registry = dr.async_get(self._hass)
-
-        device_registry.async_get_or_create(
-            config_entry_id=self._config_entry.entry_id,
-            #            connections={(dr.CONNECTION_NETWORK_MAC, config.mac)},
-            identifiers={(LENNOX_DOMAIN, self.unique_name)},
-            manufacturer=LENNOX_MFG,
-            suggested_area="basement",
-            name=self._system.name,
-            model=self._system.productType,
-            sw_version=self._system.softwareVersion,
-        )
+    def registry_info(self) -> dict[str, any]:
+        """Return the device registry fields."""
+        return {
+            "manufacturer": LENNOX_MFG,
+            "suggested_area": "basement",
+            "name": self._system.name,
+            "model": self._system.productType,
+            "sw_version": self._system.softwareVersion,
+        }
 
 
 class S30OutdoorUnit(Device):
@@ -90,26 +122,22 @@ class S30OutdoorUnit(Device):
             return self.equipment.unit_model_number
         return self._system.outdoorUnitType
 
-    def register_device(self) -> None:
-        """Register device with HASS."""
-        device_registry = dr.async_get(self._hass)
+    def registry_info(self) -> dict[str, any]:
+        """Return the device registry fields."""
         if self.equipment is not None and self.equipment.equipment_type_name is not None:
             name = f"{self._system.name} {self.equipment.equipment_type_name}"
         elif self._system.outdoorUnitType is not None:
             name = f"{self._system.name} {self._system.outdoorUnitType}"
         else:
             name = f"{self._system.name} outdoor unit"
-
-        device_registry.async_get_or_create(
-            config_entry_id=self._config_entry.entry_id,
-            identifiers={(LENNOX_DOMAIN, self.unique_name)},
-            manufacturer=LENNOX_MFG,
-            suggested_area="outside",
-            name=name,
-            model=self.device_model,
-            hw_version=self.hw_version,
-            via_device=(LENNOX_DOMAIN, self._s30_controller_device.unique_name),
-        )
+        return {
+            "manufacturer": LENNOX_MFG,
+            "suggested_area": "outside",
+            "name": name,
+            "model": self.device_model,
+            "hw_version": self.hw_version,
+            "via_device": (LENNOX_DOMAIN, self._s30_controller_device.unique_name),
+        }
 
 
 class S30IndoorUnit(Device):
@@ -141,26 +169,22 @@ class S30IndoorUnit(Device):
             return self.equipment.unit_model_number
         return self._system.indoorUnitType
 
-    def register_device(self) -> None:
-        """Register device with HASS."""
-        device_registry = dr.async_get(self._hass)
+    def registry_info(self) -> dict[str, any]:
+        """Return the device registry fields."""
         if self.equipment is not None and self.equipment.equipment_type_name is not None:
             name = f"{self._system.name} {self.equipment.equipment_type_name}"
         elif self._system.indoorUnitType is not None:
             name = f"{self._system.name} {self._system.indoorUnitType}"
         else:
             name = f"{self._system.name} indoor unit"
-
-        device_registry.async_get_or_create(
-            config_entry_id=self._config_entry.entry_id,
-            identifiers={(LENNOX_DOMAIN, self.unique_name)},
-            manufacturer=LENNOX_MFG,
-            suggested_area="basement",
-            name=name,
-            model=self.device_model,
-            hw_version=self.hw_version,
-            via_device=(LENNOX_DOMAIN, self._s30_controller_device.unique_name),
-        )
+        return {
+            "manufacturer": LENNOX_MFG,
+            "suggested_area": "basement",
+            "name": name,
+            "model": self.device_model,
+            "hw_version": self.hw_version,
+            "via_device": (LENNOX_DOMAIN, self._s30_controller_device.unique_name),
+        }
 
 
 class S30AuxiliaryUnit(Device):
@@ -198,21 +222,17 @@ class S30AuxiliaryUnit(Device):
             return self.equipment.unit_model_number
         return None
 
-    def register_device(self) -> None:
-        """Register the device with HASS."""
-        device_registry = dr.async_get(self._hass)
+    def registry_info(self) -> dict[str, any]:
+        """Return the device registry fields."""
         name = f"{self._system.name} {self.equipment.equipment_type_name}"
-
-        device_registry.async_get_or_create(
-            config_entry_id=self._config_entry.entry_id,
-            identifiers={(LENNOX_DOMAIN, self.unique_name)},
-            manufacturer=LENNOX_MFG,
-            suggested_area="basement",
-            name=name,
-            model=self.device_model,
-            hw_version=self.hw_version,
-            via_device=(LENNOX_DOMAIN, self._s30_controller_device.unique_name),
-        )
+        return {
+            "manufacturer": LENNOX_MFG,
+            "suggested_area": "basement",
+            "name": name,
+            "model": self.device_model,
+            "hw_version": self.hw_version,
+            "via_device": (LENNOX_DOMAIN, self._s30_controller_device.unique_name),
+        }
 
 
 class S30VentilationUnit(Device):
@@ -244,20 +264,16 @@ class S30VentilationUnit(Device):
             return "Fresh Air Damper"
         return self._system.ventilationUnitType
 
-    def register_device(self) -> None:
-        """Register the device with HASS."""
-        device_registry = dr.async_get(self._hass)
+    def registry_info(self) -> dict[str, any]:
+        """Return the device registry fields."""
         name = f"{self._system.name} Ventilator"
-
-        device_registry.async_get_or_create(
-            config_entry_id=self._config_entry.entry_id,
-            identifiers={(LENNOX_DOMAIN, self.unique_name)},
-            manufacturer=LENNOX_MFG,
-            suggested_area="basement",
-            name=name,
-            model=self.device_model,
-            via_device=(LENNOX_DOMAIN, self._s30_controller_device.unique_name),
-        )
+        return {
+            "manufacturer": LENNOX_MFG,
+            "suggested_area": "basement",
+            "name": name,
+            "model": self.device_model,
+            "via_device": (LENNOX_DOMAIN, self._s30_controller_device.unique_name),
+        }
 
 
 class S30ZoneThermostat(Device):
@@ -284,18 +300,14 @@ class S30ZoneThermostat(Device):
         """Return unique_name."""
         return self._zone.unique_id
 
-    def register_device(self) -> None:
-        """Register the device with HASS."""
-        device_registry = dr.async_get(self._hass)
-
-        device_registry.async_get_or_create(
-            config_entry_id=self._config_entry.entry_id,
-            identifiers={(LENNOX_DOMAIN, self.unique_name)},
-            manufacturer=LENNOX_MFG,
-            name=self._system.name + "_" + self._zone.name,
-            model="thermostat",
-            via_device=(LENNOX_DOMAIN, self._s30_controller_device.unique_name),
-        )
+    def registry_info(self) -> dict[str, any]:
+        """Return the device registry fields."""
+        return {
+            "manufacturer": LENNOX_MFG,
+            "name": self._system.name + "_" + self._zone.name,
+            "model": "thermostat",
+            "via_device": (LENNOX_DOMAIN, self._s30_controller_device.unique_name),
+        }
 
 
 def helper_create_ble_device_id(system: lennox_system, ble_device: LennoxBle) -> str:
@@ -327,17 +339,13 @@ class S40BleDevice(Device):
         """Return  unique_name."""
         return helper_create_ble_device_id(self._system, self._ble_device)
 
-    def register_device(self) -> None:
-        """Register the device with HASS."""
-        device_registry = dr.async_get(self._hass)
-
-        device_registry.async_get_or_create(
-            config_entry_id=self._config_entry.entry_id,
-            identifiers={(LENNOX_DOMAIN, self.unique_name)},
-            manufacturer=LENNOX_MFG,
-            name=self._system.name + " " + self._ble_device.deviceName,
-            model=self._ble_device.controlModelNumber,
-            via_device=(LENNOX_DOMAIN, self._s30_controller_device.unique_name),
-            sw_version=self._ble_device.controlSoftwareVersion,
-            hw_version=self._ble_device.controlHardwareVersion,
-        )
+    def registry_info(self) -> dict[str, any]:
+        """Return the device registry fields."""
+        return {
+            "manufacturer": LENNOX_MFG,
+            "name": self._system.name + " " + self._ble_device.deviceName,
+            "model": self._ble_device.controlModelNumber,
+            "via_device": (LENNOX_DOMAIN, self._s30_controller_device.unique_name),
+            "sw_version": self._ble_device.controlSoftwareVersion,
+            "hw_version": self._ble_device.controlHardwareVersion,
+        }
@@ -0,0 +1,240 @@
+"""Captures the diagnostic updates of a system into a ring buffer and exports them to a file, without going through Home Assistant states."""
+
+# pylint: disable=line-too-long
+from __future__ import annotations
+
+import csv
+import logging
+import math
+import time
+from array import array
+from datetime import datetime
+
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from lennoxs30api import lennox_system
+
+from .const import LENNOX_DOMAIN, MANAGER
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_START_CAPTURE = "start_capture"
+SERVICE_STOP_CAPTURE = "stop_capture"
+SERVICE_EXPORT_CAPTURE = "export_capture"
+ATTR_CAPACITY = "capacity"
+ATTR_STOP = "stop"
+
+# Samples held per system, about 2 MB
+DEFAULT_CAPTURE_CAPACITY: int = 100000
+
+START_CAPTURE_SCHEMA = vol.Schema(
+    {vol.Optional(ATTR_CAPACITY, default=DEFAULT_CAPTURE_CAPACITY): vol.All(vol.Coerce(int), vol.Range(min=100, max=5000000))}
+)
+STOP_CAPTURE_SCHEMA = vol.Schema({})
+EXPORT_CAPTURE_SCHEMA = vol.Schema({vol.Optional(ATTR_STOP, default=False): cv.boolean})
+
+
+class DiagCapture:
+    """Diagnostic updates of a system in a preallocated columnar ring buffer.
+
+    Each sample is the time it was received, the index of its equipment_id_diagnostic_id key and its value. Values that
+    are not numbers are stored as NaN with the index of the text. When the buffer is full the oldest sample is
+    overwritten.
+    """
+
+    def __init__(self, system: lennox_system) -> None:
+        self.system: lennox_system = system
+        self.capturing: bool = False
+        self.overwritten: int = 0
+        self._keys: dict[str, int] = {}
+        self._texts: dict[str, int] = {}
+        self._times: array = array("d")
+        self._key_index: array = array("H")
+        self._values: array = array("d")
+        self._text_index: array = array("i")
+        self._first: int = 0
+        self._count: int = 0
+        # The library has no way to remove a callback, the capture registers once and ignores updates while stopped
+        system.registerOnUpdateCallbackDiag(self.diag_update_callback)
+
+    @property
+    def capacity(self) -> int:
+        """Number of samples the buffer holds."""
+        return len(self._times)
+
+    @property
+    def count(self) -> int:
+        """Number of samples held."""
+        return self._count
+
+    def start(self, capacity: int) -> None:
+        """Discards the samples held and starts capturing into a buffer of capacity samples."""
+        self._keys = {}
+        self._texts = {}
+        self._times = array("d", bytes(8 * capacity))
+        self._key_index = array("H", bytes(2 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        self._text_index = array("i", bytes(4 * capacity))
+        self._first = 0
+        self._count = 0
+        self.overwritten = 0
+        self.capturing = True
+
+    def stop(self) -> None:
+        """Stops capturing, the samples held remain available to export."""
+        self.capturing = False
+
+    def diag_update_callback(self, eid_did: str, newval: str) -> None:
+        """Records a diagnostic update."""
+        if not self.capturing:
+            return
+        key = self._keys.get(eid_did)
+        if key is None:
+            key = self._keys[eid_did] = len(self._keys)
+        try:
+            value = float(newval)
+            text = -1
+        except (TypeError, ValueError):
+            value = math.nan
+            text = self._texts.get(newval)
+            if text is None:
+                text = self._texts[newval] = len(self._texts)
+
+        capacity = len(self._times)
+        if self._count == capacity:
+            self._first = (self._first + 1) % capacity
+            self._count -= 1
+            self.overwritten += 1
+        index = (self._first + self._count) % capacity
+        self._times[index] = time.time()
+        self._key_index[index] = key
+        self._values[index] = value
+        self._text_index[index] = text
+        self._count += 1
+
+    def snapshot(self) -> CaptureSnapshot:
+        """Returns a copy of the samples held, oldest first, that can be written while the capture continues."""
+        end = self._first + self._count
+        capacity = len(self._times)
+
+        def ordered(column: array) -> array:
+            if end <= capacity:
+                return column[self._first : end]
+            return column[self._first :] + column[: end - capacity]
+
+        names: dict[str, str] = {}
+        for eid_did in self._keys:
+            names[eid_did] = eid_did
+            eid, did = eid_did.split("_", 1)
+            try:
+                names[eid_did] = self.system.equipment[int(eid)].diagnostics[int(did)].name
+            except (KeyError, IndexError, ValueError):
+                pass
+        return CaptureSnapshot(
+            list(self._keys),
+            names,
+            list(self._texts),
+            ordered(self._times),
+            ordered(self._key_index),
+            ordered(self._values),
+            ordered(self._text_index),
+        )
+
+
+class CaptureSnapshot:
+    """Copy of the samples of a capture."""
+
+    def __init__(
+        self,
+        keys: list[str],
+        names: dict[str, str],
+        texts: list[str],
+        times: array,
+        key_index: array,
+        values: array,
+        text_index: array,
+    ) -> None:
+        self.keys = keys
+        self.names = names
+        self.texts = texts
+        self.times = times
+        self.key_index = key_index
+        self.values = values
+        self.text_index = text_index
+
+    def write_csv(self, path: str) -> int:
+        """Writes the samples to a csv file, returns the number of samples written."""
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(["time", "equipment_id", "diagnostic_id", "name", "value"])
+            for received, key, value, text in zip(self.times, self.key_index, self.values, self.text_index):
+                eid_did = self.keys[key]
+                eid, did = eid_did.split("_", 1)
+                writer.writerow([f"{received:.3f}", eid, did, self.names[eid_did], self.texts[text] if text >= 0 else repr(value)])
+        return len(self.times)
+
+
+def _get_captures(hass: HomeAssistant, create: bool) -> list[DiagCapture]:
+    captures: list[DiagCapture] = []
+    for entry_data in hass.data.get(LENNOX_DOMAIN, {}).values():
+        manager = entry_data[MANAGER]
+        for system in manager.api.system_list:
+            capture = manager.diag_captures.get(system.sysId)
+            if capture is None and create:
+                capture = manager.diag_captures[system.sysId] = DiagCapture(system)
+            if capture is not None:
+                captures.append(capture)
+    return captures
+
+
+async def async_start_capture_service(call: ServiceCall) -> None:
+    """Starts capturing the diagnostic updates of every system."""
+    for capture in _get_captures(call.hass, True):
+        capture.start(call.data[ATTR_CAPACITY])
+        _LOGGER.info(
+            "start_capture sysId [%s] capacity [%d] diagLevel [%s]",
+            capture.system.sysId,
+            capture.capacity,
+            capture.system.diagLevel,
+        )
+        if capture.system.diagLevel not in (1, 2):
+            _LOGGER.warning(
+                "start_capture sysId [%s] diagnostics are not enabled, no samples will be captured until they are", capture.system.sysId
+            )
+
+
+async def async_stop_capture_service(call: ServiceCall) -> None:
+    """Stops capturing, the samples remain available to export."""
+    for capture in _get_captures(call.hass, False):
+        capture.stop()
+
+
+async def async_export_capture_service(call: ServiceCall) -> None:
+    """Writes the samples captured for each system to a csv file in the configuration directory."""
+    captures = _get_captures(call.hass, False)
+    if len(captures) == 0:
+        raise HomeAssistantError("export_capture no capture has been started, call lennoxs30.start_capture first")
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    for capture in captures:
+        if call.data[ATTR_STOP]:
+            capture.stop()
+        snapshot = capture.snapshot()
+        path = call.hass.config.path(f"lennoxs30_capture_{capture.system.sysId}_{timestamp}.csv")
+        try:
+            count = await call.hass.async_add_executor_job(snapshot.write_csv, path)
+        except OSError as ex:
+            raise HomeAssistantError(f"export_capture unable to write [{path}] [{ex}]") from ex
+        _LOGGER.info(
+            "export_capture sysId [%s] wrote [%d] samples to [%s] overwritten [%d]", capture.system.sysId, count, path, capture.overwritten
+        )
+
+
+def async_register_capture_services(hass: HomeAssistant) -> None:
+    """Registers the capture services, they are shared by all config entries."""
+    if hass.services.has_service(LENNOX_DOMAIN, SERVICE_START_CAPTURE):
+        return
+    hass.services.async_register(LENNOX_DOMAIN, SERVICE_START_CAPTURE, async_start_capture_service, schema=START_CAPTURE_SCHEMA)
+    hass.services.async_register(LENNOX_DOMAIN, SERVICE_STOP_CAPTURE, async_stop_capture_service, schema=STOP_CAPTURE_SCHEMA)
+    hass.services.async_register(LENNOX_DOMAIN, SERVICE_EXPORT_CAPTURE, async_export_capture_service, schema=EXPORT_CAPTURE_SCHEMA)
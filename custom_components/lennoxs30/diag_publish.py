@@ -0,0 +1,51 @@
+"""Deadband and interval rules that limit how often diagnostic sensor values are published."""
+
+# pylint: disable=line-too-long
+from __future__ import annotations
+
+from homeassistant.const import (
+    REVOLUTIONS_PER_MINUTE,
+    UnitOfElectricCurrent,
+    UnitOfElectricPotential,
+    UnitOfFrequency,
+    UnitOfTemperature,
+)
+
+
+class DiagPublishPolicy:
+    """When a new diagnostic value is published.
+
+    A value outside the deadband of the published value is published at most once every min_interval seconds. A value
+    within the deadband is published once the published value is max_staleness seconds old. A relative deadband is a
+    fraction of the published value.
+    """
+
+    __slots__ = ("deadband", "relative", "min_interval", "max_staleness")
+
+    def __init__(self, deadband: float, relative: bool = False, min_interval: float = 0.0, max_staleness: float = 300.0) -> None:
+        self.deadband: float = deadband
+        self.relative: bool = relative
+        self.min_interval: float = min_interval
+        self.max_staleness: float = max_staleness
+
+    def outside_deadband(self, published: float, value: float) -> bool:
+        """True when the value differs from the published value by more than the deadband."""
+        deadband = abs(published) * self.deadband if self.relative else self.deadband
+        return abs(value - published) > deadband
+
+    def due(self, published: float, value: float, published_at: float) -> float:
+        """Returns the time, on the time.monotonic clock, at which the value is to be published."""
+        if self.outside_deadband(published, value):
+            return published_at + self.min_interval
+        return published_at + self.max_staleness
+
+
+# Policies by Home Assistant unit of measurement, the values of other units are published on every change
+DIAG_PUBLISH_POLICIES: dict[str, DiagPublishPolicy] = {
+    UnitOfElectricPotential.VOLT: DiagPublishPolicy(2.0, min_interval=30.0),
+    UnitOfElectricCurrent.AMPERE: DiagPublishPolicy(0.05, relative=True, min_interval=30.0),
+    UnitOfFrequency.HERTZ: DiagPublishPolicy(1.0, min_interval=30.0),
+    REVOLUTIONS_PER_MINUTE: DiagPublishPolicy(0.02, relative=True, min_interval=30.0),
+    UnitOfTemperature.FAHRENHEIT: DiagPublishPolicy(0.5, min_interval=60.0),
+    UnitOfTemperature.CELSIUS: DiagPublishPolicy(0.3, min_interval=60.0),
+}
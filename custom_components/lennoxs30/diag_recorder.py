@@ -0,0 +1,155 @@
+"""Imports the hourly statistics of numeric diagnostics into the recorder as external statistics, without creating sensors for them."""
+
+# pylint: disable=line-too-long
+from __future__ import annotations
+
+import logging
+import time
+from datetime import datetime, timedelta
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMeanType, StatisticMetaData
+from homeassistant.components.recorder.statistics import STATISTIC_UNIT_TO_UNIT_CONVERTER, async_add_external_statistics
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_utc_time_change
+from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
+from lennoxs30api import lennox_system
+from lennoxs30api.lennox_equipment import lennox_equipment, lennox_equipment_diagnostic
+
+from .const import LENNOX_DOMAIN
+from .helpers import lennox_diagnostic_uom, lennox_uom_to_ha_uom
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DiagChannel:
+    """Time weighted mean, min and max of the values of a diagnostic received since the start of the hour."""
+
+    __slots__ = ("metadata", "value", "since", "area", "duration", "minimum", "maximum")
+
+    def __init__(self, metadata: StatisticMetaData, now: float, value: str) -> None:
+        self.metadata: StatisticMetaData = metadata
+        self.value: float = None
+        self.since: float = now
+        self.area: float = 0.0
+        self.duration: float = 0.0
+        self.minimum: float = None
+        self.maximum: float = None
+        self.update(now, value)
+
+    def update(self, now: float, newval: str) -> None:
+        """Accumulates the current value until now and replaces it, values that are not numbers end the current value."""
+        if self.value is not None:
+            self.area += self.value * (now - self.since)
+            self.duration += now - self.since
+        try:
+            self.value = float(newval)
+        except (TypeError, ValueError):
+            self.value = None
+        self.since = now
+        if self.value is not None:
+            self.minimum = self.value if self.minimum is None else min(self.minimum, self.value)
+            self.maximum = self.value if self.maximum is None else max(self.maximum, self.value)
+
+    def close(self, now: float) -> tuple[float, float, float] | None:
+        """Returns the mean, min and max until now and starts the next period with the current value, None when there was no value."""
+        self.update(now, self.value)
+        result = None
+        if self.duration > 0:
+            result = (self.area / self.duration, self.minimum, self.maximum)
+        self.area = 0.0
+        self.duration = 0.0
+        self.minimum = self.maximum = self.value
+        return result
+
+
+class DiagStatisticsImporter:
+    """Numeric diagnostics of a system aggregated per hour and imported into the recorder as external statistics.
+
+    The diagnostic updates are accumulated in process. At the end of each hour the mean, min and max of every channel
+    are imported, instead of a state being written for each change. The recorder imports the statistics of one
+    statistic_id per call, so there is one call per channel.
+    """
+
+    def __init__(self, hass: HomeAssistant, system: lennox_system) -> None:
+        self._hass: HomeAssistant = hass
+        self.system: lennox_system = system
+        self.channels: dict[str, DiagChannel] = {}
+        self.hour_start: datetime = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+        self.imported: int = 0
+
+    @staticmethod
+    def is_numeric(diagnostic: lennox_equipment_diagnostic) -> bool:
+        """Returns True for the diagnostics that would be created as measurement sensors."""
+        return lennox_diagnostic_uom(diagnostic) != ""
+
+    def add_channel(self, equipment: lennox_equipment, diagnostic: lennox_equipment_diagnostic) -> None:
+        """Aggregates the diagnostic, it must be numeric."""
+        eid_did = f"{equipment.equipment_id}_{diagnostic.diagnostic_id}"
+        unit = lennox_uom_to_ha_uom(lennox_diagnostic_uom(diagnostic))
+        converter = STATISTIC_UNIT_TO_UNIT_CONVERTER.get(unit)
+        suffix = str(equipment.equipment_id)
+        if equipment.equipment_id == 1:
+            suffix = "ou"
+        elif equipment.equipment_id == 2:
+            suffix = "iu"
+        metadata: StatisticMetaData = {
+            "mean_type": StatisticMeanType.ARITHMETIC,
+            "has_sum": False,
+            "name": f"{self.system.name} {suffix} {diagnostic.name}",
+            "source": LENNOX_DOMAIN,
+            "statistic_id": f"{LENNOX_DOMAIN}:{slugify(f'{self.system.unique_id}_diag_{eid_did}')}",
+            "unit_class": converter.UNIT_CLASS if converter is not None else None,
+            "unit_of_measurement": unit,
+        }
+        _LOGGER.debug(
+            "DiagStatisticsImporter add_channel sysId [%s] eid_did [%s] statistic_id [%s]",
+            self.system.sysId,
+            eid_did,
+            metadata["statistic_id"],
+        )
+        self.channels[eid_did] = DiagChannel(metadata, time.time(), diagnostic.value)
+
+    def async_start(self) -> CALLBACK_TYPE:
+        """Starts aggregating the diagnostic updates, returns the function that stops the hourly import."""
+        self.system.registerOnUpdateCallbackDiag(self.diag_update_callback)
+        return async_track_utc_time_change(self._hass, self.async_hour_elapsed, minute=0, second=0)
+
+    def diag_update_callback(self, eid_did: str, newval: str) -> None:
+        """Accumulates a diagnostic update."""
+        channel = self.channels.get(eid_did)
+        if channel is not None:
+            channel.update(time.time(), newval)
+
+    @callback
+    def async_hour_elapsed(self, now: datetime) -> None:
+        """Imports the statistics of the hour that ended."""
+        hour_end = now.replace(minute=0, second=0, microsecond=0)
+        if hour_end <= self.hour_start:
+            return
+        start = hour_end - timedelta(hours=1)
+        # When hours were missed the values since the last import can not be attributed to an hour, they are discarded
+        missed = self.hour_start < start
+        if missed:
+            _LOGGER.warning(
+                "DiagStatisticsImporter sysId [%s] hours missed since [%s], the diagnostic statistics until [%s] are not imported",
+                self.system.sysId,
+                self.hour_start,
+                hour_end,
+            )
+        self.hour_start = hour_end
+        recorder = "recorder" in self._hass.config.components
+        if not recorder:
+            _LOGGER.warning(
+                "DiagStatisticsImporter sysId [%s] the recorder is not loaded, diagnostic statistics are not imported", self.system.sysId
+            )
+        closed = time.time()
+        for channel in self.channels.values():
+            result = channel.close(closed)
+            if result is None or not recorder or missed:
+                continue
+            mean, minimum, maximum = result
+            statistic: StatisticData = {"start": start, "mean": mean, "min": minimum, "max": maximum}
+            async_add_external_statistics(self._hass, channel.metadata, [statistic])
+            self.imported += 1
+        _LOGGER.debug("DiagStatisticsImporter sysId [%s] hour [%s] imported [%d]", self.system.sysId, start, self.imported)
@@ -0,0 +1,88 @@
+"""Rolling window statistics of diagnostic values."""
+
+# pylint: disable=line-too-long
+from __future__ import annotations
+
+import math
+from array import array
+from typing import Any
+
+# Seconds between the diagnostic updates sent by the controller
+DIAG_UPDATE_INTERVAL: float = 4.0
+
+
+class DiagWindow:
+    """Values of a diagnostic received in the last window seconds.
+
+    The samples are stored in two fixed size arrays used as a ring buffer, sized for one change per diagnostic update
+    over the window, the oldest sample is overwritten when it is full. The last sample received before the window is
+    kept as the value at the start of the window.
+    """
+
+    __slots__ = ("window", "_times", "_values", "_first", "_count")
+
+    def __init__(self, window: float) -> None:
+        capacity = math.ceil(window / DIAG_UPDATE_INTERVAL) + 2
+        self.window: float = window
+        self._times: array = array("d", bytes(8 * capacity))
+        self._values: array = array("d", bytes(8 * capacity))
+        self._first: int = 0
+        self._count: int = 0
+
+    @property
+    def capacity(self) -> int:
+        """Number of samples the window holds."""
+        return len(self._times)
+
+    @property
+    def count(self) -> int:
+        """Number of samples held, including the value at the start of the window."""
+        return self._count
+
+    def add(self, now: float, value: float) -> None:
+        """Adds the value received at now, on the time.monotonic clock."""
+        capacity = len(self._times)
+        if self._count == capacity:
+            self._first = (self._first + 1) % capacity
+            self._count -= 1
+        index = (self._first + self._count) % capacity
+        self._times[index] = now
+        self._values[index] = value
+        self._count += 1
+
+    def statistics(self, now: float) -> dict[str, Any] | None:
+        """Returns the min, max, time weighted mean and last value in the window and the number of samples received in it, None when no value has been received."""
+        if self._count == 0:
+            return None
+        capacity = len(self._times)
+        start = now - self.window
+        # Drop the samples replaced before the start of the window
+        while self._count > 1 and self._times[(self._first + 1) % capacity] <= start:
+            self._first = (self._first + 1) % capacity
+            self._count -= 1
+
+        minimum = math.inf
+        maximum = -math.inf
+        area = 0.0
+        samples = 0
+        index = self._first
+        for i in range(self._count):
+            value = self._values[index]
+            received = self._times[index]
+            following = (index + 1) % capacity
+            end = self._times[following] if i + 1 < self._count else now
+            area += value * (end - max(received, start))
+            minimum = min(minimum, value)
+            maximum = max(maximum, value)
+            if received > start:
+                samples += 1
+            index = following
+        last = self._values[(self._first + self._count - 1) % capacity]
+        duration = now - max(self._times[self._first], start)
+        return {
+            "min": minimum,
+            "max": maximum,
+            "mean": area / duration if duration > 0 else last,
+            "last": last,
+            "samples": samples,
+        }
@@ -51,4 +51,7 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, config_entry:
         data["system"][system.sysId] = system_data
 
     data["comm_metrics"] = manager.getMetricsList()
+    data["startup_timings"] = manager.startup_timings
+    data["device_registrations"] = manager.device_registrations
+    data["hot_path"] = manager.get_hot_path_metrics()
     return data
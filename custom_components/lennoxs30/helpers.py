@@ -14,6 +14,7 @@ from typing import Any
 
 from homeassistant.const import (
     PERCENTAGE,
+    REVOLUTIONS_PER_MINUTE,
     UnitOfElectricCurrent,
     UnitOfElectricPotential,
     UnitOfFrequency,
@@ -22,7 +23,7 @@ from homeassistant.const import (
     UnitOfVolumeFlowRate,
 )
 from lennoxs30api import lennox_system
-from lennoxs30api.lennox_equipment import lennox_equipment, lennox_equipment_parameter
+from lennoxs30api.lennox_equipment import lennox_equipment, lennox_equipment_diagnostic, lennox_equipment_parameter
 
 from . import DOMAIN, Manager
 
@@ -54,6 +55,15 @@ def lennox_uom_to_ha_uom(unit: str) -> str:
     return unit
 
 
+def lennox_diagnostic_uom(diagnostic: lennox_equipment_diagnostic) -> str:
+    """Return the Lennox UOM of a diagnostic, empty when it has none."""
+    uom = diagnostic.unit.strip()
+    # Lennox does not provide a unit for RPM
+    if uom == "" and diagnostic.name.endswith("RPM"):
+        uom = REVOLUTIONS_PER_MINUTE
+    return uom
+
+
 def helper_get_equipment_device_info(manager: Manager, system: lennox_system, equipment_id: int) -> dict:
     """Construct the HASS device info for an entity."""
     equip_device_map = manager.system_equip_device_map.get(system.sysId)
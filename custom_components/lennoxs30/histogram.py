@@ -0,0 +1,81 @@
+"""Fixed size histograms used to record the timings of the integration."""
+
+# pylint: disable=line-too-long
+from array import array
+from bisect import bisect_left
+
+# Bucket upper bounds in milliseconds
+TIMING_BUCKETS_MS: tuple[float, ...] = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000, 60000)
+# Bucket upper bounds for counts
+COUNT_BUCKETS: tuple[float, ...] = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+
+class Histogram:
+    """Counts values into buckets with fixed upper bounds, the memory used does not grow with the number of values.
+
+    Percentiles are estimated as the upper bound of the bucket they fall in, values above the last bound are
+    counted in an overflow bucket whose upper bound is the largest value recorded.
+    """
+
+    def __init__(self, bounds: tuple[float, ...] = TIMING_BUCKETS_MS) -> None:
+        self.bounds: array = array("d", bounds)
+        self.counts: array = array("L", [0] * (len(bounds) + 1))
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = None
+
+    def record(self, value: float) -> None:
+        """Adds the value to the histogram."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def reset(self) -> None:
+        """Removes all values."""
+        for i in range(len(self.counts)):
+            self.counts[i] = 0
+        self.count = 0
+        self.total = 0.0
+        self.max = None
+
+    @property
+    def mean(self) -> float:
+        """Returns the mean of the values, None when empty."""
+        if self.count == 0:
+            return None
+        return self.total / self.count
+
+    def percentile(self, pct: float) -> float:
+        """Returns the estimated value below which pct percent of the values fall, None when empty."""
+        if self.count == 0:
+            return None
+        rank = pct / 100.0 * self.count
+        cumulative = 0
+        for i, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if bucket_count != 0 and cumulative >= rank:
+                if i == len(self.bounds):
+                    return self.max
+                return min(self.bounds[i], self.max)
+        return self.max
+
+    def as_dict(self) -> dict[str, any]:
+        """Returns a summary of the histogram."""
+        buckets: dict[str, int] = {}
+        for i, bound in enumerate(self.bounds):
+            if self.counts[i] != 0:
+                buckets[f"<={bound:g}"] = self.counts[i]
+        if self.counts[-1] != 0:
+            buckets[f">{self.bounds[-1]:g}"] = self.counts[-1]
+        mean = self.mean
+        return {
+            "count": self.count,
+            "mean": round(mean, 3) if mean is not None else None,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": round(self.max, 3) if self.max is not None else None,
+            "buckets": buckets,
+        }
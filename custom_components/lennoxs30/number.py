@@ -121,11 +121,15 @@ class DiagnosticLevelNumber(S30BaseEntityMixin, NumberEntity):
         self._hass = hass
         self._myname = self._system.name + "_diagnostic_level"
         _LOGGER.debug("Create DiagnosticLevelNumber myname [%s]", self._myname)
+        # HA fails with dashes in IDs
+        self._attr_unique_id = (self._system.unique_id + "_DL").replace("-", "")
+        self._attr_name = self._myname
+        self._attr_device_info = self._get_device_info()
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         _LOGGER.debug("async_added_to_hass DiagnosticLevelNumber myname [%s]", self._myname)
-        self._system.registerOnUpdateCallback(self.update_callback, ["diagLevel"])
+        self.register_update_callback(self._system, self.update_callback, ["diagLevel"])
         await super().async_added_to_hass()
 
     def update_callback(self):
@@ -133,15 +137,6 @@ class DiagnosticLevelNumber(S30BaseEntityMixin, NumberEntity):
         _LOGGER.debug("update_callback DiagnosticLevelNumber myname [%s]", self._myname)
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        # HA fails with dashes in IDs
-        return (self._system.unique_id + "_DL").replace("-", "")
-
-    @property
-    def name(self):
-        return self._myname
-
     @property
     def native_max_value(self) -> float:
         return 2
@@ -156,7 +151,7 @@ class DiagnosticLevelNumber(S30BaseEntityMixin, NumberEntity):
 
     @property
     def native_value(self) -> float:
-        return self._system.diagLevel
+        return self.optimistic_value(self._system, "diagLevel")
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
@@ -172,14 +167,15 @@ class DiagnosticLevelNumber(S30BaseEntityMixin, NumberEntity):
                     self._system.internetStatus,
                     self._system.relayServerConnected,
                 )
-            await self._system.set_diagnostic_level(value)
+            await self._manager.send_command(
+                "diagnostic_level", self._system, {"diagLevel": value}, self._system.set_diagnostic_level(value)
+            )
         except S30Exception as ex:
             raise HomeAssistantError(f"set_native_value [{self._myname}] [{ex.as_string()}]") from ex
         except Exception as ex:
             raise HomeAssistantError(f"set_native_value unexpected exception, please log issue, [{self._myname}] exception [{ex}]") from ex
 
-    @property
-    def device_info(self) -> DeviceInfo:
+    def _get_device_info(self) -> DeviceInfo:
         """Return device info."""
         result = {
             "identifiers": {(DOMAIN, self._system.unique_id)},
@@ -195,11 +191,16 @@ class DehumidificationOverCooling(S30BaseEntityMixin, NumberEntity):
         self._hass = hass
         self._myname = self._system.name + "_dehumidification_overcooling"
         _LOGGER.debug("Create DehumidificationOverCooling myname [%s]", self._myname)
+        # HA fails with dashes in IDs
+        self._attr_unique_id = (self._system.unique_id + "_DOC").replace("-", "")
+        self._attr_name = self._myname
+        self._attr_device_info = self._get_device_info()
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         _LOGGER.debug("async_added_to_hass DehumidificationOverCooling myname [%s]", self._myname)
-        self._system.registerOnUpdateCallback(
+        self.register_update_callback(
+            self._system,
             self.update_callback,
             [
                 "enhancedDehumidificationOvercoolingC_enable",
@@ -221,15 +222,6 @@ class DehumidificationOverCooling(S30BaseEntityMixin, NumberEntity):
         _LOGGER.debug("update_callback DehumidificationOverCooling myname [%s]", self._myname)
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        # HA fails with dashes in IDs
-        return (self._system.unique_id + "_DOC").replace("-", "")
-
-    @property
-    def name(self):
-        return self._myname
-
     @property
     def native_unit_of_measurement(self):
         if self._manager.is_metric is False:
@@ -257,24 +249,33 @@ class DehumidificationOverCooling(S30BaseEntityMixin, NumberEntity):
     @property
     def native_value(self) -> float:
         if self._manager.is_metric:
-            return self._system.enhancedDehumidificationOvercoolingC
-        return self._system.enhancedDehumidificationOvercoolingF
+            return self.optimistic_value(self._system, "enhancedDehumidificationOvercoolingC")
+        return self.optimistic_value(self._system, "enhancedDehumidificationOvercoolingF")
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
         _LOGGER.info(LOG_INFO_NUMBER_ASYNC_SET_VALUE, self.__class__.__name__, self._myname, value)
         try:
             if self._manager.is_metric:
-                await self._system.set_enhancedDehumidificationOvercooling(r_c=value)
+                await self._manager.send_command(
+                    "overcooling",
+                    self._system,
+                    {"enhancedDehumidificationOvercoolingC": value},
+                    self._system.set_enhancedDehumidificationOvercooling(r_c=value),
+                )
             else:
-                await self._system.set_enhancedDehumidificationOvercooling(r_f=value)
+                await self._manager.send_command(
+                    "overcooling",
+                    self._system,
+                    {"enhancedDehumidificationOvercoolingF": value},
+                    self._system.set_enhancedDehumidificationOvercooling(r_f=value),
+                )
         except S30Exception as ex:
             raise HomeAssistantError(f"set_native_value [{self._myname}] [{ex.as_string()}]") from ex
         except Exception as ex:
             raise HomeAssistantError(f"set_native_value unexpected exception, please log issue, [{self._myname}] exception [{ex}]") from ex
 
-    @property
-    def device_info(self) -> DeviceInfo:
+    def _get_device_info(self) -> DeviceInfo:
         """Return device info."""
         result = {
             "identifiers": {(DOMAIN, self._system.unique_id)},
@@ -290,11 +291,16 @@ class CirculateTime(S30BaseEntityMixin, NumberEntity):
         self._hass = hass
         self._myname = self._system.name + "_circulate_time"
         _LOGGER.debug("Create CirculateTime myname [%s]", self._myname)
+        # HA fails with dashes in IDs
+        self._attr_unique_id = (self._system.unique_id + "_CIRC_TIME").replace("-", "")
+        self._attr_name = self._myname
+        self._attr_device_info = self._get_device_info()
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         _LOGGER.debug("async_added_to_hass CirculateTime myname [%s]", self._myname)
-        self._system.registerOnUpdateCallback(
+        self.register_update_callback(
+            self._system,
             self.update_callback,
             [
                 "circulateTime",
@@ -307,15 +313,6 @@ class CirculateTime(S30BaseEntityMixin, NumberEntity):
         _LOGGER.debug("update_callback CirculateTime myname [%s]", self._myname)
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        # HA fails with dashes in IDs
-        return (self._system.unique_id + "_CIRC_TIME").replace("-", "")
-
-    @property
-    def name(self):
-        return self._myname
-
     @property
     def native_unit_of_measurement(self):
         return PERCENTAGE
@@ -334,21 +331,22 @@ class CirculateTime(S30BaseEntityMixin, NumberEntity):
 
     @property
     def native_value(self) -> float:
-        return self._system.circulateTime
+        return self.optimistic_value(self._system, "circulateTime")
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
         _LOGGER.info(LOG_INFO_NUMBER_ASYNC_SET_VALUE, self.__class__.__name__, self._myname, value)
 
         try:
-            await self._system.set_circulateTime(value)
+            await self._manager.send_command(
+                "circulate_time", self._system, {"circulateTime": value}, self._system.set_circulateTime(value)
+            )
         except S30Exception as ex:
             raise HomeAssistantError(f"set_native_value [{self._myname}] [{ex.as_string()}]") from ex
         except Exception as ex:
             raise HomeAssistantError(f"set_native_value unexpected exception, please log issue, [{self._myname}] exception [{ex}]") from ex
 
-    @property
-    def device_info(self) -> DeviceInfo:
+    def _get_device_info(self) -> DeviceInfo:
         """Return device info."""
         result = {
             "identifiers": {(DOMAIN, self._system.unique_id)},
@@ -364,11 +362,15 @@ class TimedVentilationNumber(S30BaseEntityMixin, NumberEntity):
         self._hass = hass
         self._myname = self._system.name + "_ventilate_now"
         _LOGGER.debug("Create TimedVentilationNumber myname [%s]", self._myname)
+        # HA fails with dashes in IDs
+        self._attr_unique_id = (self._system.unique_id + UNIQUE_ID_SUFFIX_TIMED_VENTILATION_NUMBER).replace("-", "")
+        self._attr_name = self._myname
+        self._attr_device_info = helper_get_equipment_device_info(self._manager, self._system, VENTILATION_EQUIPMENT_ID)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         _LOGGER.debug("async_added_to_hass TimedVentilationNumber myname [%s]", self._myname)
-        self._system.registerOnUpdateCallback(self.update_callback, ["ventilationRemainingTime"])
+        self.register_update_callback(self._system, self.update_callback, ["ventilationRemainingTime"])
         await super().async_added_to_hass()
 
     def update_callback(self):
@@ -376,15 +378,6 @@ class TimedVentilationNumber(S30BaseEntityMixin, NumberEntity):
         _LOGGER.debug("update_callback TimedVentilationNumber myname [%s]", self._myname)
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        # HA fails with dashes in IDs
-        return (self._system.unique_id + UNIQUE_ID_SUFFIX_TIMED_VENTILATION_NUMBER).replace("-", "")
-
-    @property
-    def name(self):
-        return self._myname
-
     @property
     def native_max_value(self) -> float:
         return 1440
@@ -408,7 +401,9 @@ class TimedVentilationNumber(S30BaseEntityMixin, NumberEntity):
         try:
             value_i = int(value)
             value_seconds = value_i * 60
-            await self._system.ventilation_timed(value_seconds)
+            await self._manager.send_command(
+                "timed_ventilation", self._system, {"ventilationRemainingTime": None}, self._system.ventilation_timed(value_seconds)
+            )
         except S30Exception as ex:
             raise HomeAssistantError(f"set_native_value [{self._myname}] [{ex.as_string()}]") from ex
         except ValueError as v:
@@ -420,11 +415,6 @@ class TimedVentilationNumber(S30BaseEntityMixin, NumberEntity):
     def native_unit_of_measurement(self):
         return UnitOfTime.MINUTES
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return helper_get_equipment_device_info(self._manager, self._system, VENTILATION_EQUIPMENT_ID)
-
 
 class EquipmentParameterNumber(S30BaseEntityMixin, NumberEntity):
     """Set timed ventilation."""
@@ -475,6 +465,12 @@ class EquipmentParameterNumber(S30BaseEntityMixin, NumberEntity):
         )
         self._attr_native_unit_of_measurement = lennox_uom_to_ha_uom(self.parameter.unit)
         self._attr_device_class = self._get_device_class()
+        # HA fails with dashes in IDs
+        self._attr_unique_id = (
+            f"{self._system.unique_id}_{UNIQUE_ID_SUFFIX_EQ_PARAM_NUMBER}_{self.equipment.equipment_id}_{self.parameter.pid}"
+        ).replace("-", "")
+        self._attr_name = self._myname
+        self._attr_device_info = helper_get_equipment_device_info(self._manager, self._system, self.equipment.equipment_id)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -501,17 +497,6 @@ class EquipmentParameterNumber(S30BaseEntityMixin, NumberEntity):
             )
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        # HA fails with dashes in IDs
-        return (f"{self._system.unique_id}_{UNIQUE_ID_SUFFIX_EQ_PARAM_NUMBER}_{self.equipment.equipment_id}_{self.parameter.pid}").replace(
-            "-", ""
-        )
-
-    @property
-    def name(self):
-        return self._myname
-
     @property
     def native_max_value(self) -> float:
         return float(self.parameter.range_max)
@@ -536,7 +521,12 @@ class EquipmentParameterNumber(S30BaseEntityMixin, NumberEntity):
             raise HomeAssistantError(f"Unable to set parameter [{self._myname}] parameter safety switch is on")
 
         try:
-            await self._system.set_equipment_parameter_value(self.equipment.equipment_id, self.parameter.pid, value)
+            await self._manager.send_command(
+                "equipment_parameter",
+                self.parameter,
+                {"value": None},
+                self._system.set_equipment_parameter_value(self.equipment.equipment_id, self.parameter.pid, value),
+            )
         except S30Exception as ex:
             raise HomeAssistantError(f"set_native_value [{self._myname}] [{ex.as_string()}]") from ex
         except Exception as ex:
@@ -552,11 +542,6 @@ class EquipmentParameterNumber(S30BaseEntityMixin, NumberEntity):
                 return NumberDeviceClass.TEMPERATURE
         return None
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return helper_get_equipment_device_info(self._manager, self._system, self.equipment.equipment_id)
-
     @property
     def entity_category(self):
         return EntityCategory.CONFIG
@@ -585,7 +570,12 @@ class EquipmentParameterNumber(S30BaseEntityMixin, NumberEntity):
                 f"EquipmentParameterNumber::async_set_zonetest_parameter invalid equipment for zoneTest [{self._myname}] set value to [{value}] equipment_id [{self.equipment.equipment_id}]"
             )
         try:
-            await self._system.set_zone_test_parameter_value(self.parameter.pid, value, enabled)
+            await self._manager.send_command(
+                "zone_test_parameter",
+                self.parameter,
+                {"value": None},
+                self._system.set_zone_test_parameter_value(self.parameter.pid, value, enabled),
+            )
         except S30Exception as ex:
             raise HomeAssistantError(f"async_set_zonetest_parameter [{self._myname}] [{ex.as_string()}]") from ex
         except Exception as ex:
@@ -615,7 +605,7 @@ class HumidifySetpointNumber(S30BaseEntityMixin, NumberEntity):
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         _LOGGER.debug("async_added_to_hass HumidifySetpointNumber myname [%s]", self._myname)
-        self._zone.registerOnUpdateCallback(self.update_callback)
+        self.register_update_callback(self._zone, self.update_callback)
         await super().async_added_to_hass()
 
     def update_callback(self) -> None:
@@ -633,13 +623,15 @@ class HumidifySetpointNumber(S30BaseEntityMixin, NumberEntity):
 
     @property
     def native_value(self) -> float:
-        return self._zone.husp
+        return self.optimistic_value(self._zone, "husp")
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
         _LOGGER.info(LOG_INFO_NUMBER_ASYNC_SET_VALUE, self.__class__.__name__, self._myname, value)
         try:
-            await self._zone.perform_humidify_setpoint(r_husp=value)
+            await self._manager.send_command(
+                "humidity_setpoint", self._zone, {"husp": value}, self._zone.perform_humidify_setpoint(r_husp=value)
+            )
         except S30Exception as ex:
             raise HomeAssistantError(f"set_native_value [{self._myname}] [{ex.as_string()}]") from ex
         except Exception as ex:
@@ -667,7 +659,7 @@ class DehumidifySetpointNumber(S30BaseEntityMixin, NumberEntity):
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         _LOGGER.debug("async_added_to_hass DehumidifySetpointNumber myname [%s]", self._myname)
-        self._zone.registerOnUpdateCallback(self.update_callback)
+        self.register_update_callback(self._zone, self.update_callback)
         await super().async_added_to_hass()
 
     def update_callback(self) -> None:
@@ -685,13 +677,15 @@ class DehumidifySetpointNumber(S30BaseEntityMixin, NumberEntity):
 
     @property
     def native_value(self) -> float:
-        return self._zone.desp
+        return self.optimistic_value(self._zone, "desp")
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
         _LOGGER.info(LOG_INFO_NUMBER_ASYNC_SET_VALUE, self.__class__.__name__, self._myname, value)
         try:
-            await self._zone.perform_humidify_setpoint(r_desp=value)
+            await self._manager.send_command(
+                "humidity_setpoint", self._zone, {"desp": value}, self._zone.perform_humidify_setpoint(r_desp=value)
+            )
         except S30Exception as ex:
             raise HomeAssistantError(f"set_native_value [{self._myname}] [{ex.as_string()}]") from ex
         except Exception as ex:
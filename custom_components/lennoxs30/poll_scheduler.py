@@ -0,0 +1,152 @@
+"""Schedulers that determine the interval between message retrieves."""
+
+# pylint: disable=line-too-long
+import time
+from array import array
+
+POLL_REASON_FIXED = "fixed"
+POLL_REASON_FAST_POLL = "fast_poll"
+POLL_REASON_CONFIRMATION = "confirmation"
+POLL_REASON_ACTIVITY = "activity"
+POLL_REASON_BACKOFF = "backoff"
+POLL_REASON_ACTIVE_HOURS = "active_hours"
+
+# Each day the activity learned for an hour is reduced by this factor, so the pattern follows changes in usage.
+HOURLY_ACTIVITY_DECAY: float = 0.9
+
+
+class PollScheduler:
+    """Polls at a fixed interval, after a command fast polls until the controller confirms it.
+
+    While commands are waiting for confirmation the scheduler fast polls until they are all confirmed, for at most
+    fast_poll_count retrieves after the last command was sent. A command that is not waiting for confirmation fast
+    polls for fast_poll_count retrieves.
+    """
+
+    def __init__(self, poll_interval: float, fast_poll_interval: float, fast_poll_count: int) -> None:
+        self.poll_interval: float = poll_interval
+        self.fast_poll_interval: float = fast_poll_interval
+        self.fast_poll_count: int = fast_poll_count
+        self.fast_poll_countdown: int = 0
+        self.pending_confirmations: int = 0
+        # Retrieves left to fast poll while waiting for confirmations, a command the controller never confirms
+        # does not keep the scheduler fast polling until it expires
+        self.confirmation_countdown: int = 0
+        self.interval: float = poll_interval
+        self.reason: str = POLL_REASON_FIXED
+
+    @property
+    def fast_polling(self) -> bool:
+        """True when the scheduler is fast polling."""
+        return self.fast_poll_countdown > 0 or (self.pending_confirmations > 0 and self.confirmation_countdown > 0)
+
+    def reset(self) -> None:
+        """Called when the message pump starts."""
+        self.fast_poll_countdown = 0
+        self.pending_confirmations = 0
+        self.confirmation_countdown = 0
+
+    def start_fast_poll(self, pending_confirmations: int = 0) -> None:
+        """Called when a command has been issued to the controller with the number of commands waiting for confirmation."""
+        self.pending_confirmations = pending_confirmations
+        self.fast_poll_countdown = self.fast_poll_count if pending_confirmations == 0 else 0
+        self.confirmation_countdown = self.fast_poll_count if pending_confirmations > 0 else 0
+
+    def on_retrieve(self, received: bool, now: float = None, pending_confirmations: int = 0) -> None:
+        """Called after each retrieve with whether messages were received and the number of commands still waiting for confirmation."""
+        if self.fast_poll_countdown > 0:
+            self.fast_poll_countdown -= 1
+        if pending_confirmations > self.pending_confirmations:
+            # A command was sent since the last retrieve
+            self.confirmation_countdown = self.fast_poll_count
+        elif self.confirmation_countdown > 0:
+            self.confirmation_countdown -= 1
+        self.pending_confirmations = pending_confirmations
+
+    def _fast_poll_interval(self) -> None:
+        reason = POLL_REASON_CONFIRMATION if self.pending_confirmations > 0 else POLL_REASON_FAST_POLL
+        self._set_interval(min(self.fast_poll_interval, self.poll_interval), reason)
+
+    def next_interval(self, now: float = None) -> float:
+        """Returns the seconds to wait before the next retrieve."""
+        if self.fast_polling:
+            self._fast_poll_interval()
+        else:
+            self._set_interval(self.poll_interval, POLL_REASON_FIXED)
+        return self.interval
+
+    def _set_interval(self, interval: float, reason: str) -> None:
+        self.interval = interval
+        self.reason = reason
+
+    def get_metrics(self) -> dict[str, any]:
+        """Returns the scheduler metrics."""
+        return {"poll_interval": self.interval, "poll_reason": self.reason}
+
+
+class AdaptivePollScheduler(PollScheduler):
+    """Backs off exponentially while the controller is quiet and returns to the poll interval on activity.
+
+    The number of retrieves that returned messages is tracked for each hour of the day, during hours that
+    are historically active the backoff is limited to twice the poll interval.
+    """
+
+    def __init__(
+        self,
+        poll_interval: float,
+        fast_poll_interval: float,
+        fast_poll_count: int,
+        max_poll_interval: float,
+        backoff_factor: float = 2.0,
+    ) -> None:
+        super().__init__(poll_interval, fast_poll_interval, fast_poll_count)
+        self.max_poll_interval: float = max(max_poll_interval, poll_interval)
+        self.backoff_factor: float = backoff_factor
+        self.hourly_activity: array = array("d", [0.0] * 24)
+        self.quiet_retrieves: int = 0
+        self._last_hour: int = None
+
+    @staticmethod
+    def _hour(now: float) -> int:
+        return time.localtime(now).tm_hour
+
+    def reset(self) -> None:
+        super().reset()
+        self.quiet_retrieves = 0
+
+    def start_fast_poll(self, pending_confirmations: int = 0) -> None:
+        super().start_fast_poll(pending_confirmations)
+        self.quiet_retrieves = 0
+
+    def on_retrieve(self, received: bool, now: float = None, pending_confirmations: int = 0) -> None:
+        super().on_retrieve(received, now, pending_confirmations)
+        if received is False:
+            self.quiet_retrieves += 1
+            return
+        self.quiet_retrieves = 0
+        hour = self._hour(time.time() if now is None else now)
+        if hour != self._last_hour:
+            # Entering the hour again, age what was learned on previous days
+            self.hourly_activity[hour] *= HOURLY_ACTIVITY_DECAY
+            self._last_hour = hour
+        self.hourly_activity[hour] += 1.0
+
+    def is_active_hour(self, now: float = None) -> bool:
+        """True when the hour of day has seen more activity than average."""
+        total = sum(self.hourly_activity)
+        if total == 0.0:
+            return False
+        return self.hourly_activity[self._hour(time.time() if now is None else now)] >= total / 24.0
+
+    def next_interval(self, now: float = None) -> float:
+        if self.fast_polling:
+            self._fast_poll_interval()
+        elif self.quiet_retrieves <= 1:
+            self._set_interval(self.poll_interval, POLL_REASON_ACTIVITY)
+        else:
+            backoff = min(self.poll_interval * self.backoff_factor ** min(self.quiet_retrieves - 1, 32), self.max_poll_interval)
+            if backoff > self.poll_interval * 2 and self.is_active_hour(now):
+                self._set_interval(self.poll_interval * 2, POLL_REASON_ACTIVE_HOURS)
+            else:
+                self._set_interval(backoff, POLL_REASON_BACKOFF)
+        return self.interval
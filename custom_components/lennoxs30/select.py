@@ -117,17 +117,23 @@ class HumidityModeSelect(S30BaseEntityMixin, SelectEntity):
         self._zone = zone
         self._myname = self._system.name + "_" + self._zone.name + "_humidity_mode"
         _LOGGER.debug("Create HumidityModeSelect myname [%s]", self._myname)
+        # HA fails with dashes in IDs
+        self._attr_unique_id = self._zone.unique_id + "_HMS"
+        self._attr_name = self._myname
+        self._attr_device_info = self._get_device_info()
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         _LOGGER.debug("async_added_to_hass HumidityModeSelect myname [%s]", self._myname)
-        self._zone.registerOnUpdateCallback(
+        self.register_update_callback(
+            self._zone,
             self.zone_update_callback,
             [
                 "humidityMode",
             ],
         )
-        self._system.registerOnUpdateCallback(
+        self.register_update_callback(
+            self._system,
             self.system_update_callback,
             [
                 "zoningMode",
@@ -155,20 +161,11 @@ class HumidityModeSelect(S30BaseEntityMixin, SelectEntity):
             )
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        # HA fails with dashes in IDs
-        return self._zone.unique_id + "_HMS"
-
-    @property
-    def name(self):
-        return self._myname
-
     @property
     def current_option(self) -> str:
         if self._zone.is_zone_disabled:
             return None
-        return self._zone.humidityMode
+        return self.optimistic_value(self._zone, "humidityMode")
 
     @property
     def options(self) -> list:
@@ -189,14 +186,13 @@ class HumidityModeSelect(S30BaseEntityMixin, SelectEntity):
         if self._zone.is_zone_disabled:
             raise HomeAssistantError(f"Unable to control humidity mode as zone [{self._myname}] is disabled")
         try:
-            await self._zone.setHumidityMode(option)
+            await self._manager.send_command("humidity_mode", self._zone, {"humidityMode": option}, self._zone.setHumidityMode(option))
         except S30Exception as ex:
             raise HomeAssistantError(f"select_option [{self._myname}] [{ex.as_string()}]") from ex
         except Exception as ex:
             raise HomeAssistantError(f"select_option unexpected exception, please log issue, [{self._myname}] exception [{ex}]") from ex
 
-    @property
-    def device_info(self) -> DeviceInfo:
+    def _get_device_info(self) -> DeviceInfo:
         """Return device info."""
         result = {
             "identifiers": {(DOMAIN, self._zone.unique_id)},
@@ -217,11 +213,16 @@ class DehumidificationModeSelect(S30BaseEntityMixin, SelectEntity):
         self.hass: HomeAssistant = hass
         self._myname = self._system.name + "_dehumidification_mode"
         _LOGGER.debug("Create DehumidificationModeSelect myname [%s]", self._myname)
+        # HA fails with dashes in IDs
+        self._attr_unique_id = self._system.unique_id + "_DHMS"
+        self._attr_name = self._myname
+        self._attr_device_info = self._get_device_info()
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         _LOGGER.debug("async_added_to_hass DehumidificationModeSelect myname %s]", self._myname)
-        self._system.registerOnUpdateCallback(
+        self.register_update_callback(
+            self._system,
             self.system_update_callback,
             [
                 "dehumidificationMode",
@@ -239,22 +240,14 @@ class DehumidificationModeSelect(S30BaseEntityMixin, SelectEntity):
             )
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        # HA fails with dashes in IDs
-        return self._system.unique_id + "_DHMS"
-
-    @property
-    def name(self):
-        return self._myname
-
     @property
     def current_option(self) -> str:
-        if self._system.dehumidificationMode == LENNOX_DEHUMIDIFICATION_MODE_HIGH:
+        mode = self.optimistic_value(self._system, "dehumidificationMode")
+        if mode == LENNOX_DEHUMIDIFICATION_MODE_HIGH:
             return "max"
-        if self._system.dehumidificationMode == LENNOX_DEHUMIDIFICATION_MODE_MEDIUM:
+        if mode == LENNOX_DEHUMIDIFICATION_MODE_MEDIUM:
             return "normal"
-        if self._system.dehumidificationMode == LENNOX_DEHUMIDIFICATION_MODE_AUTO:
+        if mode == LENNOX_DEHUMIDIFICATION_MODE_AUTO:
             return "climate IQ"
         return None
 
@@ -276,14 +269,15 @@ class DehumidificationModeSelect(S30BaseEntityMixin, SelectEntity):
                 f"DehumidificationModeSelect select option - invalid mode [{option}] requested must be in [normal, climate IQ, max]"
             )
         try:
-            await self._system.set_dehumidificationMode(mode)
+            await self._manager.send_command(
+                "dehumidification_mode", self._system, {"dehumidificationMode": mode}, self._system.set_dehumidificationMode(mode)
+            )
         except S30Exception as ex:
             raise HomeAssistantError(f"select_option [{self._myname}] [{ex.as_string()}]") from ex
         except Exception as ex:
             raise HomeAssistantError(f"select_option unexpected exception, please log issue, [{self._myname}] exception [{ex}]") from ex
 
-    @property
-    def device_info(self) -> DeviceInfo:
+    def _get_device_info(self) -> DeviceInfo:
         """Return device info."""
         result = {
             "identifiers": {(DOMAIN, self._system.unique_id)},
@@ -308,6 +302,12 @@ class EquipmentParameterSelect(S30BaseEntityMixin, SelectEntity):
         self.parameter = parameter
         self._myname = helper_create_equipment_entity_name(system, equipment, parameter.name, prefix="par")
         _LOGGER.debug("Create EquipmentParameterSelect myname [%s]", self._myname)
+        # HA fails with dashes in IDs
+        self._attr_unique_id = (
+            f"{self._system.unique_id}_{UNIQUE_ID_SUFFIX_EQ_PARAM_SELECT}_{self.equipment.equipment_id}_{self.parameter.pid}"
+        ).replace("-", "")
+        self._attr_name = self._myname
+        self._attr_device_info = helper_get_equipment_device_info(self._manager, self._system, self.equipment.equipment_id)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -324,17 +324,6 @@ class EquipmentParameterSelect(S30BaseEntityMixin, SelectEntity):
             _LOGGER.debug("system_update_callback EquipmentParameterSelect myname [%s]  [%s]", self._myname, pid)
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        # HA fails with dashes in IDs
-        return (f"{self._system.unique_id}_{UNIQUE_ID_SUFFIX_EQ_PARAM_SELECT}_{self.equipment.equipment_id}_{self.parameter.pid}").replace(
-            "-", ""
-        )
-
-    @property
-    def name(self):
-        return self._myname
-
     @property
     def current_option(self) -> str:
         try:
@@ -363,7 +352,12 @@ class EquipmentParameterSelect(S30BaseEntityMixin, SelectEntity):
             raise HomeAssistantError(f"Unable to set parameter [{self._myname}] parameter safety switch is on")
 
         try:
-            await self._system.set_equipment_parameter_value(self.equipment.equipment_id, self.parameter.pid, option)
+            await self._manager.send_command(
+                "equipment_parameter",
+                self.parameter,
+                {"value": None},
+                self._system.set_equipment_parameter_value(self.equipment.equipment_id, self.parameter.pid, option),
+            )
         except S30Exception as ex:
             raise HomeAssistantError(f"select_option [{self._myname}] [{option}] [{ex.as_string()}]") from ex
         except Exception as ex:
@@ -371,11 +365,6 @@ class EquipmentParameterSelect(S30BaseEntityMixin, SelectEntity):
                 f"select_option unexpected exception, please log issue, [{self._myname}] [{option}] exception [{ex}]"
             ) from ex
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return helper_get_equipment_device_info(self._manager, self._system, self.equipment.equipment_id)
-
     @property
     def entity_category(self):
         return EntityCategory.CONFIG
@@ -398,11 +387,16 @@ class VentilationModeSelect(S30BaseEntityMixin, SelectEntity):
         self.hass: HomeAssistant = hass
         self._myname = self._system.name + "_ventilation_mode"
         _LOGGER.debug("Create VentilationModeSelect myname [%s]", self._myname)
+        # HA fails with dashes in IDs
+        self._attr_unique_id = self._system.unique_id + UNIQUE_ID_SUFFIX_VENTILATION_SELECT
+        self._attr_name = self._myname
+        self._attr_device_info = self._get_device_info()
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         _LOGGER.debug("async_added_to_hass VentilationModeSelect myname [%s]", self._myname)
-        self._system.registerOnUpdateCallback(
+        self.register_update_callback(
+            self._system,
             self.system_update_callback,
             [
                 "ventilationMode",
@@ -421,18 +415,9 @@ class VentilationModeSelect(S30BaseEntityMixin, SelectEntity):
             )
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        # HA fails with dashes in IDs
-        return self._system.unique_id + UNIQUE_ID_SUFFIX_VENTILATION_SELECT
-
-    @property
-    def name(self):
-        return self._myname
-
     @property
     def current_option(self) -> str:
-        return self._system.ventilationMode
+        return self.optimistic_value(self._system, "ventilationMode")
 
     @property
     def options(self) -> list:
@@ -442,18 +427,19 @@ class VentilationModeSelect(S30BaseEntityMixin, SelectEntity):
         _LOGGER.info(LOG_INFO_SELECT_ASYNC_SELECT_OPTION, self.__class__.__name__, self._myname, option)
         try:
             if option == LENNOX_VENTILATION_MODE_ON:
-                await self._system.ventilation_on()
+                await self._manager.send_command("ventilation", self._system, {"ventilationMode": "on"}, self._system.ventilation_on())
             elif option == LENNOX_VENTILATION_MODE_OFF:
-                await self._system.ventilation_off()
+                await self._manager.send_command("ventilation", self._system, {"ventilationMode": "off"}, self._system.ventilation_off())
             elif option == LENNOX_VENTILATION_MODE_INSTALLER:
-                await self._system.ventilation_installer()
+                await self._manager.send_command(
+                    "ventilation", self._system, {"ventilationMode": "installer"}, self._system.ventilation_installer()
+                )
             else:
                 raise HomeAssistantError(f"select_option [{self._myname}] invalid mode [{option}]")
         except Exception as ex:
             raise HomeAssistantError(f"select_option unexpected exception, [{self._myname}] exception [{ex}]") from ex
 
-    @property
-    def device_info(self) -> DeviceInfo:
+    def _get_device_info(self) -> DeviceInfo:
         """Return device info."""
         result = {
             "identifiers": {(DOMAIN, self._system.unique_id)},
@@ -483,12 +469,16 @@ class ZoneModeSelect(S30BaseEntityMixin, SelectEntity):
         self._zone = zone
         self._myname = f"{self._system.name}_{self._zone.name}_hvac_mode"
         _LOGGER.debug("Create ZoneModeSelect myname [%s]", self._myname)
+        # HA fails with dashes in IDs
+        self._attr_unique_id = self._zone.unique_id + UNIQUE_ID_SUFFIX_ZONEMODE_SELECT
+        self._attr_name = self._myname
+        self._attr_device_info = self._get_device_info()
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         _LOGGER.debug("async_added_to_hass VentilationModeSelect myname [%s]", self._myname)
-        self._zone.registerOnUpdateCallback(self.zone_update_callback, ["systemMode"])
-        self._system.registerOnUpdateCallback(self.system_update_callback, ["zoningMode"])
+        self.register_update_callback(self._zone, self.zone_update_callback, ["systemMode"])
+        self.register_update_callback(self._system, self.system_update_callback, ["zoningMode"])
         await super().async_added_to_hass()
 
     def zone_update_callback(self):
@@ -509,18 +499,9 @@ class ZoneModeSelect(S30BaseEntityMixin, SelectEntity):
             )
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        # HA fails with dashes in IDs
-        return self._zone.unique_id + UNIQUE_ID_SUFFIX_ZONEMODE_SELECT
-
-    @property
-    def name(self):
-        return self._myname
-
     @property
     def current_option(self) -> str:
-        r = self._zone.getSystemMode()
+        r = self.optimistic_value(self._zone, "systemMode")
         if r == LENNOX_HVAC_HEAT_COOL:
             r = HVACMode.HEAT_COOL
         return r
@@ -553,7 +534,7 @@ class ZoneModeSelect(S30BaseEntityMixin, SelectEntity):
                 option,
                 hvac_mode,
             )
-            await self._zone.setHVACMode(hvac_mode)
+            await self._manager.command_queue.set_hvac_mode(self._zone, hvac_mode)
         except S30Exception as ex:
             raise HomeAssistantError(f"async_select_option [{self._myname}] [{ex.as_string()}]") from ex
         except Exception as ex:
@@ -561,8 +542,7 @@ class ZoneModeSelect(S30BaseEntityMixin, SelectEntity):
                 f"async_select_option unexpected exception, please log issue, [{self._myname}] exception [{ex}]"
             ) from ex
 
-    @property
-    def device_info(self) -> DeviceInfo:
+    def _get_device_info(self) -> DeviceInfo:
         """Return device info."""
         result = {
             "identifiers": {(DOMAIN, self._zone.unique_id)},
@@ -5,10 +5,14 @@
 # pylint: disable=unused-argument
 # pylint: disable=line-too-long
 # pylint: disable=invalid-name
+import asyncio
 import logging
+import time
+from datetime import datetime, timedelta
 from typing import Any
 
 from homeassistant.components.sensor import (
+    RestoreSensor,
     SensorDeviceClass,
     SensorEntity,
     SensorStateClass,
@@ -16,16 +20,16 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     PERCENTAGE,
-    REVOLUTIONS_PER_MINUTE,
     UnitOfElectricCurrent,
     UnitOfElectricPotential,
     UnitOfFrequency,
     UnitOfPower,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
 from lennoxs30api import (
     LENNOX_BAD_STATUS,
     LENNOX_STATUS_NOT_EXIST,
@@ -36,7 +40,7 @@ from lennoxs30api import (
 )
 
 from . import Manager
-from .base_entity import S30BaseEntityMixin
+from .base_entity import S30BaseEntityMixin, S30RestoreEntityMixin
 from .ble_device_21p02 import lennox_21p02_sensors, lennox_iaq_sensors
 from .ble_device_22v25 import lennox_22v25_sensors
 from .const import (
@@ -45,8 +49,12 @@ from .const import (
     UNIQUE_ID_SUFFIX_ALERT_SENSOR,
     UNIQUE_ID_SUFFIX_DIAG_SENSOR,
 )
-from .helpers import helper_create_system_unique_id, helper_get_equipment_device_info, lennox_uom_to_ha_uom
+from .diag_publish import DIAG_PUBLISH_POLICIES, DiagPublishPolicy
+from .diag_recorder import DiagStatisticsImporter
+from .diag_statistics import DiagWindow
+from .helpers import helper_create_system_unique_id, helper_get_equipment_device_info, lennox_diagnostic_uom, lennox_uom_to_ha_uom
 from .sensor_ble import S40BleSensor
+from .sensor_hot_path import HotPathSensor
 from .sensor_iaq import S40IAQSensor
 from .sensor_wifi import WifiRSSISensor
 from .sensor_wt_env import WTEnvSensor, lennox_wt_env_sensors, lennox_wt_env_sensors_metric, lennox_wt_env_sensors_us
@@ -60,10 +68,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     """Setup the home assistant entities"""
     sensor_list = []
     manager: Manager = hass.data[DOMAIN][entry.unique_id][MANAGER]
+    # The sensors only restore their saved value when restore_state is enabled
+    if manager.restore_state:
+        outdoor_temp_sensor_class = S30OutdoorTempRestoreSensor
+        diag_sensor_class = S30DiagRestoreSensor
+        temp_sensor_class = S30TempRestoreSensor
+        humidity_sensor_class = S30HumidityRestoreSensor
+    else:
+        outdoor_temp_sensor_class = S30OutdoorTempSensor
+        diag_sensor_class = S30DiagSensor
+        temp_sensor_class = S30TempSensor
+        humidity_sensor_class = S30HumiditySensor
     for system in manager.api.system_list:
         if system.outdoorTemperatureStatus != LENNOX_STATUS_NOT_EXIST:
             _LOGGER.debug("Create S30OutdoorTempSensor system [%s]", system.sysId)
-            sensor = S30OutdoorTempSensor(hass, manager, system)
+            sensor = outdoor_temp_sensor_class(hass, manager, system)
             sensor_list.append(sensor)
 
         if manager.create_inverter_power:
@@ -90,11 +109,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
                     system.relayServerConnected,
                 )
 
+            importer: DiagStatisticsImporter = None
+            if manager.diag_external_statistics:
+                _LOGGER.debug("Create DiagStatisticsImporter system [%s]", system.sysId)
+                importer = manager.diag_importers[system.sysId] = DiagStatisticsImporter(hass, system)
+
             for _, eq in system.equipment.items():
                 equip: lennox_equipment = eq
                 if equip.equipment_id != 0:
                     for _, diagnostic in equip.diagnostics.items():
                         if diagnostic.valid:
+                            if importer is not None and importer.is_numeric(diagnostic):
+                                importer.add_channel(equip, diagnostic)
+                                continue
                             _LOGGER.debug(
                                 "Create Diagsensor system [%s] eid [%s] did [%s] name [%s]",
                                 system.sysId,
@@ -102,9 +129,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
                                 diagnostic.diagnostic_id,
                                 diagnostic.name,
                             )
-                            diagsensor = S30DiagSensor(hass, manager, system, equip, diagnostic)
+                            diagsensor = diag_sensor_class(hass, manager, system, equip, diagnostic)
                             sensor_list.append(diagsensor)
 
+            if importer is not None:
+                entry.async_on_unload(importer.async_start())
+
         if system.is_s40:
             for env in lennox_wt_env_sensors:
                 wt_sensor = WTEnvSensor(hass, manager, system, env)
@@ -122,9 +152,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
             for zone in system.zone_list:
                 if zone.is_zone_active():
                     _LOGGER.debug("Create S30TempSensor sensor system [%s] zone [%s]", system.sysId, zone.id)
-                    sensor_list.append(S30TempSensor(hass, manager, system, zone))
+                    sensor_list.append(temp_sensor_class(hass, manager, system, zone))
                     _LOGGER.debug("Create S30HumSensor sensor system [%s] zone [%s]", system.sysId, zone.id)
-                    sensor_list.append(S30HumiditySensor(hass, manager, system, zone))
+                    sensor_list.append(humidity_sensor_class(hass, manager, system, zone))
 
         if manager.create_alert_sensors:
             sensor_list.append(S30AlertSensor(hass, manager, system))
@@ -174,13 +204,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         if manager.api.isLANConnection:
             sensor_list.append(WifiRSSISensor(hass, manager, system))
 
+    # The message pump timings are for the connection, the sensors are attached to the first system
+    if manager.hot_path_sensors and len(manager.api.system_list) > 0:
+        for metric in manager.hot_path:
+            sensor_list.append(HotPathSensor(hass, manager, manager.api.system_list[0], metric))
+
     if len(sensor_list) != 0:
         async_add_entities(sensor_list, True)
         return True
     return False
 
 
-class S30DiagSensor(S30BaseEntityMixin, SensorEntity):
+class S30RestoreSensorMixin(S30RestoreEntityMixin):
+    """Restores the native value saved by Home Assistant when the sensor also derives from RestoreSensor"""
+
+    async def async_restore_values(self) -> None:
+        if (data := await self.async_get_last_sensor_data()) is not None:
+            self._restored_values["native_value"] = data.native_value
+
+
+class S30DiagSensor(S30RestoreSensorMixin, SensorEntity):
     """Diagnostic Data Sensor"""
 
     def __init__(
@@ -196,11 +239,7 @@ class S30DiagSensor(S30BaseEntityMixin, SensorEntity):
         self._equipment: lennox_equipment = equipment
         self._diagnostic: lennox_equipment_diagnostic = diagnostic
 
-        self.uom = diagnostic.unit.strip()
-        if self.uom == "":
-            # Lennox does not provide a unit for RPM
-            if self._diagnostic.name.endswith("RPM"):
-                self.uom = REVOLUTIONS_PER_MINUTE
+        self.uom = lennox_diagnostic_uom(diagnostic)
 
         if self.uom == "":
             self._state_class = None
@@ -214,6 +253,28 @@ class S30DiagSensor(S30BaseEntityMixin, SensorEntity):
             suffix = "iu"
         self._myname = f"{self._system.name}_{suffix}_{self._diagnostic.name}".replace(" ", "_")
         _LOGGER.debug("Create S30DiagSensor myname [%s]", self._myname)
+        # HA fails with dashes in IDs
+        self._attr_unique_id = (
+            f"{self._system.unique_id}_{UNIQUE_ID_SUFFIX_DIAG_SENSOR}_{self._equipment.equipment_id}_{self._diagnostic.name}"
+        ).replace("-", "")
+        self._attr_name = self._myname
+        self._attr_device_info = self._get_device_info()
+
+        # Numeric values are aggregated and published once per interval when statistics are enabled
+        self._statistics: DiagWindow = None
+        self._published_statistics: dict[str, Any] = None
+        if manager.diag_statistics_interval > 0 and self._state_class == SensorStateClass.MEASUREMENT:
+            self._statistics = DiagWindow(manager.diag_statistics_interval)
+            self._add_sample()
+            self._published_statistics = self._statistics.statistics(time.monotonic())
+
+        self._publish_policy: DiagPublishPolicy = None
+        if manager.diag_publish_policy and self._statistics is None:
+            self._publish_policy = DIAG_PUBLISH_POLICIES.get(self.native_unit_of_measurement)
+        # Value published to HA when a publishing policy applies, and when it was published
+        self._published_value: str = self._diagnostic.value
+        self._published_at: float = time.monotonic()
+        self._publish_timer: asyncio.TimerHandle = None
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -223,14 +284,65 @@ class S30DiagSensor(S30BaseEntityMixin, SensorEntity):
             [f"{self._equipment.equipment_id}_{self._diagnostic.diagnostic_id}"],
         )
         self._system.registerOnUpdateCallback(self.system_update_callback, ["diagLevel"])
+        self.async_on_remove(self._cancel_publish_timer)
+        if self._statistics is not None:
+            self.async_on_remove(
+                async_track_time_interval(self._hass, self._publish_statistics, timedelta(seconds=self._manager.diag_statistics_interval))
+            )
         await super().async_added_to_hass()
 
     def update_callback(self, eid_did, newval):
         """Callback to execute on data change"""
         if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("update_callback S30DiagSSensor myname [%s] value [%s]", self._myname, newval)
+        if self._statistics is not None:
+            self._add_sample()
+        elif self._publish_policy is None:
+            self.schedule_update_ha_state()
+        else:
+            self._publish_value()
+
+    def _add_sample(self) -> None:
+        try:
+            self._statistics.add(time.monotonic(), float(self._diagnostic.value))
+        except (TypeError, ValueError):
+            # waiting... is sent until the controller has a value
+            pass
+
+    @callback
+    def _publish_statistics(self, _now: datetime = None) -> None:
+        """Publishes the statistics of the values received in the window."""
+        self._published_statistics = self._statistics.statistics(time.monotonic())
+        self.schedule_update_ha_state()
+
+    def _publish_value(self) -> None:
+        """Publishes the diagnostic value when its publishing policy allows, otherwise waits until it is due."""
+        self._cancel_publish_timer()
+        value = self._diagnostic.value
+        if value == self._published_value:
+            return
+        now = time.monotonic()
+        try:
+            due = self._publish_policy.due(float(self._published_value), float(value), self._published_at)
+        except (TypeError, ValueError):
+            # Values that are not numbers are published immediately
+            due = now
+        if due > now:
+            self._publish_timer = asyncio.get_running_loop().call_later(due - now, self._on_publish_timer)
+            return
+        self._published_value = value
+        self._published_at = now
         self.schedule_update_ha_state()
 
+    def _on_publish_timer(self) -> None:
+        self._publish_timer = None
+        self._publish_value()
+
+    def _cancel_publish_timer(self) -> None:
+        if self._publish_timer is not None:
+            self._publish_timer.cancel()
+            self._publish_timer = None
+
     def system_update_callback(self):
         """Callback to execute on system data change"""
         if _LOGGER.isEnabledFor(logging.DEBUG):
@@ -239,7 +351,7 @@ class S30DiagSensor(S30BaseEntityMixin, SensorEntity):
 
     @property
     def available(self) -> bool:
-        if self._diagnostic.value == "waiting...":
+        if self._diagnostic.value == "waiting..." and self.native_value is None:
             return False
         if self._system.diagLevel not in (1, 2):
             return False
@@ -248,30 +360,29 @@ class S30DiagSensor(S30BaseEntityMixin, SensorEntity):
     @property
     def native_value(self):
         """Return native value of the sensor."""
-        if self._diagnostic.value == "waiting...":
-            return None
-        if self._state_class == SensorStateClass.MEASUREMENT:
+        if self._statistics is not None:
+            value = None
+            if self._published_statistics is not None:
+                value = round(self._published_statistics["mean"], 3)
+            return self.restored_value("native_value", value)
+        value = self._diagnostic.value if self._publish_policy is None else self._published_value
+        if value == "waiting...":
+            value = None
+        elif self._state_class == SensorStateClass.MEASUREMENT:
             try:
-                _ = float(self._diagnostic.value)
+                _ = float(value)
             except ValueError:
-                return None
-        return self._diagnostic.value
+                value = None
+        return self.restored_value("native_value", value)
 
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
-        return {}
-
-    @property
-    def unique_id(self) -> str:
-        # HA fails with dashes in IDs
-        return (f"{self._system.unique_id}_{UNIQUE_ID_SUFFIX_DIAG_SENSOR}_{self._equipment.equipment_id}_{self._diagnostic.name}").replace(
-            "-", ""
-        )
-
-    @property
-    def name(self):
-        return self._myname
+        attrs: dict[str, Any] = {}
+        if self._published_statistics is not None:
+            attrs.update(self._published_statistics)
+            attrs["mean"] = round(attrs["mean"], 3)
+        return self.stale_attributes(attrs)
 
     @property
     def native_unit_of_measurement(self):
@@ -294,8 +405,7 @@ class S30DiagSensor(S30BaseEntityMixin, SensorEntity):
     def state_class(self):
         return self._state_class
 
-    @property
-    def device_info(self) -> DeviceInfo:
+    def _get_device_info(self) -> DeviceInfo:
         """Return device info."""
         equip_device_map = self._manager.system_equip_device_map.get(self._system.sysId)
         if equip_device_map is not None:
@@ -329,13 +439,23 @@ class S30DiagSensor(S30BaseEntityMixin, SensorEntity):
         return EntityCategory.DIAGNOSTIC
 
 
-class S30OutdoorTempSensor(S30BaseEntityMixin, SensorEntity):
+class S30DiagRestoreSensor(S30DiagSensor, RestoreSensor):
+    """Diagnostic Data Sensor restoring the value saved by Home Assistant, created when restore_state is enabled"""
+
+
+class S30OutdoorTempSensor(S30RestoreSensorMixin, SensorEntity):
     """Class for Lennox S30 thermostat."""
 
     def __init__(self, hass: HomeAssistant, manager: Manager, system: lennox_system):
         super().__init__(manager, system)
         self._hass = hass
         self._myname = self._system.name + "_outdoor_temperature"
+        # HA fails with dashes in IDs
+        self._attr_unique_id = (self._system.unique_id + "_OT").replace("-", "")
+        self._attr_name = self._myname
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, self._system.unique_id + "_ou")},
+        }
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -351,19 +471,10 @@ class S30OutdoorTempSensor(S30BaseEntityMixin, SensorEntity):
         _LOGGER.debug("update_callback S30OutdoorTempSensor myname [%s]", self._myname)
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        # HA fails with dashes in IDs
-        return (self._system.unique_id + "_OT").replace("-", "")
-
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
-        return {}
-
-    @property
-    def name(self):
-        return self._myname
+        return self.stale_attributes({})
 
     @property
     def available(self):
@@ -381,8 +492,8 @@ class S30OutdoorTempSensor(S30BaseEntityMixin, SensorEntity):
             )
             return None
         if self._manager.is_metric is False:
-            return self._system.outdoorTemperature
-        return self._system.outdoorTemperatureC
+            return self.restored_value("native_value", self._system.outdoorTemperature)
+        return self.restored_value("native_value", self._system.outdoorTemperatureC)
 
     @property
     def native_unit_of_measurement(self):
@@ -398,15 +509,12 @@ class S30OutdoorTempSensor(S30BaseEntityMixin, SensorEntity):
     def state_class(self):
         return SensorStateClass.MEASUREMENT
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return {
-            "identifiers": {(DOMAIN, self._system.unique_id + "_ou")},
-        }
+
+class S30OutdoorTempRestoreSensor(S30OutdoorTempSensor, RestoreSensor):
+    """Outdoor temperature sensor restoring the value saved by Home Assistant, created when restore_state is enabled"""
 
 
-class S30TempSensor(S30BaseEntityMixin, SensorEntity):
+class S30TempSensor(S30RestoreSensorMixin, SensorEntity):
     """Class for Lennox S30 thermostat temperature."""
 
     def __init__(
@@ -420,6 +528,12 @@ class S30TempSensor(S30BaseEntityMixin, SensorEntity):
         self._hass = hass
         self._zone = zone
         self._myname = self._zone.system.name + "_" + self._zone.name + "_temperature"
+        # HA fails with dashes in IDs
+        self._attr_unique_id = (self._zone.system.unique_id + "_" + str(self._zone.id)).replace("-", "") + "_T"
+        self._attr_name = self._myname
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, self._zone.unique_id)},
+        }
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -432,15 +546,10 @@ class S30TempSensor(S30BaseEntityMixin, SensorEntity):
         _LOGGER.debug("update_callback S30TempSensor myname [%s]", self._myname)
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        # HA fails with dashes in IDs
-        return (self._zone.system.unique_id + "_" + str(self._zone.id)).replace("-", "") + "_T"
-
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
-        return {}
+        return self.stale_attributes({})
 
     @property
     def available(self):
@@ -453,10 +562,6 @@ class S30TempSensor(S30BaseEntityMixin, SensorEntity):
             return False
         return super().available
 
-    @property
-    def name(self):
-        return self._myname
-
     @property
     def native_value(self):
         if self._zone.temperatureStatus in LENNOX_BAD_STATUS:
@@ -467,8 +572,8 @@ class S30TempSensor(S30BaseEntityMixin, SensorEntity):
             )
             return None
         if self._manager.is_metric is False:
-            return self._zone.getTemperature()
-        return self._zone.getTemperatureC()
+            return self.restored_value("native_value", self._zone.getTemperature())
+        return self.restored_value("native_value", self._zone.getTemperatureC())
 
     @property
     def native_unit_of_measurement(self):
@@ -484,15 +589,12 @@ class S30TempSensor(S30BaseEntityMixin, SensorEntity):
     def state_class(self):
         return SensorStateClass.MEASUREMENT
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return {
-            "identifiers": {(DOMAIN, self._zone.unique_id)},
-        }
 
+class S30TempRestoreSensor(S30TempSensor, RestoreSensor):
+    """Zone temperature sensor restoring the value saved by Home Assistant, created when restore_state is enabled"""
 
-class S30HumiditySensor(S30BaseEntityMixin, SensorEntity):
+
+class S30HumiditySensor(S30RestoreSensorMixin, SensorEntity):
     """Class for Lennox S30 thermostat temperature."""
 
     def __init__(
@@ -506,6 +608,12 @@ class S30HumiditySensor(S30BaseEntityMixin, SensorEntity):
         self._hass = hass
         self._zone = zone
         self._myname = self._zone.system.name + "_" + self._zone.name + "_humidity"
+        # HA fails with dashes in IDs
+        self._attr_unique_id = (self._zone.system.unique_id + "_" + str(self._zone.id)).replace("-", "") + "_H"
+        self._attr_name = self._myname
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, self._zone.unique_id)},
+        }
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -518,19 +626,10 @@ class S30HumiditySensor(S30BaseEntityMixin, SensorEntity):
         _LOGGER.debug("update_callback S30HumiditySensor myname [%s]", self._myname)
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        # HA fails with dashes in IDs
-        return (self._zone.system.unique_id + "_" + str(self._zone.id)).replace("-", "") + "_H"
-
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
-        return {}
-
-    @property
-    def name(self):
-        return self._myname
+        return self.stale_attributes({})
 
     @property
     def available(self):
@@ -552,7 +651,7 @@ class S30HumiditySensor(S30BaseEntityMixin, SensorEntity):
                 self._zone.humidityStatus,
             )
             return None
-        return self._zone.getHumidity()
+        return self.restored_value("native_value", self._zone.getHumidity())
 
     @property
     def native_unit_of_measurement(self):
@@ -566,12 +665,9 @@ class S30HumiditySensor(S30BaseEntityMixin, SensorEntity):
     def state_class(self):
         return SensorStateClass.MEASUREMENT
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return {
-            "identifiers": {(DOMAIN, self._zone.unique_id)},
-        }
+
+class S30HumidityRestoreSensor(S30HumiditySensor, RestoreSensor):
+    """Zone humidity sensor restoring the value saved by Home Assistant, created when restore_state is enabled"""
 
 
 class S30InverterPowerSensor(S30BaseEntityMixin, SensorEntity):
@@ -581,6 +677,12 @@ class S30InverterPowerSensor(S30BaseEntityMixin, SensorEntity):
         super().__init__(manager, system)
         self._hass = hass
         self._myname = self._system.name + "_inverter_energy"
+        # HA fails with dashes in IDs
+        self._attr_unique_id = (self._system.unique_id + "_IE").replace("-", "")
+        self._attr_name = self._myname
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, self._system.unique_id + "_ou")},
+        }
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -610,15 +712,6 @@ class S30InverterPowerSensor(S30BaseEntityMixin, SensorEntity):
             return False
         return super().available
 
-    @property
-    def unique_id(self) -> str:
-        # HA fails with dashes in IDs
-        return (self._system.unique_id + "_IE").replace("-", "")
-
-    @property
-    def name(self):
-        return self._myname
-
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
@@ -656,12 +749,6 @@ class S30InverterPowerSensor(S30BaseEntityMixin, SensorEntity):
     def state_class(self):
         return SensorStateClass.MEASUREMENT
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return {
-            "identifiers": {(DOMAIN, self._system.unique_id + "_ou")},
-        }
-
 
 class S30AlertSensor(S30BaseEntityMixin, SensorEntity):
     """Class for Lennox S30 thermostat temperature."""
@@ -675,6 +762,9 @@ class S30AlertSensor(S30BaseEntityMixin, SensorEntity):
         super().__init__(manager, system)
         self._hass = hass
         self._myname = self._system.name + "_alert"
+        self._attr_unique_id = helper_create_system_unique_id(self._system, UNIQUE_ID_SUFFIX_ALERT_SENSOR)
+        self._attr_name = self._myname
+        self._attr_device_info = helper_get_equipment_device_info(self._manager, self._system, 0)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -688,28 +778,15 @@ class S30AlertSensor(S30BaseEntityMixin, SensorEntity):
             _LOGGER.debug("update_callback S30AlertSensor myname [%s]", self._myname)
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        return helper_create_system_unique_id(self._system, UNIQUE_ID_SUFFIX_ALERT_SENSOR)
-
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
         return {}
 
-    @property
-    def name(self):
-        return self._myname
-
     @property
     def native_value(self):
         return self._system.alert
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return helper_get_equipment_device_info(self._manager, self._system, 0)
-
 
 class S30ActiveAlertsList(S30BaseEntityMixin, SensorEntity):
     """Class for Lennox S30 thermostat temperature."""
@@ -723,6 +800,9 @@ class S30ActiveAlertsList(S30BaseEntityMixin, SensorEntity):
         super().__init__(manager, system)
         self._hass = hass
         self._myname = self._system.name + "_active_alerts"
+        self._attr_unique_id = helper_create_system_unique_id(self._system, UNIQUE_ID_SUFFIX_ACTIVE_ALERTS_SENSOR)
+        self._attr_name = self._myname
+        self._attr_device_info = helper_get_equipment_device_info(self._manager, self._system, 0)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -744,9 +824,15 @@ class S30ActiveAlertsList(S30BaseEntityMixin, SensorEntity):
             _LOGGER.debug("update_callback S30ActiveAlertList myname [%s]", self._myname)
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        return helper_create_system_unique_id(self._system, UNIQUE_ID_SUFFIX_ACTIVE_ALERTS_SENSOR)
+    def state_fingerprint(self) -> tuple:
+        # The api replaces the alert list when alerts are received
+        return (
+            self.available,
+            self._system.active_alerts,
+            self._system.alerts_num_cleared,
+            self._system.alerts_last_cleared_id,
+            self._system.alerts_num_in_active_array,
+        )
 
     @property
     def extra_state_attributes(self):
@@ -761,10 +847,6 @@ class S30ActiveAlertsList(S30BaseEntityMixin, SensorEntity):
         attrs["alerts_num_in_active_array"] = 0 if val is None else val
         return attrs
 
-    @property
-    def name(self):
-        return self._myname
-
     @property
     def native_value(self):
         if not self._system.active_alerts:
@@ -774,8 +856,3 @@ class S30ActiveAlertsList(S30BaseEntityMixin, SensorEntity):
     @property
     def state_class(self):
         return SensorStateClass.MEASUREMENT
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return helper_get_equipment_device_info(self._manager, self._system, 0)
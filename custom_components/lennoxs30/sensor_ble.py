@@ -11,7 +11,6 @@ from homeassistant.components.sensor import (
     SensorEntity,
 )
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from lennoxs30api import (
     LENNOX_BLE_COMMSTATUS_AVAILABLE,
     LENNOX_BLE_STATUS_INPUT_AVAILABLE,
@@ -58,6 +57,14 @@ class S40BleSensor(S30BaseEntityMixin, SensorEntity):
         self._state_class: str = sensor_dict.get("state_class")
         self._device_class: str = sensor_dict.get("device_class")
         self._entity_category: str = sensor_dict.get("entity_category")
+        self._attr_unique_id = helper_create_system_unique_id(
+            self._system,
+            f"{UNIQUE_ID_SUFFIX_BLE}_{self._ble_device.ble_id}_{self._sensor_value.input_id}",
+        )
+        self._attr_name = self._myname
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, helper_create_ble_device_id(self._system, self._ble_device))},
+        }
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -87,17 +94,6 @@ class S40BleSensor(S30BaseEntityMixin, SensorEntity):
             _LOGGER.debug("status_value_update S40BleSensor myname [%s]", self._myname)
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        return helper_create_system_unique_id(
-            self._system,
-            f"{UNIQUE_ID_SUFFIX_BLE}_{self._ble_device.ble_id}_{self._sensor_value.input_id}",
-        )
-
-    @property
-    def name(self):
-        return self._myname
-
     @property
     def native_value(self):
         try:
@@ -119,13 +115,6 @@ class S40BleSensor(S30BaseEntityMixin, SensorEntity):
     def device_class(self):
         return self._device_class
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return {
-            "identifiers": {(DOMAIN, helper_create_ble_device_id(self._system, self._ble_device))},
-        }
-
     @property
     def native_unit_of_measurement(self):
         return self._uom
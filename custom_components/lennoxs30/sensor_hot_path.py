@@ -0,0 +1,84 @@
+"""Support for Lennoxs30 message pump timing sensors"""
+
+# pylint: disable=global-statement
+# pylint: disable=broad-except
+# pylint: disable=unused-argument
+# pylint: disable=line-too-long
+# pylint: disable=invalid-name
+import logging
+from typing import Any
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
+from homeassistant.const import UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import EntityCategory
+from lennoxs30api import lennox_system
+
+from . import HOT_PATH_ENTITIES, Manager
+from .base_entity import S30BaseEntityMixin
+from .const import LENNOX_DOMAIN, UNIQUE_ID_SUFFIX_HOT_PATH
+from .histogram import Histogram
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class HotPathSensor(S30BaseEntityMixin, SensorEntity):
+    """95th percentile of a message pump timing histogram, refreshed by polling so the message pump is not slowed."""
+
+    def __init__(self, hass: HomeAssistant, manager: Manager, system: lennox_system, metric: str):
+        super().__init__(manager, system)
+        self._hass = hass
+        self._metric = metric
+        self._histogram: Histogram = manager.hot_path[metric]
+        self._myname = f"{self._system.name}_hot_path_{metric}"
+        _LOGGER.debug("Create HotPathSensor myname [%s]", self._myname)
+        self._attr_unique_id = (self._system.unique_id + UNIQUE_ID_SUFFIX_HOT_PATH + self._metric).replace("-", "")
+        self._attr_name = self._myname
+        self._attr_device_info = {
+            "identifiers": {(LENNOX_DOMAIN, self._system.unique_id)},
+        }
+
+    @property
+    def base_ignore_cloud_status(self) -> bool:
+        return True
+
+    @property
+    def available(self) -> bool:
+        # The timings remain valid while disconnected
+        return True
+
+    @property
+    def should_poll(self) -> bool:
+        return True
+
+    @property
+    def native_value(self):
+        return self._histogram.percentile(95)
+
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes."""
+        attrs: dict[str, Any] = self._histogram.as_dict()
+        attrs.pop("buckets")
+        attrs.pop("p95")
+        return attrs
+
+    @property
+    def native_unit_of_measurement(self):
+        if self._metric == HOT_PATH_ENTITIES:
+            return None
+        return UnitOfTime.MILLISECONDS
+
+    @property
+    def device_class(self):
+        if self._metric == HOT_PATH_ENTITIES:
+            return None
+        return SensorDeviceClass.DURATION
+
+    @property
+    def state_class(self):
+        return SensorStateClass.MEASUREMENT
+
+    @property
+    def entity_category(self):
+        return EntityCategory.DIAGNOSTIC
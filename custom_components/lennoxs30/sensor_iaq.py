@@ -9,7 +9,6 @@ import logging
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from lennoxs30api import LennoxBle, lennox_system
 
 from . import Manager
@@ -44,6 +43,14 @@ class S40IAQSensor(S30BaseEntityMixin, SensorEntity):
         self._device_class: str = sensor_dict.get("device_class")
         self._entity_category: str = sensor_dict.get("entity_category")
         self._precision: int = sensor_dict.get("precision", 1)
+        self._attr_unique_id = helper_create_system_unique_id(
+            self._system,
+            f"{UNIQUE_ID_SUFFIX_BLE}_{self._ble_device.ble_id}_{self._system_attr}",
+        )
+        self._attr_name = self._myname
+        self._attr_device_info = {
+            "identifiers": {(LENNOX_DOMAIN, helper_create_ble_device_id(self._system, self._ble_device))},
+        }
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -62,17 +69,6 @@ class S40IAQSensor(S30BaseEntityMixin, SensorEntity):
             _LOGGER.debug("sensor_value_update S40IAQSensor myname [%s]", self._myname)
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        return helper_create_system_unique_id(
-            self._system,
-            f"{UNIQUE_ID_SUFFIX_BLE}_{self._ble_device.ble_id}_{self._system_attr}",
-        )
-
-    @property
-    def name(self):
-        return self._myname
-
     @property
     def native_value(self):
         value = getattr(self._system, self._system_attr)
@@ -97,13 +93,6 @@ class S40IAQSensor(S30BaseEntityMixin, SensorEntity):
     def device_class(self):
         return self._device_class
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return {
-            "identifiers": {(LENNOX_DOMAIN, helper_create_ble_device_id(self._system, self._ble_device))},
-        }
-
     @property
     def native_unit_of_measurement(self):
         return self._uom
@@ -11,7 +11,7 @@ from typing import Any
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
 from homeassistant.const import SIGNAL_STRENGTH_DECIBELS_MILLIWATT
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.helpers.entity import EntityCategory
 from lennoxs30api import lennox_system
 
 from . import Manager
@@ -28,6 +28,11 @@ class WifiRSSISensor(S30BaseEntityMixin, SensorEntity):
         super().__init__(manager, system)
         self._hass = hass
         self._myname = self._system.name + "_wifi_rssi"
+        self._attr_unique_id = (self._system.unique_id + UNIQUE_ID_SUFFIX_WIFI_RSSI).replace("-", "")
+        self._attr_name = self._myname
+        self._attr_device_info = {
+            "identifiers": {(LENNOX_DOMAIN, self._system.unique_id)},
+        }
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -53,9 +58,19 @@ class WifiRSSISensor(S30BaseEntityMixin, SensorEntity):
         _LOGGER.debug("update_callback WifiRSSISensor myname [%s]", self._myname)
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        return (self._system.unique_id + UNIQUE_ID_SUFFIX_WIFI_RSSI).replace("-", "")
+    def state_fingerprint(self) -> tuple:
+        return (
+            self.available,
+            self._system.wifi_rssi,
+            self._system.wifi_macAddr,
+            self._system.wifi_ssid,
+            self._system.wifi_ip,
+            self._system.wifi_router,
+            self._system.wifi_dns,
+            self._system.wifi_dns2,
+            self._system.wifi_subnetMask,
+            self._system.wifi_bitRate,
+        )
 
     @property
     def extra_state_attributes(self):
@@ -71,10 +86,6 @@ class WifiRSSISensor(S30BaseEntityMixin, SensorEntity):
         attrs["bitRate"] = self._system.wifi_bitRate
         return attrs
 
-    @property
-    def name(self):
-        return self._myname
-
     @property
     def native_value(self):
         return self._system.wifi_rssi
@@ -91,12 +102,6 @@ class WifiRSSISensor(S30BaseEntityMixin, SensorEntity):
     def state_class(self):
         return SensorStateClass.MEASUREMENT
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return {
-            "identifiers": {(LENNOX_DOMAIN, self._system.unique_id)},
-        }
-
     @property
     def entity_category(self):
         return EntityCategory.DIAGNOSTIC
@@ -10,7 +10,6 @@ import logging
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
 from homeassistant.const import PERCENTAGE, UnitOfSpeed, UnitOfTemperature
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from lennoxs30api import lennox_system
 
 from . import Manager
@@ -148,6 +147,14 @@ class WTEnvSensor(S30BaseEntityMixin, SensorEntity):
         self._device_class = sensor_dict.get("device_class")
         self._uom = sensor_dict.get("uom")
         self._entity_category = sensor_dict.get("entity_category")
+        self._attr_unique_id = helper_create_system_unique_id(
+            self._system,
+            self._system_attr,
+        )
+        self._attr_name = self._myname
+        self._attr_device_info = {
+            "identifiers": {(LENNOX_DOMAIN, self._system.unique_id)},
+        }
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -165,17 +172,6 @@ class WTEnvSensor(S30BaseEntityMixin, SensorEntity):
             _LOGGER.debug("sensor_value_update WTEnvSensor myname [%s]", self._myname)
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        return helper_create_system_unique_id(
-            self._system,
-            self._system_attr,
-        )
-
-    @property
-    def name(self):
-        return self._myname
-
     @property
     def native_value(self):
         value = getattr(self._system, self._system_attr)
@@ -200,13 +196,6 @@ class WTEnvSensor(S30BaseEntityMixin, SensorEntity):
     def device_class(self):
         return self._device_class
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return {
-            "identifiers": {(LENNOX_DOMAIN, self._system.unique_id)},
-        }
-
     @property
     def native_unit_of_measurement(self):
         return self._uom
@@ -79,10 +79,15 @@ class S30VentilationSwitch(S30BaseEntityMixin, SwitchEntity):
         super().__init__(manager, system)
         self._hass = hass
         self._myname = self._system.name + "_ventilation"
+        # HA fails with dashes in IDs
+        self._attr_unique_id = (self._system.unique_id + "_VST").replace("-", "")
+        self._attr_name = self._myname
+        self._attr_device_info = self._get_device_info()
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
-        self._system.registerOnUpdateCallback(
+        self.register_update_callback(
+            self._system,
             self.update_callback,
             [
                 "ventilationRemainingTime",
@@ -99,11 +104,6 @@ class S30VentilationSwitch(S30BaseEntityMixin, SwitchEntity):
             _LOGGER.debug("update_callback myname [%s]", self._myname)
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        # HA fails with dashes in IDs
-        return (self._system.unique_id + "_VST").replace("-", "")
-
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
@@ -115,16 +115,14 @@ class S30VentilationSwitch(S30BaseEntityMixin, SwitchEntity):
         attrs["timed"] = self._system.ventilationRemainingTime != 0
         return attrs
 
-    @property
-    def name(self):
-        return self._myname
-
     @property
     def is_on(self):
-        return self._system.ventilationMode == "on" or self._system.ventilationRemainingTime > 0
+        return (
+            self.optimistic_value(self._system, "ventilationMode") == "on"
+            or self.optimistic_value(self._system, "ventilationRemainingTime") > 0
+        )
 
-    @property
-    def device_info(self) -> DeviceInfo:
+    def _get_device_info(self) -> DeviceInfo:
         """Return device info."""
         equip_device_map = self._manager.system_equip_device_map.get(self._system.sysId)
         if equip_device_map is not None:
@@ -146,7 +144,7 @@ class S30VentilationSwitch(S30BaseEntityMixin, SwitchEntity):
     async def async_turn_on(self, **kwargs):
         _LOGGER.info(LOG_INFO_SWITCH_ASYNC_TURN_ON, self.__class__.__name__, self._myname)
         try:
-            await self._system.ventilation_on()
+            await self._manager.send_command("ventilation", self._system, {"ventilationMode": "on"}, self._system.ventilation_on())
             self._manager.mp_wakeup_event.set()
         except S30Exception as ex:
             raise HomeAssistantError(f"async_turn_on [{self._myname}] [{ex.as_string()}]") from ex
@@ -159,10 +157,12 @@ class S30VentilationSwitch(S30BaseEntityMixin, SwitchEntity):
             called = False
             if self._system.ventilationMode == "on":
                 _LOGGER.debug("ventilation:async_turn_off calling ventilation_off")
-                await self._system.ventilation_off()
+                await self._manager.send_command("ventilation", self._system, {"ventilationMode": "off"}, self._system.ventilation_off())
                 called = True
             if self._system.ventilationRemainingTime > 0:
-                await self._system.ventilation_timed(0)
+                await self._manager.send_command(
+                    "timed_ventilation", self._system, {"ventilationRemainingTime": 0}, self._system.ventilation_timed(0)
+                )
                 _LOGGER.debug("ventilation:async_turn_off calling ventilation_timed(0)")
                 called = True
             if called:
@@ -180,10 +180,14 @@ class S30AllergenDefenderSwitch(S30BaseEntityMixin, SwitchEntity):
         super().__init__(manager, system)
         self._hass = hass
         self._myname = self._system.name + "_allergen_defender"
+        # HA fails with dashes in IDs
+        self._attr_unique_id = (self._system.unique_id + "_ADST").replace("-", "")
+        self._attr_name = self._myname
+        self._attr_device_info = {"identifiers": {(DOMAIN, self._system.unique_id)}}
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
-        self._system.registerOnUpdateCallback(self.update_callback, ["allergenDefender"])
+        self.register_update_callback(self._system, self.update_callback, ["allergenDefender"])
         await super().async_added_to_hass()
 
     def update_callback(self):
@@ -192,11 +196,6 @@ class S30AllergenDefenderSwitch(S30BaseEntityMixin, SwitchEntity):
             _LOGGER.debug("update_callback myname [%s]", self._myname)
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        # HA fails with dashes in IDs
-        return (self._system.unique_id + "_ADST").replace("-", "")
-
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
@@ -211,23 +210,16 @@ class S30AllergenDefenderSwitch(S30BaseEntityMixin, SwitchEntity):
         """No polling needed."""
         return False
 
-    @property
-    def name(self):
-        return self._myname
-
     @property
     def is_on(self):
-        return self._system.allergenDefender
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return {"identifiers": {(DOMAIN, self._system.unique_id)}}
+        return self.optimistic_value(self._system, "allergenDefender")
 
     async def async_turn_on(self, **kwargs):
         _LOGGER.info(LOG_INFO_SWITCH_ASYNC_TURN_ON, self.__class__.__name__, self._myname)
         try:
-            await self._system.allergenDefender_on()
+            await self._manager.send_command(
+                "allergen_defender", self._system, {"allergenDefender": True}, self._system.allergenDefender_on()
+            )
             self._manager.mp_wakeup_event.set()
         except S30Exception as ex:
             raise HomeAssistantError(f"async_turn_on [{self._myname}] [{ex.as_string()}]") from ex
@@ -237,7 +229,9 @@ class S30AllergenDefenderSwitch(S30BaseEntityMixin, SwitchEntity):
     async def async_turn_off(self, **kwargs):
         _LOGGER.info(LOG_INFO_SWITCH_ASYNC_TURN_OFF, self.__class__.__name__, self._myname)
         try:
-            await self._system.allergenDefender_off()
+            await self._manager.send_command(
+                "allergen_defender", self._system, {"allergenDefender": False}, self._system.allergenDefender_off()
+            )
             self._manager.mp_wakeup_event.set()
         except S30Exception as ex:
             raise HomeAssistantError(f"async_turn_off [{self._myname}] [{ex.as_string()}]") from ex
@@ -252,10 +246,15 @@ class S30ManualAwayModeSwitch(S30BaseEntityMixin, SwitchEntity):
         super().__init__(manager, system)
         self._hass = hass
         self._myname = self._system.name + "_manual_away_mode"
+        # HA fails with dashes in IDs
+        self._attr_unique_id = (self._system.unique_id + "_SW_MA").replace("-", "")
+        self._attr_name = self._myname
+        self._attr_device_info = {"identifiers": {(DOMAIN, self._system.unique_id)}}
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
-        self._system.registerOnUpdateCallback(
+        self.register_update_callback(
+            self._system,
             self.update_callback,
             [
                 "manualAwayMode",
@@ -269,31 +268,18 @@ class S30ManualAwayModeSwitch(S30BaseEntityMixin, SwitchEntity):
             _LOGGER.debug("update_callback myname [%s]", self._myname)
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        # HA fails with dashes in IDs
-        return (self._system.unique_id + "_SW_MA").replace("-", "")
-
     @property
     def extra_state_attributes(self):
         return {}
 
-    @property
-    def name(self):
-        return self._myname
-
     @property
     def is_on(self):
-        return self._system.get_manual_away_mode()
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return {"identifiers": {(DOMAIN, self._system.unique_id)}}
+        return self.optimistic_value(self._system, "manualAwayMode")
 
     async def async_turn_on(self, **kwargs):
         _LOGGER.info(LOG_INFO_SWITCH_ASYNC_TURN_ON, self.__class__.__name__, self._myname)
         try:
-            await self._system.set_manual_away_mode(True)
+            await self._manager.send_command("away_mode", self._system, {"manualAwayMode": True}, self._system.set_manual_away_mode(True))
             self._manager.mp_wakeup_event.set()
         except S30Exception as ex:
             raise HomeAssistantError(f"async_turn_on [{self._myname}] [{ex.as_string()}]") from ex
@@ -303,7 +289,7 @@ class S30ManualAwayModeSwitch(S30BaseEntityMixin, SwitchEntity):
     async def async_turn_off(self, **kwargs):
         _LOGGER.info(LOG_INFO_SWITCH_ASYNC_TURN_OFF, self.__class__.__name__, self._myname)
         try:
-            await self._system.set_manual_away_mode(False)
+            await self._manager.send_command("away_mode", self._system, {"manualAwayMode": False}, self._system.set_manual_away_mode(False))
             self._manager.mp_wakeup_event.set()
         except S30Exception as ex:
             raise HomeAssistantError(f"async_turn_off [{self._myname}] [{ex.as_string()}]") from ex
@@ -318,10 +304,15 @@ class S30SmartAwayEnableSwitch(S30BaseEntityMixin, SwitchEntity):
         super().__init__(manager, system)
         self._hass = hass
         self._myname = self._system.name + "_smart_away_enable"
+        # HA fails with dashes in IDs
+        self._attr_unique_id = (self._system.unique_id + "_SW_SAE").replace("-", "")
+        self._attr_name = self._myname
+        self._attr_device_info = {"identifiers": {(DOMAIN, self._system.unique_id)}}
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
-        self._system.registerOnUpdateCallback(
+        self.register_update_callback(
+            self._system,
             self.update_callback,
             [
                 "sa_enabled",
@@ -335,11 +326,6 @@ class S30SmartAwayEnableSwitch(S30BaseEntityMixin, SwitchEntity):
             _LOGGER.debug("update_callback myname [%s]", self._myname)
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        # HA fails with dashes in IDs
-        return (self._system.unique_id + "_SW_SAE").replace("-", "")
-
     @property
     def extra_state_attributes(self):
         return {}
@@ -351,22 +337,14 @@ class S30SmartAwayEnableSwitch(S30BaseEntityMixin, SwitchEntity):
     def should_poll(self):
         return False
 
-    @property
-    def name(self):
-        return self._myname
-
     @property
     def is_on(self):
-        return self._system.sa_enabled
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return {"identifiers": {(DOMAIN, self._system.unique_id)}}
+        return self.optimistic_value(self._system, "sa_enabled")
 
     async def async_turn_on(self, **kwargs):
         _LOGGER.info(LOG_INFO_SWITCH_ASYNC_TURN_ON, self.__class__.__name__, self._myname)
         try:
-            await self._system.enable_smart_away(True)
+            await self._manager.send_command("smart_away", self._system, {"sa_enabled": True}, self._system.enable_smart_away(True))
             self._manager.mp_wakeup_event.set()
         except S30Exception as ex:
             raise HomeAssistantError(f"async_turn_on [{self._myname}] [{ex.as_string()}]") from ex
@@ -376,7 +354,7 @@ class S30SmartAwayEnableSwitch(S30BaseEntityMixin, SwitchEntity):
     async def async_turn_off(self, **kwargs):
         _LOGGER.info(LOG_INFO_SWITCH_ASYNC_TURN_OFF, self.__class__.__name__, self._myname)
         try:
-            await self._system.enable_smart_away(False)
+            await self._manager.send_command("smart_away", self._system, {"sa_enabled": False}, self._system.enable_smart_away(False))
             self._manager.mp_wakeup_event.set()
         except S30Exception as ex:
             raise HomeAssistantError(f"async_turn_off [{self._myname}] [{ex.as_string()}]") from ex
@@ -391,10 +369,15 @@ class S30ZoningSwitch(S30BaseEntityMixin, SwitchEntity):
         super().__init__(manager, system)
         self._hass = hass
         self._myname = self._system.name + "_zoning_enable"
+        # HA fails with dashes in IDs
+        self._attr_unique_id = (self._system.unique_id + "_SW_ZE").replace("-", "")
+        self._attr_name = self._myname
+        self._attr_device_info = {"identifiers": {(DOMAIN, self._system.unique_id)}}
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
-        self._system.registerOnUpdateCallback(
+        self.register_update_callback(
+            self._system,
             self.update_callback,
             [
                 "centralMode",
@@ -408,11 +391,6 @@ class S30ZoningSwitch(S30BaseEntityMixin, SwitchEntity):
             _LOGGER.debug("update_callback myname [%s]", self._myname)
         self.schedule_update_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        # HA fails with dashes in IDs
-        return (self._system.unique_id + "_SW_ZE").replace("-", "")
-
     @property
     def extra_state_attributes(self):
         return {}
@@ -424,22 +402,14 @@ class S30ZoningSwitch(S30BaseEntityMixin, SwitchEntity):
     def should_poll(self):
         return False
 
-    @property
-    def name(self):
-        return self._myname
-
     @property
     def is_on(self):
-        return self._system.centralMode is False
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return {"identifiers": {(DOMAIN, self._system.unique_id)}}
+        return self.optimistic_value(self._system, "centralMode") is False
 
     async def async_turn_on(self, **kwargs):
         _LOGGER.info(LOG_INFO_SWITCH_ASYNC_TURN_ON, self.__class__.__name__, self._myname)
         try:
-            await self._system.centralMode_off()
+            await self._manager.send_command("central_mode", self._system, {"centralMode": False}, self._system.centralMode_off())
             self._manager.mp_wakeup_event.set()
         except S30Exception as ex:
             raise HomeAssistantError(f"async_turn_on [{self._myname}] [{ex.as_string()}]") from ex
@@ -449,7 +419,7 @@ class S30ZoningSwitch(S30BaseEntityMixin, SwitchEntity):
     async def async_turn_off(self, **kwargs):
         _LOGGER.info(LOG_INFO_SWITCH_ASYNC_TURN_OFF, self.__class__.__name__, self._myname)
         try:
-            await self._system.centralMode_on()
+            await self._manager.send_command("central_mode", self._system, {"centralMode": True}, self._system.centralMode_on())
             self._manager.mp_wakeup_event.set()
         except S30Exception as ex:
             raise HomeAssistantError(f"async_turn_off [{self._myname}] [{ex.as_string()}]") from ex
@@ -473,11 +443,10 @@ class S30ParameterSafetySwitch(S30BaseEntityMixin, SwitchEntity):
         self._rearm_duration_sec = rearm_duration_sec
         self._rearm_task = None
         manager.parameter_safety_turn_on(self._system.sysId)
-
-    @property
-    def unique_id(self) -> str:
         # HA fails with dashes in IDs
-        return (f"{self._system.unique_id}{UNIQUE_ID_SUFFIX_PARAMETER_SAFETY_SWITCH}").replace("-", "")
+        self._attr_unique_id = (f"{self._system.unique_id}{UNIQUE_ID_SUFFIX_PARAMETER_SAFETY_SWITCH}").replace("-", "")
+        self._attr_name = self._myname
+        self._attr_device_info = {"identifiers": {(DOMAIN, self._system.unique_id)}}
 
     @property
     def extra_state_attributes(self):
@@ -490,19 +459,11 @@ class S30ParameterSafetySwitch(S30BaseEntityMixin, SwitchEntity):
     def should_poll(self):
         return False
 
-    @property
-    def name(self):
-        return self._myname
-
     @property
     def is_on(self):
         res = self._manager.parameter_safety_on(self._system.sysId)
         return res
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return {"identifiers": {(DOMAIN, self._system.unique_id)}}
-
     async def async_turn_on(self, **kwargs):
         _LOGGER.info(LOG_INFO_SWITCH_ASYNC_TURN_ON, self.__class__.__name__, self._myname)
         self._manager.parameter_safety_turn_on(self._system.sysId)
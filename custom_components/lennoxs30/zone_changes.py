@@ -0,0 +1,32 @@
+"""The changes to the mode, fan mode and setpoints of a zone requested by the set_zones service."""
+
+# pylint: disable=line-too-long
+from __future__ import annotations
+
+from typing import Any
+
+from lennoxs30api import lennox_zone
+
+
+class ZoneChange:
+    """The hvac mode, fan mode and lennox_zone.perform_setpoint arguments requested for a zone, None when unchanged."""
+
+    __slots__ = ("zone", "hvac_mode", "setpoints", "fan_mode")
+
+    def __init__(self, zone: lennox_zone, hvac_mode: str = None, setpoints: dict[str, float] = None, fan_mode: str = None) -> None:
+        self.zone: lennox_zone = zone
+        self.hvac_mode: str = hvac_mode
+        self.setpoints: dict[str, float] = setpoints if setpoints is not None else {}
+        self.fan_mode: str = fan_mode
+
+    def tracked_attributes(self) -> dict[str, dict[str, Any]]:
+        """Returns the zone attributes expected to change for each command type."""
+        tracked: dict[str, dict[str, Any]] = {}
+        if self.hvac_mode is not None:
+            tracked["hvac_mode"] = {"systemMode": self.hvac_mode}
+        if len(self.setpoints) != 0:
+            # The zone attribute of each argument is its name without the r_ prefix
+            tracked["setpoint"] = {name[2:]: value for name, value in self.setpoints.items()}
+        if self.fan_mode is not None:
+            tracked["fan_mode"] = {"fanMode": self.fan_mode}
+        return tracked
@@ -12,6 +12,7 @@
 import json
 import logging
 import os
+from functools import partial
 from unittest.mock import patch
 
 import pytest
@@ -51,6 +52,7 @@ from custom_components.lennoxs30 import (
     DS_RETRY_WAIT,
     Manager,
 )
+from custom_components.lennoxs30.command_scheduler import CommandScheduler
 from custom_components.lennoxs30.const import (
     CONF_ALLERGEN_DEFENDER_SWITCH,
     CONF_APP_ID,
@@ -83,6 +85,13 @@ def disable_device_registry(hass):
         yield
 
 
+@pytest.fixture(autouse=True)
+def disable_command_rate_limit():
+    # Tests send commands back to back, the rate limit is tested in test_command_scheduler
+    with patch("custom_components.lennoxs30.CommandScheduler", partial(CommandScheduler, rate=1000.0, burst=1000)):
+        yield
+
+
 @pytest.fixture()
 def calls(hass):
     """Track calls to a mock service."""
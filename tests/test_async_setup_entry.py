@@ -10,6 +10,7 @@
 # pylint: disable=missing-function-docstring
 # pylint: disable=protected-access
 
+import asyncio
 import logging
 from unittest.mock import patch
 
@@ -17,7 +18,6 @@ import pytest
 from homeassistant import config_entries
 from homeassistant.const import CONF_TIMEOUT
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import HomeAssistantError
 from lennoxs30api.s30exception import EC_COMMS_ERROR, EC_CONFIG_TIMEOUT, EC_LOGIN, S30Exception
 
 from custom_components.lennoxs30 import (
@@ -100,34 +100,52 @@ async def test_async_setup_entry_local(hass: HomeAssistant, caplog):
         assert manager.is_metric is True
         assert manager.connection_state == DOMAIN_STATE
 
-    with patch("custom_components.lennoxs30.Manager.s30_initialize") as s30_initialize:
-        with patch("custom_components.lennoxs30.Manager.updateState") as update_state:
-            s30_initialize.side_effect = S30Exception("login error", EC_LOGIN, 0)
-            ex: HomeAssistantError = None
-            try:
-                res = await async_setup_entry(hass, config_entry)
-            except HomeAssistantError as he:
-                ex = he
-            assert ex is not None
-            assert "unable to login" in str(ex)
-            assert "please check credential" in str(ex)
-            assert update_state.call_count == 1
-            assert update_state.call_args[0][0] == DS_LOGIN_FAILED
+    with caplog.at_level(logging.ERROR):
+        caplog.clear()
+        with patch("custom_components.lennoxs30.Manager.s30_initialize") as s30_initialize:
+            with patch("custom_components.lennoxs30.Manager.updateState") as update_state:
+                with patch("custom_components.lennoxs30.Manager.initialize_retry_task") as initialize_retry_task:
+                    s30_initialize.side_effect = S30Exception("login error", EC_LOGIN, 0)
+                    res = await async_setup_entry(hass, config_entry)
+                    manager: Manager = hass.data[LENNOX_DOMAIN][config_entry.unique_id][MANAGER]
+                    await manager.initialize_task
+                    assert res is True
+                    assert update_state.call_count == 1
+                    assert update_state.call_args[0][0] == DS_LOGIN_FAILED
+                    assert initialize_retry_task.call_count == 0
+                    assert len(caplog.records) == 1
+                    assert "unable to login" in caplog.messages[0]
+                    assert "please check credential" in caplog.messages[0]
+                    assert manager._ip_address in caplog.messages[0]
+
+    with caplog.at_level(logging.INFO):
+        caplog.clear()
+        with patch("custom_components.lennoxs30.Manager.s30_initialize") as s30_initialize:
+            with patch("custom_components.lennoxs30.Manager.updateState") as update_state:
+                with patch("custom_components.lennoxs30.Manager.initialize_retry_task") as initialize_retry_task:
+                    s30_initialize.side_effect = ValueError("unexpected error")
+                    res = await async_setup_entry(hass, config_entry)
+                    manager: Manager = hass.data[LENNOX_DOMAIN][config_entry.unique_id][MANAGER]
+                    await manager.initialize_task
+                    assert res is True
+                    assert initialize_retry_task.await_count == 1
+                    assert caplog.records[len(caplog.messages) - 2].levelname == "ERROR"
+                    assert "unexpected exception" in caplog.messages[len(caplog.messages) - 2]
+                    assert "connection will be retried" in caplog.messages[len(caplog.messages) - 1]
 
     with caplog.at_level(logging.INFO):
         caplog.clear()
         with patch("custom_components.lennoxs30.Manager.s30_initialize") as s30_initialize:
             with patch("custom_components.lennoxs30.Manager.updateState") as update_state:
-                with patch("asyncio.create_task") as create_task:
+                with patch("custom_components.lennoxs30.Manager.initialize_retry_task") as initialize_retry_task:
                     s30_initialize.side_effect = S30Exception("Timeout waiting for config", EC_CONFIG_TIMEOUT, 0)
-                    ex: HomeAssistantError = None
                     res = await async_setup_entry(hass, config_entry)
                     manager: Manager = hass.data[LENNOX_DOMAIN][config_entry.unique_id][MANAGER]
+                    await manager.initialize_task
 
                     assert res is True
 
-                    assert create_task.call_count == 1
-                    assert create_task.call_args[0][0].__name__ == "initialize_retry_task"
+                    assert initialize_retry_task.await_count == 1
 
                     assert len(caplog.messages) >= 2
 
@@ -143,16 +161,15 @@ async def test_async_setup_entry_local(hass: HomeAssistant, caplog):
         caplog.clear()
         with patch("custom_components.lennoxs30.Manager.s30_initialize") as s30_initialize:
             with patch("custom_components.lennoxs30.Manager.updateState") as update_state:
-                with patch("asyncio.create_task") as create_task:
+                with patch("custom_components.lennoxs30.Manager.initialize_retry_task") as initialize_retry_task:
                     s30_initialize.side_effect = S30Exception("Transport Error", EC_COMMS_ERROR, 0)
-                    ex: HomeAssistantError = None
                     res = await async_setup_entry(hass, config_entry)
                     manager: Manager = hass.data[LENNOX_DOMAIN][config_entry.unique_id][MANAGER]
+                    await manager.initialize_task
 
                     assert res is True
 
-                    assert create_task.call_count == 1
-                    assert create_task.call_args[0][0].__name__ == "initialize_retry_task"
+                    assert initialize_retry_task.await_count == 1
 
                     assert len(caplog.messages) >= 2
 
@@ -164,6 +181,18 @@ async def test_async_setup_entry_local(hass: HomeAssistant, caplog):
                     assert record.levelname == "INFO"
                     assert "connection will be retried" in record.message
 
+    # The retries run in the background task of the config entry, unloading the entry cancels them
+    with patch("custom_components.lennoxs30.Manager.s30_initialize") as s30_initialize:
+        s30_initialize.side_effect = S30Exception("Transport Error", EC_COMMS_ERROR, 0)
+        await async_setup_entry(hass, config_entry)
+        manager: Manager = hass.data[LENNOX_DOMAIN][config_entry.unique_id][MANAGER]
+        assert manager.initialize_task in config_entry._background_tasks
+        await asyncio.sleep(0)
+        assert manager.initialize_task.done() is False
+        manager.initialize_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await manager.initialize_task
+
 
 @pytest.mark.asyncio()
 async def test_async_setup_entry_cloud(hass, caplog):
@@ -459,6 +488,7 @@ async def test_async_unload_entry_success(hass, caplog):
         res = await async_setup_entry(hass, config_entry)
         assert res is True
         manager: Manager = hass.data[LENNOX_DOMAIN][config_entry.unique_id][MANAGER]
+        manager._climate_entities_initialized = True
         with patch.object(hass.config_entries, "async_unload_platforms") as mock_unload_platforms:
             with patch.object(manager, "async_shutdown") as mockasync_shutdown:
                 mock_unload_platforms.return_value = True
@@ -518,6 +548,7 @@ async def test_async_unload_entry_unload_fail(hass, caplog):
             res = await async_setup_entry(hass, config_entry)
             assert res is True
             manager: Manager = hass.data[LENNOX_DOMAIN][config_entry.unique_id][MANAGER]
+            manager._climate_entities_initialized = True
             with patch.object(hass.config_entries, "async_unload_platforms") as mock_unload_platforms:
                 mock_unload_platforms.return_value = False
                 with patch.object(manager, "async_shutdown") as mockasync_shutdown:
@@ -562,6 +593,7 @@ async def test_async_unload_entry_unload_fail(hass, caplog):
             res = await async_setup_entry(hass, config_entry)
             assert res is True
             manager: Manager = hass.data[LENNOX_DOMAIN][config_entry.unique_id][MANAGER]
+            manager._climate_entities_initialized = True
             with patch.object(hass.config_entries, "async_unload_platforms") as mock_unload_platforms:
                 mock_unload_platforms.return_value = True
                 with patch.object(manager, "async_shutdown") as mockasync_shutdown:
@@ -582,3 +614,54 @@ async def test_async_unload_entry_unload_fail(hass, caplog):
                     assert "async_unload_entry" in msg
                     assert "unexpected exception" in msg
                     assert str(config_entry.unique_id) in msg
+
+
+@pytest.mark.asyncio()
+async def test_async_unload_entry_platforms_not_initialized(hass, caplog):
+    data = {
+        "cloud_connection": False,
+        "host": "192.168.1.93",
+        "app_id": "homeassistant",
+        "create_sensors": True,
+        "allergen_defender_switch": False,
+        "create_inverter_power": False,
+        "create_diagnostic_sensors": False,
+        "create_parameters": False,
+        "protocol": "https",
+        "scan_interval": 1,
+        "fast_scan_interval": 0.75,
+        "init_wait_time": 30,
+        "pii_in_message_logs": False,
+        "message_debug_logging": True,
+        "log_messages_to_file": False,
+        "message_debug_file": "messages.log",
+        CONF_FAST_POLL_COUNT: 5,
+        CONF_TIMEOUT: 30,
+    }
+    hass.data[LENNOX_DOMAIN] = {}
+
+    config_entry = config_entries.ConfigEntry(
+        version=1,
+        minor_version=0,
+        domain=DOMAIN,
+        title="Test",
+        data=data,
+        source="my_source",
+        unique_id="12345",
+        discovery_keys={},
+        options=None,
+        subentries_data=[],
+    )
+
+    with patch("custom_components.lennoxs30.Manager.s30_initialize") as _:
+        res = await async_setup_entry(hass, config_entry)
+        assert res is True
+        manager: Manager = hass.data[LENNOX_DOMAIN][config_entry.unique_id][MANAGER]
+        assert manager.platforms_initialized is False
+        with patch.object(hass.config_entries, "async_unload_platforms") as mock_unload_platforms:
+            with patch.object(manager, "async_shutdown") as mockasync_shutdown:
+                res = await async_unload_entry(hass, config_entry)
+                assert mock_unload_platforms.call_count == 0
+                assert mockasync_shutdown.call_count == 1
+                assert hass.data[LENNOX_DOMAIN].get(config_entry.unique_id) is None
+                assert res is True
@@ -0,0 +1,33 @@
+"""Tests the retry backoff"""
+
+# pylint: disable=missing-function-docstring
+from custom_components.lennoxs30.backoff import RetryBackoff
+
+
+def test_retry_backoff_exponential():
+    backoff = RetryBackoff(5, 60, rand=lambda: 0.0)
+    assert [backoff.next_delay() for _ in range(6)] == [5, 10, 20, 40, 60, 60]
+    assert backoff.attempts == 6
+    backoff.reset()
+    assert backoff.attempts == 0
+    assert backoff.next_delay() == 5
+
+
+def test_retry_backoff_jitter():
+    backoff = RetryBackoff(8, 60, jitter=0.25, rand=lambda: 1.0)
+    assert backoff.next_delay() == 6.0
+    assert backoff.next_delay() == 12.0
+    backoff = RetryBackoff(8, 60, jitter=0.25)
+    for _ in range(100):
+        delay = backoff.next_delay()
+        assert 0 < delay <= 60
+
+
+def test_retry_backoff_max_below_initial():
+    backoff = RetryBackoff(10, 5, rand=lambda: 0.0)
+    assert backoff.max_delay == 10
+    assert backoff.next_delay() == 10
+    assert backoff.next_delay() == 10
+    # Large attempt counts do not overflow
+    backoff.attempts = 10000
+    assert backoff.next_delay() == 10
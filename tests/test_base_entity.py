@@ -17,6 +17,10 @@ from custom_components.lennoxs30.base_entity import S30BaseEntityMixin
 class TestEntity(S30BaseEntityMixin, Entity):
     def __init__(self, manager: Manager, system: lennox_system):
         super().__init__(manager, system)
+        self.values: tuple = None
+
+    def state_fingerprint(self) -> tuple:
+        return None if self.values is None else (self.available, self.values)
 
 
 @pytest.mark.asyncio()
@@ -88,3 +92,187 @@ async def test_s30_base_entity_subscription(hass, manager: Manager, caplog):
         system.executeOnUpdateCallbacks()
         assert update_callback.call_count == 1
         assert c.available == True
+
+
+@pytest.mark.asyncio()
+async def test_s30_base_entity_message_cycle(hass, manager: Manager, caplog):
+    system: lennox_system = manager.api.system_list[0]
+    c = TestEntity(manager, system)
+    c.hass = hass
+    c.entity_id = "sensor.test_entity"
+    callbacks = manager.entity_callbacks
+    writes = manager.entity_writes
+
+    def process_message(_message):
+        c.schedule_update_ha_state()
+        c.schedule_update_ha_state()
+        c.schedule_update_ha_state()
+
+    async def message_pump():
+        # The cycle is not held open while waiting for messages, a write made meanwhile is not delayed
+        assert manager._message_cycle is False
+        with patch("homeassistant.helpers.entity.Entity.schedule_update_ha_state") as schedule_update_ha_state:
+            c.schedule_update_ha_state()
+            assert schedule_update_ha_state.call_count == 1
+        manager.api.processMessage({})
+        manager.api.processMessage({})
+        return True
+
+    with (
+        patch.object(c, "async_write_ha_state") as async_write_ha_state,
+        patch.object(manager, "_api_process_message", side_effect=process_message),
+    ):
+        with patch.object(manager.api, "messagePump", side_effect=message_pump):
+            assert await manager.messagePump() is True
+        assert async_write_ha_state.call_count == 1
+        assert manager.entity_callbacks == callbacks + 7
+        assert manager.entity_writes == writes + 2
+        assert len(manager._dirty_entities) == 0
+        assert manager._message_cycle is False
+        assert manager._retrieving is False
+    writes = manager.entity_writes
+    callbacks = manager.entity_callbacks
+
+    # Outside of a message cycle the state write is scheduled immediately
+    with patch("homeassistant.helpers.entity.Entity.schedule_update_ha_state") as schedule_update_ha_state:
+        c.schedule_update_ha_state()
+        assert schedule_update_ha_state.call_count == 1
+        assert manager.entity_writes == writes + 1
+
+    # Without a fingerprint the entity is always written, Home Assistant skips a state that has not changed
+    with patch.object(c, "async_write_ha_state") as async_write_ha_state:
+        suppressed = manager.entity_writes_suppressed
+        for _ in range(2):
+            manager._message_cycle = True
+            c.schedule_update_ha_state()
+            assert manager.flush_dirty_entities() == 1
+        assert async_write_ha_state.call_count == 2
+        assert manager.entity_writes_suppressed == suppressed
+
+    # The same fingerprint is not written again
+    c.values = (1,)
+    with patch.object(c, "async_write_ha_state") as async_write_ha_state:
+        manager._message_cycle = True
+        c.schedule_update_ha_state()
+        assert manager.flush_dirty_entities() == 1
+        manager._message_cycle = True
+        c.schedule_update_ha_state()
+        assert manager.flush_dirty_entities() == 0
+        assert async_write_ha_state.call_count == 1
+        assert manager.entity_writes_suppressed == suppressed + 1
+
+        # A change in the values is written
+        c.values = (2,)
+        manager._message_cycle = True
+        c.schedule_update_ha_state()
+        assert manager.flush_dirty_entities() == 1
+        assert async_write_ha_state.call_count == 2
+
+        # Entities that force updates are always written
+        c._attr_force_update = True
+        manager._message_cycle = True
+        c.schedule_update_ha_state()
+        assert manager.flush_dirty_entities() == 1
+        assert async_write_ha_state.call_count == 3
+        c._attr_force_update = False
+        manager._message_cycle = True
+        c.schedule_update_ha_state()
+        assert manager.flush_dirty_entities() == 1
+        assert async_write_ha_state.call_count == 4
+
+        # A write outside of a message cycle is not fingerprinted
+        with patch("homeassistant.helpers.entity.Entity.schedule_update_ha_state"):
+            c.schedule_update_ha_state()
+        assert c.written_fingerprint is None
+        manager._message_cycle = True
+        c.schedule_update_ha_state()
+        assert manager.flush_dirty_entities() == 1
+        assert async_write_ha_state.call_count == 5
+
+    # Removed entities are not written
+    with patch.object(c, "async_write_ha_state") as async_write_ha_state:
+        manager._message_cycle = True
+        c.schedule_update_ha_state()
+        c.hass = None
+        manager.flush_dirty_entities()
+        assert async_write_ha_state.call_count == 0
+
+
+@pytest.mark.asyncio()
+async def test_s30_base_entity_callback_registration(hass, manager: Manager, caplog):
+    system: lennox_system = manager.api.system_list[0]
+    c = TestEntity(manager, system)
+    system_callbacks = len(system._callbacks)
+    await c.async_added_to_hass()
+    await c.async_added_to_hass()
+    # Registering again has no effect
+    assert list(manager._cs_callbacks) == [c.connection_state_callback]
+    assert list(manager._cloud_status_callbacks[system.sysId]) == [c.cloud_status_update_callback]
+    # A single api callback is registered per system
+    assert len(system._callbacks) == system_callbacks + 1
+    c2 = TestEntity(manager, system)
+    await c2.async_added_to_hass()
+    assert len(system._callbacks) == system_callbacks + 1
+    assert len(manager._cloud_status_callbacks[system.sysId]) == 2
+
+    # Removing the entity removes the callbacks
+    c.hass = hass
+    c.entity_id = "sensor.test_entity"
+    await c.async_remove(force_remove=True)
+    assert list(manager._cs_callbacks) == [c2.connection_state_callback]
+    assert list(manager._cloud_status_callbacks[system.sysId]) == [c2.cloud_status_update_callback]
+    with patch.object(c, "schedule_update_ha_state") as update_callback:
+        manager.updateState(DS_RETRY_WAIT)
+        assert update_callback.call_count == 0
+
+
+@pytest.mark.asyncio()
+async def test_s30_base_entity_batched_availability(hass, manager: Manager, caplog):
+    system: lennox_system = manager.api.system_list[0]
+    entities: list[TestEntity] = []
+    for i in range(10):
+        c = TestEntity(manager, system)
+        c.hass = hass
+        c.entity_id = f"sensor.test_entity_{i}"
+        c.values = ()
+        await c.async_added_to_hass()
+        entities.append(c)
+
+    writes = manager.entity_writes
+    with patch("homeassistant.helpers.entity.Entity.schedule_update_ha_state") as schedule_update_ha_state:
+        with patch("homeassistant.helpers.entity.Entity.async_write_ha_state") as async_write_ha_state:
+            manager.updateState(DS_RETRY_WAIT)
+            # The states are written in a single pass, no tasks are scheduled
+            assert schedule_update_ha_state.call_count == 0
+            assert async_write_ha_state.call_count == 10
+            assert manager.entity_writes == writes + 10
+            assert manager._message_cycle is False
+
+            # Already unavailable, the state written would be the same
+            async_write_ha_state.reset_mock()
+            suppressed = manager.entity_writes_suppressed
+            system.attr_updater({"status": "offline"}, "status", "cloud_status")
+            system.executeOnUpdateCallbacks()
+            assert schedule_update_ha_state.call_count == 0
+            assert async_write_ha_state.call_count == 0
+            assert manager.entity_writes_suppressed == suppressed + 10
+
+    # During a message cycle the entities are written at the end of the cycle
+    manager.updateState(DS_CONNECTED)
+
+    def process_message(_message):
+        system.attr_updater({"status": "online"}, "status", "cloud_status")
+        system.executeOnUpdateCallbacks()
+
+    async def message_pump():
+        manager.api.processMessage({})
+        assert len(manager._dirty_entities) == 10
+        return True
+
+    with patch("homeassistant.helpers.entity.Entity.async_write_ha_state") as async_write_ha_state:
+        with (
+            patch.object(manager, "_api_process_message", side_effect=process_message),
+            patch.object(manager.api, "messagePump", side_effect=message_pump),
+        ):
+            assert await manager.messagePump() is True
+        assert async_write_ha_state.call_count == 10
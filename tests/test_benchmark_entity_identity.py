@@ -0,0 +1,135 @@
+"""Benchmarks the CPU time of entity state writes, with the entity identity computed once or on every access.
+
+The benchmark is skipped unless LENNOXS30_BENCHMARK is set:
+
+    LENNOXS30_BENCHMARK=1 python -m pytest tests/test_benchmark_entity_identity.py -s
+"""
+
+# pylint: disable=missing-function-docstring
+# pylint: disable=protected-access
+# pylint: disable=line-too-long
+import os
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from lennoxs30api.s30api_async import lennox_system
+
+from custom_components.lennoxs30 import Manager
+from custom_components.lennoxs30.base_entity import S30BaseEntityMixin
+from custom_components.lennoxs30.const import (
+    MANAGER,
+    UNIQUE_ID_SUFFIX_DIAG_SENSOR,
+    UNIQUE_ID_SUFFIX_EQ_PARAM_NUMBER,
+    UNIQUE_ID_SUFFIX_EQ_PARAM_SELECT,
+)
+from custom_components.lennoxs30.helpers import helper_get_equipment_device_info
+from custom_components.lennoxs30.number import EquipmentParameterNumber
+from custom_components.lennoxs30.number import async_setup_entry as number_setup_entry
+from custom_components.lennoxs30.select import EquipmentParameterSelect
+from custom_components.lennoxs30.select import async_setup_entry as select_setup_entry
+from custom_components.lennoxs30.sensor import S30DiagSensor
+from custom_components.lennoxs30.sensor import async_setup_entry as sensor_setup_entry
+
+MIN_ENTITIES = 300
+ROUNDS = 50
+
+
+def _recomputed_class(cls: type, unique_id) -> type:
+    """Returns a subclass that computes unique_id, name and device_info on every access, as the entities used to."""
+
+    def device_info(self):
+        if hasattr(self, "_get_device_info"):
+            return self._get_device_info()
+        return helper_get_equipment_device_info(self._manager, self._system, self.equipment.equipment_id)
+
+    return type(
+        f"Recomputed{cls.__name__}",
+        (cls,),
+        {
+            "unique_id": property(unique_id),
+            "name": property(lambda self: self._myname),
+            "device_info": property(device_info),
+        },
+    )
+
+
+RECOMPUTED = {
+    S30DiagSensor: _recomputed_class(
+        S30DiagSensor,
+        lambda self: (
+            f"{self._system.unique_id}_{UNIQUE_ID_SUFFIX_DIAG_SENSOR}_{self._equipment.equipment_id}_{self._diagnostic.name}".replace(
+                "-", ""
+            )
+        ),
+    ),
+    EquipmentParameterNumber: _recomputed_class(
+        EquipmentParameterNumber,
+        lambda self: (
+            f"{self._system.unique_id}_{UNIQUE_ID_SUFFIX_EQ_PARAM_NUMBER}_{self.equipment.equipment_id}_{self.parameter.pid}".replace(
+                "-", ""
+            )
+        ),
+    ),
+    EquipmentParameterSelect: _recomputed_class(
+        EquipmentParameterSelect,
+        lambda self: (
+            f"{self._system.unique_id}_{UNIQUE_ID_SUFFIX_EQ_PARAM_SELECT}_{self.equipment.equipment_id}_{self.parameter.pid}".replace(
+                "-", ""
+            )
+        ),
+    ),
+}
+
+
+async def _create_entities(hass: HomeAssistant, manager: Manager) -> list[S30BaseEntityMixin]:
+    entities: list[S30BaseEntityMixin] = []
+    for setup_entry in (sensor_setup_entry, number_setup_entry, select_setup_entry):
+        async_add_entities = Mock()
+        await setup_entry(hass, manager.config_entry, async_add_entities)
+        entities.extend(e for e in async_add_entities.call_args[0][0] if type(e) in RECOMPUTED)
+    return entities
+
+
+def _time_writes(entities: list[S30BaseEntityMixin], rounds: int = ROUNDS) -> float:
+    """Returns the mean microseconds of CPU to access the identity and write the state of an entity."""
+    start = time.process_time()
+    for _ in range(rounds):
+        for entity in entities:
+            # Accessed by Home Assistant when the entity is added and by the integration when logging
+            _ = (entity.unique_id, entity.device_info)
+            entity.async_write_ha_state()
+    return (time.process_time() - start) * 1e6 / (rounds * len(entities))
+
+
+@pytest.mark.skipif(os.environ.get("LENNOXS30_BENCHMARK") is None, reason="benchmark, set LENNOXS30_BENCHMARK to run")
+@pytest.mark.asyncio()
+async def test_benchmark_entity_identity(hass, manager_system_04_furn_ac_zoning: Manager):
+    manager = manager_system_04_furn_ac_zoning
+    system: lennox_system = manager.api.system_list[0]
+    system.diagLevel = 2
+    manager.create_diagnostic_sensors = True
+    manager.create_equipment_parameters = True
+    hass.data["lennoxs30"] = {manager.config_entry.unique_id: {MANAGER: manager}}
+    await manager.create_devices()
+
+    entities: list[S30BaseEntityMixin] = []
+    with patch("homeassistant.helpers.entity_platform.async_get_current_platform"):
+        while len(entities) < MIN_ENTITIES:
+            entities.extend(await _create_entities(hass, manager))
+    for index, entity in enumerate(entities):
+        entity.hass = hass
+        entity.entity_id = f"{type(entity).__module__.rsplit('.', 1)[1]}.benchmark_{index}"
+    # The first write of an entity without a platform logs a warning, keep it out of the timing
+    _time_writes(entities, 1)
+
+    cached = _time_writes(entities)
+    for entity in entities:
+        entity.__class__ = RECOMPUTED[type(entity)]
+    recomputed = _time_writes(entities)
+    for entity in entities:
+        entity.__class__ = entity.__class__.__bases__[0]
+
+    print(f"\n{len(entities)} entities: identity recomputed {recomputed:.1f} us per write, computed once {cached:.1f} us per write")
+    assert len(entities) >= MIN_ENTITIES
@@ -17,6 +17,7 @@ from homeassistant.components.climate.const import (
     HVACMode,
 )
 from homeassistant.const import UnitOfTemperature
+from homeassistant.core import State
 from homeassistant.exceptions import HomeAssistantError
 from lennoxs30api.s30api_async import (
     LENNOX_BAD_STATUS,
@@ -42,6 +43,7 @@ from lennoxs30api.s30api_async import (
     lennox_system,
     lennox_zone,
 )
+from pytest_homeassistant_custom_component.common import mock_restore_cache
 
 from custom_components.lennoxs30 import (
     Manager,
@@ -51,6 +53,7 @@ from custom_components.lennoxs30.climate import (
     PRESET_CANCEL_HOLD,
     PRESET_SCHEDULE_OVERRIDE,
     S30Climate,
+    S30RestoreClimate,
 )
 from custom_components.lennoxs30.const import LENNOX_DOMAIN
 from tests.conftest import conf_test_exception_handling, conftest_base_entity_availability
@@ -394,10 +397,52 @@ async def test_climate_system_subscription(hass, manager_mz: Manager):
 
     with patch.object(c, "schedule_update_ha_state") as update_callback:
         zone._dirty = True
+        zone._dirtyList = ["temperature"]
         zone.executeOnUpdateCallbacks()
         assert update_callback.call_count == 1
 
 
+@pytest.mark.asyncio()
+async def test_climate_zone_subscription(hass, manager_mz: Manager):
+    manager: Manager = manager_mz
+    system: lennox_system = manager.api.system_list[0]
+    zone: lennox_zone = system.zone_list[0]
+    c = S30Climate(hass, manager, system, zone)
+    await c.async_added_to_hass()
+
+    with patch.object(c, "schedule_update_ha_state") as update_callback:
+        attrs = c.extra_state_attributes
+        assert c.extra_state_attributes is attrs
+
+        # Attributes the entity does not render do not write the state
+        zone.processMessage({"status": {"period": {"startTime": 12345}}})
+        assert update_callback.call_count == 0
+        assert c.extra_state_attributes is attrs
+
+        # The state is written, the attributes are not rebuilt
+        zone.processMessage({"status": {"temperature": zone.temperature + 1}})
+        assert update_callback.call_count == 1
+        assert c.extra_state_attributes is attrs
+
+        zone.processMessage({"status": {"damper": 42}})
+        assert update_callback.call_count == 2
+        attrs = c.extra_state_attributes
+        assert attrs["damper"] == 42
+        assert c.extra_state_attributes is attrs
+
+        system.attr_updater({"zoningMode": LENNOX_ZONING_MODE_CENTRAL}, "zoningMode", "zoningMode")
+        system.executeOnUpdateCallbacks()
+        assert update_callback.call_count == 3
+        assert c.extra_state_attributes["zoningMode"] == LENNOX_ZONING_MODE_CENTRAL
+
+    # The attributes are rebuilt when the entity becomes stale
+    manager.restore_state = True
+    manager.connected = False
+    assert c.extra_state_attributes["stale"] is True
+    manager.connected = True
+    assert c.extra_state_attributes["stale"] is False
+
+
 @pytest.mark.asyncio()
 async def test_climate_preset_mode(hass, manager_mz: Manager):
     manager = manager_mz
@@ -1498,3 +1543,27 @@ async def test_climate_turn_off(hass, manager_mz: Manager, caplog):
         await c.async_turn_off()
         assert setHVACMode.call_count == 1
         assert setHVACMode.await_args[0][0] == LENNOX_HVAC_OFF
+
+
+@pytest.mark.asyncio()
+async def test_climate_restore_state(hass, manager: Manager):
+    system: lennox_system = manager.api.system_list[0]
+    zone: lennox_zone = system.getZone(0)
+    manager.restore_state = True
+    manager.is_metric = True
+    c = S30RestoreClimate(hass, manager, system, zone)
+    c.entity_id = "climate.zone_1"
+    mock_restore_cache(hass, (State(c.entity_id, HVACMode.HEAT, {"current_temperature": 20.5, "current_humidity": 41}),))
+    await c.async_added_to_hass()
+
+    manager.connected = False
+    assert c.available is True
+    assert c.extra_state_attributes["stale"] is True
+    with patch.object(zone, "getTemperatureC", return_value=None), patch.object(zone, "getHumidity", return_value=None):
+        assert c.current_temperature == 20.5
+        assert c.current_humidity == 41
+
+    manager.connected = True
+    assert c.extra_state_attributes["stale"] is False
+    assert c.current_temperature == zone.getTemperatureC()
+    assert c.current_humidity == zone.getHumidity()
@@ -2,6 +2,7 @@ import logging
 from unittest.mock import Mock
 
 import pytest
+from homeassistant.helpers.restore_state import RestoreEntity
 from lennoxs30api.s30api_async import (
     lennox_system,
 )
@@ -11,6 +12,7 @@ from custom_components.lennoxs30 import (
 )
 from custom_components.lennoxs30.climate import (
     S30Climate,
+    S30RestoreClimate,
     async_setup_entry,
 )
 from custom_components.lennoxs30.const import MANAGER
@@ -27,6 +29,7 @@ async def test_async_setup_entry_mz(hass, manager_mz: Manager, caplog):
     async_add_entities = Mock()
     await async_setup_entry(hass, entry, async_add_entities)
     assert async_add_entities.called == 1
+    assert hass.services.has_service("lennoxs30", "set_zones")
     sensor_list = async_add_entities.call_args[0][0]
     assert len(sensor_list) == 4
     for i in range(4):
@@ -50,6 +53,15 @@ async def test_async_setup_entry(hass, manager: Manager, caplog):
     assert isinstance(sensor_list[0], S30Climate)
     c: S30Climate = sensor_list[0]
     assert c._zone == system.zone_list[0]
+    assert not isinstance(c, RestoreEntity)
+
+    # The thermostat restores its saved values only when restore_state is enabled
+    manager.restore_state = True
+    async_add_entities = Mock()
+    await async_setup_entry(hass, entry, async_add_entities)
+    c = async_add_entities.call_args[0][0][0]
+    assert isinstance(c, S30RestoreClimate)
+    assert isinstance(c, RestoreEntity)
 
 
 @pytest.mark.asyncio()
@@ -0,0 +1,131 @@
+"""Tests the zone setpoint and mode command queue"""
+
+# pylint: disable=missing-function-docstring
+# pylint: disable=protected-access
+# pylint: disable=line-too-long
+import asyncio
+from unittest.mock import call, patch
+
+import pytest
+from homeassistant.exceptions import HomeAssistantError
+from lennoxs30api.s30api_async import lennox_system, lennox_zone
+from lennoxs30api.s30exception import EC_COMMS_ERROR, S30Exception
+
+from custom_components.lennoxs30 import Manager
+from custom_components.lennoxs30.climate import S30Climate
+
+
+@pytest.mark.asyncio()
+async def test_command_queue_immediate(hass, manager_mz: Manager):
+    manager = manager_mz
+    system: lennox_system = manager.api.system_list[0]
+    zone: lennox_zone = system.zone_list[1]
+    assert manager.command_queue.debounce == 0.0
+    with patch.object(zone, "perform_setpoint") as perform_setpoint:
+        with patch.object(zone, "setHVACMode") as set_hvac_mode:
+            await manager.command_queue.set_hvac_mode(zone, "heat")
+            await manager.command_queue.set_setpoints(zone, r_hsp=68)
+            assert set_hvac_mode.mock_calls == [call("heat")]
+            assert perform_setpoint.mock_calls == [call(r_hsp=68)]
+    assert manager.command_queue.sent == 2
+    assert len(manager.command_queue._pending) == 0
+
+
+@pytest.mark.asyncio()
+async def test_command_queue_last_writer_wins(hass, manager_mz: Manager):
+    manager = manager_mz
+    manager.is_metric = False
+    system: lennox_system = manager.api.system_list[0]
+    system.single_setpoint_mode = False
+    zone: lennox_zone = system.zone_list[1]
+    assert zone.systemMode == "cool"
+    manager.command_queue.debounce = 0.01
+    c = S30Climate(hass, manager, system, zone)
+    with patch.object(zone, "perform_setpoint") as perform_setpoint:
+        await asyncio.gather(
+            c.async_set_temperature(temperature=73),
+            c.async_set_temperature(temperature=74),
+            c.async_set_temperature(temperature=75),
+        )
+        assert perform_setpoint.mock_calls == [call(r_csp=75)]
+    assert manager.command_queue.sent == 1
+    assert manager.command_queue.superseded == 2
+    assert len(manager.command_queue._pending) == 0
+
+    # Changes after the window are sent in a new command
+    with patch.object(zone, "perform_setpoint") as perform_setpoint:
+        await c.async_set_temperature(temperature=76)
+        assert perform_setpoint.mock_calls == [call(r_csp=76)]
+    assert manager.command_queue.sent == 2
+
+
+@pytest.mark.asyncio()
+async def test_command_queue_merge(hass, manager_mz: Manager):
+    manager = manager_mz
+    system: lennox_system = manager.api.system_list[0]
+    zone: lennox_zone = system.zone_list[1]
+    queue = manager.command_queue
+    queue.debounce = 0.01
+    calls = []
+
+    async def set_hvac_mode(mode):
+        calls.append(("mode", mode))
+
+    async def perform_setpoint(**kwargs):
+        calls.append(("setpoint", kwargs))
+
+    with patch.object(zone, "perform_setpoint", side_effect=perform_setpoint):
+        with patch.object(zone, "setHVACMode", side_effect=set_hvac_mode):
+            results = await asyncio.gather(
+                queue.set_setpoints(zone, r_hsp=65, r_csp=80),
+                queue.set_hvac_mode(zone, "cool"),
+                queue.set_setpoints(zone, r_cspC=25.5),
+                queue.set_hvac_mode(zone, "heat and cool"),
+            )
+    assert results == [None, None, None, None]
+    # The mode is sent first, the celsius cooling setpoint replaces the fahrenheit one
+    assert calls == [("mode", "heat and cool"), ("setpoint", {"r_hsp": 65, "r_cspC": 25.5})]
+    assert queue.sent == 2
+    assert queue.superseded == 1
+
+
+@pytest.mark.asyncio()
+async def test_command_queue_error(hass, manager_mz: Manager):
+    manager = manager_mz
+    manager.is_metric = False
+    system: lennox_system = manager.api.system_list[0]
+    system.single_setpoint_mode = False
+    zone: lennox_zone = system.zone_list[1]
+    manager.command_queue.debounce = 0.01
+    c = S30Climate(hass, manager, system, zone)
+    with patch.object(zone, "perform_setpoint") as perform_setpoint:
+        perform_setpoint.side_effect = S30Exception("Simulated", EC_COMMS_ERROR, 1)
+        results = await asyncio.gather(
+            c.async_set_temperature(temperature=73),
+            c.async_set_temperature(temperature=75),
+            return_exceptions=True,
+        )
+        assert perform_setpoint.mock_calls == [call(r_csp=75)]
+    # The superseded caller is not affected by the failure
+    assert results[0] is None
+    assert isinstance(results[1], HomeAssistantError)
+    assert "Simulated" in str(results[1])
+    assert len(manager.command_tracker.pending) == 0
+
+
+@pytest.mark.asyncio()
+async def test_command_queue_cancel(hass, manager_mz: Manager):
+    manager = manager_mz
+    system: lennox_system = manager.api.system_list[0]
+    zone: lennox_zone = system.zone_list[1]
+    queue = manager.command_queue
+    queue.debounce = 10.0
+    with patch.object(zone, "perform_setpoint") as perform_setpoint:
+        task = asyncio.create_task(queue.set_setpoints(zone, r_hsp=65))
+        await asyncio.sleep(0)
+        assert len(queue._pending) == 1
+        queue.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert perform_setpoint.call_count == 0
+    assert len(queue._pending) == 0
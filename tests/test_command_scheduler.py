@@ -0,0 +1,146 @@
+"""Tests the command scheduler"""
+
+# pylint: disable=missing-function-docstring
+# pylint: disable=protected-access
+# pylint: disable=line-too-long
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from lennoxs30api.s30api_async import lennox_system
+
+from custom_components.lennoxs30 import Manager
+from custom_components.lennoxs30.command_scheduler import (
+    PRIORITY_DIAGNOSTIC,
+    PRIORITY_PARAMETER,
+    PRIORITY_USER,
+    CommandScheduler,
+)
+
+
+@pytest.mark.asyncio()
+async def test_command_scheduler_concurrency():
+    scheduler = CommandScheduler(concurrency=2, rate=1000.0, burst=1000)
+    order = []
+    release = asyncio.Event()
+
+    async def command(name: str, priority: int):
+        async with scheduler.slot(priority):
+            order.append(name)
+            await release.wait()
+
+    tasks = [asyncio.create_task(command("first", PRIORITY_DIAGNOSTIC)), asyncio.create_task(command("second", PRIORITY_DIAGNOSTIC))]
+    await asyncio.sleep(0)
+    assert scheduler.in_flight == 2
+    tasks.append(asyncio.create_task(command("diagnostic", PRIORITY_DIAGNOSTIC)))
+    tasks.append(asyncio.create_task(command("parameter", PRIORITY_PARAMETER)))
+    tasks.append(asyncio.create_task(command("user", PRIORITY_USER)))
+    await asyncio.sleep(0)
+    assert order == ["first", "second"]
+    assert scheduler.queued == 3
+    assert scheduler.max_queued == 3
+
+    # The waiting commands are released by priority
+    release.set()
+    await asyncio.gather(*tasks)
+    assert order == ["first", "second", "user", "parameter", "diagnostic"]
+    assert scheduler.in_flight == 0
+    assert scheduler.queued == 0
+
+    metrics = scheduler.get_metrics()
+    assert metrics["in_flight"] == 0
+    assert metrics["queued"] == 0
+    assert metrics["max_queued"] == 3
+    assert metrics["wait"]["user"]["count"] == 1
+    assert metrics["wait"]["parameter"]["count"] == 1
+    assert metrics["wait"]["diagnostic"]["count"] == 3
+    assert "buckets" not in metrics["wait"]["user"]
+
+
+@pytest.mark.asyncio()
+async def test_command_scheduler_rate():
+    scheduler = CommandScheduler(concurrency=10, rate=10.0, burst=2)
+    now = 100.0
+    scheduler._updated = now
+
+    scheduler._clock = lambda: now
+    await scheduler.acquire()
+    await scheduler.acquire()
+    # The burst is used, the next command waits for a token
+    task = asyncio.create_task(scheduler.acquire())
+    await asyncio.sleep(0)
+    assert task.done() is False
+    assert scheduler.queued == 1
+    assert scheduler._timer is not None
+    timer = scheduler._timer
+    assert timer.when() - asyncio.get_running_loop().time() == pytest.approx(0.1, abs=0.01)
+
+    now = 100.2
+    timer.cancel()
+    scheduler._on_timer()
+    await task
+    assert scheduler.in_flight == 3
+    assert scheduler._tokens == pytest.approx(1.0)
+
+    # Tokens do not accumulate beyond the burst
+    now = 200.0
+    scheduler.release()
+    await scheduler.acquire()
+    assert scheduler._tokens == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio()
+async def test_command_scheduler_cancel():
+    scheduler = CommandScheduler(concurrency=1, rate=1000.0, burst=1000)
+    await scheduler.acquire()
+    waiting = asyncio.create_task(scheduler.acquire())
+    after = asyncio.create_task(scheduler.acquire(PRIORITY_DIAGNOSTIC))
+    await asyncio.sleep(0)
+    assert scheduler.queued == 2
+
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert scheduler.queued == 1
+
+    # The cancelled command does not hold a place in flight
+    scheduler.release()
+    await after
+    assert scheduler.in_flight == 1
+    scheduler.release()
+    assert scheduler.in_flight == 0
+
+
+@pytest.mark.asyncio()
+async def test_manager_send_command_priority(hass, manager: Manager):
+    system: lennox_system = manager.api.system_list[0]
+    manager.command_scheduler = CommandScheduler(concurrency=1, rate=1000.0, burst=1000)
+    await manager.command_scheduler.acquire()
+
+    command = AsyncMock()
+    tasks = [
+        asyncio.create_task(manager.send_command("diagnostic_level", system, {"diagLevel": 2}, command("diagnostic_level"))),
+        asyncio.create_task(manager.send_command("equipment_parameter", system, {"value": None}, command("equipment_parameter"))),
+        asyncio.create_task(manager.send_command("fan_mode", system, {"fanMode": "on"}, command("fan_mode"))),
+    ]
+    await asyncio.sleep(0)
+    assert manager.command_scheduler.queued == 3
+    assert command.await_count == 0
+    manager.command_scheduler.release()
+    await asyncio.gather(*tasks)
+    assert [c.args[0] for c in command.await_args_list] == ["fan_mode", "equipment_parameter", "diagnostic_level"]
+
+    # Cancelled while waiting, the command is never sent and not tracked
+    await manager.command_scheduler.acquire()
+    manager.command_tracker.pending.clear()
+    command = AsyncMock()
+    task = asyncio.create_task(manager.send_command("fan_mode", system, {"fanMode": "auto"}, command()))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert command.await_count == 0
+    assert len(manager.command_tracker.pending) == 0
+    manager.command_scheduler.release()
+
+    assert "command_scheduler" in manager._update_metrics()
@@ -0,0 +1,158 @@
+"""Tests the command confirmation tracking"""
+
+# pylint: disable=missing-function-docstring
+# pylint: disable=protected-access
+# pylint: disable=line-too-long
+from unittest.mock import patch
+
+import pytest
+from lennoxs30api.s30api_async import lennox_system, lennox_zone
+from lennoxs30api.s30exception import EC_COMMS_ERROR, S30Exception
+
+from custom_components.lennoxs30 import Manager
+from custom_components.lennoxs30.climate import S30Climate
+from custom_components.lennoxs30.command_tracker import CommandTracker
+
+
+class Target:
+    def __init__(self):
+        self.mode = "off"
+        self.setpoint = 70
+
+
+def test_command_tracker_confirm():
+    tracker = CommandTracker(timeout=10)
+    target = Target()
+    pending = tracker.start("mode", target, {"mode": "cool"}, now=100.0)
+    assert tracker.pending == [pending]
+    assert tracker.check(now=100.5) == []
+
+    # Another value is not the requested one
+    target.mode = "heat"
+    assert tracker.check(now=100.7) == []
+
+    target.mode = "cool"
+    assert tracker.check(now=101.0) == [pending]
+    assert len(tracker.pending) == 0
+    assert tracker.latency["mode"].count == 1
+    assert tracker.latency["mode"].total == 1000.0
+
+    metrics = tracker.get_metrics()
+    assert metrics["mode"]["count"] == 1
+    assert metrics["mode"]["p50"] == 1000
+    assert metrics["mode"]["timeouts"] == 0
+    assert "buckets" not in metrics["mode"]
+
+
+def test_command_tracker_no_change_expected():
+    tracker = CommandTracker(timeout=10)
+    target = Target()
+    # Already has the requested value
+    assert tracker.start("mode", target, {"mode": "off"}, now=100.0) is None
+    assert len(tracker.pending) == 0
+    # Unknown resulting value is always tracked
+    pending = tracker.start("setpoint", target, {"setpoint": None}, now=100.0)
+    assert pending.snapshot == {"setpoint": 70}
+    # Confirmed by any change
+    target.setpoint = 71
+    assert pending.confirmed() is True
+    tracker.cancel(pending)
+    assert len(tracker.pending) == 0
+    tracker.cancel(None)
+
+
+def test_command_tracker_timeout():
+    tracker = CommandTracker(timeout=10)
+    target = Target()
+    tracker.start("setpoint", target, {"setpoint": 72}, now=100.0)
+    assert tracker.check(now=105.0) == []
+    assert len(tracker.pending) == 1
+    assert tracker.check(now=111.0) == []
+    assert len(tracker.pending) == 0
+    assert tracker.timeouts["setpoint"] == 1
+    # A late update is not recorded
+    target.setpoint = 72
+    assert tracker.check(now=112.0) == []
+    metrics = tracker.get_metrics()
+    assert metrics["setpoint"]["count"] == 0
+    assert metrics["setpoint"]["p95"] is None
+    assert metrics["setpoint"]["timeouts"] == 1
+
+
+def test_command_tracker_requested_value():
+    expired = []
+    tracker = CommandTracker(timeout=10, on_expire=expired.append)
+    target = Target()
+    other = Target()
+    assert tracker.requested_value(target, "mode", "off") == "off"
+    first = tracker.start("mode", target, {"mode": "cool", "setpoint": None}, now=100.0)
+    # Only attributes with a known requested value are kept
+    assert first.requested == {"mode": "cool"}
+    assert tracker.requested_value(target, "mode", "off") == "cool"
+    assert tracker.requested_value(target, "setpoint", 70) == 70
+    assert tracker.requested_value(other, "mode", "off") == "off"
+    # The most recent command wins
+    second = tracker.start("mode", target, {"mode": "heat"}, now=105.0)
+    assert tracker.requested_value(target, "mode", "off") == "heat"
+    # Commands older than max_age are ignored
+    assert tracker.requested_value(target, "mode", "off", max_age=3.0, now=107.0) == "heat"
+    assert tracker.requested_value(target, "mode", "off", max_age=3.0, now=109.0) == "off"
+
+    assert tracker.check(now=111.0) == []
+    assert expired == [first]
+    assert tracker.requested_value(target, "mode", "off") == "heat"
+    target.mode = "heat"
+    assert tracker.check(now=112.0) == [second]
+    assert expired == [first]
+    assert tracker.requested_value(target, "mode", "off") == "off"
+
+
+@pytest.mark.asyncio()
+async def test_manager_send_command(hass, manager: Manager):
+    system: lennox_system = manager.api.system_list[0]
+    zone: lennox_zone = system.zone_list[0]
+    tracker = manager.command_tracker
+
+    # A failed command is not tracked
+    with patch.object(zone, "setFanMode", side_effect=S30Exception("error", EC_COMMS_ERROR, 0)):
+        with pytest.raises(S30Exception):
+            await manager.send_command("fan_mode", zone, {"fanMode": "on"}, zone.setFanMode("on"))
+    assert len(tracker.pending) == 0
+
+    with patch.object(zone, "setFanMode") as set_fan_mode:
+        await manager.send_command("fan_mode", zone, {"fanMode": "on"}, zone.setFanMode("on"))
+        assert set_fan_mode.call_count == 1
+    assert len(tracker.pending) == 1
+
+    # Messages that do not change the attribute do not confirm the command
+    manager.api.processMessage(
+        {"SenderID": system.sysId, "Data": {"zones": [{"id": zone.id, "status": {"temperature": zone.temperature + 1}}]}}
+    )
+    assert len(tracker.pending) == 1
+
+    manager.api.processMessage(
+        {"SenderID": system.sysId, "Data": {"zones": [{"id": zone.id, "status": {"fan": True, "period": {"fanMode": "on"}}}]}}
+    )
+    assert zone.fanMode == "on"
+    assert len(tracker.pending) == 0
+    assert manager.getMetricsList()["command_latency"]["fan_mode"]["count"] == 1
+
+
+@pytest.mark.asyncio()
+async def test_climate_set_temperature_tracked(hass, manager_mz: Manager):
+    manager = manager_mz
+    manager.is_metric = False
+    system: lennox_system = manager.api.system_list[0]
+    system.single_setpoint_mode = False
+    zone: lennox_zone = system.zone_list[1]
+    assert zone.systemMode == "cool"
+    c = S30Climate(hass, manager, system, zone)
+    with patch.object(zone, "perform_setpoint") as perform_setpoint:
+        with patch.object(manager, "send_command", wraps=manager.send_command) as send_command:
+            await c.async_set_temperature(temperature=zone.csp + 1)
+            assert perform_setpoint.call_count == 1
+            assert send_command.call_count == 1
+            assert send_command.mock_calls[0].args[0] == "setpoint"
+            assert send_command.mock_calls[0].args[1] == zone
+            assert send_command.mock_calls[0].args[2] == {"csp": zone.csp + 1}
+    assert len(manager.command_tracker.pending) == 1
@@ -0,0 +1,174 @@
+"""Test the configuration cache"""
+
+# pylint: disable=line-too-long
+# pylint: disable=missing-function-docstring
+# pylint: disable=protected-access
+from unittest.mock import patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from lennoxs30api.s30api_async import lennox_system
+
+from custom_components.lennoxs30 import Manager, async_remove_entry
+from custom_components.lennoxs30.config_cache import CONFIG_CACHE_FIELDS, ConfigCache, merge_message_data, select_fields
+from tests.conftest import loadfile
+
+
+def create_manager(hass: HomeAssistant, config_entry) -> Manager:
+    manager = Manager(
+        hass=hass,
+        config=config_entry,
+        email=None,
+        password=None,
+        poll_interval=1,
+        fast_poll_interval=2,
+        allergen_defender_switch=False,
+        app_id="HA",
+        conf_init_wait_time=30,
+        ip_address="10.0.0.1",
+        create_sensors=False,
+        create_inverter_power=False,
+        protocol="https",
+        timeout=30,
+        fast_poll_count=10,
+        warm_start=True,
+    )
+    manager.api.process_login_response(loadfile("login_response.json"))
+    return manager
+
+
+def test_merge_message_data():
+    snapshot = {}
+    assert merge_message_data(snapshot, {"zones": [{"id": 0, "config": {"name": "Zone 1", "humidificationOption": False}}]}) is True
+    # Unchanged values do not change the snapshot
+    assert merge_message_data(snapshot, {"zones": [{"id": 0, "config": {"name": "Zone 1"}}]}) is False
+    assert merge_message_data(snapshot, {"zones": [{"id": 0, "config": {"humidificationOption": True}}]}) is True
+    assert snapshot["zones"][0]["config"] == {"name": "Zone 1", "humidificationOption": True}
+    # New elements are added by id
+    assert merge_message_data(snapshot, {"zones": [{"id": 1, "config": {"name": "Zone 2"}}]}) is True
+    assert [zone["id"] for zone in snapshot["zones"]] == [0, 1]
+    # Lists without ids are replaced
+    assert merge_message_data(snapshot, {"system": {"config": {"values": [1, 2]}}}) is True
+    assert merge_message_data(snapshot, {"system": {"config": {"values": [1, 2]}}}) is False
+    assert merge_message_data(snapshot, {"system": {"config": {"values": [3]}}}) is True
+    assert snapshot["system"]["config"]["values"] == [3]
+
+
+def test_select_fields():
+    data = {
+        "system": {"config": {"name": "home"}, "status": {"outdoorTemperature": 50, "numberOfZones": 2}, "time": {"sysUpTime": 10}},
+        "zones": [{"id": 0, "config": {"name": "Zone 1"}, "status": {"temperature": 70}}, {"id": 1, "status": {"temperature": 71}}],
+        "schedules": [{"id": 1, "schedule": {}}],
+    }
+    assert select_fields(data, CONFIG_CACHE_FIELDS) == {
+        "system": {"config": {"name": "home"}, "status": {"numberOfZones": 2}},
+        "zones": [{"id": 0, "config": {"name": "Zone 1"}}],
+    }
+    # Diagnostic updates only carry values
+    assert select_fields(loadfile("equipments_diag_update.json")["Data"], CONFIG_CACHE_FIELDS) == {}
+
+
+@pytest.mark.asyncio()
+async def test_config_cache_record(hass: HomeAssistant, config_entry_local):
+    cache = ConfigCache(hass, config_entry_local.entry_id)
+    cache.systems["sysid"] = {"zones": [{"id": 0, "config": {"name": "Zone 1"}}, {"id": 1, "config": {"name": "Zone 2"}}]}
+    with patch.object(cache._store, "async_delay_save") as async_delay_save:
+        # The first message after loading replaces the section, zones removed from the system are removed
+        cache.record("sysid", {"zones": [{"id": 0, "config": {"name": "Zone 1"}, "status": {"temperature": 70}}]})
+        assert cache.systems["sysid"]["zones"] == [{"id": 0, "config": {"name": "Zone 1"}}]
+        assert async_delay_save.call_count == 1
+        assert cache._dirty is True
+        await cache.async_save()
+        assert cache._dirty is False
+
+        # Value updates are not recorded
+        async_delay_save.reset_mock()
+        cache.record("sysid", {"zones": [{"id": 0, "status": {"temperature": 71}}]})
+        cache.record("sysid", {"zones": [{"id": 0, "config": {"name": "Zone 1"}}]})
+        assert async_delay_save.call_count == 0
+        assert cache._dirty is False
+
+        # Later messages are merged
+        cache.record("sysid", {"zones": [{"id": 1, "config": {"name": "Zone 2"}}]})
+        assert [zone["id"] for zone in cache.systems["sysid"]["zones"]] == [0, 1]
+        assert async_delay_save.call_count == 1
+        assert cache._dirty is True
+
+
+@pytest.mark.asyncio()
+async def test_config_cache_warm_start(hass: HomeAssistant, config_entry_local, hass_storage):
+    manager = create_manager(hass, config_entry_local)
+    sys_id = "0000000-0000-0000-0000-000000000002"
+    manager.api.processMessage(loadfile("config_response_system_02.json"))
+    data = loadfile("equipments_lcc_singlesetpoint.json")
+    data["SenderID"] = sys_id
+    manager.api.processMessage(data)
+    data = loadfile("device_response_lcc.json")
+    data["SenderID"] = sys_id
+    manager.api.processMessage(data)
+    # Messages are still processed by the api
+    system: lennox_system = manager.api.getSystem(sys_id)
+    assert len(system.zone_list) == 4
+    assert len(system.equipment) > 0
+
+    snapshot = manager.config_cache.systems[sys_id]
+    assert set(snapshot.keys()) == {"system", "zones", "equipments", "devices"}
+    # Messages from unknown systems are not cached
+    manager.api.processMessage({"SenderID": "unknown", "Data": {"system": {}}})
+    assert "unknown" not in manager.config_cache.systems
+
+    await manager.config_cache.async_save()
+    assert f"lennoxs30.config_cache.{config_entry_local.entry_id}" in hass_storage
+
+    # A new connection creates the zones and equipment from the cache before any message arrives
+    manager_2 = create_manager(hass, config_entry_local)
+    system_2: lennox_system = manager_2.api.getSystem(sys_id)
+    system_2.cloud_status = "offline"
+    assert len(system_2.zone_list) == 0
+    await manager_2.config_cache.async_load()
+    with patch.object(manager_2.config_cache._store, "async_delay_save") as async_delay_save:
+        manager_2.warm_start()
+        assert async_delay_save.call_count == 0
+    assert len(system_2.zone_list) == 4
+    assert system_2.name == system.name
+    assert system_2.serialNumber == system.serialNumber
+    assert system_2.config_complete() is True
+    assert set(system_2.equipment.keys()) == set(system.equipment.keys())
+    assert system_2.cloud_status == "offline"
+
+
+@pytest.mark.asyncio()
+async def test_config_cache_load_error(hass: HomeAssistant, config_entry_local, caplog):
+    cache = ConfigCache(hass, config_entry_local.entry_id)
+    with patch.object(cache._store, "async_load", side_effect=ValueError("bad data")):
+        await cache.async_load()
+    assert cache.loaded is True
+    assert cache.systems == {}
+    assert "unable to load configuration cache" in caplog.text
+
+
+@pytest.mark.asyncio()
+async def test_config_cache_remove_entry(hass: HomeAssistant, config_entry_local, hass_storage):
+    cache = ConfigCache(hass, config_entry_local.entry_id)
+    cache.record("sysid", {"system": {"config": {"name": "home"}}})
+    await cache.async_save()
+    key = f"lennoxs30.config_cache.{config_entry_local.entry_id}"
+    assert hass_storage[key]["data"]["systems"]["sysid"]["system"]["config"]["name"] == "home"
+    await async_remove_entry(hass, config_entry_local)
+    assert key not in hass_storage
+
+
+@pytest.mark.asyncio()
+async def test_config_cache_s30_initialize(hass: HomeAssistant, config_entry_local):
+    manager = create_manager(hass, config_entry_local)
+    calls = []
+    with patch.object(manager.config_cache, "async_load", side_effect=lambda: calls.append("load")):
+        with patch.object(manager, "connect_subscribe", side_effect=lambda: calls.append("connect")):
+            with patch.object(manager, "warm_start", side_effect=lambda: calls.append("warm_start")):
+                with patch.object(manager, "configuration_initialization", side_effect=lambda: calls.append("configuration")):
+                    with patch("asyncio.create_task"):
+                        with patch.object(hass.config_entries, "async_forward_entry_setups"):
+                            with patch.object(manager, "create_devices"):
+                                await manager.s30_initialize()
+    # The cache is processed after connecting and before waiting for the configuration
+    assert calls == ["load", "connect", "warm_start", "configuration"]
@@ -10,7 +10,9 @@
 # pylint: disable=missing-function-docstring
 # pylint: disable=protected-access
 
+import json
 import logging
+import os
 from unittest.mock import patch
 
 import pytest
@@ -48,21 +50,33 @@ from custom_components.lennoxs30.config_flow import (
     lennox30_entries,
 )
 from custom_components.lennoxs30.const import (
+    CONF_ADAPTIVE_POLLING,
     CONF_ALLERGEN_DEFENDER_SWITCH,
     CONF_APP_ID,
     CONF_CLOUD_CONNECTION,
+    CONF_COMMAND_DEBOUNCE,
     CONF_CREATE_DIAGNOSTICS_SENSORS,
     CONF_CREATE_INVERTER_POWER,
     CONF_CREATE_PARAMETERS,
     CONF_CREATE_SENSORS,
+    CONF_DIAG_EXTERNAL_STATISTICS,
+    CONF_DIAG_PUBLISH_POLICY,
+    CONF_DIAG_STATISTICS_INTERVAL,
     CONF_FAST_POLL_COUNT,
     CONF_FAST_POLL_INTERVAL,
+    CONF_HOT_PATH_SENSORS,
     CONF_INIT_WAIT_TIME,
     CONF_LOCAL_CONNECTION,
     CONF_LOG_MESSAGES_TO_FILE,
+    CONF_MAX_POLL_INTERVAL,
     CONF_MESSAGE_DEBUG_FILE,
     CONF_MESSAGE_DEBUG_LOGGING,
+    CONF_METRICS_REFRESH_INTERVAL,
+    CONF_OPTIMISTIC_STATE,
     CONF_PII_IN_MESSAGE_LOGS,
+    CONF_RESTORE_STATE,
+    CONF_SYSTEM_CONCURRENCY,
+    CONF_WARM_START,
     DEFAULT_CLOUD_TIMEOUT,
     DEFAULT_LOCAL_TIMEOUT,
     LENNOX_DEFAULT_CLOUD_APP_ID,
@@ -806,6 +820,63 @@ def test_lennoxS30ConfigFlow(manager: Manager, hass, caplog):
     assert v1.min == 15
     assert v1.max == 300
 
+    si = schema.schema[CONF_ADAPTIVE_POLLING]
+    assert si == cv.boolean
+
+    si = schema.schema[CONF_MAX_POLL_INTERVAL]
+    assert si.required is False
+    v0: vol.Coerce = si.validators[0]
+    assert isinstance(v0, vol.Coerce)
+    assert v0.type_name == "int"
+    v1: vol.Range = si.validators[1]
+    assert v1.min == 1
+    assert v1.max == 3600
+
+    si = schema.schema[CONF_METRICS_REFRESH_INTERVAL]
+    assert si.required is False
+    v0: vol.Coerce = si.validators[0]
+    assert isinstance(v0, vol.Coerce)
+    assert v0.type_name == "int"
+    v1: vol.Range = si.validators[1]
+    assert v1.min == 0
+    assert v1.max == 3600
+
+    si = schema.schema[CONF_SYSTEM_CONCURRENCY]
+    assert si.required is False
+    v0: vol.Coerce = si.validators[0]
+    assert isinstance(v0, vol.Coerce)
+    assert v0.type_name == "int"
+    v1: vol.Range = si.validators[1]
+    assert v1.min == 1
+    assert v1.max == 16
+
+    si = schema.schema[CONF_WARM_START]
+    assert si == cv.boolean
+
+    si = schema.schema[CONF_RESTORE_STATE]
+    assert si == cv.boolean
+
+    si = schema.schema[CONF_HOT_PATH_SENSORS]
+    assert si == cv.boolean
+
+    si = schema.schema[CONF_OPTIMISTIC_STATE]
+    assert si == cv.boolean
+
+    si = schema.schema[CONF_DIAG_PUBLISH_POLICY]
+    assert si == cv.boolean
+
+    si = schema.schema[CONF_DIAG_EXTERNAL_STATISTICS]
+    assert si == cv.boolean
+
+    si = schema.schema[CONF_COMMAND_DEBOUNCE]
+    assert si.required is False
+    v0: vol.Coerce = si.validators[0]
+    assert isinstance(v0, vol.Coerce)
+    assert v0.type_name == "float"
+    v1: vol.Range = si.validators[1]
+    assert v1.min == 0
+    assert v1.max == 10
+
     si = schema.schema[CONF_PII_IN_MESSAGE_LOGS]
     assert si == cv.boolean
 
@@ -864,6 +935,63 @@ def test_lennoxS30ConfigFlow(manager: Manager, hass, caplog):
     assert v1.min == 15
     assert v1.max == 300
 
+    si = schema.schema[CONF_ADAPTIVE_POLLING]
+    assert si == cv.boolean
+
+    si = schema.schema[CONF_MAX_POLL_INTERVAL]
+    assert si.required is False
+    v0: vol.Coerce = si.validators[0]
+    assert isinstance(v0, vol.Coerce)
+    assert v0.type_name == "int"
+    v1: vol.Range = si.validators[1]
+    assert v1.min == 1
+    assert v1.max == 3600
+
+    si = schema.schema[CONF_METRICS_REFRESH_INTERVAL]
+    assert si.required is False
+    v0: vol.Coerce = si.validators[0]
+    assert isinstance(v0, vol.Coerce)
+    assert v0.type_name == "int"
+    v1: vol.Range = si.validators[1]
+    assert v1.min == 0
+    assert v1.max == 3600
+
+    si = schema.schema[CONF_SYSTEM_CONCURRENCY]
+    assert si.required is False
+    v0: vol.Coerce = si.validators[0]
+    assert isinstance(v0, vol.Coerce)
+    assert v0.type_name == "int"
+    v1: vol.Range = si.validators[1]
+    assert v1.min == 1
+    assert v1.max == 16
+
+    si = schema.schema[CONF_WARM_START]
+    assert si == cv.boolean
+
+    si = schema.schema[CONF_RESTORE_STATE]
+    assert si == cv.boolean
+
+    si = schema.schema[CONF_HOT_PATH_SENSORS]
+    assert si == cv.boolean
+
+    si = schema.schema[CONF_OPTIMISTIC_STATE]
+    assert si == cv.boolean
+
+    si = schema.schema[CONF_DIAG_PUBLISH_POLICY]
+    assert si == cv.boolean
+
+    si = schema.schema[CONF_DIAG_EXTERNAL_STATISTICS]
+    assert si == cv.boolean
+
+    si = schema.schema[CONF_COMMAND_DEBOUNCE]
+    assert si.required is False
+    v0: vol.Coerce = si.validators[0]
+    assert isinstance(v0, vol.Coerce)
+    assert v0.type_name == "float"
+    v1: vol.Range = si.validators[1]
+    assert v1.min == 0
+    assert v1.max == 10
+
     si = schema.schema[CONF_PII_IN_MESSAGE_LOGS]
     assert si == cv.boolean
 
@@ -1160,13 +1288,25 @@ async def test_OptionsFlowHandler_async_step_init_local(config_entry_local, hass
     si = schema[CONF_INIT_WAIT_TIME]
     si = schema[CONF_FAST_POLL_INTERVAL]
     si = schema[CONF_FAST_POLL_COUNT]
+    si = schema[CONF_ADAPTIVE_POLLING]
+    si = schema[CONF_MAX_POLL_INTERVAL]
     si = schema[CONF_TIMEOUT]
+    si = schema[CONF_METRICS_REFRESH_INTERVAL]
+    si = schema[CONF_SYSTEM_CONCURRENCY]
+    si = schema[CONF_WARM_START]
+    si = schema[CONF_RESTORE_STATE]
+    si = schema[CONF_HOT_PATH_SENSORS]
+    si = schema[CONF_OPTIMISTIC_STATE]
+    si = schema[CONF_DIAG_PUBLISH_POLICY]
+    si = schema[CONF_DIAG_STATISTICS_INTERVAL]
+    si = schema[CONF_DIAG_EXTERNAL_STATISTICS]
+    si = schema[CONF_COMMAND_DEBOUNCE]
     si = schema[CONF_PROTOCOL]
     si = schema[CONF_PII_IN_MESSAGE_LOGS]
     si = schema[CONF_MESSAGE_DEBUG_LOGGING]
     si = schema[CONF_LOG_MESSAGES_TO_FILE]
     si = schema[CONF_MESSAGE_DEBUG_FILE]
-    assert len(schema) == 16
+    assert len(schema) == 28
 
 
 @pytest.mark.skip()
@@ -1189,13 +1329,25 @@ async def test_OptionsFlowHandler_async_step_init_cloud(config_entry_cloud, hass
     si = schema[CONF_INIT_WAIT_TIME]
     si = schema[CONF_FAST_POLL_INTERVAL]
     si = schema[CONF_FAST_POLL_COUNT]
+    si = schema[CONF_ADAPTIVE_POLLING]
+    si = schema[CONF_MAX_POLL_INTERVAL]
     si = schema[CONF_TIMEOUT]
+    si = schema[CONF_METRICS_REFRESH_INTERVAL]
+    si = schema[CONF_SYSTEM_CONCURRENCY]
+    si = schema[CONF_WARM_START]
+    si = schema[CONF_RESTORE_STATE]
+    si = schema[CONF_HOT_PATH_SENSORS]
+    si = schema[CONF_OPTIMISTIC_STATE]
+    si = schema[CONF_DIAG_PUBLISH_POLICY]
+    si = schema[CONF_DIAG_STATISTICS_INTERVAL]
+    si = schema[CONF_DIAG_EXTERNAL_STATISTICS]
+    si = schema[CONF_COMMAND_DEBOUNCE]
     si = schema[CONF_PII_IN_MESSAGE_LOGS]
     si = schema[CONF_MESSAGE_DEBUG_LOGGING]
     si = schema[CONF_LOG_MESSAGES_TO_FILE]
     si = schema[CONF_MESSAGE_DEBUG_FILE]
 
-    assert len(schema) == 13
+    assert len(schema) == 25
 
 
 @pytest.mark.skip()
@@ -1325,3 +1477,12 @@ def test_lennox30_entries(hass, caplog):
 
     assert isinstance(result, set)
     assert result == {"192.168.1.1", "192.168.1.2"}
+
+
+@pytest.mark.parametrize("filename", ["strings.json", "translations/en.json"])
+def test_translations_json(filename: str):
+    path = os.path.join(os.path.dirname(__file__), "..", "custom_components", "lennoxs30", filename)
+    with open(path, encoding="utf-8") as file:
+        translations = json.load(file)
+    assert CONF_MAX_POLL_INTERVAL in translations["config"]["step"]["advanced"]["data"]
+    assert CONF_MAX_POLL_INTERVAL in translations["options"]["step"]["init"]["data"]
@@ -479,3 +479,42 @@ async def test_S30VentilationUnit_device_model(hass, manager_2_systems: Manager)
     system.ventilationUnitType = "1_stage_hrv"
     vent = S30VentilationUnit(hass, manager.config_entry, system, s30)
     assert vent.device_model == "1_stage_hrv"
+
+
+@pytest.mark.asyncio()
+async def test_create_devices_skip_unchanged(hass, manager_2_systems: Manager):
+    manager = manager_2_systems
+    device_registry = dr.async_get(hass)
+    system = manager.api.system_list[0]
+    # Use the real registry, so the skipped devices are known to exist
+    real_get_or_create = dr.DeviceRegistry.async_get_or_create.__get__(device_registry)
+    with patch.object(hass.config_entries, "async_get_entry", return_value=manager.config_entry):
+        with patch.object(device_registry, "async_get_or_create", wraps=real_get_or_create) as mock_create_device:
+            await manager.create_devices()
+            updated = manager.device_registrations["updated"]
+            assert updated == mock_create_device.call_count
+            assert updated > 0
+            assert manager.device_registrations["skipped"] == 0
+            assert device_registry.async_get_device(identifiers={(DOMAIN, system.unique_id)}) is not None
+
+            # Nothing changed, nothing is written
+            mock_create_device.reset_mock()
+            await manager.create_devices()
+            assert mock_create_device.call_count == 0
+            assert manager.device_registrations["updated"] == updated
+            assert manager.device_registrations["skipped"] == updated
+
+            # Only the changed device is written
+            system.softwareVersion = "4.0.0"
+            await manager.create_devices()
+            assert mock_create_device.call_count == 1
+            assert mock_create_device.mock_calls[0].kwargs["sw_version"] == "4.0.0"
+            assert device_registry.async_get_device(identifiers={(DOMAIN, system.unique_id)}).sw_version == "4.0.0"
+
+            # A device missing from the registry is written
+            mock_create_device.reset_mock()
+            device = device_registry.async_get_device(identifiers={(DOMAIN, system.unique_id)})
+            device_registry.async_remove_device(device.id)
+            await manager.create_devices()
+            assert mock_create_device.call_count == 1
+            assert mock_create_device.mock_calls[0].kwargs["identifiers"] == {(DOMAIN, system.unique_id)}
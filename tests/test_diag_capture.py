@@ -0,0 +1,127 @@
+"""Tests the diagnostic capture"""
+
+# pylint: disable=missing-function-docstring
+# pylint: disable=protected-access
+# pylint: disable=line-too-long
+import csv
+import math
+from unittest.mock import Mock, patch
+
+import pytest
+from homeassistant.exceptions import HomeAssistantError
+from lennoxs30api.s30api_async import lennox_system
+
+from custom_components.lennoxs30 import Manager
+from custom_components.lennoxs30.const import LENNOX_DOMAIN, MANAGER
+from custom_components.lennoxs30.diag_capture import (
+    EXPORT_CAPTURE_SCHEMA,
+    SERVICE_EXPORT_CAPTURE,
+    SERVICE_START_CAPTURE,
+    SERVICE_STOP_CAPTURE,
+    START_CAPTURE_SCHEMA,
+    STOP_CAPTURE_SCHEMA,
+    DiagCapture,
+    async_export_capture_service,
+    async_register_capture_services,
+    async_start_capture_service,
+    async_stop_capture_service,
+)
+from tests.conftest import loadfile
+
+
+def test_diag_capture_ring_buffer(manager: Manager):
+    system: lennox_system = manager.api.system_list[0]
+    capture = DiagCapture(system)
+    assert system._diagcallbacks[-1]["func"] == capture.diag_update_callback  # pylint: disable=comparison-with-callable
+    assert system._diagcallbacks[-1]["match"] is None
+
+    # Updates are ignored until the capture is started
+    capture.diag_update_callback("1_1", "10.0")
+    assert capture.count == 0
+
+    capture.start(4)
+    assert capture.capacity == 4
+    with patch("custom_components.lennoxs30.diag_capture.time") as clock:
+        for i in range(6):
+            clock.time.return_value = 1000.0 + i
+            capture.diag_update_callback("1_1" if i % 2 == 0 else "2_4", str(i * 10.0))
+        clock.time.return_value = 1006.0
+        capture.diag_update_callback("1_0", "Yes")
+    assert capture.count == 4
+    assert capture.overwritten == 3
+
+    snapshot = capture.snapshot()
+    assert list(snapshot.times) == [1003.0, 1004.0, 1005.0, 1006.0]
+    assert [snapshot.keys[k] for k in snapshot.key_index] == ["2_4", "1_1", "2_4", "1_0"]
+    assert list(snapshot.values)[:3] == [30.0, 40.0, 50.0]
+    assert math.isnan(snapshot.values[3])
+    assert snapshot.texts[snapshot.text_index[3]] == "Yes"
+    assert snapshot.names["1_0"] == system.equipment[1].diagnostics[0].name
+
+    capture.stop()
+    capture.diag_update_callback("1_1", "10.0")
+    assert capture.count == 4
+
+    # Restarting discards the samples
+    capture.start(100)
+    assert capture.count == 0
+    assert capture.overwritten == 0
+
+
+@pytest.mark.asyncio()
+async def test_diag_capture_services(hass, manager: Manager, tmp_path):
+    system: lennox_system = manager.api.system_list[0]
+    hass.data[LENNOX_DOMAIN] = {"entry": {MANAGER: manager}}
+
+    def service_call(schema, data):
+        call = Mock()
+        call.hass = hass
+        call.data = schema(data)
+        return call
+
+    with pytest.raises(HomeAssistantError, match="no capture has been started"):
+        await async_export_capture_service(service_call(EXPORT_CAPTURE_SCHEMA, {}))
+
+    await async_start_capture_service(service_call(START_CAPTURE_SCHEMA, {"capacity": 1000}))
+    capture: DiagCapture = manager.diag_captures[system.sysId]
+    assert capture.capturing is True
+    assert capture.capacity == 1000
+
+    manager.api.processMessage(loadfile("equipments_diag_update.json", system.sysId))
+    count = capture.count
+    assert count > 0
+
+    with patch.object(hass.config, "path", side_effect=lambda name: str(tmp_path / name)):
+        await async_export_capture_service(service_call(EXPORT_CAPTURE_SCHEMA, {}))
+        assert capture.capturing is True
+        await async_export_capture_service(service_call(EXPORT_CAPTURE_SCHEMA, {"stop": True}))
+        assert capture.capturing is False
+
+    # Both exports write the same file unless the second one is in the next second
+    files = sorted(tmp_path.glob(f"lennoxs30_capture_{system.sysId}_*.csv"))
+    assert len(files) >= 1
+    with open(files[-1], encoding="utf-8") as file:
+        rows = list(csv.reader(file))
+    assert rows[0] == ["time", "equipment_id", "diagnostic_id", "name", "value"]
+    assert len(rows) == count + 1
+    diagnostic = system.equipment[int(rows[1][1])].diagnostics[int(rows[1][2])]
+    assert rows[1][3] == diagnostic.name
+
+    await async_start_capture_service(service_call(START_CAPTURE_SCHEMA, {}))
+    assert manager.diag_captures[system.sysId] is capture
+    assert capture.capacity == 100000
+    await async_stop_capture_service(service_call(STOP_CAPTURE_SCHEMA, {}))
+    assert capture.capturing is False
+
+    with patch.object(hass.config, "path", return_value=str(tmp_path / "missing" / "capture.csv")):
+        with pytest.raises(HomeAssistantError, match="unable to write"):
+            await async_export_capture_service(service_call(EXPORT_CAPTURE_SCHEMA, {}))
+
+
+@pytest.mark.asyncio()
+async def test_diag_capture_register_services(hass):
+    async_register_capture_services(hass)
+    async_register_capture_services(hass)
+    assert hass.services.has_service(LENNOX_DOMAIN, SERVICE_START_CAPTURE)
+    assert hass.services.has_service(LENNOX_DOMAIN, SERVICE_STOP_CAPTURE)
+    assert hass.services.has_service(LENNOX_DOMAIN, SERVICE_EXPORT_CAPTURE)
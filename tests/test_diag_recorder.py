@@ -0,0 +1,129 @@
+"""Tests the import of diagnostic statistics into the recorder"""
+
+# pylint: disable=missing-function-docstring
+# pylint: disable=protected-access
+# pylint: disable=line-too-long
+import logging
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+from homeassistant.components.recorder.models import StatisticMeanType
+from homeassistant.const import PERCENTAGE
+from lennoxs30api.s30api_async import lennox_system
+
+from custom_components.lennoxs30 import Manager
+from custom_components.lennoxs30.diag_recorder import DiagChannel, DiagStatisticsImporter
+from tests.conftest import loadfile
+
+
+def test_diag_channel():
+    channel = DiagChannel({}, 1000.0, "10.0")
+    channel.update(1010.0, "20.0")
+    channel.update(1030.0, "waiting...")
+    # No value is accumulated while the diagnostic is waiting
+    channel.update(1050.0, "5.0")
+    assert channel.close(1060.0) == pytest.approx(((10.0 * 10.0 + 20.0 * 20.0 + 10.0 * 5.0) / 40.0, 5.0, 20.0))
+
+    # The next period starts with the current value
+    assert channel.minimum == 5.0
+    assert channel.close(1120.0) == (5.0, 5.0, 5.0)
+
+    channel.update(1120.0, "waiting...")
+    channel.update(1200.0, "waiting...")
+    assert channel.close(1200.0) is None
+
+
+@pytest.mark.asyncio()
+async def test_diag_statistics_importer(hass, manager: Manager, caplog):
+    system: lennox_system = manager.api.system_list[0]
+    equipment = system.equipment[1]
+    importer = DiagStatisticsImporter(hass, system)
+    for diagnostic in equipment.diagnostics.values():
+        if importer.is_numeric(diagnostic):
+            importer.add_channel(equipment, diagnostic)
+    assert not importer.is_numeric(equipment.diagnostics[0])
+    assert "1_0" not in importer.channels
+    channel_1_1 = importer.channels["1_1"]
+    assert channel_1_1.metadata == {
+        "mean_type": StatisticMeanType.ARITHMETIC,
+        "has_sum": False,
+        "name": f"{system.name} ou {equipment.diagnostics[1].name}",
+        "source": "lennoxs30",
+        "statistic_id": f"lennoxs30:{system.unique_id.replace('-', '_')}_diag_1_1",
+        "unit_class": "unitless",
+        "unit_of_measurement": PERCENTAGE,
+    }
+
+    unsub = importer.async_start()
+    assert system._diagcallbacks[-1]["func"] == importer.diag_update_callback  # pylint: disable=comparison-with-callable
+    assert system._diagcallbacks[-1]["match"] is None
+
+    importer.hour_start = datetime(2026, 1, 1, 10, tzinfo=timezone.utc)
+    hass.config.components.add("recorder")
+    with (
+        patch("custom_components.lennoxs30.diag_recorder.time") as clock,
+        patch("custom_components.lennoxs30.diag_recorder.async_add_external_statistics") as add_statistics,
+    ):
+        for eid_did, channel in importer.channels.items():
+            importer.channels[eid_did] = DiagChannel(channel.metadata, 0.0, "0.0")
+        channel_1_1 = importer.channels["1_1"]
+        clock.time.return_value = 1800.0
+        manager.api.processMessage(loadfile("equipments_diag_update.json", system.sysId))
+        assert channel_1_1.value == 10.0
+
+        clock.time.return_value = 3600.0
+        importer.async_hour_elapsed(datetime(2026, 1, 1, 11, 0, 0, 5000, tzinfo=timezone.utc))
+        assert importer.hour_start == datetime(2026, 1, 1, 11, tzinfo=timezone.utc)
+        assert add_statistics.call_count == len(importer.channels)
+        assert importer.imported == len(importer.channels)
+        for call in add_statistics.call_args_list:
+            assert call.args[0] is hass
+            assert len(call.args[2]) == 1
+            assert call.args[2][0]["start"] == datetime(2026, 1, 1, 10, tzinfo=timezone.utc)
+        statistics = {call.args[1]["statistic_id"]: call.args[2][0] for call in add_statistics.call_args_list}
+        # Half of the hour at 0 and half at 10
+        assert statistics[channel_1_1.metadata["statistic_id"]] == {
+            "start": datetime(2026, 1, 1, 10, tzinfo=timezone.utc),
+            "mean": 5.0,
+            "min": 0.0,
+            "max": 10.0,
+        }
+
+        # Called again within the same hour nothing is imported
+        add_statistics.reset_mock()
+        clock.time.return_value = 5400.0
+        importer.async_hour_elapsed(datetime(2026, 1, 1, 11, 30, tzinfo=timezone.utc))
+        assert add_statistics.call_count == 0
+
+        # When hours were missed the values since the last import are not imported
+        with caplog.at_level(logging.WARNING):
+            clock.time.return_value = 10800.0
+            importer.async_hour_elapsed(datetime(2026, 1, 1, 13, tzinfo=timezone.utc))
+        assert add_statistics.call_count == 0
+        assert "hours missed" in caplog.text
+        assert importer.hour_start == datetime(2026, 1, 1, 13, tzinfo=timezone.utc)
+        assert channel_1_1.duration == 0.0
+
+        # The next hour is imported
+        clock.time.return_value = 14400.0
+        importer.async_hour_elapsed(datetime(2026, 1, 1, 14, tzinfo=timezone.utc))
+        statistics = {call.args[1]["statistic_id"]: call.args[2][0] for call in add_statistics.call_args_list}
+        assert statistics[channel_1_1.metadata["statistic_id"]] == {
+            "start": datetime(2026, 1, 1, 13, tzinfo=timezone.utc),
+            "mean": 10.0,
+            "min": 10.0,
+            "max": 10.0,
+        }
+
+        # Without the recorder the hour is closed and nothing is imported
+        add_statistics.reset_mock()
+        hass.config.components.remove("recorder")
+        clock.time.return_value = 18000.0
+        with caplog.at_level(logging.WARNING):
+            importer.async_hour_elapsed(datetime(2026, 1, 1, 15, tzinfo=timezone.utc))
+        assert add_statistics.call_count == 0
+        assert "recorder is not loaded" in caplog.text
+        assert importer.hour_start == datetime(2026, 1, 1, 15, tzinfo=timezone.utc)
+        assert channel_1_1.duration == 0.0
+    unsub()
@@ -4,8 +4,9 @@
 # pylint: disable=missing-function-docstring
 # pylint: disable=invalid-name
 
+import asyncio
 import logging
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
@@ -24,6 +25,7 @@ from lennoxs30api.s30api_async import lennox_equipment_diagnostic, lennox_system
 
 from custom_components.lennoxs30 import Manager
 from custom_components.lennoxs30.const import LENNOX_DOMAIN
+from custom_components.lennoxs30.diag_publish import DIAG_PUBLISH_POLICIES
 from custom_components.lennoxs30.sensor import S30DiagSensor
 from tests.conftest import conftest_base_entity_availability, loadfile
 
@@ -75,7 +77,8 @@ async def test_diag_sensor_async_added_to_hass(hass, manager: Manager):
 
     assert len(system._callbacks) == 2
     assert system._callbacks[0]["func"] == s.system_update_callback  # pylint: disable=comparison-with-callable
-    assert system._callbacks[1]["func"] == s.cloud_status_update_callback  # pylint: disable=comparison-with-callable
+    assert system._callbacks[1]["match"] == ["cloud_status"]
+    assert s.cloud_status_update_callback in manager._cloud_status_callbacks[system.sysId]
 
 
 @pytest.mark.asyncio()
@@ -129,6 +132,127 @@ async def test_diag_sensor_update_callback(hass, manager: Manager):
     conftest_base_entity_availability(manager, system, s)
 
 
+@pytest.mark.asyncio()
+async def test_diag_sensor_publish_policy(hass, manager: Manager):
+    system: lennox_system = manager.api.system_list[0]
+    system.diagLevel = 2
+    equipment = system.equipment[2]
+    diagnostic = equipment.diagnostics[4]
+    s = S30DiagSensor(hass, manager, system, equipment, diagnostic)
+    assert s._publish_policy is None
+
+    manager.diag_publish_policy = True
+    # Percentages have no policy
+    assert S30DiagSensor(hass, manager, system, system.equipment[1], system.equipment[1].diagnostics[1])._publish_policy is None
+    s = S30DiagSensor(hass, manager, system, equipment, diagnostic)
+    assert s._publish_policy is DIAG_PUBLISH_POLICIES[REVOLUTIONS_PER_MINUTE]
+    await s.async_added_to_hass()
+    diagnostic.value = "1000"
+    s._published_value = "1000"
+    s._published_at = 100.0
+
+    clock = Mock()
+    with patch("custom_components.lennoxs30.sensor.time", clock), patch.object(s, "schedule_update_ha_state") as update_callback:
+        # Within the deadband, published once the value is stale
+        clock.monotonic.return_value = 110.0
+        diagnostic.value = "1010"
+        s.update_callback("2_4", diagnostic.value)
+        assert update_callback.call_count == 0
+        assert s.state == "1000"
+        assert s._publish_timer.when() - asyncio.get_running_loop().time() == pytest.approx(290.0, abs=1.0)
+
+        # Outside the deadband, published once the minimum interval has passed
+        diagnostic.value = "1100"
+        s.update_callback("2_4", diagnostic.value)
+        assert update_callback.call_count == 0
+        assert s.state == "1000"
+        timer = s._publish_timer
+        assert timer.when() - asyncio.get_running_loop().time() == pytest.approx(20.0, abs=1.0)
+
+        clock.monotonic.return_value = 130.0
+        timer.cancel()
+        s._on_publish_timer()
+        assert update_callback.call_count == 1
+        assert s.state == "1100"
+        assert s._published_at == 130.0
+        assert s._publish_timer is None
+
+        s.update_callback("2_4", diagnostic.value)
+        assert update_callback.call_count == 1
+        assert s._publish_timer is None
+
+        clock.monotonic.return_value = 200.0
+        diagnostic.value = "1300"
+        s.update_callback("2_4", diagnostic.value)
+        assert update_callback.call_count == 2
+        assert s.state == "1300"
+
+        # Values that are not numbers are published immediately
+        clock.monotonic.return_value = 201.0
+        diagnostic.value = "waiting..."
+        s.update_callback("2_4", diagnostic.value)
+        assert update_callback.call_count == 3
+        assert s.state is None
+
+        diagnostic.value = "1400"
+        s.update_callback("2_4", diagnostic.value)
+        diagnostic.value = "1410"
+        s.update_callback("2_4", diagnostic.value)
+        assert update_callback.call_count == 4
+        assert s._publish_timer is not None
+        s._cancel_publish_timer()
+        assert s._publish_timer is None
+
+
+@pytest.mark.asyncio()
+async def test_diag_sensor_statistics(hass, manager: Manager):
+    system: lennox_system = manager.api.system_list[0]
+    system.diagLevel = 2
+    equipment = system.equipment[2]
+    diagnostic = equipment.diagnostics[4]
+    diagnostic.value = "1000"
+    manager.diag_statistics_interval = 60
+    manager.diag_publish_policy = True
+
+    clock = Mock()
+    clock.monotonic.return_value = 100.0
+    with patch("custom_components.lennoxs30.sensor.time", clock):
+        s = S30DiagSensor(hass, manager, system, equipment, diagnostic)
+        assert s._publish_policy is None
+        assert s.state == 1000.0
+        assert s.extra_state_attributes == {"min": 1000.0, "max": 1000.0, "mean": 1000.0, "last": 1000.0, "samples": 1}
+
+        with patch("custom_components.lennoxs30.sensor.async_track_time_interval") as track_time_interval:
+            await s.async_added_to_hass()
+            assert track_time_interval.call_count == 1
+            assert track_time_interval.call_args[0][1] == s._publish_statistics
+            assert track_time_interval.call_args[0][2].total_seconds() == 60
+
+        with patch.object(s, "schedule_update_ha_state") as update_callback:
+            # Changes are aggregated and not written
+            clock.monotonic.return_value = 120.0
+            diagnostic.value = "1200"
+            s.update_callback("2_4", diagnostic.value)
+            diagnostic.value = "waiting..."
+            s.update_callback("2_4", diagnostic.value)
+            assert update_callback.call_count == 0
+            assert s.state == 1000.0
+
+            clock.monotonic.return_value = 150.0
+            s._publish_statistics()
+            assert update_callback.call_count == 1
+            assert s.state == round((20.0 * 1000.0 + 30.0 * 1200.0) / 50.0, 3)
+            assert s.extra_state_attributes["min"] == 1000.0
+            assert s.extra_state_attributes["max"] == 1200.0
+            assert s.extra_state_attributes["last"] == 1200.0
+            assert s.extra_state_attributes["samples"] == 2
+
+    # Values that are not numbers are not aggregated
+    s = S30DiagSensor(hass, manager, system, system.equipment[1], system.equipment[1].diagnostics[0])
+    assert s._statistics is None
+    assert s.extra_state_attributes == {}
+
+
 @pytest.mark.asyncio()
 async def test_diag_sensor_unique_id(hass, manager: Manager):
     system: lennox_system = manager.api.system_list[0]
@@ -245,11 +369,12 @@ async def test_diag_sensor_device_info_no_device_errors(hass, manager_system_04_
     system: lennox_system = manager.api.system_list[0]
     equipment = system.equipment[1]
     diagnostic = equipment.diagnostics[0]
-    s = S30DiagSensor(hass, manager, system, equipment, diagnostic)
     manager.system_equip_device_map = {}
 
     with caplog.at_level(logging.WARNING):
         caplog.clear()
+        # Device info is determined when the sensor is created
+        s = S30DiagSensor(hass, manager, system, equipment, diagnostic)
         identifiers = s.device_info["identifiers"]
         for x in identifiers:
             assert x[0] == LENNOX_DOMAIN
@@ -266,11 +391,12 @@ async def test_diag_sensor_device_info_no_device_errors_1(hass, manager_system_0
     system: lennox_system = manager.api.system_list[0]
     equipment = system.equipment[1]
     diagnostic = equipment.diagnostics[0]
-    s = S30DiagSensor(hass, manager, system, equipment, diagnostic)
     manager.system_equip_device_map[system.sysId].pop(1)
 
     with caplog.at_level(logging.WARNING):
         caplog.clear()
+        # Device info is determined when the sensor is created
+        s = S30DiagSensor(hass, manager, system, equipment, diagnostic)
         identifiers = s.device_info["identifiers"]
         for x in identifiers:
             assert x[0] == LENNOX_DOMAIN
@@ -0,0 +1,60 @@
+"""Tests the rolling window statistics of diagnostic values"""
+
+# pylint: disable=missing-function-docstring
+# pylint: disable=protected-access
+# pylint: disable=line-too-long
+import pytest
+
+from custom_components.lennoxs30.diag_statistics import DiagWindow
+
+
+def test_diag_window_statistics():
+    window = DiagWindow(60.0)
+    assert window.capacity == 17
+    assert window.statistics(100.0) is None
+
+    window.add(100.0, 10.0)
+    assert window.statistics(100.0) == {"min": 10.0, "max": 10.0, "mean": 10.0, "last": 10.0, "samples": 1}
+
+    window.add(110.0, 20.0)
+    window.add(130.0, 5.0)
+    statistics = window.statistics(140.0)
+    assert statistics["min"] == 5.0
+    assert statistics["max"] == 20.0
+    # 10 seconds at 10, 20 seconds at 20 and 10 seconds at 5
+    assert statistics["mean"] == pytest.approx((10.0 * 10.0 + 20.0 * 20.0 + 10.0 * 5.0) / 40.0)
+    assert statistics["last"] == 5.0
+    assert statistics["samples"] == 3
+
+    # The value at the start of the window is the last one received before it
+    statistics = window.statistics(180.0)
+    assert window.count == 2
+    assert statistics["min"] == 5.0
+    assert statistics["max"] == 20.0
+    assert statistics["mean"] == pytest.approx((10.0 * 20.0 + 50.0 * 5.0) / 60.0)
+    assert statistics["samples"] == 1
+
+    statistics = window.statistics(300.0)
+    assert window.count == 1
+    assert statistics == {"min": 5.0, "max": 5.0, "mean": 5.0, "last": 5.0, "samples": 0}
+
+
+def test_diag_window_ring_buffer():
+    window = DiagWindow(8.0)
+    assert window.capacity == 4
+    for i in range(10):
+        window.add(float(i), float(i))
+    # The oldest samples are overwritten once the buffer is full
+    assert window.count == 4
+    statistics = window.statistics(10.0)
+    assert statistics["min"] == 6.0
+    assert statistics["max"] == 9.0
+    assert statistics["last"] == 9.0
+    assert statistics["samples"] == 4
+    assert statistics["mean"] == pytest.approx((6.0 + 7.0 + 8.0 + 9.0) / 4.0)
+
+    window.add(10.0, 1.0)
+    assert window.count == 4
+    assert window.statistics(10.0)["last"] == 1.0
+    # A window of samples for 300 seconds of diagnostics is about a kilobyte
+    assert DiagWindow(300.0).capacity * 16 < 2048
@@ -20,13 +20,22 @@ async def test_diagnostics_local(hass, manager_system_04_furn_ac_zoning_ble: Man
 
     # last_message_time is expected to vary, so compare all other diagnostics fields.
     diags["comm_metrics"].pop("last_message_time", None)
+    # The timings vary
+    hot_path = diags.pop("hot_path")
+    assert set(hot_path.keys()) == {"retrieve_ms", "process_ms", "dispatch_ms", "entities_per_message"}
+    assert hot_path["process_ms"]["count"] == manager.hot_path["process_ms"].count
     assert diags == {
         "comm_metrics": {
             "bytes_in": 0,
             "bytes_out": 0,
             "client_response_errors": 0,
+            "command_latency": {},
+            "command_scheduler": {"in_flight": 0, "queued": 0, "max_queued": 0, "wait": {}},
             "connection_errors": 0,
             "diagLevel": None,
+            "entity_callbacks": 0,
+            "entity_writes": 0,
+            "entity_writes_suppressed": 0,
             "error_count": 0,
             "hostname": "10.0.0.1",
             "http_2xx_cnt": 0,
@@ -36,6 +45,8 @@ async def test_diagnostics_local(hass, manager_system_04_furn_ac_zoning_ble: Man
             "last_receive_time": None,
             "last_reconnect_time": None,
             "message_count": 6,
+            "poll_interval": 1,
+            "poll_reason": "fixed",
             "receive_count": 0,
             "send_count": 0,
             "sender_message_drop": 0,
@@ -45,6 +56,7 @@ async def test_diagnostics_local(hass, manager_system_04_furn_ac_zoning_ble: Man
             "sibling_message_drop": 0,
             "softwareVersion": "3.81.207",
             "sysUpTime": 107460,
+            "system_timings": {},
             "timeouts": 0,
         },
         "config": {
@@ -67,6 +79,8 @@ async def test_diagnostics_local(hass, manager_system_04_furn_ac_zoning_ble: Man
             "scan_interval": 10,
             "timeout": 30,
         },
+        "startup_timings": {},
+        "device_registrations": {"skipped": 0, "updated": 0},
         "system": {
             "0000000-0000-0000-0000-000000000001": {
                 "cloud_status": None,
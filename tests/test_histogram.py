@@ -0,0 +1,49 @@
+"""Tests the histogram"""
+
+# pylint: disable=missing-function-docstring
+from custom_components.lennoxs30.histogram import COUNT_BUCKETS, Histogram
+
+
+def test_histogram_empty():
+    histogram = Histogram()
+    assert histogram.count == 0
+    assert histogram.mean is None
+    assert histogram.percentile(50) is None
+    assert histogram.as_dict() == {"count": 0, "mean": None, "p50": None, "p95": None, "p99": None, "max": None, "buckets": {}}
+
+
+def test_histogram_percentiles():
+    histogram = Histogram((10, 100, 1000))
+    for _ in range(90):
+        histogram.record(5)
+    for _ in range(9):
+        histogram.record(50)
+    histogram.record(5000)
+    assert histogram.count == 100
+    assert histogram.mean == (90 * 5 + 9 * 50 + 5000) / 100
+    assert histogram.percentile(50) == 10
+    assert histogram.percentile(95) == 100
+    assert histogram.percentile(99) == 100
+    # The overflow bucket reports the largest value
+    assert histogram.percentile(100) == 5000
+    summary = histogram.as_dict()
+    assert summary["buckets"] == {"<=10": 90, "<=100": 9, ">1000": 1}
+    assert summary["max"] == 5000
+
+    # Percentiles do not exceed the largest value
+    histogram = Histogram((10, 100, 1000))
+    histogram.record(3)
+    assert histogram.percentile(50) == 3
+
+    histogram.reset()
+    assert histogram.count == 0
+    assert histogram.max is None
+    assert sum(histogram.counts) == 0
+
+
+def test_histogram_counts():
+    histogram = Histogram(COUNT_BUCKETS)
+    histogram.record(0)
+    histogram.record(0.5)
+    histogram.record(3)
+    assert histogram.as_dict()["buckets"] == {"<=0": 1, "<=1": 1, "<=5": 1}
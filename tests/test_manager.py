@@ -35,6 +35,7 @@ from custom_components.lennoxs30 import (
     DS_LOGIN_FAILED,
     DS_RETRY_WAIT,
     RETRY_INTERVAL_SECONDS,
+    RETRY_MIN_INTERVAL_SECONDS,
     Manager,
 )
 
@@ -108,6 +109,42 @@ async def test_manager_configuration_initialization(manager: Manager, caplog):
                     assert "Timeout waiting for configuration data from Lennox - this sometimes happens" in ex.message
 
 
+@pytest.mark.asyncio()
+async def test_manager_configuration_initialization_per_system(manager_2_systems: Manager, caplog):
+    manager = manager_2_systems
+    system_1: lennox_system = manager.api.system_list[0]
+    system_2: lennox_system = manager.api.system_list[1]
+    with patch.object(manager, "messagePump") as messagePump:
+        messagePump.return_value = False
+        with patch.object(system_2, "config_complete") as config_complete:
+            with patch("asyncio.sleep") as sleep:
+                config_complete.side_effect = [False, False, True]
+                await manager.configuration_initialization()
+                # The first system is not checked again once ready
+                assert sleep.call_count == 2
+                timings = manager.startup_timings
+                assert timings[f"system_ready_{system_1.sysId}"] <= timings[f"system_ready_{system_2.sysId}"]
+
+    # One system never becomes ready
+    with caplog.at_level(logging.WARNING):
+        caplog.clear()
+        with patch.object(manager, "messagePump") as messagePump:
+            messagePump.return_value = False
+            with patch.object(system_2, "config_complete") as config_complete:
+                with patch("asyncio.sleep") as _:
+                    config_complete.return_value = False
+                    ex: S30Exception = None
+                    try:
+                        await manager.configuration_initialization()
+                    except S30Exception as exc:
+                        ex = exc
+                    assert ex is not None
+                    assert ex.error_code == EC_CONFIG_TIMEOUT
+                    assert len(caplog.records) == 1
+                    assert system_2.sysId in caplog.messages[0]
+                    assert "timeout waiting for configuration" in caplog.messages[0]
+
+
 class CloudPresence:
     """Helper class for testing"""
 
@@ -281,6 +318,24 @@ async def test_manager_update_cloud_presence(manager: Manager, caplog):
                 assert manager.last_cloud_presence_poll < time.time() and manager.last_cloud_presence_poll > time.time() - 10.0
                 assert len(caplog.records) == 0
                 assert manager._reinitialize is False
+                assert f"cloud_presence_{system.sysId}" in manager.system_timings
+
+
+@pytest.mark.asyncio()
+async def test_manager_update_cloud_presence_2_systems(manager_2_systems: Manager):
+    manager = manager_2_systems
+    system_1: lennox_system = manager.api.system_list[0]
+    system_2: lennox_system = manager.api.system_list[1]
+    manager.last_cloud_presence_poll = 1
+    with patch.object(system_1, "update_system_online_cloud") as update_1:
+        with patch.object(system_2, "update_system_online_cloud") as update_2:
+            # An error on one system does not prevent checking the other
+            update_1.side_effect = S30Exception("simulated error", 100, 1)
+            await manager.update_cloud_presence()
+            assert update_1.call_count == 1
+            assert update_2.call_count == 1
+            assert f"cloud_presence_{system_1.sysId}" in manager.system_timings
+            assert f"cloud_presence_{system_2.sysId}" in manager.system_timings
 
 
 @pytest.mark.asyncio()
@@ -295,6 +350,94 @@ async def test_manager_us_customary_units(hass: HomeAssistant, manager_us_custom
     assert manager_us_customary_units.is_metric is False
 
 
+@pytest.mark.asyncio()
+async def test_manager_update_state_publish(hass: HomeAssistant, manager: Manager):
+    manager._metrics_refresh_interval = 60
+    with patch("homeassistant.core.StateMachine.async_set") as async_set:
+        with patch("time.monotonic") as monotonic:
+            monotonic.return_value = 1000.0
+            manager.updateState(DS_CONNECTED)
+            assert async_set.call_count == 1
+            assert async_set.mock_calls[0].args[0] == manager.connection_state
+            assert async_set.mock_calls[0].args[1] == DS_CONNECTED
+            assert async_set.mock_calls[0].args[2]["message_count"] == manager.api.metrics.message_count
+            assert async_set.mock_calls[0].args[2]["softwareVersion"] == manager.api.system_list[0].softwareVersion
+
+            # Same state within the refresh interval is not republished
+            monotonic.return_value = 1030.0
+            manager.updateState(DS_CONNECTED)
+            assert async_set.call_count == 1
+            assert manager.state_publish_skipped == 1
+
+            # A state change is always published
+            manager.updateState(DS_RETRY_WAIT)
+            assert async_set.call_count == 2
+            assert async_set.mock_calls[1].args[1] == DS_RETRY_WAIT
+            manager.updateState(DS_CONNECTED)
+            assert async_set.call_count == 3
+
+            # Metrics are refreshed once the interval elapses
+            manager.api.metrics.inc_message_count()
+            monotonic.return_value = 1091.0
+            manager.updateState(DS_CONNECTED)
+            assert async_set.call_count == 4
+            assert async_set.mock_calls[3].args[2]["message_count"] == manager.api.metrics.message_count
+            assert manager.state_publish_count == 4
+            assert manager.state_publish_skipped == 1
+
+    manager._metrics_refresh_interval = 0
+    with patch("homeassistant.core.StateMachine.async_set") as async_set:
+        manager.api.metrics.inc_message_count()
+        manager.updateState(DS_CONNECTED)
+        assert async_set.call_count == 1
+        # Metrics that have not changed since they were published are not published again
+        skipped = manager.state_publish_skipped
+        manager.updateState(DS_CONNECTED)
+        assert async_set.call_count == 1
+        assert manager.state_publish_skipped == skipped + 1
+
+        # The nested dicts updated in place are published as copies
+        published = async_set.mock_calls[0].args[2]
+        manager.system_timings["subscribe_0000000-0000-0000-0000-000000000001"] = 1.5
+        assert "subscribe_0000000-0000-0000-0000-000000000001" not in published["system_timings"]
+        manager.updateState(DS_CONNECTED)
+        assert async_set.call_count == 2
+        assert async_set.mock_calls[1].args[2]["system_timings"]["subscribe_0000000-0000-0000-0000-000000000001"] == 1.5
+        assert async_set.mock_calls[1].args[2]["system_timings"] is not manager.system_timings
+
+
+@pytest.mark.asyncio()
+async def test_manager_get_metrics_list(manager: Manager):
+    metrics = manager.getMetricsList()
+    assert metrics["message_count"] == manager.api.metrics.message_count
+    assert metrics["hostname"] == manager._ip_address
+    # Callers receive a copy so they cannot modify the published metrics
+    metrics.pop("message_count")
+    assert "message_count" in manager.getMetricsList()
+    assert metrics["system_timings"] is not manager.system_timings
+
+    # The api metrics and the siblings are only collected again when they change
+    system: lennox_system = manager.api.system_list[0]
+    with patch.object(manager.api.metrics, "getMetricList", wraps=manager.api.metrics.getMetricList) as get_metric_list:
+        manager.getMetricsList()
+        assert get_metric_list.call_count == 0
+        manager.api.metrics.inc_timeout()
+        assert manager.getMetricsList()["timeouts"] == manager.api.metrics.timeouts
+        assert get_metric_list.call_count == 1
+        manager.api.metrics.last_reconnect_time = manager.api.metrics.now()
+        assert manager.getMetricsList()["last_reconnect_time"] == manager.api.metrics.last_reconnect_time
+        assert get_metric_list.call_count == 2
+
+    sibling_ids = manager.getMetricsList()["sibling_id"]
+    assert manager.getMetricsList()["sibling_id"] is sibling_ids
+    system._processSiblings([{"selfIdentifier": "KL21J00001", "sibling": {"identifier": "KL21J00002", "ipAddress": "10.0.0.2"}}])
+    metrics = manager.getMetricsList()
+    assert "KL21J00002" in metrics["sibling_id"]
+    assert "10.0.0.2" in metrics["sibling_ip"]
+    system._processSiblings([])
+    assert manager.getMetricsList()["sibling_id"] == set()
+
+
 @pytest.mark.asyncio()
 async def test_manager_s30_initialize(hass: HomeAssistant, manager_us_customary_units: Manager):
     manager = manager_us_customary_units
@@ -322,13 +465,21 @@ async def test_manager_s30_initialize(hass: HomeAssistant, manager_us_customary_
                             assert manager._retrieve_task == "AWAITABLE_TASK"
                             assert create_devices.call_count == 1
                             assert len(create_devices.mock_calls[0].args) == 0
+                            assert len(create_devices.mock_calls[0].kwargs) == 0
+                            assert len(configuration_initialization.mock_calls[0].kwargs) == 0
 
                             assert forward_entry_setups.call_count == 1
 
+                            assert manager.platforms_initialized is True
+                            assert set(manager.startup_timings.keys()) == {"connect", "configuration", "devices", "platforms", "total"}
+                            assert manager.startup_timings["total"] >= manager.startup_timings["configuration"]
+
 
 @pytest.mark.asyncio()
 async def test_manager_s30_initialize_retry_task(manager_us_customary_units: Manager):
     manager = manager_us_customary_units
+    # No jitter
+    manager._retry_backoff._rand = lambda: 0.0
     with patch.object(manager, "updateState") as update_state:
         with patch("asyncio.sleep") as sleep:
             with patch.object(manager, "s30_initialize") as _:
@@ -339,7 +490,7 @@ async def test_manager_s30_initialize_retry_task(manager_us_customary_units: Man
                 assert update_state.mock_calls[2].args[0] == DS_CONNECTED
 
                 assert sleep.call_count == 1
-                assert sleep.mock_calls[0].args[0] == RETRY_INTERVAL_SECONDS
+                assert sleep.mock_calls[0].args[0] == RETRY_MIN_INTERVAL_SECONDS
 
     with patch.object(manager, "updateState") as update_state:
         with patch("asyncio.sleep") as sleep:
@@ -353,7 +504,7 @@ async def test_manager_s30_initialize_retry_task(manager_us_customary_units: Man
                 assert update_state.mock_calls[2].args[0] == DS_LOGIN_FAILED
 
                 assert sleep.call_count == 1
-                assert sleep.mock_calls[0].args[0] == RETRY_INTERVAL_SECONDS
+                assert sleep.mock_calls[0].args[0] == RETRY_MIN_INTERVAL_SECONDS
 
     with patch.object(manager, "updateState") as update_state:
         with patch("asyncio.sleep") as sleep:
@@ -376,9 +527,12 @@ async def test_manager_s30_initialize_retry_task(manager_us_customary_units: Man
                 assert update_state.mock_calls[5].args[0] == DS_CONNECTING
                 assert update_state.mock_calls[6].args[0] == DS_CONNECTED
 
+                # The delay doubles after each failure
                 assert sleep.call_count == 3
-                assert sleep.mock_calls[0].args[0] == RETRY_INTERVAL_SECONDS
-                assert sleep.mock_calls[1].args[0] == RETRY_INTERVAL_SECONDS
+                assert sleep.mock_calls[0].args[0] == RETRY_MIN_INTERVAL_SECONDS
+                assert sleep.mock_calls[1].args[0] == RETRY_MIN_INTERVAL_SECONDS * 2
+                assert sleep.mock_calls[2].args[0] == RETRY_MIN_INTERVAL_SECONDS * 4
+                assert sleep.mock_calls[2].args[0] <= RETRY_INTERVAL_SECONDS
 
 
 @pytest.mark.asyncio()
@@ -403,47 +557,132 @@ async def test_manager_connect_subscribe(manager_us_customary_units: Manager):
             assert subscribe.call_count == 1
             assert len(subscribe.mock_calls[0].args) == 1
             assert subscribe.mock_calls[0].args[0] == system
+            assert f"subscribe_{system.sysId}" in manager.system_timings
+
+
+@pytest.mark.asyncio()
+async def test_manager_connect_subscribe_concurrency(manager_2_systems: Manager):
+    manager = manager_2_systems
+    system_1: lennox_system = manager.api.system_list[0]
+    system_2: lennox_system = manager.api.system_list[1]
+    active = 0
+    max_active = 0
+    subscribed = []
+
+    async def subscribe(system: lennox_system):
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        await asyncio.sleep(0)
+        active -= 1
+        if system.sysId == fail_sys_id:
+            raise S30Exception("simulated error", EC_COMMS_ERROR, 0)
+        subscribed.append(system)
+
+    fail_sys_id = None
+    with patch.object(manager.api, "serverConnect"):
+        with patch.object(manager.api, "subscribe", side_effect=subscribe):
+            await manager.connect_subscribe()
+            assert max_active == 2
+            assert len(subscribed) == 2
+            assert f"subscribe_{system_1.sysId}" in manager.system_timings
+            assert f"subscribe_{system_2.sysId}" in manager.system_timings
+            assert manager.getMetricsList()["system_timings"] == manager.system_timings
+
+            manager._system_concurrency = 1
+            max_active = 0
+            subscribed.clear()
+            await manager.connect_subscribe()
+            assert max_active == 1
+            assert subscribed == [system_1, system_2]
+
+            # A failure is raised after the other systems have subscribed
+            manager._system_concurrency = 2
+            subscribed.clear()
+            fail_sys_id = system_1.sysId
+            ex: S30Exception = None
+            try:
+                await manager.connect_subscribe()
+            except S30Exception as e:
+                ex = e
+            assert ex is not None
+            assert ex.error_code == EC_COMMS_ERROR
+            assert subscribed == [system_2]
 
 
 @pytest.mark.asyncio()
 async def test_manager_reinitialize_task(manager_us_customary_units: Manager, caplog):
     manager = manager_us_customary_units
+    manager._retry_backoff._rand = lambda: 0.0
+    system: lennox_system = manager.api.system_list[0]
+    # Resubscribing on the existing session succeeds
     with caplog.at_level(logging.DEBUG):
         caplog.clear()
         with patch.object(manager, "updateState") as update_state:
+            with patch.object(manager.api, "subscribe") as subscribe:
+                with patch.object(manager, "connect_subscribe") as connect_subscribe:
+                    with patch.object(manager, "messagePump_task") as messagePump_task:
+                        with patch("asyncio.create_task") as create_task:
+                            create_task.return_value = "AWAITABLE_TASK"
+                            await manager.reinitialize_task()
+                            assert subscribe.call_count == 1
+                            assert subscribe.mock_calls[0].args[0] == system
+                            assert connect_subscribe.call_count == 0
+                            assert update_state.call_count == 2
+                            assert update_state.mock_calls[0].args[0] == DS_CONNECTING
+                            assert update_state.mock_calls[1].args[0] == DS_CONNECTED
+
+                            assert create_task.call_count == 1
+                            assert messagePump_task.call_count == 1
+                            assert manager._retrieve_task == "AWAITABLE_TASK"
+
+    # Resubscribe fails, log in again
+    with patch.object(manager, "updateState") as update_state:
+        with patch.object(manager.api, "subscribe") as subscribe:
+            subscribe.side_effect = S30Exception("Network Error", EC_COMMS_ERROR, 0)
             with patch.object(manager, "connect_subscribe") as connect_subscribe:
                 with patch.object(manager, "messagePump_task") as messagePump_task:
-                    with patch("asyncio.create_task") as create_task:
-                        create_task.return_value = "AWAITABLE_TASK"
-                        await manager.reinitialize_task()
-                        assert connect_subscribe.call_count == 1
-                        assert len(connect_subscribe.mock_calls[0].args) == 0
-                        assert update_state.call_count == 2
-                        assert update_state.mock_calls[0].args[0] == DS_CONNECTING
-                        assert update_state.mock_calls[1].args[0] == DS_CONNECTED
-
-                        assert create_task.call_count == 1
-                        assert messagePump_task.call_count == 1
-                        assert manager._retrieve_task == "AWAITABLE_TASK"
-    with caplog.at_level(logging.ERROR):
-        caplog.clear()
-        with patch.object(manager, "updateState") as update_state:
-            with patch.object(manager, "messagePump_task") as messagePump_task:
-                with patch.object(manager, "connect_subscribe") as connect_subscribe:
-                    connect_subscribe.side_effect = [S30Exception("Network Error", EC_COMMS_ERROR, 0), mock.DEFAULT]
                     with patch("asyncio.create_task") as create_task:
                         with patch("asyncio.sleep") as sleep:
                             await manager.reinitialize_task()
-                            assert connect_subscribe.call_count == 2
-                            assert len(connect_subscribe.mock_calls[0].args) == 0
+                            assert subscribe.call_count == 1
+                            assert connect_subscribe.call_count == 1
                             assert update_state.call_count == 4
                             assert update_state.mock_calls[0].args[0] == DS_CONNECTING
                             assert update_state.mock_calls[1].args[0] == DS_RETRY_WAIT
                             assert update_state.mock_calls[2].args[0] == DS_CONNECTING
                             assert update_state.mock_calls[3].args[0] == DS_CONNECTED
-
                             assert sleep.call_count == 1
-                            assert sleep.mock_calls[0].args[0] == RETRY_INTERVAL_SECONDS
+                            assert sleep.mock_calls[0].args[0] == RETRY_MIN_INTERVAL_SECONDS
+                            assert create_task.call_count == 1
+
+    # Unauthorized, the session is not reused
+    manager._login_required = True
+    with caplog.at_level(logging.ERROR):
+        caplog.clear()
+        with patch.object(manager, "updateState") as update_state:
+            with patch.object(manager, "messagePump_task") as messagePump_task:
+                with patch.object(manager, "resubscribe") as resubscribe:
+                    with patch.object(manager, "connect_subscribe") as connect_subscribe:
+                        connect_subscribe.side_effect = [S30Exception("Network Error", EC_COMMS_ERROR, 0), mock.DEFAULT]
+                        with patch("asyncio.create_task") as create_task:
+                            with patch("asyncio.sleep") as sleep:
+                                await manager.reinitialize_task()
+                                assert resubscribe.call_count == 0
+                                assert manager._login_required is False
+                                assert connect_subscribe.call_count == 2
+                                assert len(connect_subscribe.mock_calls[0].args) == 0
+                                assert update_state.call_count == 6
+                                assert update_state.mock_calls[0].args[0] == DS_CONNECTING
+                                assert update_state.mock_calls[1].args[0] == DS_RETRY_WAIT
+                                assert update_state.mock_calls[2].args[0] == DS_CONNECTING
+                                assert update_state.mock_calls[3].args[0] == DS_RETRY_WAIT
+                                assert update_state.mock_calls[4].args[0] == DS_CONNECTING
+                                assert update_state.mock_calls[5].args[0] == DS_CONNECTED
+
+                                assert sleep.call_count == 2
+                                assert sleep.mock_calls[0].args[0] == RETRY_MIN_INTERVAL_SECONDS
+                                assert sleep.mock_calls[1].args[0] == RETRY_MIN_INTERVAL_SECONDS * 2
 
                             assert create_task.call_count == 1
                             assert messagePump_task.call_count == 1
@@ -456,22 +695,26 @@ async def test_manager_reinitialize_task(manager_us_customary_units: Manager, ca
     with caplog.at_level(logging.ERROR):
         caplog.clear()
         with patch.object(manager, "updateState") as update_state:
-            with patch.object(manager, "connect_subscribe") as connect_subscribe:
-                connect_subscribe.side_effect = S30Exception("Bad Login", EC_LOGIN, 0)
-                with patch("asyncio.create_task") as create_task:
-                    ex: HomeAssistantError = None
-                    try:
-                        await manager.reinitialize_task()
-                    except HomeAssistantError as hae:
-                        ex = hae
-                    assert ex is not None
-                    assert "unable to login" in str(ex)
-                    assert manager._ip_address in str(ex)
+            with patch.object(manager, "resubscribe", return_value=False):
+                with patch.object(manager, "connect_subscribe") as connect_subscribe:
+                    connect_subscribe.side_effect = S30Exception("Bad Login", EC_LOGIN, 0)
+                    with patch("asyncio.create_task") as create_task:
+                        with patch("asyncio.sleep"):
+                            ex: HomeAssistantError = None
+                            try:
+                                await manager.reinitialize_task()
+                            except HomeAssistantError as hae:
+                                ex = hae
+                            assert ex is not None
+                            assert "unable to login" in str(ex)
+                            assert manager._ip_address in str(ex)
 
-                    assert connect_subscribe.call_count == 1
-                    assert len(connect_subscribe.mock_calls[0].args) == 0
-                    assert update_state.call_count == 1
-                    assert update_state.mock_calls[0].args[0] == DS_CONNECTING
+                            assert connect_subscribe.call_count == 1
+                            assert len(connect_subscribe.mock_calls[0].args) == 0
+                            assert update_state.call_count == 3
+                            assert update_state.mock_calls[0].args[0] == DS_CONNECTING
+                            assert update_state.mock_calls[1].args[0] == DS_RETRY_WAIT
+                            assert update_state.mock_calls[2].args[0] == DS_CONNECTING
 
 
 @pytest.mark.asyncio()
@@ -702,7 +945,7 @@ async def test_manager_messagePump_task(manager_us_customary_units: Manager, cap
 
     manager._shutdown = False
 
-    manager._fast_poll_count = 5
+    manager.poll_scheduler.fast_poll_count = 5
     with caplog.at_level(logging.DEBUG):
         caplog.clear()
         with patch("asyncio.sleep") as sleep:
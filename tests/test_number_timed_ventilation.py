@@ -138,9 +138,10 @@ async def test_timed_ventilation_time_device_info(hass, manager: Manager, caplog
     manager.system_equip_device_map = {}
     await manager.create_devices()
     manager.is_metric = True
-    c = TimedVentilationNumber(hass, manager, system)
     with caplog.at_level(logging.WARNING):
         caplog.clear()
+        # Device info is determined when the entity is created
+        c = TimedVentilationNumber(hass, manager, system)
         identifiers = c.device_info["identifiers"]
         for x in identifiers:
             assert x[0] == LENNOX_DOMAIN
@@ -153,9 +154,9 @@ async def test_timed_ventilation_time_device_info(hass, manager: Manager, caplog
     system.ventilationUnitType = None
     manager.system_equip_device_map = {}
     manager.is_metric = True
-    c = TimedVentilationNumber(hass, manager, system)
     with caplog.at_level(logging.WARNING):
         caplog.clear()
+        c = TimedVentilationNumber(hass, manager, system)
         identifiers = c.device_info["identifiers"]
         for x in identifiers:
             assert x[0] == LENNOX_DOMAIN
@@ -0,0 +1,192 @@
+"""Tests entities showing the requested values of commands waiting for confirmation"""
+
+# pylint: disable=missing-function-docstring
+# pylint: disable=protected-access
+# pylint: disable=line-too-long
+import logging
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from homeassistant.components.climate import HVACMode
+from lennoxs30api.s30api_async import lennox_system, lennox_zone
+from lennoxs30api.s30exception import EC_COMMS_ERROR, S30Exception
+
+from custom_components.lennoxs30 import Manager
+from custom_components.lennoxs30.climate import S30Climate
+from custom_components.lennoxs30.command_tracker import OPTIMISTIC_STATE_TIMEOUT
+from custom_components.lennoxs30.number import CirculateTime
+from custom_components.lennoxs30.select import ZoneModeSelect
+from custom_components.lennoxs30.switch import S30AllergenDefenderSwitch
+from custom_components.lennoxs30.zone_changes import ZoneChange
+
+
+@pytest.mark.asyncio()
+async def test_optimistic_state_disabled(hass, manager: Manager):
+    system: lennox_system = manager.api.system_list[0]
+    assert manager.optimistic_state is False
+    c = S30AllergenDefenderSwitch(hass, manager, system)
+    await c.async_added_to_hass()
+    value = system.allergenDefender
+    with patch.object(c, "schedule_update_ha_state") as update_callback:
+        await manager.send_command("allergen_defender", system, {"allergenDefender": not value}, AsyncMock()())
+        assert update_callback.call_count == 0
+    assert len(manager.command_tracker.pending) == 1
+    assert c.is_on == value
+
+
+@pytest.mark.asyncio()
+async def test_optimistic_state_switch(hass, manager: Manager, caplog):
+    system: lennox_system = manager.api.system_list[0]
+    manager.optimistic_state = True
+    c = S30AllergenDefenderSwitch(hass, manager, system)
+    await c.async_added_to_hass()
+    value = system.allergenDefender
+
+    # The requested value is shown as soon as the command is sent, without changing the state of the library objects
+    with patch.object(c, "schedule_update_ha_state") as update_callback, patch.object(hass.loop, "call_later") as call_later:
+        await manager.send_command("allergen_defender", system, {"allergenDefender": not value}, AsyncMock()())
+        assert update_callback.call_count == 1
+        assert c.is_on == (not value)
+        assert system._dirty is False
+        pending = manager.command_tracker.pending[0]
+        call_later.assert_called_once_with(OPTIMISTIC_STATE_TIMEOUT, manager._optimistic_expired, pending)
+        assert manager._optimistic_timers[pending] is call_later.return_value
+
+    # Not confirmed in time, the entity reverts to the reported value well before the command expires
+    pending.start -= OPTIMISTIC_STATE_TIMEOUT + 1
+    with patch.object(c, "schedule_update_ha_state") as update_callback:
+        with caplog.at_level(logging.WARNING):
+            caplog.clear()
+            manager._optimistic_expired(pending)
+            assert update_callback.call_count == 1
+            assert c.is_on == value
+            assert pending not in manager._optimistic_timers
+            assert len(caplog.records) == 1
+            assert "allergen_defender" in caplog.messages[0]
+            assert "not confirmed" in caplog.messages[0]
+    assert pending in manager.command_tracker.pending
+    manager.command_tracker.pending.clear()
+
+    # Confirmed commands are not reverted
+    with patch.object(c, "schedule_update_ha_state") as update_callback:
+        manager._optimistic_expired(pending)
+        assert update_callback.call_count == 0
+
+    # Removed entities are not refreshed
+    c2 = S30AllergenDefenderSwitch(hass, manager, system)
+    await c2.async_added_to_hass()
+    with patch.object(c2, "schedule_update_ha_state") as update_callback:
+        c2.hass = hass
+        c2.entity_id = "switch.test_allergen_defender"
+        await c2.async_remove(force_remove=True)
+        await manager.send_command("allergen_defender", system, {"allergenDefender": not value}, AsyncMock()())
+        assert update_callback.call_count == 0
+    manager.command_tracker.pending.clear()
+
+    # Failure to send reverts the entity
+    timers = len(manager._optimistic_timers)
+    with patch.object(c, "schedule_update_ha_state") as update_callback:
+        command = AsyncMock(side_effect=S30Exception("Simulated", EC_COMMS_ERROR, 1))
+        with pytest.raises(S30Exception):
+            await manager.send_command("allergen_defender", system, {"allergenDefender": not value}, command())
+        assert update_callback.call_count == 2
+        assert len(manager.command_tracker.pending) == 0
+        assert c.is_on == value
+        assert len(manager._optimistic_timers) == timers
+
+    # Confirmed by the controller, the timer is cancelled
+    await manager.send_command("allergen_defender", system, {"allergenDefender": not value}, AsyncMock()())
+    timer = manager._optimistic_timers[manager.command_tracker.pending[0]]
+    system.attr_updater({"allergenDefender": not value}, "allergenDefender")
+    manager._check_commands()
+    assert len(manager.command_tracker.pending) == 0
+    assert len(manager._optimistic_timers) == timers
+    assert timer.cancelled()
+    assert c.is_on == (not value)
+
+    # The timers are cancelled on shutdown
+    await manager.send_command("allergen_defender", system, {"allergenDefender": value}, AsyncMock()())
+    timer = manager._optimistic_timers[manager.command_tracker.pending[0]]
+    with patch.object(manager.api, "shutdown"):
+        await manager.async_shutdown(None)
+    assert len(manager._optimistic_timers) == 0
+    assert timer.cancelled()
+
+
+@pytest.mark.asyncio()
+async def test_optimistic_state_number(hass, manager: Manager):
+    system: lennox_system = manager.api.system_list[0]
+    manager.optimistic_state = True
+    c = CirculateTime(hass, manager, system)
+    value = system.circulateTime
+    with patch.object(system, "set_circulateTime"):
+        await c.async_set_native_value(value + 5)
+    assert c.native_value == value + 5
+    manager.command_tracker.pending.clear()
+    assert c.native_value == value
+
+
+@pytest.mark.asyncio()
+async def test_optimistic_state_climate(hass, manager_mz: Manager):
+    manager = manager_mz
+    manager.optimistic_state = True
+    manager.is_metric = False
+    system: lennox_system = manager.api.system_list[0]
+    zone: lennox_zone = system.zone_list[1]
+    c = S30Climate(hass, manager, system, zone)
+    s = ZoneModeSelect(hass, manager, system, zone)
+    await c.async_added_to_hass()
+    await s.async_added_to_hass()
+    assert zone.systemMode == "cool"
+    assert c.target_temperature == zone.getTargetTemperatureF()
+
+    # Both entities showing the mode are updated
+    with patch.object(c, "schedule_update_ha_state") as climate_callback:
+        with patch.object(s, "schedule_update_ha_state") as select_callback:
+            await manager.send_command("hvac_mode", zone, {"systemMode": "heat"}, AsyncMock()())
+            assert climate_callback.call_count == 1
+            assert select_callback.call_count == 1
+            assert c.hvac_mode == HVACMode.HEAT
+            assert s.current_option == HVACMode.HEAT
+            assert c.target_temperature == zone.sp
+
+            await manager.send_command("fan_mode", zone, {"fanMode": "circulate"}, AsyncMock()())
+            assert c.fan_mode == "circulate"
+
+            system.single_setpoint_mode = False
+            assert c.target_temperature == zone.hsp
+            await manager.send_command("setpoint", zone, {"hsp": 66}, AsyncMock()())
+            assert c.target_temperature == 66
+            manager.is_metric = True
+            assert c.target_temperature == zone.hspC
+            await manager.send_command("setpoint", zone, {"hspC": 19.0}, AsyncMock()())
+            assert c.target_temperature == 19.0
+            manager.is_metric = False
+
+            await manager.send_command("hvac_mode", zone, {"systemMode": "heat and cool"}, AsyncMock()())
+            await manager.send_command("setpoint", zone, {"csp": 80}, AsyncMock()())
+            assert c.hvac_mode == HVACMode.HEAT_COOL
+            assert c.target_temperature is None
+            assert c.target_temperature_low == 66
+            assert c.target_temperature_high == 80
+
+    manager.command_tracker.pending.clear()
+    assert c.hvac_mode == "cool"
+    assert c.fan_mode == zone.fanMode
+    assert c.target_temperature == zone.csp
+    assert c.target_temperature_low is None
+
+
+@pytest.mark.asyncio()
+async def test_optimistic_state_set_zones(hass, manager_mz: Manager):
+    manager = manager_mz
+    manager.optimistic_state = True
+    system: lennox_system = manager.api.system_list[0]
+    zone: lennox_zone = system.zone_list[0]
+    c = S30Climate(hass, manager, system, zone)
+    await c.async_added_to_hass()
+    with patch.object(manager.api, "publishMessageHelper"):
+        with patch.object(c, "schedule_update_ha_state") as update_callback:
+            await manager.async_set_zones([ZoneChange(zone, fan_mode="on")])
+            assert update_callback.call_count == 1
+    assert c.fan_mode == "on"
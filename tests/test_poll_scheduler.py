@@ -0,0 +1,205 @@
+"""Tests the poll schedulers"""
+
+# pylint: disable=missing-function-docstring
+# pylint: disable=protected-access
+import time
+from unittest.mock import patch
+
+import pytest
+from lennoxs30api.s30api_async import lennox_zone
+
+from custom_components.lennoxs30 import Manager
+from custom_components.lennoxs30.poll_scheduler import (
+    POLL_REASON_ACTIVE_HOURS,
+    POLL_REASON_ACTIVITY,
+    POLL_REASON_BACKOFF,
+    POLL_REASON_CONFIRMATION,
+    POLL_REASON_FAST_POLL,
+    POLL_REASON_FIXED,
+    AdaptivePollScheduler,
+    PollScheduler,
+)
+
+
+def test_poll_scheduler_fixed():
+    scheduler = PollScheduler(10, 0.75, 3)
+    scheduler.on_retrieve(False)
+    assert scheduler.next_interval() == 10
+    assert scheduler.reason == POLL_REASON_FIXED
+    assert scheduler.fast_polling is False
+
+    scheduler.start_fast_poll()
+    for _ in range(2):
+        scheduler.on_retrieve(False)
+        assert scheduler.fast_polling is True
+        assert scheduler.next_interval() == 0.75
+        assert scheduler.reason == POLL_REASON_FAST_POLL
+    scheduler.on_retrieve(False)
+    assert scheduler.fast_polling is False
+    assert scheduler.next_interval() == 10
+    assert scheduler.get_metrics() == {"poll_interval": 10, "poll_reason": POLL_REASON_FIXED}
+
+    scheduler.start_fast_poll()
+    scheduler.reset()
+    assert scheduler.fast_polling is False
+
+    # Fast poll interval never exceeds the poll interval
+    scheduler = PollScheduler(0.5, 0.75, 3)
+    scheduler.start_fast_poll()
+    assert scheduler.next_interval() == 0.5
+
+
+def test_poll_scheduler_confirmation():
+    scheduler = PollScheduler(10, 0.75, 3)
+    # Fast polls until the commands are confirmed
+    scheduler.start_fast_poll(2)
+    for _ in range(2):
+        scheduler.on_retrieve(False, pending_confirmations=2)
+        assert scheduler.fast_polling is True
+        assert scheduler.next_interval() == 0.75
+        assert scheduler.reason == POLL_REASON_CONFIRMATION
+    scheduler.on_retrieve(True, pending_confirmations=0)
+    assert scheduler.fast_polling is False
+    assert scheduler.next_interval() == 10
+    assert scheduler.reason == POLL_REASON_FIXED
+
+    # A command that is never confirmed fast polls for at most fast_poll_count retrieves
+    scheduler.start_fast_poll(1)
+    for _ in range(2):
+        scheduler.on_retrieve(False, pending_confirmations=1)
+        assert scheduler.fast_polling is True
+    scheduler.on_retrieve(False, pending_confirmations=1)
+    assert scheduler.fast_polling is False
+    assert scheduler.next_interval() == 10
+    # Another command sent while the first one is still waiting fast polls again
+    scheduler.on_retrieve(False, pending_confirmations=2)
+    assert scheduler.fast_polling is True
+    assert scheduler.next_interval() == 0.75
+    scheduler.on_retrieve(False, pending_confirmations=0)
+    assert scheduler.fast_polling is False
+    assert scheduler.next_interval() == 10
+    assert scheduler.reason == POLL_REASON_FIXED
+
+    # A command sent while counting down switches to waiting for its confirmation
+    scheduler.start_fast_poll()
+    scheduler.on_retrieve(False)
+    scheduler.start_fast_poll(1)
+    scheduler.on_retrieve(False, pending_confirmations=0)
+    assert scheduler.fast_polling is False
+
+    scheduler.start_fast_poll(1)
+    scheduler.reset()
+    assert scheduler.fast_polling is False
+
+    scheduler = AdaptivePollScheduler(1, 0.75, 3, 10)
+    for _ in range(5):
+        scheduler.on_retrieve(False)
+    scheduler.start_fast_poll(1)
+    scheduler.on_retrieve(False, pending_confirmations=1)
+    assert scheduler.next_interval() == 0.75
+    assert scheduler.reason == POLL_REASON_CONFIRMATION
+    scheduler.on_retrieve(True, pending_confirmations=0)
+    assert scheduler.next_interval() == 1
+    assert scheduler.reason == POLL_REASON_ACTIVITY
+
+
+def test_poll_scheduler_adaptive_backoff():
+    scheduler = AdaptivePollScheduler(1, 0.75, 3, 10)
+    now = time.time()
+    scheduler.on_retrieve(False, now)
+    assert scheduler.next_interval(now) == 1
+    assert scheduler.reason == POLL_REASON_ACTIVITY
+    intervals = []
+    for _ in range(5):
+        scheduler.on_retrieve(False, now)
+        intervals.append(scheduler.next_interval(now))
+        assert scheduler.reason == POLL_REASON_BACKOFF
+    assert intervals == [2, 4, 8, 10, 10]
+    assert scheduler.get_metrics() == {"poll_interval": 10, "poll_reason": POLL_REASON_BACKOFF}
+
+    # Activity returns to the poll interval
+    scheduler.on_retrieve(True, now)
+    scheduler.on_retrieve(False, now)
+    assert scheduler.next_interval(now) == 1
+    assert scheduler.reason == POLL_REASON_ACTIVITY
+
+    # Commands fast poll and reset the backoff
+    for _ in range(5):
+        scheduler.on_retrieve(False, now)
+    scheduler.start_fast_poll()
+    scheduler.on_retrieve(False, now)
+    assert scheduler.next_interval(now) == 0.75
+    assert scheduler.reason == POLL_REASON_FAST_POLL
+
+    # Max interval can not be less than the poll interval
+    scheduler = AdaptivePollScheduler(15, 0.75, 3, 10)
+    assert scheduler.max_poll_interval == 15
+
+
+def test_poll_scheduler_adaptive_active_hours():
+    scheduler = AdaptivePollScheduler(1, 0.75, 3, 60)
+    with patch.object(AdaptivePollScheduler, "_hour") as hour:
+        hour.return_value = 7
+        for _ in range(10):
+            scheduler.on_retrieve(True)
+        assert scheduler.hourly_activity[7] == 10.0
+        assert scheduler.is_active_hour() is True
+        for _ in range(5):
+            scheduler.on_retrieve(False)
+        assert scheduler.next_interval() == 2
+        assert scheduler.reason == POLL_REASON_ACTIVE_HOURS
+
+        hour.return_value = 3
+        assert scheduler.is_active_hour() is False
+        assert scheduler.next_interval() == 16
+        assert scheduler.reason == POLL_REASON_BACKOFF
+
+        # Returning to an hour on a later day ages the history for that hour
+        scheduler.on_retrieve(True)
+        hour.return_value = 7
+        scheduler.on_retrieve(True)
+        assert scheduler.hourly_activity[7] == pytest.approx(10.0)
+
+
+@pytest.mark.asyncio()
+async def test_poll_scheduler_manager(manager: Manager):
+    assert isinstance(manager.poll_scheduler, PollScheduler)
+    assert not isinstance(manager.poll_scheduler, AdaptivePollScheduler)
+    metrics = manager.getMetricsList()
+    assert metrics["poll_interval"] == manager._poll_interval
+    assert metrics["poll_reason"] == POLL_REASON_FIXED
+
+
+@pytest.mark.asyncio()
+async def test_poll_scheduler_manager_confirmation(manager_mz: Manager):
+    manager = manager_mz
+    zone: lennox_zone = manager.api.system_list[0].zone_list[0]
+    requested = "on" if zone.fanMode != "on" else "auto"
+    manager.command_tracker.start("fan_mode", zone, {"fanMode": requested})
+    # Commands without a known result do not hold the scheduler in fast poll
+    manager.command_tracker.start("equipment_parameter", zone, {"name": None})
+    assert manager.command_tracker.expected == 1
+
+    def message_pump():
+        if messagePump.call_count == 2:
+            zone.fanMode = requested
+            manager.command_tracker.check()
+        return False
+
+    with patch("asyncio.sleep") as sleep:
+        with patch.object(manager, "messagePump") as messagePump:
+            messagePump.side_effect = message_pump
+            with patch.object(manager, "event_wait_mp_wakeup") as event_wait_mp_wakeup:
+                event_wait_mp_wakeup.return_value = False
+                with patch.object(manager, "get_reinitialize") as get_reinitialize:
+                    get_reinitialize.side_effect = [False, False, False, True, True]
+                    with patch.object(manager, "reinitialize_task"):
+                        with patch("asyncio.create_task"):
+                            with patch.object(manager, "updateState"):
+                                await manager.messagePump_task()
+    assert messagePump.call_count == 3
+    # Fast polls once while waiting, the confirmation returns to the poll interval
+    fast_poll_interval = min(manager._fast_poll_interval, manager._poll_interval)
+    assert [call.args[0] for call in sleep.mock_calls] == [manager._poll_interval, fast_poll_interval]
+    assert event_wait_mp_wakeup.call_count == 2
+    assert manager.poll_scheduler.reason == POLL_REASON_FIXED
@@ -0,0 +1,120 @@
+"""Tests the message pump timing sensors"""
+
+# pylint: disable=missing-function-docstring
+# pylint: disable=protected-access
+# pylint: disable=line-too-long
+from unittest.mock import patch
+
+import pytest
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import UnitOfTime
+from homeassistant.helpers.entity import EntityCategory
+from lennoxs30api.s30api_async import lennox_system
+
+from custom_components.lennoxs30 import (
+    DS_RETRY_WAIT,
+    HOT_PATH_DISPATCH,
+    HOT_PATH_ENTITIES,
+    HOT_PATH_PROCESS,
+    HOT_PATH_RETRIEVE,
+    Manager,
+)
+from custom_components.lennoxs30.const import LENNOX_DOMAIN, MANAGER
+from custom_components.lennoxs30.sensor import async_setup_entry
+from custom_components.lennoxs30.sensor_hot_path import HotPathSensor
+
+
+@pytest.mark.asyncio()
+async def test_hot_path_message_pump(hass, manager: Manager):
+    system: lennox_system = manager.api.system_list[0]
+    zone = system.zone_list[0]
+    entity_writes = manager.entity_writes
+    for histogram in manager.hot_path.values():
+        histogram.reset()
+
+    async def message_pump():
+        for temperature in (72, 73):
+            manager.api.processMessage(
+                {"SenderID": system.sysId, "Data": {"zones": [{"id": zone.id, "status": {"temperature": temperature}}]}}
+            )
+        return True
+
+    entity = HotPathSensor(hass, manager, system, HOT_PATH_RETRIEVE)
+    entity.hass = hass
+    entity.entity_id = "sensor.test_hot_path"
+    zone.registerOnUpdateCallback(lambda: manager.entity_mark_dirty(entity))
+    with patch.object(manager.api, "messagePump", side_effect=message_pump):
+        with patch.object(entity, "async_write_ha_state") as async_write_ha_state:
+            assert await manager.messagePump() is True
+            assert async_write_ha_state.call_count == 1
+    assert len(manager._dirty_entities) == 0
+
+    assert manager.hot_path[HOT_PATH_RETRIEVE].count == 1
+    assert manager.hot_path[HOT_PATH_PROCESS].count == 2
+    assert manager.hot_path[HOT_PATH_DISPATCH].count == 1
+    # One entity was written for the two messages
+    assert manager.entity_writes == entity_writes + 1
+    assert manager.hot_path[HOT_PATH_ENTITIES].count == 1
+    assert manager.hot_path[HOT_PATH_ENTITIES].total == 0.5
+
+    # No messages
+    with patch.object(manager.api, "messagePump", return_value=False):
+        assert await manager.messagePump() is False
+    assert manager.hot_path[HOT_PATH_RETRIEVE].count == 2
+    assert manager.hot_path[HOT_PATH_PROCESS].count == 2
+    assert manager.hot_path[HOT_PATH_DISPATCH].count == 1
+    assert manager.hot_path[HOT_PATH_ENTITIES].count == 1
+
+    metrics = manager.get_hot_path_metrics()
+    assert metrics[HOT_PATH_PROCESS]["count"] == 2
+
+
+@pytest.mark.asyncio()
+async def test_hot_path_sensor(hass, manager: Manager):
+    system: lennox_system = manager.api.system_list[0]
+    s = HotPathSensor(hass, manager, system, HOT_PATH_RETRIEVE)
+    assert s.unique_id == (system.unique_id + "_HOT_PATH_retrieve_ms").replace("-", "")
+    assert s.name == system.name + "_hot_path_retrieve_ms"
+    assert s.should_poll is True
+    assert s.native_value is None
+    assert s.native_unit_of_measurement == UnitOfTime.MILLISECONDS
+    assert s.device_class == SensorDeviceClass.DURATION
+    assert s.state_class == SensorStateClass.MEASUREMENT
+    assert s.entity_category == EntityCategory.DIAGNOSTIC
+    identifiers = s.device_info["identifiers"]
+    assert identifiers == {(LENNOX_DOMAIN, system.unique_id)}
+
+    manager.hot_path[HOT_PATH_RETRIEVE].record(15)
+    manager.hot_path[HOT_PATH_RETRIEVE].record(150)
+    assert s.native_value == 150
+    attrs = s.extra_state_attributes
+    assert attrs == {"count": 2, "mean": 82.5, "p50": 20, "p99": 150, "max": 150}
+
+    # The timings remain available while disconnected
+    manager.updateState(DS_RETRY_WAIT)
+    assert s.available is True
+
+    s = HotPathSensor(hass, manager, system, HOT_PATH_ENTITIES)
+    assert s.native_unit_of_measurement is None
+    assert s.device_class is None
+
+
+@pytest.mark.asyncio()
+async def test_hot_path_sensor_setup(hass, manager: Manager, config_entry_local):
+    hass.data["lennoxs30"] = {config_entry_local.unique_id: {MANAGER: manager}}
+    manager.create_sensors = False
+    manager.create_alert_sensors = False
+    manager.create_diagnostic_sensors = False
+    manager.create_inverter_power = False
+
+    with patch("homeassistant.helpers.entity_platform.AddEntitiesCallback") as add_entities:
+        await async_setup_entry(hass, config_entry_local, add_entities)
+        sensors = [s for s in add_entities.call_args[0][0] if isinstance(s, HotPathSensor)]
+        assert len(sensors) == 0
+
+    manager.hot_path_sensors = True
+    with patch("homeassistant.helpers.entity_platform.AddEntitiesCallback") as add_entities:
+        await async_setup_entry(hass, config_entry_local, add_entities)
+        sensors = [s for s in add_entities.call_args[0][0] if isinstance(s, HotPathSensor)]
+        assert len(sensors) == 4
+        assert {s._metric for s in sensors} == {HOT_PATH_RETRIEVE, HOT_PATH_PROCESS, HOT_PATH_DISPATCH, HOT_PATH_ENTITIES}
@@ -5,6 +5,7 @@ import logging
 from unittest.mock import Mock
 
 import pytest
+from homeassistant.components.sensor import RestoreSensor
 from homeassistant.const import UnitOfTemperature
 from lennoxs30api.s30api_async import (
     LENNOX_PRODUCT_TYPE_S40,
@@ -21,6 +22,7 @@ from custom_components.lennoxs30.sensor import (
     S30DiagSensor,
     S30HumiditySensor,
     S30InverterPowerSensor,
+    S30OutdoorTempRestoreSensor,
     S30OutdoorTempSensor,
     S30TempSensor,
     async_setup_entry,
@@ -72,6 +74,16 @@ async def test_async_setup_entry(hass, manager: Manager, caplog):
     sensor_list = async_add_entities.call_args[0][0]
     assert len(sensor_list) == 1
     assert isinstance(sensor_list[0], S30OutdoorTempSensor)
+    assert not isinstance(sensor_list[0], RestoreSensor)
+
+    # The sensor restores its saved value only when restore_state is enabled
+    manager.restore_state = True
+    async_add_entities = Mock()
+    await async_setup_entry(hass, entry, async_add_entities)
+    sensor_list = async_add_entities.call_args[0][0]
+    assert isinstance(sensor_list[0], S30OutdoorTempRestoreSensor)
+    assert isinstance(sensor_list[0], RestoreSensor)
+    manager.restore_state = False
 
     # Inverter Power Sensor
     with caplog.at_level(logging.WARNING):
@@ -172,7 +184,8 @@ async def test_async_setup_entry(hass, manager: Manager, caplog):
             assert isinstance(sensor_list[(i * 2) + 1], S30HumiditySensor)
         assert len(caplog.records) == 0
 
-    # Diagnostic Sensors
+    # Diagnostic Sensors, the devices are created before the platforms are setup
+    await manager.create_devices()
     with caplog.at_level(logging.WARNING):
         caplog.clear()
         system.outdoorTemperatureStatus = LENNOX_STATUS_NOT_EXIST
@@ -189,6 +202,24 @@ async def test_async_setup_entry(hass, manager: Manager, caplog):
             assert isinstance(sensor_list[i], S30DiagSensor)
         assert len(caplog.records) == 0
 
+    # Numeric diagnostics imported into long-term statistics are not created as sensors
+    with caplog.at_level(logging.WARNING):
+        caplog.clear()
+        manager.diag_external_statistics = True
+        async_add_entities = Mock()
+        await async_setup_entry(hass, entry, async_add_entities)
+        assert async_add_entities.called == 1
+        sensor_list = async_add_entities.call_args[0][0]
+        importer = manager.diag_importers[system.sysId]
+        assert len(importer.channels) > 0
+        assert len(sensor_list) + len(importer.channels) == 47
+        for i in range(len(sensor_list)):
+            assert isinstance(sensor_list[i], S30DiagSensor)
+            assert sensor_list[i].state_class is None
+        assert system._diagcallbacks[-1]["func"] == importer.diag_update_callback  # pylint: disable=protected-access,comparison-with-callable
+        assert len(caplog.records) == 0
+        manager.diag_external_statistics = False
+
     # Inverter Power Sensor Internet Connected
     with caplog.at_level(logging.WARNING):
         caplog.clear()
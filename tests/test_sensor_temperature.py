@@ -11,15 +11,17 @@ from unittest.mock import patch
 import pytest
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.const import UnitOfTemperature
+from homeassistant.core import State
 from lennoxs30api.s30api_async import (
     LENNOX_BAD_STATUS,
     lennox_system,
     lennox_zone,
 )
+from pytest_homeassistant_custom_component.common import mock_restore_cache_with_extra_data
 
 from custom_components.lennoxs30 import Manager
 from custom_components.lennoxs30.const import LENNOX_DOMAIN
-from custom_components.lennoxs30.sensor import S30TempSensor
+from custom_components.lennoxs30.sensor import S30TempRestoreSensor, S30TempSensor
 from tests.conftest import conftest_base_entity_availability
 
 
@@ -102,3 +104,48 @@ async def test_temperature_sensor_subscription(hass, manager: Manager):
         assert update_callback.call_count == 1
         assert s.native_value is None
         assert s.available is False
+
+
+@pytest.mark.asyncio()
+async def test_temperature_sensor_restore_state(hass, manager: Manager):
+    system: lennox_system = manager.api.system_list[0]
+    zone: lennox_zone = system.getZone(0)
+    manager.is_metric = True
+    s = S30TempRestoreSensor(hass, manager, system, zone)
+    s.hass = hass
+    s.entity_id = "sensor.zone_1_temperature"
+    mock_restore_cache_with_extra_data(
+        hass, ((State(s.entity_id, "21.5"), {"native_value": 21.5, "native_unit_of_measurement": UnitOfTemperature.CELSIUS}),)
+    )
+
+    # Restore disabled, the entity follows the connection
+    await s.async_added_to_hass()
+    assert s._restored_values == {}
+    manager.connected = False
+    assert s.available is False
+    assert s.stale is False
+    assert len(s.extra_state_attributes) == 0
+
+    manager.restore_state = True
+    # A sensor created without restore support publishes stale values but has nothing to restore
+    plain = S30TempSensor(hass, manager, system, zone)
+    plain.hass = hass
+    plain.entity_id = "sensor.zone_1_temperature"
+    await plain.async_added_to_hass()
+    assert plain._restored_values == {}
+
+    await s.async_added_to_hass()
+    assert s._restored_values["native_value"] == 21.5
+    # While disconnected the last known value is published as stale
+    assert s.available is True
+    assert s.extra_state_attributes == {"stale": True}
+    assert s.native_value == zone.temperatureC
+    # Values that have not been received are restored
+    with patch.object(zone, "getTemperatureC", return_value=None):
+        assert s.native_value == 21.5
+
+    manager.connected = True
+    assert s.available is True
+    assert s.extra_state_attributes == {"stale": False}
+    with patch.object(zone, "getTemperatureC", return_value=None):
+        assert s.native_value is None
@@ -48,6 +48,11 @@ async def test_wifi_rssi_sensor(hass, manager: Manager, caplog):
     assert s.device_class == SensorDeviceClass.SIGNAL_STRENGTH
     assert s.state_class == SensorStateClass.MEASUREMENT
 
+    fingerprint = s.state_fingerprint()
+    assert fingerprint == s.state_fingerprint()
+    system.wifi_rssi = -70
+    assert fingerprint != s.state_fingerprint()
+
     identifiers = s.device_info["identifiers"]
     for x in identifiers:
         assert x[0] == LENNOX_DOMAIN
@@ -46,13 +46,16 @@ async def test_ventilation_switch(hass, manager: Manager, caplog):
         assert x[0] == LENNOX_DOMAIN
         assert x[1] == system.unique_id
 
+    # Device info is determined when the switch is created
     await manager.create_devices()
+    c = S30VentilationSwitch(hass, manager, system)
     identifiers = c.device_info["identifiers"]
     for x in identifiers:
         assert x[0] == LENNOX_DOMAIN
         assert x[1] == "0000000-0000-0000-0000-000000000002_ventilation"
 
     manager.system_equip_device_map.get(system.sysId).pop(VENTILATION_EQUIPMENT_ID)
+    c = S30VentilationSwitch(hass, manager, system)
     identifiers = c.device_info["identifiers"]
     for x in identifiers:
         assert x[0] == LENNOX_DOMAIN
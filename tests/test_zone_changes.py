@@ -0,0 +1,184 @@
+"""Tests changing several zones with the set_zones service"""
+
+# pylint: disable=missing-function-docstring
+# pylint: disable=protected-access
+# pylint: disable=line-too-long
+from unittest.mock import Mock, patch
+
+import pytest
+from homeassistant.components.climate import DATA_COMPONENT, HVACMode
+from homeassistant.exceptions import HomeAssistantError
+from lennoxs30api.s30api_async import lennox_system, lennox_zone
+from lennoxs30api.s30exception import EC_COMMS_ERROR, S30Exception
+
+from custom_components.lennoxs30 import Manager
+from custom_components.lennoxs30.climate import SET_ZONES_SCHEMA, S30Climate, async_set_zones_service
+from custom_components.lennoxs30.zone_changes import ZoneChange
+
+
+def test_zone_change_tracked_attributes(manager_mz: Manager):
+    system: lennox_system = manager_mz.api.system_list[0]
+    zone: lennox_zone = system.zone_list[0]
+    change = ZoneChange(zone, hvac_mode="heat", setpoints={"r_hsp": 70, "r_cspC": 24.5}, fan_mode="on")
+    assert change.tracked_attributes() == {
+        "hvac_mode": {"systemMode": "heat"},
+        "setpoint": {"hsp": 70, "cspC": 24.5},
+        "fan_mode": {"fanMode": "on"},
+    }
+    assert ZoneChange(zone, fan_mode="auto").tracked_attributes() == {"fan_mode": {"fanMode": "auto"}}
+
+
+@pytest.mark.asyncio()
+async def test_manager_set_zones(hass, manager_2_systems: Manager):
+    manager = manager_2_systems
+    system_1: lennox_system = manager.api.system_list[1]
+    system_2: lennox_system = manager.api.system_list[0]
+    zone_1: lennox_zone = system_1.zone_list[0]
+    zone_2: lennox_zone = system_2.zone_list[0]
+    changes = [
+        ZoneChange(zone_1, hvac_mode="cool", setpoints={"r_csp": 76}),
+        ZoneChange(system_1.zone_list[1], fan_mode="on"),
+        ZoneChange(zone_2, hvac_mode="heat", fan_mode="on"),
+    ]
+    calls = []
+
+    def record(name):
+        async def command(zone, *args, **kwargs):
+            calls.append((zone.unique_id, name, args, kwargs))
+
+        return command
+
+    manager.mp_wakeup_event.clear()
+    with (
+        patch.object(lennox_zone, "setHVACMode", autospec=True, side_effect=record("setHVACMode")),
+        patch.object(lennox_zone, "perform_setpoint", autospec=True, side_effect=record("perform_setpoint")),
+        patch.object(lennox_zone, "setFanMode", autospec=True, side_effect=record("setFanMode")),
+    ):
+        assert await manager.async_set_zones(changes) == 5
+    assert manager.mp_wakeup_event.is_set()
+    # The changes to a zone are made in order through the zone methods
+    assert [call for call in calls if call[0] == zone_1.unique_id] == [
+        (zone_1.unique_id, "setHVACMode", ("cool",), {}),
+        (zone_1.unique_id, "perform_setpoint", (), {"r_csp": 76}),
+    ]
+    assert [call for call in calls if call[0] == zone_2.unique_id] == [
+        (zone_2.unique_id, "setHVACMode", ("heat",), {}),
+        (zone_2.unique_id, "setFanMode", ("on",), {}),
+    ]
+    assert len(calls) == 5
+    assert sorted(pending.command_type for pending in manager.command_tracker.pending) == [
+        "fan_mode",
+        "fan_mode",
+        "hvac_mode",
+        "hvac_mode",
+        "setpoint",
+    ]
+
+    # The capabilities of the zone are checked by the library
+    manager.command_tracker.pending.clear()
+    zone_1.coolingOption = False
+    with patch.object(manager.api, "publishMessageHelper") as publish:
+        with pytest.raises(S30Exception):
+            await manager.async_set_zones([ZoneChange(zone_1, hvac_mode="cool")])
+        assert publish.call_count == 0
+    assert len(manager.command_tracker.pending) == 0
+
+    with patch.object(manager.api, "publishMessageHelper") as publish:
+        publish.side_effect = S30Exception("Simulated", EC_COMMS_ERROR, 1)
+        with pytest.raises(S30Exception):
+            await manager.async_set_zones([ZoneChange(zone_2, fan_mode="auto")])
+    assert len(manager.command_tracker.pending) == 0
+
+
+@pytest.mark.asyncio()
+async def test_climate_zone_change(hass, manager_mz: Manager):
+    manager = manager_mz
+    manager.is_metric = False
+    system: lennox_system = manager.api.system_list[0]
+    system.single_setpoint_mode = False
+    zone: lennox_zone = system.zone_list[1]
+    c = S30Climate(hass, manager, system, zone)
+
+    change = c.zone_change(hvac_mode=HVACMode.HEAT_COOL, target_temp_low=65, target_temp_high=75, fan_mode="on")
+    assert change.zone == zone
+    assert change.hvac_mode == "heat and cool"
+    assert change.setpoints == {"r_hsp": 65, "r_csp": 75}
+    assert change.fan_mode == "on"
+
+    # Zone is in cool mode
+    change = c.zone_change(temperature=77)
+    assert change.hvac_mode is None
+    assert change.setpoints == {"r_csp": 77}
+
+    manager.is_metric = True
+    change = c.zone_change(hvac_mode=HVACMode.HEAT, temperature=21)
+    assert change.setpoints == {"r_hspC": 21}
+
+    with pytest.raises(HomeAssistantError):
+        c.zone_change()
+    with pytest.raises(HomeAssistantError):
+        c.zone_change(fan_mode="turbo")
+    with pytest.raises(HomeAssistantError):
+        c.zone_change(temperature=72, target_temp_high=75)
+    with pytest.raises(HomeAssistantError):
+        c.zone_change(hvac_mode=HVACMode.OFF, temperature=72)
+    zone.coolingOption = False
+    with pytest.raises(HomeAssistantError):
+        c.zone_change(hvac_mode=HVACMode.COOL)
+
+
+@pytest.mark.asyncio()
+async def test_set_zones_service(hass, manager_mz: Manager, manager_2_systems: Manager):
+    manager_mz.is_metric = False
+    manager_2_systems.is_metric = False
+    c_1 = S30Climate(hass, manager_mz, manager_mz.api.system_list[0], manager_mz.api.system_list[0].zone_list[0])
+    c_1.entity_id = "climate.mz_zone_1"
+    c_2 = S30Climate(hass, manager_mz, manager_mz.api.system_list[0], manager_mz.api.system_list[0].zone_list[1])
+    c_2.entity_id = "climate.mz_zone_2"
+    c_3 = S30Climate(hass, manager_2_systems, manager_2_systems.api.system_list[1], manager_2_systems.api.system_list[1].zone_list[0])
+    c_3.entity_id = "climate.second_zone_1"
+    entities = {c.entity_id: c for c in (c_1, c_2, c_3)}
+    entities["climate.other"] = Mock()
+    component = Mock()
+    component.get_entity = entities.get
+    hass.data[DATA_COMPONENT] = component
+
+    def service_call(zones):
+        call = Mock()
+        call.hass = hass
+        call.data = SET_ZONES_SCHEMA({"zones": zones})
+        return call
+
+    call = service_call(
+        [
+            {"entity_id": "climate.mz_zone_1", "temperature": 70},
+            {"entity_id": "climate.mz_zone_2", "hvac_mode": "heat", "temperature": "71"},
+            {"entity_id": "climate.second_zone_1", "fan_mode": "circulate"},
+        ]
+    )
+    with patch.object(manager_mz, "async_set_zones") as set_zones_mz:
+        with patch.object(manager_2_systems, "async_set_zones") as set_zones_2:
+            await async_set_zones_service(call)
+            assert set_zones_mz.call_count == 1
+            changes: list[ZoneChange] = set_zones_mz.call_args[0][0]
+            assert [change.zone for change in changes] == [c_1._zone, c_2._zone]
+            assert changes[0].setpoints == {"r_sp": 70.0}
+            assert changes[1].hvac_mode == "heat"
+            assert changes[1].setpoints == {"r_sp": 71.0}
+            assert set_zones_2.call_count == 1
+            changes = set_zones_2.call_args[0][0]
+            assert len(changes) == 1
+            assert changes[0].fan_mode == "circulate"
+
+    with patch.object(manager_mz, "async_set_zones") as set_zones_mz:
+        with pytest.raises(HomeAssistantError, match="more than once"):
+            await async_set_zones_service(service_call([{"entity_id": "climate.mz_zone_1", "fan_mode": "on"}] * 2))
+        with pytest.raises(HomeAssistantError, match="not a lennoxs30 climate entity"):
+            await async_set_zones_service(service_call([{"entity_id": "climate.other", "fan_mode": "on"}]))
+        with pytest.raises(HomeAssistantError, match="not a lennoxs30 climate entity"):
+            await async_set_zones_service(service_call([{"entity_id": "climate.missing", "fan_mode": "on"}]))
+        assert set_zones_mz.call_count == 0
+
+        set_zones_mz.side_effect = S30Exception("Simulated", EC_COMMS_ERROR, 1)
+        with pytest.raises(HomeAssistantError, match="Simulated"):
+            await async_set_zones_service(service_call([{"entity_id": "climate.mz_zone_1", "fan_mode": "on"}]))